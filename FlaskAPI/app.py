@@ -1,39 +1,143 @@
-from flask import Flask, jsonify, request
-import pickle
+from flask import Flask, Response, jsonify, request
+import io
+import time
 import numpy as np
+import orjson
+from scipy import sparse
+from data_input import data_in
+from registry import InvalidInput, ModelRegistry, get_n_features, predict_salaries
+
+# The binary bodies: a NumPy file (np.save), or the float64 little-endian features
+# of the postings one after another, routed by the query string (?region=Europe)
+NPY_TYPE = "application/x-npy"
+BINARY_TYPE = "application/octet-stream"
 
 app = Flask(__name__)
+# A new version of a model is served only if it predicts the sample posting
+registry = ModelRegistry.from_directory("models", smoke_batch=np.array([data_in["valid"]]))
+# The models within the memory budget loaded before the first request,
+# and their new versions in the background, under any WSGI server
+registry.start()
+
+
+@app.before_request
+def start_registry():
+    # In each process forked by the server after the import
+    registry.start()
 
 
 @app.route("/predict", methods=["GET"])
 def predict():
-    if request.method == "GET" and request.is_json:
-        prediction = get_prediction(request)
+    model_name = None
+
+    try:
+        prediction, model_name = get_prediction(request)
         status_code = 200
 
-    else:
-        prediction = "invalid input"
+    except (InvalidInput, orjson.JSONDecodeError) as error:
+        prediction = f"invalid input: {error}"
         status_code = 400
 
-    response = jsonify({"salary_predicted": prediction, "currency": "USD"})
-    response.headers.add("Content-Type", "application/json")
-    return response, status_code
+    # The salaries array is serialized as it is, without a list of Python numbers
+    body = orjson.dumps(
+        {"salary_predicted": prediction, "currency": "USD", "model": model_name},
+        option=orjson.OPT_SERIALIZE_NUMPY,
+    )
+    return Response(body, status=status_code, mimetype="application/json")
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    return jsonify(registry.get_metrics())
 
 
 def get_prediction(request):
-    input_data = request.get_json().get("input")
-    data_reshaped = np.array(input_data).reshape(1, -1)
-    model = load_models()
-    salary = model.predict(data_reshaped)[0]
-    return round(salary)
-
-
-def load_models():
-    file_name = "models/model_file.p"
-    with open(file_name, "rb") as pickled:
-        data = pickle.load(pickled)
-        model = data["model"]
-    return model
+    if request.mimetype in (NPY_TYPE, BINARY_TYPE):
+        body = None
+        options = request.args
+    elif request.is_json:
+        body = options = orjson.loads(request.get_data())
+        if not isinstance(body, dict):
+            raise InvalidInput("the JSON body is not an object")
+    else:
+        raise InvalidInput(f"unsupported content type {request.mimetype!r}")
+
+    # The model of the country or of the region of the postings, e.g. "Europe"
+    model_name = registry.route(options.get("country"), options.get("region"))
+    model = registry.get(model_name)
+
+    features, batch = get_features(request, body, get_n_features(model))
+
+    start = time.perf_counter()
+    try:
+        salaries = predict_salaries(model, features)
+        # E.g. an overflow of the huge features, not cast to a wrong salary
+        if not np.isfinite(salaries).all():
+            raise ValueError(f"The model {model_name} predicted a salary not finite")
+    except Exception:
+        registry.record(model_name, 0, time.perf_counter() - start, error=True)
+        raise
+    registry.record(model_name, len(salaries), time.perf_counter() - start)
+
+    salaries = np.rint(salaries).astype(np.int64)
+    # A batch of postings is predicted in a single pass
+    return (salaries if batch else int(salaries[0])), model_name
+
+
+def get_features(request, body, n_features):
+    if request.mimetype == NPY_TYPE:
+        try:
+            features = np.load(io.BytesIO(request.get_data()), allow_pickle=False)
+        except (ValueError, EOFError, OSError):
+            raise InvalidInput("the body is not a NumPy file of an array")
+        # Bools and integers are cast, not strings nor objects
+        if not isinstance(features, np.ndarray) or features.dtype.kind not in "biuf":
+            raise InvalidInput("the features are not numbers")
+
+    elif request.mimetype == BINARY_TYPE:
+        buffer = request.get_data()
+        if len(buffer) % (8 * n_features):
+            raise InvalidInput(f"{len(buffer)} bytes are not rows of {n_features} float64")
+        features = np.frombuffer(buffer, dtype="<f8").reshape(-1, n_features)
+
+    else:
+        input_data = body.get("input")
+        # The sparse input sends only the non-zero features: {"indices": [...], "values": [...]}
+        if isinstance(input_data, dict):
+            return get_sparse_features(input_data, n_features), False
+        try:
+            features = np.array(input_data, dtype=np.float64)
+        except (TypeError, ValueError):
+            raise InvalidInput("the features are not a list or a list of lists of numbers")
+
+    if features.ndim not in (1, 2) or features.shape[-1] != n_features:
+        raise InvalidInput(f"{features.shape[-1] if features.ndim else 0} features "
+                           f"instead of {n_features}")
+
+    batch = features.ndim == 2
+    features = features.astype(np.float64, copy=False).reshape(-1, n_features)
+    # An empty body or batch is not sent to the model
+    if not len(features):
+        raise InvalidInput("no postings")
+    # Nor NaN or infinity, e.g. "nan" in JSON: the forests reject them, the linear models
+    # predict NaN, which is no integer salary
+    if not np.isfinite(features).all():
+        raise InvalidInput("the features are not finite numbers")
+    return features, batch
+
+
+def get_sparse_features(input_data, n_features):
+    try:
+        indices = np.asarray(input_data.get("indices", []), dtype=np.int64).reshape(-1)
+        values = np.asarray(input_data.get("values", []), dtype=np.float64).reshape(-1)
+    except (TypeError, ValueError):
+        raise InvalidInput("the indices and the values are not lists of numbers")
+    out_of_range = len(indices) and not 0 <= indices.min() <= indices.max() < n_features
+    if len(indices) != len(values) or out_of_range:
+        raise InvalidInput(f"the indices and the values are not of {n_features} features")
+    if not np.isfinite(values).all():
+        raise InvalidInput("the values are not finite numbers")
+    return sparse.csr_matrix((values, indices, [0, len(indices)]), shape=(1, n_features))
 
 
 if __name__ == "__main__":
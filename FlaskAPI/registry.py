@@ -0,0 +1,319 @@
+'''
+This module keeps the salary models served by the API, e.g. the model of all the postings
+(`_004_model_building.ipynb`) and the one of the European postings
+(`_004_model_building_europe_data.ipynb`), listed in "models/registry.json":
+
+{
+    "default": "global",
+    "memory_budget_MB": 500,
+    "models": {
+        "global": {"file": "model_file.p"},
+        "europe": {"file": "model_file_europe.p", "regions": ["Europe"]}
+    }
+}
+
+A request is routed to the model of its country, else of its region, else to the default
+model, through a lookup table. The models are loaded at the start of the API
+(`ModelRegistry.preload`), the default one first, as long as they fit in the memory budget
+(the size of a model is the size of its file); the others are loaded on their first request.
+When the loaded models exceed the budget, the least recently used ones are unloaded,
+never the default model, and loaded again by their next request.
+Without "models/registry.json", the default model is "models/model_file.p".
+
+`ModelRegistry.start` preloads the models and starts watching their files, once per process.
+
+The files of the loaded models are watched: a new version of a file is loaded
+in the background, once it is no longer written, and checked on a smoke batch
+(the same number of features, finite predictions). Only then it replaces the loaded model,
+at once, so the requests never wait for it; the ones already running finish on the old model.
+A version failing the check is logged and the old model keeps serving.
+'''
+from collections import OrderedDict
+import json
+import logging
+import os
+import pickle
+import threading
+
+import numpy as np
+
+DEFAULT_MODEL = "global"
+MODEL_FILE = "model_file.p"
+REGISTRY_FILE = "registry.json"
+WATCH_INTERVAL = 1.0
+
+
+class InvalidInput(ValueError):
+    pass
+
+
+def load_model_file(file_path):
+    with open(file_path, "rb") as pickled:
+        data = pickle.load(pickled)
+    # The ensemble of the models (training.ensemble) is saved as its arrays and models
+    return data["ensemble"] if "ensemble" in data else data["model"]
+
+
+def get_n_features(model):
+    if isinstance(model, dict):
+        return len(model["coef"])
+    return model.n_features_in_
+
+
+def predict_salaries(model, features):
+    # The ensemble of the models (training.ensemble): the linear models reduced
+    # to a single dot product, plus the weighted predictions of the other models
+    if isinstance(model, dict):
+        salaries = np.asarray(features @ model["coef"], dtype=np.float64) + model["intercept"]
+        for estimator, weight in model["estimators"]:
+            salaries += weight * estimator.predict(features)
+        return salaries
+    return model.predict(features)
+
+
+def validate_model(model, n_features, smoke_batch):
+    # The clients send the features of the served model
+    if get_n_features(model) != n_features:
+        raise ValueError(f"{get_n_features(model)} features instead of {n_features}")
+    if smoke_batch is not None and smoke_batch.shape[1] == n_features:
+        salaries = predict_salaries(model, smoke_batch)
+        if len(salaries) != len(smoke_batch) or not np.isfinite(salaries).all():
+            raise ValueError("Invalid predictions of the smoke batch")
+
+
+def get_version(file_path):
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ModelMetrics:
+    '''The requests served by a model.'''
+
+    __slots__ = (
+        "requests", "rows", "seconds", "errors", "loads", "evictions", "reloads", "reload_errors"
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.rows = 0
+        self.seconds = 0.0
+        self.errors = 0
+        self.loads = 0
+        self.evictions = 0
+        self.reloads = 0
+        self.reload_errors = 0
+
+    def to_dict(self):
+        return {
+            "requests": self.requests,
+            "rows": self.rows,
+            "errors": self.errors,
+            "mean_latency_ms": round(1000 * self.seconds / self.requests, 3)
+            if self.requests else None,
+            "loads": self.loads,
+            "evictions": self.evictions,
+            "reloads": self.reloads,
+            "reload_errors": self.reload_errors,
+        }
+
+
+class ModelRegistry:
+    '''The named models, loaded on their first request and unloaded by the memory budget.'''
+
+    def __init__(
+        self, directory, models, default=DEFAULT_MODEL, memory_budget_MB=None, smoke_batch=None
+    ):
+        if default not in models:
+            raise ValueError(f"The default model is not in the registry:\n{default}")
+
+        self.files = {
+            name: os.path.join(directory, model["file"]) for name, model in models.items()
+        }
+        self.default = default
+        self.memory_budget = memory_budget_MB * 1e6 if memory_budget_MB else None
+        self.smoke_batch = smoke_batch
+
+        # The lookup table of the routes, by the lowercase country or region
+        self.routes = {}
+        for name, model in models.items():
+            for region in model.get("regions", []):
+                self.routes[("region", region.lower())] = name
+            for country in model.get("countries", []):
+                self.routes[("country", country.lower())] = name
+
+        # The loaded models and their sizes, the least recently used first
+        self.loaded = OrderedDict()
+        # The versions of the files of the loaded models, and the new ones seen being written
+        self.versions = {}
+        self.pending = {}
+        self.metrics = {name: ModelMetrics() for name in models}
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        # The process the models are preloaded and watched in
+        self.started_pid = None
+        self.starting = threading.Lock()
+        self.watcher = None
+
+    @classmethod
+    def from_directory(cls, directory, smoke_batch=None):
+        file_path = os.path.join(directory, REGISTRY_FILE)
+
+        if not os.path.exists(file_path):
+            return cls(directory, {DEFAULT_MODEL: {"file": MODEL_FILE}}, smoke_batch=smoke_batch)
+
+        with open(file_path, "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+
+        return cls(
+            directory,
+            manifest["models"],
+            manifest.get("default", DEFAULT_MODEL),
+            manifest.get("memory_budget_MB"),
+            smoke_batch,
+        )
+
+    def route(self, country=None, region=None):
+        for key, value in (("country", country), ("region", region)):
+            if value is not None and not isinstance(value, str):
+                raise InvalidInput(f"the {key} is not a string")
+
+        if country:
+            name = self.routes.get(("country", country.lower()))
+            if name:
+                return name
+        if region:
+            name = self.routes.get(("region", region.lower()))
+            if name:
+                return name
+        return self.default
+
+    def preload(self):
+        size = 0
+        for name in sorted(self.files, key=lambda name: name != self.default):
+            model_size = os.path.getsize(self.files[name])
+            if name != self.default and self.memory_budget is not None \
+                    and size + model_size > self.memory_budget:
+                continue
+            self.get(name)
+            size += model_size
+
+    def get(self, name):
+        with self.lock:
+            if name in self.loaded:
+                self.loaded.move_to_end(name)
+                return self.loaded[name][0]
+
+        # Loaded without the lock, so the other models serve meanwhile
+        file_path = self.files[name]
+        version = get_version(file_path)
+        model = load_model_file(file_path)
+
+        with self.lock:
+            if name not in self.loaded:
+                self.loaded[name] = (model, version[1])
+                self.versions[name] = version
+                self.metrics[name].loads += 1
+            self.loaded.move_to_end(name)
+            self._evict(keep=name)
+            return self.loaded[name][0]
+
+    def _evict(self, keep):
+        if self.memory_budget is None:
+            return
+
+        size = sum(model_size for _, model_size in self.loaded.values())
+
+        for name in list(self.loaded):
+            if size <= self.memory_budget:
+                break
+            if name in (keep, self.default):
+                continue
+            size -= self.loaded.pop(name)[1]
+            self.versions.pop(name, None)
+            self.metrics[name].evictions += 1
+
+    def record(self, name, rows, seconds, error=False):
+        with self.lock:
+            metrics = self.metrics[name]
+            metrics.requests += 1
+            metrics.rows += rows
+            metrics.seconds += seconds
+            metrics.errors += error
+
+    def get_metrics(self):
+        with self.lock:
+            return {
+                name: {**metrics.to_dict(), "loaded": name in self.loaded}
+                for name, metrics in self.metrics.items()
+            }
+
+    def reload_changed(self):
+        with self.lock:
+            names = list(self.loaded)
+
+        for name in names:
+            try:
+                version = get_version(self.files[name])
+            except FileNotFoundError:
+                continue
+
+            if version == self.versions.get(name):
+                self.pending.pop(name, None)
+            # Loaded once the file is the same for two checks, no longer written
+            elif self.pending.get(name) != version:
+                self.pending[name] = version
+            else:
+                del self.pending[name]
+                self._reload(name, version)
+
+    def _reload(self, name, version):
+        with self.lock:
+            if name not in self.loaded:
+                return
+            old_model = self.loaded[name][0]
+
+        try:
+            model = load_model_file(self.files[name])
+            validate_model(model, get_n_features(old_model), self.smoke_batch)
+        except Exception as error:
+            logging.error(f"The new version of the model {name} is not served: {error!r}")
+            with self.lock:
+                # Not loaded again until the file changes
+                self.versions[name] = version
+                self.metrics[name].reload_errors += 1
+            return
+
+        # The running requests keep their reference to the old model
+        with self.lock:
+            if name in self.loaded:
+                self.loaded[name] = (model, version[1])
+                self.versions[name] = version
+                self.metrics[name].reloads += 1
+        logging.info(f"The new version of the model {name} is served")
+
+    def start(self, interval=WATCH_INTERVAL):
+        # Once per process, again in the processes forked by the WSGI server,
+        # as they don't inherit the watching thread
+        if self.started_pid == os.getpid():
+            return
+        with self.starting:
+            if self.started_pid == os.getpid():
+                return
+            self.preload()
+            self.watcher = self.start_watching(interval)
+            self.started_pid = os.getpid()
+
+    def start_watching(self, interval=WATCH_INTERVAL):
+        def watch():
+            while not self.stopped.wait(interval):
+                try:
+                    self.reload_changed()
+                except Exception:
+                    logging.exception("The models are not watched")
+
+        thread = threading.Thread(target=watch, name="model-watcher", daemon=True)
+        thread.start()
+        return thread
+
+    def stop_watching(self):
+        self.stopped.set()
@@ -6,6 +6,7 @@ ultimately indicating when the scraping for all countries has finished.
 """
 
 # Python
+import time
 import traceback
 import logging
 
@@ -13,22 +14,60 @@ import logging
 from scraper.config.get import get_config
 from scraper.scraper import scrape_data
 from scraper.jobs_to_csv.debugger.printer import print_current_date_time
+from scraper.telemetry.run_log import RunLog, new_run_log_path
 
 config = get_config()
 countries = config["locations"]["others"]
+jobs_number = 900
 
-for country in countries:
-    try:
-        scrape_data(debug_mode=False, location=country, jobs_number=900)
+with RunLog(new_run_log_path()) as run_log:
 
-    except SystemExit as _exit:
-        print(_exit)
+    run_log.event(
+        "run_start",
+        job_title=config['jobs_titles']['default'],
+        countries=countries,
+        jobs_number=jobs_number
+    )
 
-    # https://stackoverflow.com/a/4992124/12490791
-    except Exception as _error:
-        logging.error(traceback.format_exc(_error))
+    for country in countries:
 
-# scrape_data(debug_mode=False, jobs_number=900)
+        run_log.event("country_start", location=country)
+        start = time.perf_counter()
+
+        try:
+            scrape_data(
+                debug_mode=False,
+                location=country,
+                jobs_number=jobs_number,
+                profile_stages=True,
+                run_log=run_log
+            )
+
+        except SystemExit as _exit:
+            print(_exit)
+            is_completed = "successfully scraped" in str(_exit)
+            run_log.event(
+                "country_stop",
+                location=country,
+                outcome="completed" if is_completed else "terminated",
+                message=str(_exit),
+                elapsed_s=round(time.perf_counter() - start, 3)
+            )
+
+        # https://stackoverflow.com/a/4992124/12490791
+        except Exception as _error:
+            logging.error(traceback.format_exc())
+            run_log.event(
+                "country_stop",
+                location=country,
+                outcome="error",
+                message=repr(_error),
+                elapsed_s=round(time.perf_counter() - start, 3)
+            )
+
+    # scrape_data(debug_mode=False, jobs_number=900)
+
+    run_log.event("run_end")
 
 print(f"\rScraping for all countries has ended.")
 print_current_date_time("End")
@@ -0,0 +1,70 @@
+'''
+This module measures the memory of the clean dataset read back from the clean CSV file,
+with the object columns of `pd.read_csv` and with the typed columns of `cleaning.schema`.
+
+Usage:
+- python -m benchmarks.bench_clean_memory "data/clean/Data_Engineer/Data_Engineer_15-04-2023.csv"
+'''
+
+# Python
+import argparse
+import sys
+import time
+
+# External
+import pandas as pd
+
+# Internal
+from cleaning.schema import get_memory_usage, read_clean_csv
+from scraper.config.get import get_encoding
+
+
+def run_benchmark(file_path: str) -> pd.DataFrame:
+    '''
+    Reads the clean CSV file without and with the schema and compares the memory usage.
+
+    Args:
+    - file_path (str): The path to the clean CSV file.
+
+    Returns:
+    - pd.DataFrame: The memory in MB of each group of columns, untyped and typed,
+    with the total in the last row.
+    '''
+
+    start = time.perf_counter()
+    df_untyped = pd.read_csv(file_path, index_col=0, header=[0, 1], encoding=get_encoding())
+    time_untyped = time.perf_counter() - start
+
+    start = time.perf_counter()
+    df_typed = read_clean_csv(file_path)
+    time_typed = time.perf_counter() - start
+
+    report = pd.DataFrame({
+        'untyped_MB': get_memory_usage(df_untyped),
+        'typed_MB': get_memory_usage(df_typed),
+    }) / 1e6
+    report.loc['Total'] = report.sum()
+    report['reduction'] = 1 - report['typed_MB'] / report['untyped_MB']
+
+    print(f"{len(df_typed)} postings, read in {time_untyped:.2f}s untyped, "
+          f"{time_typed:.2f}s typed")
+
+    return report
+
+
+def main(args: list[str]):
+    '''Runs the benchmark with the command line arguments.'''
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_clean_memory",
+        description="Compare the memory of the clean dataset without and with the schema.")
+    parser.add_argument("file_path", help="the clean CSV file")
+    options = parser.parse_args(args)
+
+    report = run_benchmark(options.file_path)
+
+    print(report.to_string(float_format=lambda value: f"{value:.3f}"))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
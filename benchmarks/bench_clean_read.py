@@ -0,0 +1,71 @@
+'''
+This module measures loading the columns of the model building from the clean dataset:
+the whole clean CSV file against the selected columns of the Parquet file next to it.
+
+Usage:
+- python -m benchmarks.bench_clean_read "data/clean/Data_Engineer/Data_Engineer_15-04-2023.csv"
+'''
+
+# Python
+import argparse
+import sys
+import timeit
+
+# External
+import pandas as pd
+
+# Internal
+from cleaning.pipeline import get_path_parquet
+from cleaning.store import read_clean_parquet
+from scraper.config.get import get_encoding
+from training.dataset import BI_TOOLS_GROUP, COLUMNS_MODEL
+
+
+def run_benchmark(file_path: str, repeats: int = 10) -> dict[str, float]:
+    '''
+    Measures the mean time of loading the model building columns.
+
+    Args:
+    - file_path (str): The path to the clean CSV file.
+    - repeats (int): The number of loads measured.
+
+    Returns:
+    - dict[str, float]: The mean times in seconds of each way of loading.
+    '''
+
+    path_parquet = get_path_parquet(file_path)
+
+    loads = {
+        'csv_whole_file': lambda: pd.read_csv(
+            file_path, index_col=0, header=[0, 1], encoding=get_encoding()),
+        'parquet_columns': lambda: read_clean_parquet(
+            path_parquet, COLUMNS_MODEL + [BI_TOOLS_GROUP]),
+        'parquet_columns_single_country': lambda: read_clean_parquet(
+            path_parquet, COLUMNS_MODEL + [BI_TOOLS_GROUP], ["United States"]),
+    }
+
+    return {
+        name: timeit.timeit(load, number=repeats) / repeats
+        for name, load in loads.items()
+    }
+
+
+def main(args: list[str]):
+    '''Runs the benchmark with the command line arguments.'''
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_clean_read",
+        description="Compare loading the model columns from the clean CSV and Parquet files.")
+    parser.add_argument("file_path", help="the clean CSV file, with the Parquet file next to it")
+    parser.add_argument("--repeats", type=int, default=10, help="the number of loads measured")
+    options = parser.parse_args(args)
+
+    times = run_benchmark(options.file_path, options.repeats)
+
+    for name, seconds in times.items():
+        print(f"{name}: {seconds * 1000:.1f} ms "
+              f"({seconds / times['csv_whole_file']:.0%} of the CSV)")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
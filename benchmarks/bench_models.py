@@ -0,0 +1,330 @@
+'''
+This module benchmarks the stages of the model building of `_004_model_building.ipynb`:
+the features, the OLS of statsmodels, the linear regression, the Lasso alphas,
+the cross-validation of the random forest and the search of its parameters.
+
+Each stage is run on fixed data with fixed seeds: synthetic postings with the columns
+of the models table, or a snapshot of the clean dataset. Its wall time (the best of
+the repeats), its peak memory (of the allocations traced by `tracemalloc`, as NumPy's)
+and its MAE are appended to a JSON history. A stage is flagged as a regression if it is
+slower or takes more memory than the best of the previous runs on the same data
+beyond the threshold, or if its MAE is worse.
+
+Usage:
+- python -m benchmarks.bench_models
+- python -m benchmarks.bench_models --file-path "data/clean/Data_Engineer/Data_Engineer_15-04-2023.csv" --repeats 3
+'''
+
+# Python
+import argparse
+from datetime import datetime
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+
+# External
+import numpy as np
+import pandas as pd
+import statsmodels.api as sm
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.model_selection import cross_val_score
+
+# Internal
+from cleaning.stage_cache import hash_file
+from training.dataset import RANDOM_STATE, TARGET, split_train_test
+from training.encoding import CategoryEncoder
+from training.features import build_features
+from training.lasso import get_lasso_errors
+from training.search import N_FOLDS, SCORING, ScoreCache, search
+
+HISTORY_FILE = os.path.join(os.path.dirname(__file__), "history", "bench_models.json")
+# The runs compared with, the latest ones on the same data
+HISTORY_BASELINE_RUNS = 5
+THRESHOLD = 0.2
+MAE_TOLERANCE = 1e-3
+
+SYNTHETIC_ROWS = 3000
+# The categories of the models table, as many as in the clean dataset
+SYNTHETIC_CATEGORIES = {
+    'Country': 23, 'Seniority': 5, 'Employees': 8,
+    'Type_of_ownership': 11, 'Sector': 24, 'Revenue_USD': 10,
+}
+SYNTHETIC_FLAGS = [
+    'Employer_provided', 'Is_hourly', 'SQL', 'Python', 'Java', 'Scala', 'Microsoft_Azure',
+    'AWS', 'GPC', 'Databricks', 'Snowflake', 'Apache_Kafka', 'Apache_Spark', 'BI_Tools',
+]
+
+# A part of the grid of `training.search`, so the stage takes seconds
+PARAM_GRID = {'n_estimators': [10, 50], 'max_features': [1.0, 'sqrt']}
+
+
+def get_synthetic_frame(rows: int = SYNTHETIC_ROWS, seed: int = RANDOM_STATE) -> pd.DataFrame:
+    '''
+    Returns the synthetic models table, the same for the same seed: the categories
+    and the flags of the clean dataset, with the salary depending on them and a noise.
+    '''
+
+    random_state = np.random.RandomState(seed)
+
+    df = pd.DataFrame({
+        'Job_age': random_state.randint(1, 31, rows),
+        'Rating': np.round(random_state.uniform(1, 5, rows), 1),
+        'Company_age': random_state.randint(-1, 150, rows),
+    })
+
+    salary = np.full(rows, 60_000.0)
+
+    for column, n_categories in SYNTHETIC_CATEGORIES.items():
+        codes = random_state.randint(0, n_categories, rows)
+        df[column] = pd.Series([f"{column}_{code}" for code in codes], dtype=object)
+        salary += random_state.normal(0, 10_000, n_categories)[codes]
+
+    for column in SYNTHETIC_FLAGS:
+        df[column] = random_state.randint(0, 2, rows).astype(bool)
+        salary += random_state.normal(0, 5_000) * df[column]
+
+    df[TARGET] = salary + 1_000 * df['Rating'] + random_state.normal(0, 8_000, rows)
+
+    return df
+
+
+def _build_synthetic_features(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    '''Returns the encoded features and the target of the synthetic models table.'''
+
+    df_features = df.drop(columns=TARGET)
+
+    return CategoryEncoder().fit(df_features).transform(df_features), df[TARGET].to_numpy()
+
+
+def _fit_ols(X_train, X_test, y_train, y_test) -> float:
+    '''Fits the OLS as the notebook, with the constant, and returns its MAE on the test set.'''
+
+    results = sm.OLS(y_train, sm.add_constant(X_train, has_constant='add')).fit()
+    predictions = results.predict(sm.add_constant(X_test, has_constant='add'))
+
+    return float(np.abs(predictions - y_test).mean())
+
+
+def _cross_validate(estimator, X_train, y_train) -> float:
+    '''Returns the cross-validated MAE of the estimator, as the notebook.'''
+
+    return -float(np.mean(
+        cross_val_score(estimator, X_train, y_train, scoring=SCORING, cv=N_FOLDS)))
+
+
+def _search_forest(X_train, y_train, seed: int) -> float:
+    '''Searches the random forest parameters, without a cache, and returns the best MAE.'''
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = search(
+            RandomForestRegressor(random_state=seed), PARAM_GRID, X_train, y_train,
+            ScoreCache(os.path.join(directory, "scores.jsonl")), max_workers=1, verbose=False)
+
+    return -float(results['mean_score'].iloc[0])
+
+
+def get_stages(
+    X_train: np.ndarray,
+    X_test: np.ndarray,
+    y_train: np.ndarray,
+    y_test: np.ndarray,
+    seed: int
+) -> dict[str, Callable[[], float]]:
+    '''Returns the model stages, each one returning its MAE.'''
+
+    return {
+        'ols': lambda: _fit_ols(X_train, X_test, y_train, y_test),
+        'linear_regression': lambda: _cross_validate(LinearRegression(), X_train, y_train),
+        'lasso_alphas': lambda: -float(get_lasso_errors(X_train, y_train)['error'].max()),
+        'random_forest_cv': lambda: _cross_validate(
+            RandomForestRegressor(random_state=seed), X_train, y_train),
+        'grid_search': lambda: _search_forest(X_train, y_train, seed),
+    }
+
+
+def measure(stage: Callable[[], float | None], repeats: int) -> dict:
+    '''
+    Measures the stage: its best wall time of the repeats, its peak memory
+    in a separate run, as tracing the allocations slows it down, and its MAE.
+    '''
+
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        mae = stage()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        stage()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'time_s': round(min(times), 4),
+        'peak_MB': round(peak / 1e6, 3),
+        'mae': None if mae is None else round(mae, 4),
+    }
+
+
+def run_benchmark(
+    file_path: str | None = None,
+    repeats: int = 1,
+    seed: int = RANDOM_STATE,
+    rows: int = SYNTHETIC_ROWS
+) -> dict:
+    '''
+    Runs each model stage on the snapshot of the clean dataset or on the synthetic postings.
+
+    Args:
+    - file_path (str | None): The clean CSV file of the snapshot.
+    If None, synthetic postings are generated.
+    - repeats (int): The number of runs timed of each stage.
+    - seed (int): The seed of the synthetic postings and of the random forests.
+    - rows (int): The number of synthetic postings.
+
+    Returns:
+    - dict: The run, with the data and the time, the peak memory and the MAE of each stage.
+    '''
+
+    if file_path:
+        data = f"snapshot {hash_file(file_path)[:16]}"
+    else:
+        data = f"synthetic {rows} rows (seed {seed})"
+        df = get_synthetic_frame(rows, seed)
+
+    def build() -> tuple[np.ndarray, np.ndarray]:
+        if not file_path:
+            return _build_synthetic_features(df)
+        features = build_features(file_path)
+        return np.asarray(features.X), np.asarray(features.y)
+
+    def build_stage() -> None:
+        build()
+
+    stages = {'features': measure(build_stage, repeats)}
+
+    X, y = build()
+    X = X.astype(np.float64)
+
+    X_train, X_test, y_train, y_test = split_train_test(X, y)
+
+    for name, stage in get_stages(X_train, X_test, y_train, y_test, seed).items():
+        stages[name] = measure(stage, repeats)
+        print(f"{name}: {stages[name]}")
+
+    return {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'data': data,
+        'shape': list(X.shape),
+        'repeats': repeats,
+        'stages': stages,
+    }
+
+
+def load_history(history_path: str) -> list[dict]:
+    '''Returns the previous runs, none if the history doesn't exist yet or is empty.'''
+
+    if not os.path.exists(history_path) or not os.path.getsize(history_path):
+        return []
+
+    with open(history_path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_history(history: list[dict], history_path: str):
+    '''Saves the runs, replacing the history at once.'''
+
+    os.makedirs(os.path.dirname(history_path) or ".", exist_ok=True)
+
+    temporary = f"{history_path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as file:
+        json.dump(history, file, indent=2)
+    os.replace(temporary, history_path)
+
+
+def find_regressions(run: dict, history: list[dict], threshold: float = THRESHOLD) -> list[str]:
+    '''
+    Compares the run with the best of the latest previous runs on the same data.
+
+    Args:
+    - run (dict): The run, as returned by `run_benchmark`.
+    - history (list[dict]): The previous runs.
+    - threshold (float): The part of the time or of the memory over the best one flagged,
+    e.g. 0.2 for 20% slower.
+
+    Returns:
+    - list[str]: The description of each regression, none if there is no previous run.
+    '''
+
+    baseline = [previous for previous in history if previous['data'] == run['data']]
+    baseline = baseline[-HISTORY_BASELINE_RUNS:]
+
+    regressions = []
+
+    for name, current in run['stages'].items():
+        previous = [
+            previous_run['stages'][name]
+            for previous_run in baseline if name in previous_run['stages']
+        ]
+        if not previous:
+            continue
+
+        for metric in ('time_s', 'peak_MB'):
+            best = min(stage[metric] for stage in previous)
+            if current[metric] > best * (1 + threshold):
+                regressions.append(
+                    f"{name}: {metric} {current[metric]} > {best} (+{threshold:.0%})")
+
+        maes = [stage['mae'] for stage in previous if stage['mae'] is not None]
+        if current['mae'] is not None and maes:
+            best = min(maes)
+            if current['mae'] > best * (1 + MAE_TOLERANCE):
+                regressions.append(f"{name}: mae {current['mae']} > {best}")
+
+    return regressions
+
+
+def main(args: list[str]):
+    '''Runs the benchmark, adds it to the history and exits with 1 on a regression.'''
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_models",
+        description="Benchmark the model building stages and flag the regressions.")
+    parser.add_argument("--file-path", default=None,
+                        help="the clean CSV file of the snapshot, synthetic if omitted")
+    parser.add_argument("--repeats", type=int, default=1,
+                        help="number of runs timed of each stage, the best is kept")
+    parser.add_argument("--seed", type=int, default=RANDOM_STATE)
+    parser.add_argument("--rows", type=int, default=SYNTHETIC_ROWS,
+                        help="number of synthetic postings")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="part of the time or of the memory over the best run flagged")
+    parser.add_argument("--history", default=HISTORY_FILE, help="the JSON file of the runs")
+    options = parser.parse_args(args)
+
+    if options.file_path and not os.path.exists(options.file_path):
+        sys.exit(f"The clean CSV file doesn't exist:\n{options.file_path}")
+
+    run = run_benchmark(options.file_path, options.repeats, options.seed, options.rows)
+
+    history = load_history(options.history)
+    regressions = find_regressions(run, history, options.threshold)
+    run['regressions'] = regressions
+
+    save_history(history + [run], options.history)
+
+    print(json.dumps(run, indent=4))
+
+    if regressions:
+        sys.exit("Regressions:\n" + "\n".join(regressions))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,154 @@
+'''
+This module benchmarks GlassdoorJobScraper end to end against the local
+fake glassdoor server, so each pacing or extraction change
+can be measured with a reproducible number of jobs per second.
+
+Usage:
+- python -m benchmarks.bench_scraper --jobs 60 --latency 0.05 --pop-up-every 10
+'''
+
+# Python
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Internal
+from scraper.config.get import get_config
+from scraper.jobs_to_csv.CSV_Writer import CSV_Writer
+from scraper.jobs_to_csv.jobs_to_csv import GlassdoorJobScraper
+from scraper.jobs_to_csv.webpage_getter._driver_getter import get_driver
+from test.fake_glassdoor import FakeGlassdoorServer, load_postings, synthetic_postings
+
+config = get_config()
+
+
+def run_benchmark(
+    jobs_number: int,
+    driver_path: str = config['driver_path'],
+    postings_csv: str | None = None,
+    jobs_per_page: int = 30,
+    latency: float = 0.0,
+    pop_up_every: int = 0,
+    seed: int = 0,
+    profile_stages: bool = False
+) -> dict:
+    '''
+    Scrapes the fake glassdoor server and measures the throughput of the scraper.
+
+    Args:
+    - jobs_number (int): The number of jobs to scrape.
+    - driver_path (str): The path to the driver of the selected web browser.
+    - postings_csv (str | None): The RAW CSV with recorded postings to serve.
+    If None, synthetic postings are served.
+    - jobs_per_page (int): The number of job buttons on a single page.
+    - latency (float): The delay in seconds added to each served request.
+    - pop_up_every (int): Every n-th opened posting shows a pop-up. `0` disables pop-ups.
+    - seed (int): The seed of the synthetic postings.
+    - profile_stages (bool): Whether to add the per-stage timings to the result.
+
+    Returns:
+    - dict: The benchmark result with the number of written jobs,
+    the elapsed time and the jobs per second.
+    '''
+
+    if postings_csv:
+        postings = load_postings(postings_csv)
+    else:
+        # one extra page, the scraper writes one posting above the target
+        postings = synthetic_postings(jobs_number + jobs_per_page, seed)
+
+    with FakeGlassdoorServer(
+        postings, jobs_per_page, latency, pop_up_every
+    ) as server, tempfile.TemporaryDirectory() as directory:
+
+        driver = get_driver(False, driver_path)
+        driver.get(server.url)
+
+        scraper = GlassdoorJobScraper(
+            "Benchmark", "Fake Glassdoor", jobs_number, False, driver, profile_stages)
+        scraper.csv_writer = CSV_Writer(
+            os.path.join(directory, "benchmark.csv"), "Fake Glassdoor")
+
+        start = time.perf_counter()
+
+        try:
+            scraper.save_jobs_to_csv_raw()
+        except SystemExit as exit_msg:
+            # no more pages on the fake server
+            print(exit_msg)
+        finally:
+            elapsed = time.perf_counter() - start
+            driver.quit()
+
+        jobs_written = scraper.csv_writer.counter
+
+        result = {
+            'jobs_written': jobs_written,
+            'elapsed_s': round(elapsed, 3),
+            'jobs_per_second': round(jobs_written / elapsed, 4) if elapsed else 0.0,
+            'requests_served': server.requests_served,
+            'latency_s': latency,
+            'pop_up_every': pop_up_every,
+            'jobs_per_page': jobs_per_page,
+            'postings': "recorded" if postings_csv else f"synthetic (seed {seed})",
+        }
+
+        if profile_stages:
+            result['stage_timings'] = scraper.stage_timer.summary()
+
+        return result
+
+
+def _parse_args(args: list[str]) -> argparse.Namespace:
+    '''Parses the command line arguments of the benchmark.'''
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark the scraper against the local fake glassdoor server.")
+    parser.add_argument("--jobs", type=int, default=60,
+                        help="number of jobs to scrape")
+    parser.add_argument("--driver-path", default=config['driver_path'],
+                        help="path to the browser driver or 'auto-install'")
+    parser.add_argument("--postings-csv", default=None,
+                        help="RAW CSV with recorded postings, synthetic if omitted")
+    parser.add_argument("--jobs-per-page", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="seconds added to each served request")
+    parser.add_argument("--pop-up-every", type=int, default=0,
+                        help="show a pop-up every n-th posting, 0 disables")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--profile-stages", action="store_true",
+                        help="add the per-stage timings to the result")
+    parser.add_argument("--output", default=None,
+                        help="JSON file to write the result to")
+
+    return parser.parse_args(args)
+
+
+def main(args: list[str]):
+    '''Runs the benchmark and prints its result.'''
+
+    options = _parse_args(args)
+
+    result = run_benchmark(
+        options.jobs,
+        options.driver_path,
+        options.postings_csv,
+        options.jobs_per_page,
+        options.latency,
+        options.pop_up_every,
+        options.seed,
+        options.profile_stages
+    )
+
+    print(json.dumps(result, indent=4))
+
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as file:
+            json.dump(result, file, indent=4)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,64 @@
+'''
+Cleans the RAW CSV files of a job title into a single clean CSV file.
+
+Usage:
+- python -m cleaning
+- python -m cleaning "data/RAW/Data Engineer" --workers 4
+- python -m cleaning --stats
+'''
+# Python
+import argparse
+import os
+import sys
+import time
+
+# Internal
+from cleaning.pipeline import get_path_parquet, run_pipeline
+from cleaning.unique_apply import format_stats, get_stats
+from scraper.config.get import get_config
+
+
+def main(args: list[str]):
+    '''Runs the cleaning pipeline with the command line arguments.'''
+
+    config = get_config()
+    default_directory = os.path.join(
+        config['output_path']['main'],
+        config['output_path']['raw'],
+        config['jobs_titles']['default']
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="python -m cleaning",
+        description="Clean the RAW CSV files of a job title, a process per country.")
+    parser.add_argument("directory", nargs="?", default=default_directory,
+                        help=f"the RAW CSV files directory, default: {default_directory}")
+    parser.add_argument("--job-title",
+                        help="the job title in the file names, default: the directory name")
+    parser.add_argument("--output", help="the clean CSV file path")
+    parser.add_argument("--workers", type=int,
+                        help="the number of processes, default: the number of CPUs")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="clean all the countries from scratch, without the stages cache")
+    parser.add_argument("--stats", action="store_true",
+                        help="print how many calls were saved by cleaning the distinct values")
+    options = parser.parse_args(args)
+
+    start = time.perf_counter()
+
+    try:
+        output_path = run_pipeline(
+            options.directory, options.job_title, options.output, options.workers,
+            not options.no_cache)
+    except FileNotFoundError as error:
+        sys.exit(str(error))
+
+    print(f"Cleaned in {time.perf_counter() - start:.1f}s:\n{output_path}\n"
+          f"{get_path_parquet(output_path)}")
+
+    if options.stats:
+        print(format_stats(get_stats()))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,142 @@
+'''
+This module contains the columns of the clean dataset: the renamed columns
+of the cleaning stages and the order of the final columns with their groups.
+'''
+
+COLUMNS_RENAMED = {
+    'Company_name': 'Name',
+    'Job_title': 'Title',
+    'Salary_min': 'Min',
+    'Salary_max': 'Max',
+    'Salary_avg': 'Avg',
+    'Salary_currency': 'Currency',
+    'Is_salary': 'Specified',
+    'Salary_employer_provided': 'Employer_provided',
+    'Salary_hourly': 'Is_hourly',
+    'Alibaba_Cloud': 'Alibaba',
+    'Oracle_Cloud': 'Oracle',
+    'IBM_cloud': 'IBM',
+    'Tencent_cloud': 'Tencent',
+    'DigitalOcean_cloud': 'DigitalOcean',
+    'Lincode_cloud': 'Lincode',
+}
+
+# (group, column) in the order of the clean CSV file
+COLUMNS_MULTIINDEX = [
+    ('Job_details', 'Title'),
+    ('Job_details', 'Description'),
+    ('Job_details', 'Is_contract'),
+    ('Job_details', 'Seniority'),
+    ('Job_details', 'City'),
+    ('Job_details', 'State'),
+    ('Job_details', 'Country'),
+    ('Job_details', 'Region'),
+    ('Job_details', 'Job_age'),
+    ('Job_details', 'Easy_apply'),
+    ('Salary', 'Min'),
+    ('Salary', 'Max'),
+    ('Salary', 'Avg'),
+    ('Salary', 'Currency'),
+    ('Salary', 'Employer_provided'),
+    ('Salary', 'Is_hourly'),
+    ('Salary', 'Specified'),
+    ('Company_info', 'Name'),
+    ('Company_info', 'Rating'),
+    ('Company_info', 'Employees'),
+    ('Company_info', 'Type_of_ownership'),
+    ('Company_info', 'Sector'),
+    ('Company_info', 'Industry'),
+    ('Company_info', 'Company_age'),
+    ('Company_info', 'Revenue_USD'),
+    ('Company_info', 'Friend_recommend'),
+    ('Company_info', 'CEO_approval'),
+    ('Company_info', 'Career_opportunities'),
+    ('Company_info', 'Comp_&_benefits'),
+    ('Company_info', 'Senior_management'),
+    ('Company_info', 'Work/Life_balance'),
+    ('Company_info', 'Culture_&_values'),
+    ('Company_info', 'Pros'),
+    ('Company_info', 'Cons'),
+    ('Company_info', 'Benefits_rating'),
+    ('Company_info', 'Benefits_reviews'),
+    ('Education', 'BA'),
+    ('Education', 'MS'),
+    ('Education', 'Phd'),
+    ('Education', 'Certificate'),
+    ('Version_control', 'Git_SVN'),
+    ('Cloud_platforms', 'AWS'),
+    ('Cloud_platforms', 'Microsoft_Azure'),
+    ('Cloud_platforms', 'GPC'),
+    ('Cloud_platforms', 'Alibaba'),
+    ('Cloud_platforms', 'Oracle'),
+    ('Cloud_platforms', 'IBM'),
+    ('Cloud_platforms', 'Tencent'),
+    ('Cloud_platforms', 'OVHcloud'),
+    ('Cloud_platforms', 'DigitalOcean'),
+    ('Cloud_platforms', 'Lincode'),
+    ('RDBMS', 'PostgreSQL'),
+    ('RDBMS', 'Microsoft_SQL_Server'),
+    ('RDBMS', 'IBM_Db2'),
+    ('RDBMS', 'MySQL'),
+    ('RDBMS', 'Oracle_PL_SQL'),
+    ('NOSQL', 'MongoDB'),
+    ('NOSQL', 'Cassandra'),
+    ('NOSQL', 'Amazon_DynamoDB'),
+    ('NOSQL', 'Neo4j'),
+    ('Search_&_Analytics', 'Apache_Solr'),
+    ('Search_&_Analytics', 'Amazon_Redshift'),
+    ('Search_&_Analytics', 'Google_BigQuery'),
+    ('Search_&_Analytics', 'Snowflake'),
+    ('Search_&_Analytics', 'Oracle_Exadata'),
+    ('Search_&_Analytics', 'SAP_HANA'),
+    ('Search_&_Analytics', 'Teradata'),
+    ('Data_integration_and_processing', 'Informatica_PowerCenter'),
+    ('Data_integration_and_processing', 'Databricks'),
+    ('Data_integration_and_processing', 'Presto'),
+    ('Stream_processing_tools', 'Apache_Kafka'),
+    ('Stream_processing_tools', 'Apache_Flink'),
+    ('Stream_processing_tools', 'Dataflow'),
+    ('Workflow_orchestration_tools', 'Apache_Airflow'),
+    ('Workflow_orchestration_tools', 'Luigi'),
+    ('Workflow_orchestration_tools', 'SSIS'),
+    ('Big_Data_processing', 'Apache_Hadoop'),
+    ('Big_Data_processing', 'Apache_Hive'),
+    ('Big_Data_processing', 'Apache_Spark'),
+    ('OS', 'Linux'),
+    ('OS', 'Unix'),
+    ('OS', 'Windows'),
+    ('OS', 'macOS'),
+    ('Programming_languages', 'Python'),
+    ('Programming_languages', 'R'),
+    ('Programming_languages', 'Scala'),
+    ('Programming_languages', 'Julia'),
+    ('Programming_languages', 'SQL'),
+    ('Programming_languages', 'Java'),
+    ('Programming_languages', 'C++'),
+    ('Programming_languages', 'Go'),
+    ('Programming_languages', 'Rust'),
+    ('Programming_languages', 'Bash'),
+    ('Programming_languages', 'PowerShell'),
+    ('Programming_languages', 'CLI'),
+    ('Business_Intelligence_Tools', 'Tableau'),
+    ('Business_Intelligence_Tools', 'Power_BI'),
+    ('Business_Intelligence_Tools', 'Google_Analytics'),
+    ('Business_Intelligence_Tools', 'QlikView'),
+    ('Business_Intelligence_Tools', 'Oracle_BI_server'),
+    ('Business_Intelligence_Tools', 'SAS_Analytics'),
+    ('Business_Intelligence_Tools', 'Lumira'),
+    ('Business_Intelligence_Tools', 'Cognos_Impromptu'),
+    ('Business_Intelligence_Tools', 'MicroStrategy'),
+    ('Business_Intelligence_Tools', 'InsightSquared'),
+    ('Business_Intelligence_Tools', 'Sisense'),
+    ('Business_Intelligence_Tools', 'Dundas_BI'),
+    ('Business_Intelligence_Tools', 'Domo'),
+    ('Business_Intelligence_Tools', 'Looker'),
+    ('Business_Intelligence_Tools', 'Excel'),
+    ('Machine_Learning_Frameworks', 'Scikit'),
+    ('Machine_Learning_Frameworks', 'TensorFlow'),
+    ('Machine_Learning_Frameworks', 'PyTorch'),
+    ('Machine_Learning_Frameworks', 'Keras'),
+    ('Machine_Learning_Frameworks', 'SciPy'),
+    ('Machine_Learning_Frameworks', 'OpenCV'),
+]
@@ -0,0 +1,368 @@
+'''
+This module geocodes the job locations (country, state, city) into their latitudes
+and longitudes, e.g. for the job density map of the EDA, saved as
+"data/clean/_Socioeconomic data/geopositioning.csv".
+
+Every place is looked up once: the coordinates are kept in a SQLite cache keyed by
+the normalized place, and only the distinct places missing from the cache are looked up,
+in batches saved to the cache one after another. So an interrupted run resumes where it
+stopped and a re-run makes no lookups for the places already seen. The places not found
+are cached too, without coordinates, so they are not looked up again; their coordinates
+can be set by hand with `GeocodeCache.put`.
+
+The places are merged into the geopositioning file by place: its rows, e.g. of the other
+clean files or with the coordinates fixed by hand, are kept, the new places are added
+after them, and only the saved places without coordinates get the ones found.
+
+The lookups are done by a geocoder: `NominatimGeocoder` (OpenStreetMap, over the network)
+or `GazetteerGeocoder`, reading the coordinates from a CSV file, e.g. the saved
+geopositioning file, without the network.
+
+Usage:
+- python -m cleaning.geocode "data/clean/Data_Engineer/Data_Engineer_15-04-2023.csv"
+- python -m cleaning.geocode "data/clean/Data_Engineer/Data_Engineer_15-04-2023.csv"
+--gazetteer "data/clean/_Socioeconomic data/geopositioning.csv"
+'''
+# Python
+from abc import ABC, abstractmethod
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from typing import Iterator
+
+# External
+import pandas as pd
+
+# Internal
+from cleaning.pipeline import get_path_parquet
+from cleaning.socioeconomic import get_path_socioeconomic
+from cleaning.store import read_clean_parquet
+
+GEOPOSITIONING_FILE = "geopositioning.csv"
+CACHE_FILE = "geocode_cache.sqlite"
+PLACE_COLUMNS = ['Country', 'State', 'City']
+BATCH_SIZE = 50
+# The places of a cache query, 3 parameters each, below the 999 of the older SQLite versions
+QUERY_SIZE = 300
+
+Place = tuple[str, str, str]
+Coordinates = tuple[float, float] | None
+
+
+def normalize_place(country, state, city) -> Place:
+    '''
+    Returns the place as the cache key: stripped, lower case, with the underscores as spaces
+    and the missing values as empty strings, e.g. ("united states", "ca", "san jose").
+    '''
+
+    return tuple(
+        "" if pd.isna(part) else " ".join(str(part).replace("_", " ").split()).lower()
+        for part in (country, state, city)
+    )  # type: ignore
+
+
+def get_location(country, state, city) -> str | None:
+    '''
+    Returns the address of the place looked up, e.g. "United States, CA, San Jose",
+    or None if the place is unknown or remote.
+    '''
+
+    parts = ["" if pd.isna(part) else str(part).strip() for part in (country, state, city)]
+
+    if parts[2] == "Remote" or not any(parts):
+        return None
+
+    return ", ".join(part for part in parts if part)
+
+
+class Geocoder(ABC):
+    '''The base of the geocoders, which look up the coordinates of the places.'''
+
+    @abstractmethod
+    def geocode(self, places: dict[Place, str]) -> dict[Place, Coordinates]:
+        '''
+        Looks up the coordinates of the places.
+
+        Args:
+        - places (dict[Place, str]): The addresses of the normalized places.
+
+        Returns:
+        - dict[Place, Coordinates]: The latitude and longitude of each place,
+        or None if it is not found.
+        '''
+
+
+class NominatimGeocoder(Geocoder):
+    '''
+    Looks up the places in OpenStreetMap with Nominatim, a request per second at most,
+    as its usage policy requires.
+
+    Args:
+    - user_agent (str): The name of the application sending the requests.
+    - min_delay_seconds (float): The minimal delay between the requests.
+    '''
+
+    def __init__(self, user_agent: str = "DS_salaries_project", min_delay_seconds: float = 1):
+
+        # Imported only when the network is used
+        from geopy.extra.rate_limiter import RateLimiter
+        from geopy.geocoders import Nominatim
+
+        self._geocode = RateLimiter(
+            Nominatim(user_agent=user_agent).geocode, min_delay_seconds=min_delay_seconds)
+
+    def geocode(self, places: dict[Place, str]) -> dict[Place, Coordinates]:
+
+        coordinates = {}
+
+        for place, address in places.items():
+            location = self._geocode(address)
+            coordinates[place] = (location.latitude, location.longitude) if location else None
+
+        return coordinates
+
+
+class GazetteerGeocoder(Geocoder):
+    '''
+    Looks up the places in a CSV file with the Country, State, City, Latitude
+    and Longitude columns, e.g. the saved geopositioning file.
+
+    Args:
+    - file_path (str): The path to the CSV file.
+    '''
+
+    def __init__(self, file_path: str):
+
+        gazetteer = pd.read_csv(file_path)
+
+        self.coordinates: dict[Place, Coordinates] = {
+            normalize_place(*row[PLACE_COLUMNS]): (
+                None if pd.isna(row['Latitude']) else (row['Latitude'], row['Longitude']))
+            for _, row in gazetteer.iterrows()
+        }
+
+    def geocode(self, places: dict[Place, str]) -> dict[Place, Coordinates]:
+
+        return {place: self.coordinates.get(place) for place in places}
+
+
+class GeocodeCache:
+    '''
+    The coordinates of the places already looked up, in a SQLite file.
+
+    Args:
+    - file_path (str): The path to the SQLite file, created if it doesn't exist.
+    '''
+
+    def __init__(self, file_path: str):
+
+        self.connection = sqlite3.connect(file_path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS places ("
+            "country TEXT, state TEXT, city TEXT, latitude REAL, longitude REAL, "
+            "PRIMARY KEY (country, state, city))"
+        )
+
+    def get(self, places: list[Place]) -> dict[Place, Coordinates]:
+        '''
+        Returns the coordinates of the cached places, None for the places not found.
+        Only the requested places are read, by the key of the table, a query per
+        `QUERY_SIZE` places, so a warm cache stays cheap as it grows.
+        '''
+
+        cached = {}
+
+        for start in range(0, len(places), QUERY_SIZE):
+            chunk = places[start:start + QUERY_SIZE]
+            rows = self.connection.execute(
+                f"WITH requested(country, state, city) AS "
+                f"(VALUES {', '.join(['(?, ?, ?)'] * len(chunk))}) "
+                "SELECT country, state, city, latitude, longitude "
+                "FROM requested JOIN places USING (country, state, city)",
+                [part for place in chunk for part in place]
+            ).fetchall()
+
+            cached.update({
+                (country, state, city): None if latitude is None else (latitude, longitude)
+                for country, state, city, latitude, longitude in rows
+            })
+
+        return cached
+
+    def put(self, coordinates: dict[Place, Coordinates]):
+        '''Saves the coordinates of the places, replacing the cached ones.'''
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO places VALUES (?, ?, ?, ?, ?)",
+                [
+                    (*place, *(place_coordinates or (None, None)))
+                    for place, place_coordinates in coordinates.items()
+                ]
+            )
+
+    def close(self):
+        '''Closes the SQLite file.'''
+
+        self.connection.close()
+
+
+def _batch(places: dict[Place, str], batch_size: int) -> Iterator[dict[Place, str]]:
+    '''Yields the places in batches of the size.'''
+
+    items = list(places.items())
+
+    for start in range(0, len(items), batch_size):
+        yield dict(items[start:start + batch_size])
+
+
+def geocode_places(
+    df: pd.DataFrame,
+    cache: GeocodeCache,
+    geocoder: Geocoder,
+    batch_size: int = BATCH_SIZE
+) -> pd.DataFrame:
+    '''
+    Adds the Location, Latitude and Longitude columns to the places, looking up
+    only the distinct places missing from the cache.
+
+    Args:
+    - df (pd.DataFrame): The places with the Country, State and City columns.
+    - cache (GeocodeCache): The coordinates of the places already looked up.
+    - geocoder (Geocoder): The lookups of the missing places.
+    - batch_size (int): The number of places looked up before saving them to the cache.
+
+    Returns:
+    - pd.DataFrame: The places with the address and the coordinates, NaN if not found.
+    '''
+
+    df = df.copy()
+    df['Location'] = [get_location(*row) for row in df[PLACE_COLUMNS].itertuples(index=False)]
+
+    keys = [normalize_place(*row) for row in df[PLACE_COLUMNS].itertuples(index=False)]
+    addresses = {
+        key: location
+        for key, location in zip(keys, df['Location'])
+        if location is not None
+    }
+
+    coordinates = cache.get(list(addresses))
+    missing = {key: address for key, address in addresses.items() if key not in coordinates}
+
+    for batch in _batch(missing, batch_size):
+        found = geocoder.geocode(batch)
+        cache.put(found)
+        coordinates.update(found)
+
+    places_coordinates = [coordinates.get(key) or (float('nan'), float('nan')) for key in keys]
+    df['Latitude'] = [latitude for latitude, _ in places_coordinates]
+    df['Longitude'] = [longitude for _, longitude in places_coordinates]
+
+    return df
+
+
+def get_places(file_path: str) -> pd.DataFrame:
+    '''
+    Returns the distinct places of the clean postings, with their regions.
+
+    Args:
+    - file_path (str): The path to the clean CSV file, with the Parquet file next to it.
+
+    Returns:
+    - pd.DataFrame: The Region, Country, State and City of each place with a city.
+    '''
+
+    columns = [('Job_details', column) for column in ['Region'] + PLACE_COLUMNS]
+    df = read_clean_parquet(get_path_parquet(file_path), columns)
+    df.columns = df.columns.droplevel(0)
+
+    places = df.astype(object).where(df.notna(), None).drop_duplicates()
+    places = places.dropna(subset=['City'])
+
+    return places.reset_index(drop=True)
+
+
+def merge_geopositioning(places: pd.DataFrame, file_path: str) -> pd.DataFrame:
+    '''
+    Merges the geocoded places into the geopositioning file by place, so the places
+    of the other clean files and the coordinates fixed by hand are kept.
+
+    Args:
+    - places (pd.DataFrame): The geocoded places, as returned by `geocode_places`.
+    - file_path (str): The geopositioning CSV file, not necessarily existing yet.
+
+    Returns:
+    - pd.DataFrame: The places of the file, with the coordinates found for the ones
+    without them, and the new places after them.
+    '''
+
+    if not os.path.exists(file_path):
+        saved = places.iloc[:0]
+    else:
+        saved = pd.read_csv(file_path)
+
+    saved_keys = [normalize_place(*row) for row in saved[PLACE_COLUMNS].itertuples(index=False)]
+    keys = [normalize_place(*row) for row in places[PLACE_COLUMNS].itertuples(index=False)]
+    found = {
+        key: (latitude, longitude)
+        for key, latitude, longitude in zip(keys, places['Latitude'], places['Longitude'])
+        if not pd.isna(latitude)
+    }
+
+    # The saved coordinates are kept, only the missing ones are filled
+    for index, key in enumerate(saved_keys):
+        if pd.isna(saved.at[index, 'Latitude']) and key in found:
+            saved.loc[index, ['Latitude', 'Longitude']] = found[key]
+
+    # A place written differently is added once
+    seen = set(saved_keys)
+    is_new = []
+    for key in keys:
+        is_new.append(key not in seen)
+        seen.add(key)
+    new_places = places[is_new]
+
+    return pd.concat([saved, new_places], ignore_index=True)
+
+
+def main(args: list[str]):
+    '''Geocodes the places of the clean postings with the command line arguments.'''
+
+    parser = argparse.ArgumentParser(
+        prog="python -m cleaning.geocode",
+        description="Geocode the places of the clean postings, looking up only the new ones.")
+    parser.add_argument("file_path", help="the clean CSV file, with the Parquet file next to it")
+    parser.add_argument("--output", default=get_path_socioeconomic(GEOPOSITIONING_FILE),
+                        help="the geopositioning CSV file, the new places merged into it")
+    parser.add_argument("--cache", default=get_path_socioeconomic(CACHE_FILE),
+                        help="the SQLite cache of the coordinates")
+    parser.add_argument("--gazetteer",
+                        help="a CSV file with the coordinates to use instead of Nominatim")
+    options = parser.parse_args(args)
+
+    if not os.path.exists(options.file_path):
+        sys.exit(f"The clean CSV file doesn't exist:\n{options.file_path}")
+
+    geocoder = GazetteerGeocoder(options.gazetteer) if options.gazetteer \
+        else NominatimGeocoder()
+
+    start = time.perf_counter()
+
+    cache = GeocodeCache(options.cache)
+    try:
+        places = geocode_places(get_places(options.file_path), cache, geocoder)
+    finally:
+        cache.close()
+
+    merged = merge_geopositioning(places, options.output)
+    merged.to_csv(options.output, index=False)
+
+    print(f"Geocoded {len(places)} places in {time.perf_counter() - start:.1f}s, "
+          f"{places['Latitude'].isna().sum()} not found, "
+          f"{len(merged)} places in:\n{options.output}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,95 @@
+'''
+This module provides a matcher of many keywords categories in a single scan of a text.
+
+The keywords are regular expressions matched between word boundaries and ignoring case,
+the same as `re.search(r"\\b" + keyword + r"\\b", text, re.IGNORECASE)`.
+Instead of a search for each keyword, all keywords are compiled into a single
+alternation, which finds the positions where any keyword starts. Only at those positions
+the categories are checked, so the text is scanned once for all categories.
+'''
+# Python
+import re
+from typing import Hashable, Iterable
+
+
+def _alternation(keywords: Iterable[str]) -> str:
+    '''Returns the pattern matching any of the keywords between word boundaries.'''
+
+    return r"\b(?:" + "|".join(f"(?:{keyword})" for keyword in keywords) + r")\b"
+
+
+class KeywordMatcher:
+    '''
+    Finds which categories of keywords are in a text.
+
+    Args:
+    - categories (dict[Hashable, list[str]]): The keywords, as regular expressions,
+    of each category.
+    - flags (int): The flags of the regular expressions. Default is `re.IGNORECASE`.
+    '''
+
+    def __init__(self, categories: dict[Hashable, list[str]], flags: int = re.IGNORECASE):
+
+        self.categories = list(categories)
+
+        self._patterns = [
+            (category, re.compile(_alternation(keywords), flags))
+            for category, keywords in categories.items()
+            if keywords
+        ]
+
+        all_keywords = [keyword for keywords in categories.values() for keyword in keywords]
+
+        # A zero-width lookahead finds also the keywords overlapping each other
+        self._candidates = re.compile(
+            "(?=" + _alternation(all_keywords) + ")", flags) if all_keywords else None
+
+    def find(self, text: str) -> set[Hashable]:
+        '''
+        Returns the categories whose any keyword is in the text.
+
+        Args:
+        - text (str): The text to search.
+
+        Returns:
+        - set[Hashable]: The matched categories.
+        '''
+
+        matched: set[Hashable] = set()
+
+        if self._candidates is None or not isinstance(text, str):
+            return matched
+
+        remaining = self._patterns
+
+        for candidate in self._candidates.finditer(text):
+            position = candidate.start()
+
+            not_matched = []
+            for category, pattern in remaining:
+                if pattern.match(text, position):
+                    matched.add(category)
+                else:
+                    not_matched.append((category, pattern))
+
+            remaining = not_matched
+            if not remaining:
+                break
+
+        return matched
+
+    def find_first(self, text: str, categories: Iterable[Hashable]) -> Hashable | None:
+        '''
+        Returns the first of the given categories found in the text.
+
+        Args:
+        - text (str): The text to search.
+        - categories (Iterable[Hashable]): The categories in the order of priority.
+
+        Returns:
+        - Hashable | None: The first matched category or None.
+        '''
+
+        matched = self.find(text)
+
+        return next((category for category in categories if category in matched), None)
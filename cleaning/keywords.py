@@ -0,0 +1,1418 @@
+'''
+This module contains the keywords searched for in the job postings by the cleaning stages:
+the languages spoken in each scraped country, the job titles of data engineering,
+the remote and contract terms, the seniorities, the technologies, the certificates
+and the education levels. Their translations are keyed by the language name.
+
+The keywords are regular expressions matched between word boundaries and ignoring case,
+except the job titles terms, which are matched as plain substrings.
+'''
+
+# Languages of the job postings in each country, besides English
+COUNTRIES_LANGUAGES = {
+    'Austria': ["German"],
+    'Belgium': ["French", "Dutch", "German"],
+    'Canada': ["French"],
+    # By Glassdoor it is also Slovakia
+    'Czech_Republic': ["Czech", "Slovakian", "Hungarian"],
+    'Denmark': ["Danish"],
+    'Finland': ["Finnish", "Swedish"],
+    'France': ["French", "Catalan", "Italian", "Basque"],
+    'Germany': ["German"],
+    'Greece': ["Greek"],
+    'Hungary': ["Hungarian", "Romanian"],
+    # Irish is almost not spoken
+    'Ireland': [],
+    'Israel': ["Hebrew", "Arabic"],
+    'Italy': ["Italian", "German", "French", "Catalan", "Greek", "Slovenian"],
+    'Luxembourg': ["German", "French"],
+    'Netherlands': ["Dutch", "Frisian"],
+    'Norway': ["Norwegian"],
+    'Poland': ["Polish"],
+    'Portugal': ["Portuguese"],
+    'Romania': ["Romanian"],
+    'Spain': ["Spanish", "Basque", "Catalan", "Galician"],
+    'Sweden': ["Swedish", "Finnish"],
+    'Switzerland': ["German", "French", "Italian"],
+    'Turkey': ["Turkish", "Kurdish"],
+    'United_States': ["Spanish"],
+    # We can leave Scottish and Gaelic
+    'United_Kingdom': [],
+    'Japan': ["Japanese"],
+    'South_Korea': ["Korean"],
+    'Taiwan': ["Chinese_TR"],
+    'Singapore': ["Chinese_SP"],
+    'New_Zealand': [],
+    'Australia': [],
+    'Hong_Kong': ["Chinese_TR"],
+}
+
+REGIONS = {
+    'North America': ["United_States", "Canada"],
+    'Asia': ["Japan", "Singapore", "Hong_Kong", "Taiwan", "South_Korea"],
+    'Oceania': ["Australia", "New_Zealand"],
+    'Europe': [
+        "Austria", "Belgium", "Bulgaria", "Croatia", "Cyprus", "Czech_Republic", "Denmark",
+        "Estonia", "Finland", "France", "Germany", "Greece", "Hungary", "Ireland", "Israel",
+        "Italy", "Luxembourg", "Netherlands", "Norway", "Poland", "Portugal", "Romania", "Spain",
+        "Sweden", "Switzerland", "Turkey", "United_Kingdom",
+    ],
+}
+
+# Job titles
+
+SPECIALIZATIONS = [
+    "Engineer", "Engineering", "Consultant", "Architect", "Specialist", "Manager", "Developer",
+    "Architecture", "Administrator", "Head of", "Lead", "Director", "Supervisor", "Coordinator",
+    "Executive",
+]
+
+# Back-end, fullstack, data scientists are somehow different domains,
+# but sometimes in some companies they are just the same roles as data engineers
+DATA_TERMS = [
+    "Data", "ETL", "Cloud", "Analytical", "Analytics", "BI", "Buisness Intelligence",
+    "Buisness Analytics", "Database", "Pipeline", "Metadata", "Monitoring", "Datacenter",
+]
+
+INVALID_TITLES = [
+    "Mobile engineer", "Mobile Developer", "Android Developer", "Android Engineer",
+    "Biomedical Engineer", "Engineering Geologist", "Geotechnical Engineer", "Electrical Engineer",
+    "Project Manager", "Quality Engineer", "Mechanical Engineer", "Mechanical-Design Engineer",
+    "Mobile App Developer", "Full-Stack", "Fullstack", "Full Stack", "Machine Learning Engineer",
+    "Front", "FrontEnd", "Client-Side", "Support Engineer", "Data Scientist",
+    "Computer Vision Engineer", "C# Software Engineer", "Verification engineer",
+    "Networking Software Engineer", "Machine Learning Engineer", "Manual",
+    "Deep Learning Engineer", "Reliability Engineer", "Field", "Account Manager",
+    "Solutions Engineer", "Test Engineer", "Testing Engineer", "Test Development",
+    "Network Engineer", "Network Engineer", "Bid Engineer", "Machine Learning Team Lead",
+    "NLP and Text Analytics Software Engineer", "Technician", "Technisch", "Reliability",
+    "Load Engineer", "Ruby Engineer", "Manager Parts Business", "Mobile Software Engineer",
+    "Postdoctoral Fellow", "Frostbite Software", "Android Software Developer",
+    "Portability Engineer", "Sustainability", "Search Language Specialist", "Hardware Development",
+    "Site Installation", "Testing", "Software Planning Engineer", "C++ Mobile",
+    "Presales Engineer", "Electric Engineer", "Plumbing & Drainage", "Mobile Working Machines",
+    "Equipment Performance", "QA", "Quality Assurance", "Automation Engineer",
+    "mobile app development", "Biology Engineer", "Software Engineer PHP", "Sales Director",
+    "solution engineer", "solution architect", "Mechanical Design Engineer", "BIM",
+    "BIOS Platform Application Engineer", "Customer Engineer", "Robotics Engineer", "SITE MANAGER",
+    "Android Software Engineer", "Train Architect", "UI desktop", "Solutions Architect",
+]
+
+INVALID_TITLES_NON_ENGLISH = {
+    'Arabic': [
+        "مهندس الجوالات", "مطور الجوالات", "مطور أندرويد", "مهندس أندرويد", "مهندس طبي",
+        "جيولوجي هندسي", "مهندس جيوتقني", "مهندس كهربائي", "مدير مشروع", "مهندس جودة",
+        "مهندس ميكانيكي", "مهندس تصميم ميكانيكي", "مطور تطبيقات جوال",
+    ],
+    'Basque': [
+        "Mugikor Ingeniaria", "Mugikor Garatzailea", "Android Garatzailea", "Android Ingeniaria",
+        "Biomedikuntza Ingeniaria", "Geologi Ingeniaria", "Geotekniko Ingeniaria",
+        "Elektrizitate Ingeniaria", "Proiektu Kudeatzailea", "Kalitate Ingeniaria",
+        "Mekanika Ingeniaria", "Mekanika Diseinu Ingeniaria", "Mugikor Aplikazio Garatzailea",
+    ],
+    'Catalan': [
+        "Enginyer Mòbil", "Desenvolupador Mòbil", "Desenvolupador Android", "Enginyer Android",
+        "Enginyer Biomèdic", "Enginyer Geològic", "Enginyer Geotècnic", "Enginyer Elèctric",
+        "Cap de Projecte", "Enginyer de Qualitat", "Enginyer Mecànic",
+        "Enginyer de Disseny Mecànic", "Desenvolupador d'Apps Mòbils",
+    ],
+    'Czech': [
+        "Mobilní inženýr", "Mobilní vývojář", "Vývojář Androidu", "Android inženýr",
+        "Biomedicínský inženýr", "Inženýrský geolog", "Geotechnický inženýr", "Elektroinženýr",
+        "Manažer projektu", "Kvalitní inženýr", "Mechanický inženýr", "Inženýr návrhu strojů",
+        "Vývojář mobilních aplikací",
+    ],
+    'German': [
+        "Mobile Ingenieur", "Mobile Entwickler", "Android Entwickler", "Android Ingenieur",
+        "Biomedizinischer Ingenieur", "Ingenieurgeologe", "Geotechnischer Ingenieur",
+        "Elektroingenieur", "Projektmanager", "Qualitätsingenieur", "Maschinenbauingenieur",
+        "Maschinenbau-Konstrukteur", "Mobile App Entwickler",
+    ],
+    'Danish': [
+        "Mobil ingeniør", "Mobiludvikler", "Android-udvikler", "Android-ingeniør",
+        "Biomedicinsk ingeniør", "Ingeniørgeolog", "Geoteknisk ingeniør", "Elektrisk ingeniør",
+        "Projektleder", "Kvalitetsingeniør", "Mekanisk ingeniør", "Mekanisk-design ingeniør",
+        "Mobil app-udvikler",
+    ],
+    'Spanish': [
+        "Ingeniero móvil", "Desarrollador móvil", "Desarrollador de Android",
+        "Ingeniero de Android", "Ingeniero biomédico", "Geólogo de ingeniería",
+        "Ingeniero geotécnico", "Ingeniero eléctrico", "Gerente de proyectos",
+        "Ingeniero de calidad", "Ingeniero mecánico", "Ingeniero de diseño mecánico",
+        "Desarrollador de aplicaciones móviles",
+    ],
+    'Finnish': [
+        "Mobiili-insinööri", "Mobiilikehittäjä", "Android-kehittäjä", "Android-insinööri",
+        "Biomediainsinööri", "Geologian insinööri", "Geotekninen insinööri", "Sähköinsinööri",
+        "Projektipäällikkö", "Laatuinsinööri", "Mekaaninen insinööri",
+        "Mekaanisen suunnittelun insinööri", "Mobiilisovelluskehittäjä",
+    ],
+    'French': [
+        "Ingénieur mobile", "Développeur mobile", "Développeur Android", "Ingénieur Android",
+        "Ingénieur biomédical", "Géologue d'ingénierie", "Ingénieur géotechnique",
+        "Ingénieur électrique", "Chef de projet", "Ingénieur qualité", "Ingénieur mécanique",
+        "Ingénieur en conception mécanique", "Développeur d'applications mobiles",
+    ],
+    'Frisian': [
+        "Mobile yngenieur", "Mobile ûntwikkele", "Android-ûntwikkele", "Android yngenieur",
+        "Biomedysk yngenieur", "Engineering geolooch", "Geotechnysk yngenieur",
+        "Elektaryske yngenieur", "Projektmanager", "Kwaliteit yngenieur", "Mekanysk yngenieur",
+        "Mekanyske-ûntwerp yngenieur", "Mobile app-ûntwikkele",
+    ],
+    'Galician': [
+        "Enxeñeiro móbil", "Desenvolvedor móbil", "Desenvolvedor de Android",
+        "Enxeñeiro de Android", "Enxeñeiro biomédico", "Xeólogo de enxeñería",
+        "Enxeñeiro xeotécnico", "Enxeñeiro eléctrico", "Xestor de proxectos",
+        "Enxeñeiro de calidade", "Enxeñeiro mecánico", "Enxeñeiro de deseño mecánico",
+        "Desenvolvedor de aplicacións móbeis",
+    ],
+    'Greek': [
+        "Μηχανικός κινητής τηλεφωνίας", "Προγραμματιστής κινητής τηλεφωνίας",
+        "Προγραμματιστής Android", "Μηχανικός Βιοϊατρικής Τεχνολογίας", "Γεωλόγος Μηχανικός",
+        "Μηχανικός Γεωτεχνικών", "Ηλεκτρολόγος Μηχανικός", "Διευθυντής έργου",
+        "Μηχανικός Ποιότητας", "Μηχανικός Μηχανολογίας", "Μηχανικός Μηχανολογίας-Σχεδιασμού",
+        "Προγραμματιστής κινητών εφαρμογών",
+    ],
+    'Hebrew': [
+        "מהנדס מובייל", "מפתח יישומים מוביילים", "מפתח אנדרואיד", "מהנדס ביו-רפואי",
+        "גיאולוג מהנדס", "מהנדס גיאו-טכני", "מהנדס חשמל", "מנהל פרויקט", "מהנדס איכות",
+        "מהנדס מכונות", "מהנדס מכונות-תכנון", "מפתח יישומי ניידים",
+    ],
+    'Hungarian': [
+        "Mobil mérnök", "Mobil fejlesztő", "Android fejlesztő", "Android mérnök",
+        "Biomedikus mérnök", "Mérnöki geológus", "Geotechnikai mérnök", "Elektromos mérnök",
+        "Projektmenedzser", "Minőségi mérnök", "Gépészmérnök", "Gépészmérnök-tervező",
+        "Mobil alkalmazás fejlesztő",
+    ],
+    'Italian': [
+        "Ingegnere mobile", "Sviluppatore mobile", "Sviluppatore Android", "Ingegnere Android",
+        "Ingegnere biomedico", "Geologo ingegnere", "Ingegnere geotecnico", "Ingegnere elettrico",
+        "Project Manager", "Ingegnere della qualità", "Ingegnere meccanico",
+        "Ingegnere meccanico-design", "Sviluppatore di app mobili",
+    ],
+    'Kurdish': [
+        "Mühendis-ı mobîl", "Pêşkêşvan-ı mobîl", "Pêşkêşvan-ı Android", "Mühendis-ı Android",
+        "Mühendis-ı bîomedîkal", "Cîhêk-î mühendîsî", "Mühendîs-î geoteknik",
+        "Mühendîs-î elektrîkî", "Pêwendîdar-î projeyan", "Mühendîs-î quality",
+        "Mühendîs-î mekanîkî", "Mühendîs-î mekanîkî-têkildarî dizaynê", "Pêşkêşvan-î app-ê mobîl",
+    ],
+    'Dutch': [
+        "Mobiele ingenieur", "Mobiele ontwikkelaar", "Android ontwikkelaar", "Android ingenieur",
+        "Biomedisch ingenieur", "Ingenieur geologie", "Geotechnisch ingenieur",
+        "Elektrotechnisch ingenieur", "Projectmanager", "Kwaliteitsingenieur",
+        "Werktuigbouwkundig ingenieur", "Werktuigbouwkundig-ontwerp ingenieur",
+        "Mobiele app-ontwikkelaar",
+    ],
+    'Norwegian': [
+        "Mobil ingeniør", "Mobilutvikler", "Android-utvikler", "Android-ingeniør",
+        "Biomedisinsk ingeniør", "Geologiingeniør", "Geoteknisk ingeniør", "Elektroingeniør",
+        "Prosjektleder", "Kvalitetsingeniør", "Maskiningeniør", "Mekanisk designingeniør",
+        "Utvikler av mobilapper",
+    ],
+    'Polish': [
+        "Inżynier mobilny", "Deweloper mobilny", "Deweloper Androida", "Inżynier Androida",
+        "Inżynier biomedyczny", "Inżynier geologii", "Inżynier geotechniki", "Inżynier elektryk",
+        "Kierownik projektu", "Inżynier jakości", "Inżynier mechanik",
+        "Inżynier mechaniki i projektowania", "Twórca aplikacji mobilnych",
+    ],
+    'Portuguese': [
+        "Engenheiro Móvel", "Desenvolvedor Móvel", "Desenvolvedor Android", "Engenheiro Android",
+        "Engenheiro Biomédico", "Geólogo de Engenharia", "Engenheiro Geotécnico",
+        "Engenheiro Elétrico", "Gerente de Projeto", "Engenheiro de Qualidade",
+        "Engenheiro Mecânico", "Engenheiro de Design Mecânico",
+        "Desenvolvedor de Aplicativos Móveis",
+    ],
+    'Romanian': [
+        "Inginer Mobil", "Dezvoltator mobil", "Dezvoltator Android", "Inginer Android",
+        "Inginer Biomedical", "Geolog Inginer", "Inginer Geotehnic", "Inginer Electric",
+        "Manager de proiect", "Inginer de calitate", "Inginer mecanic",
+        "Inginer de design mecanic", "Dezvoltator de aplicații mobile",
+    ],
+    'Slovakian': [
+        "Mobilný inžinier", "Mobilný vývojár", "Vývojár Androidu", "Android inžinier",
+        "Biomedicínsky inžinier", "Inžinier geológie", "Geotechnický inžinier",
+        "Elektrický inžinier", "Manažér projektu", "Kvalitný inžinier", "Mechanický inžinier",
+        "Inžinier návrhu mechaniky", "Vývojár mobilných aplikácií",
+    ],
+    'Slovenian': [
+        "Mobilni inženir", "Mobilni razvijalec", "Razvijalec Androida", "Android inženir",
+        "Biomedicinski inženir", "Inženir geologije", "Geotehnični inženir", "Elektroinženir",
+        "Vodja projekta", "Inženir kakovosti", "Mehanski inženir", "Inženir oblikovanja mehanike",
+        "Razvijalec mobilnih aplikacij",
+    ],
+    'Swedish': [
+        "Mobilingenjör", "Mobilutvecklare", "Androidutvecklare", "Androidingenjör",
+        "Biomedicinsk ingenjör", "Ingenjör i geologi", "Geoteknisk ingenjör", "Elektroingenjör",
+        "Projektledare", "Kvalitetsingenjör", "Mekanisk ingenjör", "Ingenjör för mekanisk design",
+        "Mobilapputvecklare",
+    ],
+    'Turkish': [
+        "Mobil mühendisi", "Mobil Geliştirici", "Android Geliştirici", "Android Mühendisi",
+        "Biyomedikal Mühendisi", "Jeoloji Mühendisi", "Zemin Mekaniği Mühendisi",
+        "Elektrik Mühendisi", "Proje Yöneticisi", "Kalite Mühendisi", "Mekanik Mühendisi",
+        "Mekanik-Tasarım Mühendisi", "Mobil Uygulama Geliştiricisi",
+    ],
+    'Japanese': [
+        "モバイルエンジニア", "モバイル開発者", "Android開発者", "Androidエンジニア", "バイオメディカルエンジニア", "エンジニアリングジオロジスト",
+        "地質工学技術者", "電気技師", "プロジェクトマネージャー", "品質エンジニア", "機械エンジニア", "機械設計エンジニア", "モバイルアプリ開発者",
+    ],
+    'Korean': [
+        "모바일 엔지니어", "모바일 개발자", "안드로이드 개발자", "안드로이드 엔지니어", "바이오의공학 엔지니어", "공학 지질학자", "지질기술 엔지니어",
+        "전기 기술자", "프로젝트 매니저", "품질 엔지니어", "기계 엔지니어", "기계설계 엔지니어", "모바일 앱 개발자",
+    ],
+    'Chinese_TR': [
+        "移动工程师", "移动开发人员", "安卓开发人员", "安卓工程师", "生物医学工程师", "工程地质学家", "岩土工程师", "电气工程师", "项目经理",
+        "质量工程师", "机械工程师", "机械设计工程师", "移动应用程序开发人员",
+    ],
+    'Chinese_SP': [
+        "移动工程师", "移动开发人员", "安卓开发人员", "安卓工程师", "生物医学工程师", "工程地质学家", "岩土工程师", "电气工程师", "项目经理",
+        "质量工程师", "机械工程师", "机械设计工程师", "移动应用程序开发人员",
+    ],
+}
+
+SPECIALIZATIONS_NON_ENGLISH = {
+    'Arabic': [
+        "مهندس", "هندسة", "مستشار", "معماري", "متخصص", "مدير", "مطور", "عمارة", "مسؤول", "رئيس",
+        "قائد", "مشرف", "منسق", "تنفيذي",
+    ],
+    'Basque': [
+        "Ingeniaria", "Ingeniaritza", "Konsultore", "arkitektoa", "ESPECIALISTA", "Kudeatzailea",
+        "Garatzailea", "Arkitektura", "Administratzailea", "Koordinatzailea", "Koordinatzaile",
+        "Gobernuko",
+    ],
+    'Catalan': [
+        "Enginyer", "Enginyeria", "Consultor", "arquitecte", "ESPECIALISTA", "Gerent",
+        "Desenvolupador", "Arquitectura", "Administrador", "Executiu",
+    ],
+    'Czech': [
+        "Inženýr", "Konstruktér", "Architekt", "SPECIALISTA", "Manažer", "Vývojář", "Architektura",
+        "Správce", "Dozorce", "Koordinátor", "Výkonný",
+    ],
+    'German': [
+        "Ingenieur", "Berater", "Architekt", "SPEZIALIST", "Manager", "Entwickler", "Architektur",
+        "Architecture", "Administrator", "Vorgesetzter", "Koordinator", "Führungskraft",
+    ],
+    'Danish': [
+        "Ingeniør", "Konsulent", "Arkitekt", "SPECIALIST", "Manager", "Udvikler", "Arkitektur",
+        "Administrator", "Koordinator",
+    ],
+    'Dutch': [
+        "SPECIALIST", "Engineering", "Manager", "architect", "Beheerder", "Ingenieur", "Adviseur",
+        "Ontwikkelaar", "Architect", "Techniek", "Architectuur", "Toezichthouder", "Coördinator",
+        "Uitvoerend",
+    ],
+    'Spanish': [
+        "Ingeniero", "Consultor", "Arquitecto", "Especialista", "Gerente", "Desarrollador",
+        "Arquitectura", "Administrador", "Ejecutivo",
+    ],
+    'Finnish': [
+        "Insinööri", "Konsultti", "Arkkitehti", "ERITYISOSAAMINEN", "Johtaja", "Kehittäjä",
+        "Arkkitehtuuri", "Ylläpitäjä", "Esimies", "Koordinaattori", "Johtaja",
+    ],
+    'French': [
+        "Architecte", "Développeur", "architecte", "SPECIALISTE", "SPÉCIALISTE", "Consultant",
+        "Conseiller", "Ingénieur", "Administrateur", "Architecture", "Manager", "Ingénierie",
+        "Superviseur", "Coordinateur", "Cadre",
+    ],
+    'Frisian': [
+        "Ynżenier", "Ynženiering", "Konsultant", "arkitekt", "SPESJALIST", "Manager",
+        "Ûntwikkelers", "Arktitektuer", "Administrator", "Koördinator", "Uitvoerend",
+    ],
+    'Galician': [
+        "Inxeniero", "Enxeñería", "Consultor", "arquitecto", "ESPECIALISTA", "Xestor",
+        "Desenvolvedor", "Arquitectura", "Administrador", "Coordinador", "Executivo",
+    ],
+    'Greek': [
+        "Μηχανικός", "Σύμβουλος", "Αρχιτέκτονας", "ΕΙΔΙΚΟΣ", "Διευθυντής", "Προγραμματιστής",
+        "Αρχιτεκτονική", "Διαχειριστής", "Επιβλέπων", "Συντονιστής", "Διευθυντής",
+    ],
+    'Hebrew': [
+        "מהנדס", "הנדסה", "יועץ", "אדריכל", "מומחה", "מנהל", "מפתח", "ארכיטקטורה", "מנהל מערכות",
+        "מנהל", "רכז", "מבצע",
+    ],
+    'Hungarian': [
+        "Mérnök", "Mérnöki", "Tanácsadó", "építész", "SZAKÉRTŐ", "Menedzser", "Fejlesztő",
+        "Architektúra", "Rendszergazda", "Felügyelő", "Koordinátor", "Vezető",
+    ],
+    'Italian': [
+        "Ingegnere", "Consulente", "architetto", "SPECIALISTA", "Manager", "Sviluppatore",
+        "Architettura", "Amministratore", "Supervisore", "Coordinatore", "Esecutivo",
+    ],
+    'Kurdish': [
+        "Mûhandis", "Mûhendisî", "Pêşkêşker", "pargîdaniyar", "XWESER", "Manajer", "Pêşgir",
+        "Arkîtektur", "Peywendkar", "Koordinator", "Xwedî",
+    ],
+    'Norwegian': [
+        "Ingeniør", "Konsulent", "arkitekt", "SPECIALIST", "Manager", "Utvikler", "Arkitektur",
+        "Administrator", "Veileder", "Koordinator", "Leder",
+    ],
+    'Polish': [
+        "Inżynier", "Konsultant", "Architekt", "Specjalista", "Manager", "Programista",
+        "Administrator", "Przełożony", "Koordynator", "Wykonawczy",
+    ],
+    'Portuguese': [
+        "Engenheiro", "Consultor", "Arquiteto", "Especialista", "Gerente", "Desenvolvedor",
+        "Arquitetura", "Administrador", "Coordenador", "Executivo",
+    ],
+    'Romanian': [
+        "Inginer", "Consultant", "Arhitect", "Specialist", "Manager", "Dezvoltator", "Arhitectura",
+        "Administrator", "Supraveghetor", "Coordonator", "Executiv",
+    ],
+    'Slovakian': [
+        "Inžinier", "Konzultant", "architekt", "SPECIALISTA", "Manažér", "Vývojár", "Architektúra",
+        "Správca", "Dozorca", "Koordinátor", "Výkonný",
+    ],
+    'Slovenian': [
+        "Inženir", "Inženiring", "Svetovalec", "arhitekt", "SPECIALIST", "Vodja", "Razvijalec",
+        "Arhitektura", "Administrator", "Nadzornik", "Koordinator", "Izvršni",
+    ],
+    'Swedish': [
+        "Ingenjör", "Konsult", "Arkitekt", "Specialist", "Chef", "Utvecklare", "Arkitektur",
+        "Administratör", "Handledare", "Koordinator", "Verkställande",
+    ],
+    'Turkish': [
+        "Mühendis", "Danışman", "Mimar", "Uzman", "Yönetici", "Geliştirici", "Mimarlık",
+        "Yönetici", "Koordinatör", "Yönetici",
+    ],
+    'Japanese': [
+        "エンジニア", "エンジニアリング", "コンサルタント", "アーキテクト", "スペシャリスト", "マネージャー", "開発者", "アーキテクチャー", "管理者",
+        "責任者", "リーダー",
+    ],
+    'Korean': [
+        "엔지니어", "엔지니어링", "컨설턴트", "건축가", "전문가", "매니저", "개발자", "아키텍처", "관리자", "책임자", "리더", "감독자",
+        "코디네이터", "임원",
+    ],
+    'Chinese_TR': [
+        "工程師", "工程", "顧問", "建築師", "專家", "經理", "開發者", "架構", "管理員", "負責人", "領導", "監督者", "協調員",
+        "行政人員",
+    ],
+    'Chinese_SP': [
+        "工程师", "工程", "顾问", "建筑师", "专家", "经理", "开发者", "架构", "管理员", "负责人", "领导", "监督者", "协调员",
+        "行政人员",
+    ],
+}
+
+DATA_TERMS_NON_ENGLISH = {
+    'Arabic': [
+        "بيانات", "ETL", "سحابة", "تحليلي", "تحليلات", "ذكاء الأعمال", "تحليلات الأعمال",
+        "قاعدة بيانات", "خط أنابيب", "بيانات وصفية", "رصد", "مركز بيانات",
+    ],
+    'Basque': [
+        "Datuak", "ETL", "Cloud", "Analitikoa", "Analitika", "BI", "Negozioaren Inteligentzia",
+        "Negozioaren Analitika", "Datubasea", "Pipeline-a", "Metadatuak", "Monitoreo",
+        "Datuen zentroa",
+    ],
+    'Catalan': [
+        "Dades", "ETL", "Núvol", "Analític", "Anàlisi de dades", "BI", "Intel·ligència de negocis",
+        "Anàlisi de negocis", "Base de dades", "Pipeline", "Metadades", "Monitorització",
+        "Centre de dades",
+    ],
+    'Czech': [
+        "Data", "ETL", "Cloud", "Analytický", "Analytika", "BI", "Business Intelligence",
+        "Business Analytics", "Databáze", "Pipeline", "Metadata", "Monitorování", "Datacentrum",
+    ],
+    'German': [
+        "Daten", "ETL", "Cloud", "Analytisch", "Analytics", "BI", "Business Intelligence",
+        "Business Analytics", "Datenbank", "Pipeline", "Metadaten", "Überwachung", "Rechenzentrum",
+        "Datenzentrum",
+    ],
+    'Danish': [
+        "Data", "ETL", "Cloud", "Analytisk", "Analyse", "BI", "Forretningsanalyse", "Database",
+        "Pipeline", "Metadata", "Overvågning", "Datacenter",
+    ],
+    'Dutch': [
+        "Business Analytics", "Monitoring", "Leiding", "Metadata", "Cloud",
+        "Business Intelligence", "Data", "Analytisch", "BI", "Database", "Datacenter", "Pipeline",
+        "Analytics", "Bedrijfsanalyse", "Bedrijfsinformatie", "ETL",
+    ],
+    'Spanish': [
+        "Datos", "ETL", "Nube", "Analítico", "Análisis", "BI", "Inteligencia de Negocios",
+        "Análisis de Negocios", "Base de datos", "Pipeline", "Metadatos", "Monitoreo",
+        "Centro de datos",
+    ],
+    'Finnish': [
+        "Data", "ETL", "Pilvi", "Analytiikka", "BI", "Liiketoiminta-analytiikka", "Tietokanta",
+        "Putkisto", "Metatiedot", "Seuranta", "Tietokeskus",
+    ],
+    'French': [
+        "Architecte", "Développeur", "architecte", "SPECIALISTE", "SPÉCIALISTE", "Consultant",
+        "Conseiller", "Ingénieur", "Administrateur", "Architecture", "Manager", "Ingénierie",
+    ],
+    'Frisian': [
+        "Data", "ETL", "Cloud", "Analytysk", "Analitika", "BI", "Bisykens Intelligence",
+        "Bisykens Analytics", "Database", "Pipeline", "Metadata", "Monitoring", "Datacenter",
+    ],
+    'Galician': [
+        "Datos", "ETL", "Nube", "Analítica", "Analítica de datos", "BI",
+        "Intelixencia de negocios", "Analítica de negocios", "Base de datos", "Pipeline",
+        "Metadatos", "Monitorización", "Centro de datos",
+    ],
+    'Greek': [
+        "Δεδομένα", "ETL", "Νέφος", "Αναλυτική", "Ανάλυση", "BI", "Επιχειρηματική Νοημοσύνη",
+        "Επιχειρηματική Αναλυτική", "Βάση δεδομένων", "Αγωγός", "Μεταδεδομένα", "Παρακολούθηση",
+        "Κέντρο δεδομένων",
+    ],
+    'Hebrew': [
+        "נתונים", "ETL", "ענן", "ניתוח", "ניתוח נתונים", "BI", "בינה מעסיקתית", "אנליטיקה עסקית",
+        "מסד נתונים", "צינורות נתונים", "מטא נתונים", "מעקב", "מרכז נתונים",
+    ],
+    'Hungarian': [
+        "Mérnök", "Mérnöki", "Tanácsadó", "építész", "SZAKÉRTŐ", "Menedzser", "Fejlesztő",
+        "Architektúra", "Rendszergazda",
+    ],
+    'Italian': [
+        "Dati", "ETL", "Cloud", "Analitico", "Analytics", "BI", "Business Intelligence",
+        "Business Analytics", "Database", "Pipeline", "Metadati", "Monitoraggio", "Centro dati",
+    ],
+    'Kurdish': [
+        "Zanist", "ETL", "Pirsgirêk", "Analytîk", "Analîz", "BI", "Zanistên Kar", "Analîzên Kar",
+        "Bingehbazî", "Pîpelya", "Meta-Data", "Pêşwazî", "Navenda Zanistê",
+    ],
+    'Norwegian': [
+        "Data", "ETL", "Sky", "Analytisk", "Analytics", "BI", "Forretningsinnsikt",
+        "Forretningsanalyse", "Database", "Pipeline", "Metadata", "Overvåking",
+        "Databehandlingssenter",
+    ],
+    'Polish': [
+        "Dane", "ETL", "Chmura", "Analityczny", "Analityka", "BI", "Business Intelligence",
+        "Analityka Biznesowa", "Bazy Danych", "Pipeline", "Metadane", "Monitorowanie",
+        "Centrum Danych",
+    ],
+    'Portuguese': [
+        "Dados", "ETL", "Nuvem", "Analítico", "Análise", "BI", "Inteligência de Negócios",
+        "Análise de Negócios", "Banco de Dados", "Pipeline", "Metadados", "Monitoramento",
+        "Centro de Dados",
+    ],
+    'Romanian': [
+        "Date", "ETL", "Noroi", "Analitic", "Analize", "BI", "Business Intelligence",
+        "Analiză de afaceri", "Bază de date", "Conductă", "Metadate", "Monitorizare",
+        "Centru de date",
+    ],
+    'Slovakian': [
+        "Data", "ETL", "Cloud", "Analytický", "Analytika", "BI", "Business Intelligence",
+        "Business Analytics", "Databáza", "Pipeline", "Metadata", "Monitorovanie", "Datacentrum",
+    ],
+    'Slovenian': [
+        "Podatki", "ETL", "Oblak", "Analitični", "Analitika", "BI", "Poslovna Inteligenca",
+        "Poslovna Analitika", "Podatkovna Baza", "Cevovod", "Metapodatki", "Spremljanje",
+        "Podatkovni Center",
+    ],
+    'Swedish': [
+        "Data", "ETL", "Moln", "Analys", "Analytik", "BI", "Affärsinriktad Analys",
+        "Business Intelligence", "Databas", "Pipeline", "Metadata", "Övervakning", "Datacenter",
+    ],
+    'Turkish': [
+        "Veri", "ETL", "Bulut", "Analitik", "Analiz", "BI", "İş Zekası", "İş Analizi",
+        "Veritabanı", "Boru Hattı", "Meta Veri", "İzleme", "Veri Merkezi",
+    ],
+    'Japanese': [
+        "データ", "ETL", "クラウド", "分析的な", "アナリティクス", "BI", "ビジネスインテリジェンス", "ビジネスアナリティクス", "データベース",
+        "パイプライン", "メタデータ", "モニタリング", "データセンター",
+    ],
+    'Korean': [
+        "데이터", "ETL", "클라우드", "분석적인", "애널리틱스", "BI", "비즈니스 인텔리전스", "비즈니스 애널리틱스", "데이터베이스", "파이프라인",
+        "메타데이터", "모니터링", "데이터 센터",
+    ],
+    'Chinese_TR': [
+        "數據", "ETL", "雲端", "分析", "分析學", "商業智慧", "商業分析", "數據庫", "管道", "元數據", "監控", "數據中心",
+    ],
+    'Chinese_SP': [
+        "数据", "ETL", "云端", "分析", "分析学", "商业智慧", "商业分析", "数据库", "管道", "元数据", "监控", "数据中心",
+    ],
+}
+
+# Location
+
+# All those fancy, pansy names for the remote
+REMOTE = [
+    "Home office", "Telecommute", "Virtual office", "Off-site", "Work from anywhere",
+    "Distributed team", "Location-independent", "Mobile workforce", "Cloud office",
+    "Online workspace", "Digital nomad", "Flexible location", "Anywhere office", "Distance work",
+    "Virtual workplace", "Mobile office", "Roaming job", "Borderless office", "Satellite office",
+    "Remote-enabled", "Work from afar",
+]
+
+REMOTE_NON_ENGLISH = {
+    'Arabic': [
+        "عن بعد", "مكتب منزلي", "العمل عن بعد", "مكتب افتراضي", "خارج الموقع", "العمل من أي مكان",
+        "فريق موزع", "غير معتمد على الموقع", "قوة عمل متنقلة", "مكتب سحابي",
+        "مساحة عمل عبر الإنترنت", "الرحالة الرقمي", "موقع مرن", "مكتب أي مكان", "عمل عن بعد",
+        "مكان عمل افتراضي", "مكتب متنقل", "وظيفة تجوالية", "مكتب بلا حدود", "مكتب فرعي",
+        "ممكّن عن بعد", "العمل عن بعد",
+    ],
+    'Basque': [
+        "Urruneko", "Etxebizitza", "Telelan", "Birtual", "Kanpoaldeko",
+        "Lan egitea nondik nahi izan", "Banatutako taldea", "Kokapenik gabeko",
+        "Mugikor lan taldea", "Hodeiko bulegoa", "Online lan gunea", "Nabigatzaile digitala",
+        "Kokapen aldaerazpena", "Inon edozein bulego", "Urruneko lan", "Birtual bulego",
+        "Mugikor bulegoa", "Lan ibiltaria", "Mugikor ofizina", "Mugikor gunea",
+        "Mendebalde ofizina", "Urruneko gaitasuna", "Urruneko lan",
+    ],
+    'Catalan': [
+        "Remot", "Oficina a casa", "Telecommute", "Oficina virtual", "Fora del lloc",
+        "Treballa des de qualsevol lloc", "Equip distribuït", "Independent de la ubicació",
+        "Força laboral mòbil", "Oficina a la núvol", "Espai de treball en línia", "Nòmada digital",
+        "Ubicació flexible", "Oficina a qualsevol lloc", "Treball a distància",
+        "Espai de treball virtual", "Oficina mòbil", "Feina itinerant", "Oficina sense fronteres",
+        "Oficina satèl·lit", "Habilitat remotament", "Treball des de lluny",
+    ],
+    'Czech': [
+        "Vzdálený", "Domácí kancelář", "Telekomunikace", "Virtuální kancelář", "Mimo provozovnu",
+        "Práce odkudkoliv", "Rozptýlený tým", "Nezávislost na místě", "Mobilní pracovní síla",
+        "Cloudová kancelář", "Online pracovní prostor", "Digitální nomád", "Flexibilní místo",
+        "Kancelář kdekoli", "Práce na dálku", "Virtuální pracoviště", "Mobilní kancelář",
+        "Pohyblivá práce", "Bezhraniční kancelář", "Satelitní kancelář", "Možnost práce na dálku",
+        "Práce z dálky",
+    ],
+    'German': [
+        "Remote", "Home-Office", "Telearbeit", "Virtuelles Büro", "Externer Arbeitsplatz",
+        "Arbeit von überall", "Verteiltes Team", "Ortsunabhängigkeit", "Mobile Belegschaft",
+        "Cloud-Office", "Online-Arbeitsplatz", "Digitaler Nomade", "Flexible Arbeitsplätze",
+        "Arbeitsplatz überall", "Fernarbeit", "Virtueller Arbeitsplatz", "Mobiles Büro",
+        "Roaming-Job", "Grenzenloses Büro", "Satelliten-Büro", "Remote-fähig", "Arbeit von fern",
+        "Dezentrale Arbeit", "Heimarbeit", "Telearbeit",
+    ],
+    'Danish': [
+        "Fjern", "Hjemmekontor", "Telekommunikation", "Virtuelt kontor", "Uden for lokalerne",
+        "Arbejd fra ethvert sted", "Fordelt hold", "Placering-uafhængig", "Mobil arbejdsstyrke",
+        "Cloud-kontor", "Online arbejdsområde", "Digital nomade", "Fleksibel placering",
+        "Kontor hvor som helst", "Distancearbejde", "Virtuelt arbejdssted", "Mobilkontor",
+        "Roaming-job", "Grænseløst kontor", "Satellitkontor", "Fjern-kompatibel",
+        "Arbejd fra lang afstand", "Eksternt arbejde", "Hjemmearbejde", "Telearbejde",
+    ],
+    'Spanish': [
+        "Remoto", "Oficina en casa", "Teletrabajo", "Oficina virtual", "Fuera del sitio",
+        "Trabajar desde cualquier lugar", "Equipo distribuido", "Independencia del lugar",
+        "Fuerza laboral móvil", "Oficina en la nube", "Espacio de trabajo en línea",
+        "Nómada digital", "Ubicación flexible", "Oficina en cualquier lugar",
+        "Trabajo a distancia", "Lugar de trabajo virtual", "Oficina móvil", "Trabajo itinerante",
+        "Oficina sin fronteras", "Oficina satélite", "Habilitado para trabajar de forma remota",
+        "Trabajo desde lejos",
+    ],
+    'Finnish': [
+        "Etä-", "Kotitoimisto", "Etätyö", "Virtuaalitoimisto", "Poissa toimistolta",
+        "Työskentely mistä tahansa", "Hajautettu tiimi", "Sijaintiriippumaton", "Mobiilityövoima",
+        "Pilvitoimisto", "Verkkotyötila", "Digitaalinen kulkuri", "Joustava sijainti",
+        "Missä tahansa toimisto", "Etätyöskentely", "Virtuaalityöpaikka", "Mobiilitoimisto",
+        "Kiertävä työ", "Rajaton toimisto", "Satelliittoimisto", "Etätyö mahdollistettu",
+        "Työskentely kaukaa",
+    ],
+    'French': [
+        "À distance", "Télétravail", "Bureau virtuel", "Télétravailler", "Hors site",
+        "Travailler de n'importe où", "Équipe distribuée", "Indépendant de l'emplacement",
+        "Main-d'œuvre mobile", "Bureau de nuage", "Espace de travail en ligne", "Nomade digital",
+        "Emplacement flexible", "Bureau n'importe où", "Travail à distance",
+        "Espace de travail virtuel", "Bureau mobile", "Emploi itinérant", "Bureau sans frontières",
+        "Bureau satellite", "Activé à distance", "Travailler à distance",
+    ],
+    'Frisian': [
+        "Op ôfstân", "Thús kantoar", "Telekomme", "Firtueel kantoar", "Bûtenshûs",
+        "Wurkje fan hokker plak dan ek mar", "Ferdield team", "Lokaasjefrij", "Mobile wurkforc",
+        "Cloud kantoar", "Online wurkromte", "Digitale nomade", "Fleksibele lokaasje",
+        "Dochs dêr kantoar", "Ofstân wurkje", "Virtuele wurkromte", "Mobile kantoar", "Roambanen",
+        "Grenzelos kantoar", "Satellietkantoar", "Op ôfstân mooglik makke", "Wurkje fan fierren",
+    ],
+    'Galician': [
+        "Remoto", "Oficina en casa", "Teletraballo", "Oficina virtual",
+        "Fora do lugar de traballo", "Traballar desde calquera lugar", "Equipo distribuído",
+        "Independente da localización", "Forza de traballo móbil", "Oficina en nube",
+        "Espazo de traballo en liña", "Nómada dixital", "Localización flexible",
+        "Oficina en calquera lugar", "Traballo a distancia", "Espazo de traballo virtual",
+        "Oficina móbil", "Traballo itinerante", "Oficina sen fronteiras", "Oficina satélite",
+        "Activado remotamente", "Traballar desde lonxe",
+    ],
+    'Greek': [
+        "Απομακρυσμένο", "Γραφείο στο σπίτι", "Τηλεργασία", "Εικονικό γραφείο", "Εκτός έδρας",
+        "Εργασία από οπουδήποτε", "Διανεμημένη ομάδα", "Ανεξάρτητος τόπος εργασίας",
+        "Κινητό εργατικό δυναμικό", "Γραφείο στο cloud", "Διαδικτυακός χώρος εργασίας",
+        "Ψηφιακός ταξιδιώτης", "Ευέλικτη τοποθεσία", "Γραφείο από οπουδήποτε",
+        "Εργασία από απόσταση", "Εικονικός χώρος εργασίας", "Κινητό γραφείο",
+        "Επαγγελματίας χωρίς σταθερή τοποθεσία", "Σατελλίτε γραφείο", "Επιτρεπόμενο απομακρυσμένο",
+        "Εργασία από μακριά",
+    ],
+    'Hebrew': [
+        "מרוחק", "משרד ביתי", "טלקום", "משרד וירטואלי", "מחוץ למשרד", "עבודה מכל מקום",
+        "צוות מבוזר", "ללא תלות מיקום", "כוח עבודה נייד", "משרד ענן", "מרחב עבודה מקוון",
+        "נומד דיגיטלי", "מיקום גמיש", "משרד מכל מקום", "עבודה מרחוק", "משרד וירטואלי", "משרד נייד",
+        "עבודה רומנטית", "משרד לא מתפקד", "משרד סטליט", "אפשרי רחוק", "עבודה מרחוק",
+    ],
+    'Hungarian': [
+        "Távoli", "Otthoni iroda", "Távmunka", "Virtuális iroda", "Távoli munkavégzés",
+        "Elosztott csapat", "Helyfüggetlen", "Mobil munkaerő", "Felhő alapú iroda",
+        "Online munkaterület", "Digitális nomád", "Rugalmas munkavégzés helye", "Bárholi iroda",
+        "Távolléti munka", "Virtuális munkahely", "Mobil iroda", "Vándormunka",
+        "Határok nélküli iroda", "Táviroda", "Távmunka engedélyezve", "Munka távolról",
+    ],
+    'Italian': [
+        "Remoto", "Ufficio a casa", "Telelavoro", "Ufficio virtuale", "Fuori sede",
+        "Lavorare ovunque", "Team distribuito", "Indipendenza dalla posizione",
+        "Forza lavoro mobile", "Ufficio in cloud", "Spazio di lavoro online", "Nomade digitale",
+        "Posizione flessibile", "Ufficio ovunque", "Lavoro a distanza", "Posto di lavoro virtuale",
+        "Ufficio mobile", "Lavoro in itineranza", "Ufficio senza confini", "Ufficio satellite",
+        "Abilitato al lavoro remoto", "Lavoro da lontano",
+    ],
+    'Kurdish': [
+        "Dûrxistin", "Birca malê", "Telekomût", "Birca virtual", "Dîlber", "Karê ji her derê",
+        "Tîma belavkirî", "Hînariya cîhêve", "Hêja kariyê", "Birca cloud", "Cîhê karê online",
+        "Nomadê rûniştinê", "Cîhê karî kirinê kêfxweş", "Birca her derê", "Karê dûrve",
+        "Cîhê karê rûniştinê", "Birca mobîl", "Kariya serderê", "Birca beşdarî nekirî",
+        "Birca navendî", "Dabeşkirina karê dûrxistinê", "Karê ji dûrve",
+    ],
+    'Dutch': [
+        "Afstandswerk", "Thuiswerkplek", "Telewerken", "Virtueel kantoor", "Buiten de deur",
+        "Werk vanaf elke locatie", "Verspreid team", "Locatie-onafhankelijk",
+        "Mobiele beroepsbevolking", "Cloud-kantoor", "Online werkruimte", "Digitale nomade",
+        "Flexibele locatie", "Kantoor op elke locatie", "Werk op afstand", "Virtuele werkplek",
+        "Mobiel kantoor", "Zwerfbaan", "Grenzeloos kantoor", "Satellietkantoor",
+        "Op afstand mogelijk gemaakt", "Werken vanaf afstand",
+    ],
+    'Norwegian': [
+        "Fjern", "Hjemmekontor", "Telekommunikasjon", "Virtuelt kontor", "Off-site",
+        "Arbeid fra hvor som helst", "Distribuert team", "Stedsuavhengig", "Mobil arbeidsstyrke",
+        "Skykontor", "Nettbasert arbeidsområde", "Digital nomade", "Fleksibelt sted",
+        "Kontor hvor som helst", "Fjernarbeid", "Virtuelt arbeidsmiljø", "Mobilkontor",
+        "Rundreisejobb", "Grenseløst kontor", "Satellittkontor", "Fjernaktivert",
+        "Arbeid fra avstand",
+    ],
+    'Polish': [
+        "Zdalny", "Praca zdalna", "Telepraca", "Wirtualne biuro", "Praca poza siedzibą",
+        "Praca z dowolnego miejsca", "Zespoły rozproszone", "Nieuzależniony od miejsca pracy",
+        "Mobilna siła robocza", "Biuro w chmurze", "Przestrzeń robocza online", "Cyfrowy nomada",
+        "Elastyczne miejsce pracy", "Biuro w dowolnym miejscu", "Praca na odległość",
+        "Wirtualne miejsce pracy", "Mobilne biuro", "Praca mobilna", "Biuro bez granic",
+        "Biuro satelitarne", "Zdalnie zarządzany", "Praca zdalna",
+    ],
+    'Portuguese': [
+        "Remoto", "Escritório em casa", "Teletrabalho", "Escritório virtual", "Fora do local",
+        "Trabalho em qualquer lugar", "Equipe distribuída", "Independente de localização",
+        "Força de trabalho móvel", "Escritório em nuvem", "Espaço de trabalho online",
+        "Nômade digital", "Localização flexível", "Escritório em qualquer lugar",
+        "Trabalho à distância", "Local de trabalho virtual", "Escritório móvel",
+        "Trabalho itinerante", "Escritório sem fronteiras", "Escritório satélite",
+        "Habilitado para trabalho remoto", "Trabalho a distância",
+    ],
+    'Romanian': [
+        "La distanță", "Lucru de acasă", "Telecomutare", "Birou virtual",
+        "În afara locului de muncă", "Lucru de oriunde", "Echipa distribuită",
+        "Independență față de locație", "Forță de muncă mobilă", "Birou în cloud",
+        "Spațiu de lucru online", "Nomad digital", "Locație flexibilă", "Birou oriunde",
+        "Lucru la distanță", "Loc de muncă virtual", "Birou mobil", "Muncă itinerantă",
+        "Birou fără granițe", "Birou satelit", "Activat pentru lucru la distanță",
+        "Lucru de departe",
+    ],
+    'Slovakian': [
+        "Vzdialený", "Domáca kancelária", "Telekomutácia", "Virtuálna kancelária",
+        "Mimo pracoviska", "Práca z akéhokoľvek miesta", "Distribuovaný tím",
+        "Nezávislosť na mieste", "Mobilná pracovná sila", "Cloudová kancelária",
+        "Online pracovný priestor", "Digitálny nomád", "Flexibilné miesto", "Kancelária kdekoľvek",
+        "Práca na diaľku", "Virtuálna pracovná plocha", "Mobilná kancelária", "Roamingová práca",
+        "Bezhraničná kancelária", "Satelitná kancelária", "Vzdialene zapojený", "Práca z diaľky",
+    ],
+    'Slovenian': [
+        "Oddaljeno", "Domača pisarna", "Telekomutiranje", "Virtualna pisarna", "Oddaljeno delo",
+        "Delo od koderkoli", "Distribuirana ekipa", "Lokacijsko neodvisno", "Mobilna delovna sila",
+        "Oblak pisarna", "Spletni delovni prostor", "Digitalni nomad", "Fleksibilna lokacija",
+        "Pisarna kjerkoli", "Delo na daljavo", "Virtualno delovno okolje", "Mobilna pisarna",
+        "Potujoče delo", "Brezmejna pisarna", "Satelitska pisarna", "Oddaljeno omogočeno",
+        "Delo od daleč",
+    ],
+    'Swedish': [
+        "Distans", "Hemmakontor", "Telekommunikation", "Virtuellt kontor", "Utomhusarbete",
+        "Arbeta från vilken plats som helst", "Distribuerat team", "Plats oberoende",
+        "Mobil arbetsstyrka", "Molnkontor", "Online arbetsutrymme", "Digital nomad",
+        "Flexibel plats", "Kontor var som helst", "Distansarbete", "Virtuellt arbetsområde",
+        "Mobilt kontor", "Roaming-jobb", "Gränslöst kontor", "Satellitkontor", "Fjärrstyrt",
+        "Arbeta från avlägsna platser",
+    ],
+    'Turkish': [
+        "Uzaktan", "Ev ofisi", "Uzaktan çalışma", "Sanal ofis", "Ofis dışı",
+        "Herhangi bir yerden çalışma", "Dağıtılmış ekip", "Konum bağımsız", "Mobil işgücü",
+        "Bulut ofis", "Çevrimiçi çalışma alanı", "Dijital gezgin", "Esnek konum", "Her yerde ofis",
+        "Uzaktan çalışma", "Sanal işyeri", "Mobil ofis", "Gezici iş", "Sınır tanımayan ofis",
+        "Uydu ofisi", "Uzaktan çalışmaya uygun", "Uzaktan çalışma",
+    ],
+    'Japanese': [
+        "在宅勤務", "テレワーク", "バーチャルオフィス", "オフサイト勤務", "どこでも勤務", "分散チーム", "場所に依存しない", "モバイルワークフォース",
+        "クラウドオフィス", "オンラインワークスペース", "デジタルノマド", "柔軟な場所", "どこでもオフィス", "遠隔勤務", "仮想ワークプレイス",
+        "モバイルオフィス", "ローミングジョブ", "境界のないオフィス", "サテライトオフィス", "リモート対応", "遠隔からの勤務",
+    ],
+    'Korean': [
+        "재택 근무", "원격근무", "가상사무실", "사이트 외 근무", "어디서든 근무", "분산 팀", "위치 독립적", "모바일 근무", "클라우드 사무실",
+        "온라인 작업 공간", "디지털 노마드", "유연한 위치", "어디서든 사무실", "원격 근무", "가상 작업장", "모바일 사무실", "로밍 직업",
+        "경계없는 사무실", "위성 사무실", "원격 작동 가능", "멀리서 근무",
+    ],
+    'Chinese_TR': [
+        "居家辦公", "遠端辦公", "虛擬辦公室", "外地辦公", "全球任務", "分散式團隊", "不受地理限制", "流動辦公", "雲端辦公室", "線上工作空間",
+        "數位遊牧者", "靈活的工作地點", "無所不在的辦公室", "遠程工作", "虛擬工作場所", "行動辦公室", "漫遊工作", "無邊界辦公室", "衛星辦公室",
+        "遠端啟用", "遠距工作",
+    ],
+    'Chinese_SP': [
+        "远程工作", "家庭办公室", "远程办公", "虚拟办公室", "外场办公", "随处办公", "分散团队", "无固定办公地", "移动式劳动力", "云办公室",
+        "在线工作空间", "数字游牧者", "灵活的位置", "无处不办公", "远程工作", "虚拟工作场所", "移动办公室", "漫游工作", "无边界的办公室", "卫星办公室",
+        "远程启用", "远程工作",
+    ],
+}
+
+# Contract
+
+CONTRACT_TERMS = [
+    "contract", "temporary", "freelance", "consulting", "project-based", "fixed-term", "interim",
+    "non-permanent", "part-time",
+]
+
+CONTRACT_TERMS_NON_ENGLISH = {
+    'Arabic': [
+        "عقد", "مؤقت", "حر", "استشارات", "مشروع", "محدد المدة", "وكيل مؤقت", "غير دائم",
+        "جزئي الوقت",
+    ],
+    'Basque': [
+        "kontratu", "azkenaldi", "freelance", "aurrekontu", "proiektu", "zehaztutako-aldi",
+        "interim", "ez-izenaemanda", "partaide",
+    ],
+    'Catalan': [
+        "contracte", "temporal", "freelance", "consultoria", "basat en projectes", "a termini fix",
+        "interí", "no permanent", "a temps parcial",
+    ],
+    'Czech': [
+        "smlouva", "dočasný", "freelance", "konzultace", "projektově zaměřený",
+        "s pevnou dobou trvání", "dočasný", "ne stálý", "částečný úvazek",
+    ],
+    'German': [
+        "Vertrag", "temporär", "freiberuflich", "Beratung", "projektbasiert", "befristet",
+        "interim", "nicht dauerhaft", "Teilzeit",
+    ],
+    'Danish': [
+        "kontrakt", "midlertidig", "freelance", "konsulent", "projektbaseret", "tidsbegrænset",
+        "midlertidig", "ikke-permanent", "deltid",
+    ],
+    'Spanish': [
+        "contrato", "temporal", "freelance", "consultoría", "basado en proyectos", "a plazo fijo",
+        "interino", "no permanente", "a tiempo parcial",
+    ],
+    'Finnish': [
+        "sopimus", "määräaikainen", "freelance", "konsultointi", "projektipohjainen",
+        "määräaikainen", "väliaikainen", "ei-pysyvä", "osa-aikainen",
+    ],
+    'French': [
+        "contrat", "temporaire", "freelance", "consulting", "basé sur des projets",
+        "à durée déterminée", "intérim", "non permanent", "à temps partiel",
+    ],
+    'Frisian': [
+        "kontrakt", "tydelik", "freelance", "konsultearjend", "projektbasis", "fêstet tiid",
+        "yn 'e mjitte", "net-permanent", "parttime",
+    ],
+    'Galician': [
+        "contrato", "temporal", "freelance", "consultoría", "baseado en proxectos", "a prazo fixo",
+        "interino", "non permanente", "a tempo parcial",
+    ],
+    'Greek': [
+        "σύμβαση", "προσωρινός", "ελεύθερος επαγγελματίας", "συμβουλευτική", "βασισμένος σε έργα",
+        "ορισμένου χρόνου", "προσωρινός", "μη μόνιμος", "μερική απασχόληση",
+    ],
+    'Hebrew': [
+        "חוזה", "זמני", "עצמאי", "ייעוץ", "מבוסס פרויקט", "בזמן קבוע", "ביניים", "לא קבוע",
+        "עם שעות חלקיות",
+    ],
+    'Hungarian': [
+        "szerződés", "ideiglenes", "szabadúszó", "tanácsadás", "projekt-alapú", "határozott idejű",
+        "ideiglenes", "nem állandó", "részidős",
+    ],
+    'Italian': [
+        "contratto", "temporaneo", "freelance", "consulenza", "basato su progetti", "a termine",
+        "interinale", "non permanente", "part-time",
+    ],
+    'Kurdish': [
+        "ferman", "kêmtirî", "serbest", "konsultanî", "projeyê base kirî", "kêmtirî", "navdewletî",
+        "ne-qalind", "cihî (part-time)",
+    ],
+    'Dutch': [
+        "contract", "tijdelijk", "freelance", "consultancy", "projectmatig", "vastgesteld-termijn",
+        "interim", "niet-permanent", "deeltijd",
+    ],
+    'Norwegian': [
+        "kontrakt", "midlertidig", "frilans", "konsulent", "prosjektbasert", "fastsatt periode",
+        "midlertidig", "ikke-permanent", "deltid",
+    ],
+    'Polish': [
+        "kontrakt", "b2b", "o dzieło", "tymczasowy", "freelancer", "konsulting",
+        "oparty na projekcie", "określony czas", "tymczasowy", "nie stały",
+        "w niepełnym wymiarze czasu pracy",
+    ],
+    'Portuguese': [
+        "contrato", "temporário", "freelance", "consultoria", "baseado em projetos", "a termo",
+        "interino", "não permanente", "a tempo parcial",
+    ],
+    'Romanian': [
+        "contract", "temporar", "freelance", "consultanță", "bazat pe proiecte", "pe termen fix",
+        "interimar", "nepermanent", "cu timp parțial",
+    ],
+    'Slovakian': [
+        "zmluva", "dočasný", "freelance", "konzultácie", "projektový", "s pevným termínom",
+        "dočasný", "nie trvalý", "čiastočný úväzok",
+    ],
+    'Slovenian': [
+        "pogodba", "začasno", "svobodnjak", "svetovanje", "projektno usmerjeno", "za določen čas",
+        "začasno", "nepremičen", "delni delovni čas",
+    ],
+    'Swedish': [
+        "kontrakt", "tillfällig", "frilans", "konsult", "projektbaserad", "tidsbegränsad",
+        "tillfällig", "icke permanent", "deltid",
+    ],
+    'Turkish': [
+        "sözleşme", "geçici", "serbest", "danışmanlık", "proje tabanlı", "belirli bir süreli",
+        "geçici", "kalıcı olmayan", "yarı zamanlı",
+    ],
+    'Japanese': ["契約", "臨時", "フリーランス", "コンサルティング", "プロジェクトベース", "期間限定", "臨時", "非常勤", "パートタイム"],
+    'Korean': ["계약", "임시", "프리랜서", "컨설팅", "프로젝트 기반", "기간 제한", "임시", "비영구적", "파트타임"],
+    'Chinese_TR': ["合同", "临时", "自由职业者", "咨询", "项目为基础", "有固定期限", "临时", "非永久", "兼职"],
+    'Chinese_SP': ["合同", "臨時", "自由職業者", "諮詢", "以專案為基礎", "有固定期限", "臨時", "非永久", "兼職"],
+}
+
+# Seniority
+
+# "Internship", "Intern", "Trainee", "Apprentice", etc.
+# are basically the same as Junior but usually without pay.
+# The first matched seniority is taken, in the order of the keys.
+SENIORITIES = {
+    'Junior': [
+        "Jr.", "Junior", "Internship", "Intern", "Trainee", "Apprentice", "Novice", "Beginner",
+        "Probationary",
+    ],
+    'Mid': ["Mid", "Associate", "Regular"],
+    'Senior': ["Sr.", "Senior", "Lead", "Principle", "Staff"],
+    'Management': [
+        "Manager", "Head of", "Director", "Chief", "Supervisor", "Coordinator", "Executive",
+    ],
+}
+
+SENIORITIES_NON_ENGLISH = {
+    'Arabic': {
+        'Junior': [
+            "مبتدئ", "مبتدئ", "تدريب", "متدرب", "متدرب", "شابّ حرفي", "مبتدئ", "مبتدئ", "تجريبي",
+        ],
+        'Mid': ["وسط", "مساعد", "الإداري"],
+        'Senior': ["كبير", "مسن", "زعيم", "مبدأ"],
+        'Management': ["مدير", "رئيس", "مدير عام", "رئيس تنفيذي", "مشرف", "منسق", "تنفيذي"],
+    },
+    'Basque': {
+        'Junior': [
+            "Praktikak", "Praktikante", "Lantaldean", "Lantokiari", "Hasiberri", "Hasi", "Proba",
+        ],
+        'Mid': ["Erdi", " Kide Laguntzailea"],
+        'Senior': ["Zk.", "Seneur", "Lider", "Printzipio"],
+        'Management': [
+            "Kudeatzailea", "Burua", "Zuzendaria", "Buruzagia", "Buruzagi", "Koordinatzailea",
+            "Gobernatzailea", "Ejecutivoa",
+        ],
+    },
+    'Catalan': {
+        'Junior': [
+            "Pràctiques", "Practicant", "Aprenent", "Aprendiz", "Novell", "Principiant",
+            "Probatori",
+        ],
+        'Mid': ["Middle", "Associat", "Associada"],
+        'Senior': ["Snr.", "Sènior", "Líder", "Principi"],
+        'Management': [
+            "Gerent", "Cap de", "Director", "Cap", "Supervisor", "Coordinador", "Executiu",
+        ],
+    },
+    'Czech': {
+        'Junior': [
+            "Stáž", "Stážista", "Staženík", "Učeň", "Nováček", "Začátečník", "Zkušební doba",
+        ],
+        'Mid': ["Střední", "Asociát"],
+        'Senior': ["Sr.", "Starší", "Vedoucí", "Princip"],
+        'Management': ["Manažer", "Šéf", "Ředitel", "Šéf", "Dozorce", "Koordinátor", "Výkonný"],
+    },
+    'German': {
+        'Junior': [
+            "Jr.", "Junior", "Praktikum", "Praktikant", "Auszubildender", "Lehrling", "Neuling",
+            "Anfänger", "Probezeit",
+        ],
+        'Mid': ["Mittel", "Assoziierter", "Assoziierte"],
+        'Senior': ["Sr.", "Senior", "Leiter", "Prinzip"],
+        'Management': [
+            "Manager", "Leiter", "Direktor", "Chef", "Vorgesetzter", "Koordinator", "Executive",
+        ],
+    },
+    'Danish': {
+        'Junior': [
+            "Praktik", "Praktikant", "Trainee", "Lærling", "Nybegynder", "Begynder", "Prøvetid",
+        ],
+        'Mid': ["Mellem", "Associeret"],
+        'Senior': ["Sr.", "Senior", "Leder", "Princip"],
+        'Management': [
+            "Manager", "Hoved af", "Direktør", "Chef", "Supervisor", "Koordinator", "Executive",
+        ],
+    },
+    'Spanish': {
+        'Junior': [
+            "Prácticas", "Practicante", "Practicante", "Aprendiz", "Novato", "Principiante",
+            "De prueba",
+        ],
+        'Mid': ["Medio", "Intermedio", "Asociado", "Asociada"],
+        'Senior': ["Sr.", "Senior", "Líder", "Principio"],
+        'Management': [
+            "Gerente", "Jefe de", "Director", "Jefe", "Supervisor", "Coordinador", "Ejecutivo",
+        ],
+    },
+    'Finnish': {
+        'Junior': [
+            "Nuorempi", "Harjoittelu", "Harjoittelija", "Harjoittelija", "Oppipoika", "Uusi",
+            "Aloittelija", "Koeaika",
+        ],
+        'Mid': ["Keski-", "Keskivaiheen", "Yhdistynyt"],
+        'Senior': ["Sr.", "Seniori", "Johtaja", "Periaate"],
+        'Management': [
+            "Johtaja", "Pää", "Johtaja", "Päällikkö", "Valvoja", "Koordinaattori", "Toteuttava",
+        ],
+    },
+    'French': {
+        'Junior': [
+            "Stage", "Stagiaire", "Stagiaire", "Apprenti", "Novice", "Débutant", "Période d'essai",
+        ],
+        'Mid': ["Milieu", "Associé", "Associée"],
+        'Senior': ["Sr.", "Senior", "Principe"],
+        'Management': [
+            "Directeur", "Chef de", "Directeur", "Chef", "Superviseur", "Coordinateur", "Exécutif",
+        ],
+    },
+    'Frisian': {
+        'Junior': [
+            "Stazjê", "Stazjê", "Trainee", "Learling", "Nijkommer", "Nijbegjinne",
+            "Probearperiode",
+        ],
+        'Mid': ["Mids", "Midden", "Ferbûn"],
+        'Senior': ["Snr.", "Sinnior", "Lieder", "Prinsipe"],
+        'Management': [
+            "Manager", "Holwer", "Direkteur", "Chef", "Taufersjoch", "Koördinator", "Executive",
+        ],
+    },
+    'Galician': {
+        'Junior': [
+            "Novo", "Prácticas", "Estudante en prácticas", "Trainee", "Aprendiz", "Novato",
+            "Principiante", "Probatorio",
+        ],
+        'Mid': ["Medio", "Intermedio", "Asociado", "Asociada"],
+        'Senior': ["Snr.", "Sénior", "Líder", "Principio"],
+        'Management': [
+            "Xestor", "Xefe de", "Director", "Xefe", "Supervisor", "Coordinador", "Executivo",
+        ],
+    },
+    'Greek': {
+        'Junior': [
+            "Νεαρός", "Πρακτική άσκηση", "Πρακτικός", "Εκπαιδευόμενος", "Μαθητευόμενος", "Νέος",
+            "Αρχάριος", "Δοκιμαστική περίοδος",
+        ],
+        'Mid': ["Μεσαίος", "Μεσαίας", "Συνδεδεμένος "],
+        'Senior': ["Κος.", "Γερός", "Αρχηγός", "Αρχή"],
+        'Management': [
+            "Διευθυντής", "Αρχηγός", "Διευθυντής", "Αρχηγός", "Επόπτης", "Συντονιστής",
+            "Εκτελεστικός",
+        ],
+    },
+    'Hebrew': {
+        'Junior': [
+            "תקופת הכשרה", "סטודנט לתקופת הכשרה", "מתמחה", "חניך", "חדש", "מתחיל", "תקופת ניסיון",
+        ],
+        'Mid': ["אמצעי", "אמצעיים", "שותף"],
+        'Senior': ["סמסטר", "בכיר", "מנהיג", "עקרון"],
+        'Management': ["מנהל", "ראש", "מנכ״ל", "ראשי", "מפקח", "מתאם", "מנהלי"],
+    },
+    'Hungarian': {
+        'Junior': [
+            "Jr.", "Junior", "Gyakornok", "Gyakornok", "Tanuló", "Apprentice", "Újonc", "Kezdő",
+            "Próbaidős",
+        ],
+        'Mid': ["Közép", "Középső", "Társult"],
+        'Senior': ["Sr.", "Idősebb", "Vezető", "Elv"],
+        'Management': ["Menedzser", "Igazgató", "Fő", "Felügyelő", "Koordinátor"],
+    },
+    'Italian': {
+        'Junior': [
+            "Jr.", "Junior", "Stage", "Tirocinante", "Apprendista", "Apprendista", "Neofita",
+            "Principiante", "In prova",
+        ],
+        'Mid': ["Middle", "Associato", "Associata"],
+        'Senior': ["Sig.", "Senior", "Capo", "Principio"],
+        'Management': [
+            "Manager", "Capo di", "Direttore", "Capo", "Supervisore", "Coordinatore", "Esecutivo",
+        ],
+    },
+    'Kurdish': {
+        'Junior': ["Stajyerî", "Stajyer", "Dîlmej", "Şagirt", "Nûjen", "Destpêkê", "Probasyon"],
+        'Mid': ["Navend", "Pêdivî", "Pêdivîya"],
+        'Senior': ["Snr.", "Sînîor", "Serok", "Maf"],
+        'Management': [
+            "Bazirgani", "Serek", "Dirêjor", "Sereke", "Supervîzekar", "Koordinatêr", "Xebatkari",
+        ],
+    },
+    'Dutch': {
+        'Junior': ["Stage", "Stagiair", "Leerling", "Leerling", "Beginner", "Beginnend", "Proef"],
+        'Mid': ["Midden", "Associé", "Associée"],
+        'Senior': ["Sr.", "Senior", "Leidinggevende", "Principe"],
+        'Management': [
+            "Manager", "Hoofd van", "Directeur", "Chef", "Toezichthouder", "Coördinator",
+            "Uitvoerend",
+        ],
+    },
+    'Norwegian': {
+        'Junior': [
+            "Internship", "Intern", "Lærling", "Lærling", "Nybegynner", "Nybegynner", "Prøvetid",
+        ],
+        'Mid': ["Midten", "Mellom", "Assosiert"],
+        'Senior': ["Sr.", "Senior", "Leder", "Prinsipp"],
+        'Management': [
+            "Leder", "Hode av", "Direktør", "Sjef", "Veileder", "Koordinator", "Utførende",
+        ],
+    },
+    'Polish': {
+        'Junior': [
+            "Staż", "Stażysta", "Praktykant", "Praktykant", "Początkujący", "Nowicjusz",
+            "Okres próbny",
+        ],
+        'Mid': ["Średni", "Średniego"],
+        'Senior': ["Sr.", "Senior", "Lider"],
+        'Management': [
+            "Manager", "Kierownik", "Dyrektor", "Szef", "Przełożony", "Koordynator", "Wykonawczy",
+        ],
+    },
+    'Portuguese': {
+        'Junior': [
+            "Jr.", "Júnior", "Estágio", "Estagiário", "Estagiário", "Aprendiz", "Novato",
+            "Iniciante", "Probatório",
+        ],
+        'Mid': ["Médio", "Média", "Associado", "Associada"],
+        'Senior': ["Sr.", "Sênior", "Líder", "Princípio"],
+        'Management': [
+            "Gerente", "Chefe de", "Diretor", "Chefe", "Supervisor", "Coordenador", "Executivo",
+        ],
+    },
+    'Romanian': {
+        'Junior': [
+            "Internship", "Intern", "Stagiar", "Stagiar", "Începător", "Novice",
+            "Perioada de probă",
+        ],
+        'Mid': ["Mijlociu", "Asociat", "Asociată"],
+        'Senior': ["Sr.", "Senior", "Lider", "Principiu"],
+        'Management': [
+            "Manager", "Șef de", "Director", "Șef", "Supraveghetor", "Coordonator", "Executiv",
+        ],
+    },
+    'Slovakian': {
+        'Junior': ["Stáž", "Stážista", "Učeň", "Učeň", "Nováčik", "Začiatočník", "Skúšobná doba"],
+        'Mid': ["Stred", "Asociat", "Asociátka"],
+        'Senior': ["Srk.", "Starší", "Vedúci", "Princíp"],
+        'Management': ["Manažér", "Vedúci", "Riaditeľ", "Šéf", "Dozorca", "Koordinátor", "Výkonný"],
+    },
+    'Slovenian': {
+        'Junior': ["Staž", "Stažist", "Vajenec", "Vajenec", "Novinec", "Novinec", "Poskusno"],
+        'Mid': ["Srednji", "Povezan", "Povezana"],
+        'Senior': ["G. g.", "Starejši", "Vodja", "Načelo"],
+        'Management': ["Vodja", "Vodja", "Direktor", "Šef", "Nadzornik", "Koordinator", "Izvršni"],
+    },
+    'Swedish': {
+        'Junior': [
+            "Praktik", "Praktikant", "Lärling", "Lärling", "Nykomling", "Nybörjare", "Prövotid",
+        ],
+        'Mid': ["Mellan", "Associerad"],
+        'Senior': ["Sr.", "Senior", "Ledare", "Princip"],
+        'Management': [
+            "Chef", "Huvud av", "Direktör", "Chef", "Övervakare", "Koordinator", "Utförande",
+        ],
+    },
+    'Turkish': {
+        'Junior': [
+            "Stajyerlik", "Stajyer", "Stajyer", "Çırak", "Acemi", "Yeni başlayan", "Deneme süresi",
+        ],
+        'Mid': ["Orta", "Ortak", "Orta düzeyli"],
+        'Senior': ["Sn.", "Kıdemli", "Lider", "Prensip"],
+        'Management': [
+            "Yönetici", "Başkanı", "Direktör", "Şef", "Denetçi", "Koordinatör", "Yürütücü",
+        ],
+    },
+    'Japanese': {
+        'Junior': ["ジュニア", "インターンシップ", "インターン", "トレーニー", "見習い", "初心者", "ビギナー", "試用期間"],
+        'Mid': ["ミッドレベル", "アソシエイト", "ミドル"],
+        'Senior': ["Sr.", "シニア", "リーダー", "原則"],
+        'Management': ["マネージャー", "ヘッドオブ", "ディレクター", "チーフ", "スーパーバイザー", "コーディネーター", "エグゼクティブ"],
+    },
+    'Korean': {
+        'Junior': ["주니어", "인턴십", "인턴", "연수생", "견습생", "초보자", "비전문가", "수습기간"],
+        'Mid': ["중급", "어소시에이트"],
+        'Senior': ["선배", "시니어", "리더", "원칙"],
+        'Management': ["매니저", "대표", "디렉터", "최고", "감독자", "코디네이터", "집행"],
+    },
+    'Chinese_TR': {
+        'Junior': ["初級", "實習", "實習生", "見習生", "學徒", "新手", "初學者", "試用期"],
+        'Mid': ["中級", "聯合"],
+        'Senior': ["高級", "資深", "領導", "原則"],
+        'Management': ["經理", "負責人", "董事", "主管", "監督者", "協調人", "執行"],
+    },
+    'Chinese_SP': {
+        'Junior': ["Jr.", "初级", "实习", "实习生", "见习生", "学徒", "新手", "初学者", "试用期"],
+        'Mid': ["中级", "联合"],
+        'Senior': ["高级", "高级", "领导", "原则"],
+        'Management': ["经理", "负责人", "董事", "主管", "监督者", "协调人", "执行"],
+    },
+}
+
+# Salary
+
+ISO_CURRENCIES = {
+    '€': "EUR",
+    '$': "USD",
+    'CA$': "CAD",
+    'HK$': "HKD",
+    'NZ$': "NZD",
+    'A$': "AUD",
+    '£': "GBP",
+}
+
+# Technologies
+
+# The first matched platform is taken, "Git" has to be the last one on the git list!
+GIT_PLATFORMS = [
+    "Github", "GitLab", "Bitbucket", "SourceForge", "Launchpad",
+    "Google Cloud Source Repositories", "AWS CodeCommit", "GitBucket", "Gogs", "Gitea",
+    "Apache Allura", "RhodeCode", "ONEDEV", "Codeberg", "Git", "SVN", "Subversion",
+]
+
+# The column name and its keywords
+TECHNOLOGIES = {
+    'AWS': ["Amazon Web Services", "AWS"],
+    'Microsoft_Azure': ["Microsoft Azure", "Azure"],
+    'GPC': ["Google Cloud Platform", "GCP"],
+    'Alibaba_Cloud': ["Alibaba Cloud", "Aliyun"],
+    'Oracle_Cloud': ["Oracle Cloud", "OCI"],
+    'IBM_cloud': ["IBM Cloud", "Kyndryl", "Bluemix"],
+    'Tencent_cloud': ["Tencent Cloud"],
+    'OVHcloud': ["OVHcloud", "OVH"],
+    'DigitalOcean_cloud': ["DigitalOcean"],
+    'Lincode_cloud': ["Linode", "Akamai"],
+    'PostgreSQL': ["PostgreSQL", "Postgres"],
+    'Microsoft_SQL_Server': ["Microsoft SQL", "SQL Server"],
+    'MySQL': ["MySQL"],
+    'IBM_Db2': ["Db2", "IBMDb2"],
+    'Oracle_PL_SQL': ["PL/SQL", "PL / SQL", "Procedural Language for SQL"],
+    'MongoDB': ["MongoDB", "Mongo DB"],
+    'Cassandra': ["Cassandra"],
+    'Amazon_DynamoDB': ["DynamoDB", "Dynamo DB", "SimpleDB"],
+    'Neo4j': ["Neo4j"],
+    'Apache_Solr': ["Solr"],
+    'Amazon_Redshift': ["Redshift"],
+    'Google_BigQuery': ["BigQuery"],
+    'Snowflake': ["Snowflake"],
+    'Oracle_Exadata': ["Exadata"],
+    'SAP_HANA': ["HANA"],
+    'Teradata': ["Teradata"],
+    'Informatica_PowerCenter': ["PowerCenter", "Power Center"],
+    'Databricks': ["Data Bricks", "Databricks"],
+    'Presto': ["Presto", "PrestoDB", "PrestoSQL"],
+    'Apache_Kafka': ["Kafka"],
+    'Apache_Flink': ["Flink"],
+    'Dataflow': ["Dataflow"],
+    'Apache_Airflow': ["Airflow"],
+    'Luigi': ["Luigi"],
+    'SSIS': ["SSIS", "SQL Server Integration Services"],
+    'Apache_Hadoop': ["Hadoop"],
+    'Apache_Hive': ["Hive"],
+    'Apache_Spark': ["Spark", "PySpark"],
+    'Linux': [
+        "Linux", "Ubuntu", "CentOS", "Red Hat", "Debian", "Fedora", "openSUSE", "RHEL", "Gentoo",
+        "Kali",
+    ],
+    'Unix': [
+        "Solaris", "AIX", "HP-UX", "BSD", "IRIX", "SCO Unix", "Xenix", "OpenServer", "Unix",
+    ],
+    'Windows': ["Windows", "WinNT"],
+    'macOS': ["macOS"],
+    'Python': ["Python"],
+    'R': ["(?<!')[rR]", "RStudio"],
+    'Scala': ["Scala"],
+    'Julia': ["Julia", "JuliaLang "],
+    'SQL': [
+        "SQL", "MySQL", "PostgreSQL", "Postgres", "SQLite", "MariaDB", "IBM DB2",
+        "Oracle Database", "Db2",
+    ],
+    'Java': ["Java"],
+    'C++': [r"C\+\+"],
+    'Go': ["Go language", "Golang"],
+    'Rust': ["Rust"],
+    'Bash': ["Bash"],
+    'PowerShell': ["PowerShell", "DOS Shell"],
+    'CLI': ["CLI", "Command Line Interface"],
+    'Tableau': ["Tableau"],
+    'Power_BI': ["Power BI"],
+    'Google_Analytics': ["Google Analytics"],
+    'QlikView': ["QlikView", "Qlik"],
+    'Oracle_BI_server': [
+        "Oracle Business Intelligence Enterprise Edition", "OBIEE", "Oracle BI server",
+    ],
+    'SAS_Analytics': ["SAS Analytics", "Statistical Analysis System"],
+    'Lumira': ["Lumira"],
+    'Cognos_Impromptu': ["Cognos Impromptu"],
+    'MicroStrategy': ["MicroStrategy"],
+    'InsightSquared': ["InsightSquared"],
+    'Sisense': ["Sisense"],
+    'Dundas_BI': ["Dundas BI"],
+    'Domo': ["Domo"],
+    'Looker': ["Looker"],
+    'Excel': ["Excel"],
+    'Scikit': [
+        "scikit-learn", "sklearn", "sklearn-learn", "scikit", "scikit-ml", "sci-kit learn",
+    ],
+    'TensorFlow': ["TensorFlow", "TF", "TensorFlow.js", "TF:DL", "TF2", "TensorFlow Lite", "TFlow"],
+    'PyTorch': [
+        "PyTorch", "Torch", "PyTorch Lightning", "TorchScript", "Torchvision", "TorchHub", "PyT",
+    ],
+    'Keras': ["Keras", "tf.keras"],
+    'SciPy': ["Scientific Python", "Scientific Computing Library", "scipy-numpy"],
+    'OpenCV': ["OpenCV", "OpenCV-Python", "CV2", "Computer Vision Library"],
+}
+
+# Education
+
+# Coursera, Udemy, Datacamp etc. list, the generic certificates are the last ones
+CERTIFICATIONS = [
+    "Data Engineering, Big Data, and Machine Learning on GCP", "Google Professional Data Engineer",
+    "Microsoft Azure Data Engineering", "Nanodegree", "DataCamp",
+    "Data Engineering, Big Data, and Machine Learning on GCP",
+    "Python, Bash and SQL Essentials for Data Engineering Specialization",
+    "Data Engineering ETL, Web Scraping, and Automation",
+    "Big Data Engineering with Hadoop and Spark", "Certificate", "Certificates",
+]
+
+CERTIFICATES_NON_ENGLISH = {
+    'Arabic': ["الشهادات", "شهادة"],
+    'Basque': ["ziurtagiriak", "ziurtagiri"],
+    'Catalan': ["certificats", "certificat"],
+    'Czech': ["certifikáty", "certifikát"],
+    'German': ["Zertifikate", "Zertifikat"],
+    'Danish': ["certifikater", "certifikat"],
+    'Spanish': ["certificados", "certificado"],
+    'Finnish': ["todistukset", "todistus"],
+    'French': ["certificats", "certificat"],
+    'Frisian': ["sertifikaten", "sertifikaat"],
+    'Galician': ["certificados", "certificado"],
+    'Greek': ["πιστοποιητικά", "πιστοποιητικό"],
+    'Hebrew': ["תעודות", "תעודה"],
+    'Hungarian': ["tanúsítványok", "tanúsítvány"],
+    'Italian': ["certificati", "certificato"],
+    'Kurdish': ["belge", "bername"],
+    'Dutch': ["certificaten", "certificaat"],
+    'Norwegian': ["sertifikater", "sertifikat"],
+    'Polish': ["certyfikat", "certyfikaty"],
+    'Portuguese': ["certificados", "certificado"],
+    'Romanian': ["certificate", "certificat"],
+    'Slovakian': ["certifikáty", "certifikát"],
+    'Slovenian': ["certifikati", "certifikat"],
+    'Swedish': ["certifikat", "certifikat"],
+    'Turkish': ["sertifikalar", "sertifika"],
+    'Japanese': ["証明書", "資格証明書"],
+    'Korean': ["증명서", "자격증"],
+    'Chinese_TR': ["證書", "資格證書"],
+    'Chinese_SP': ["证书", "资格证书"],
+}
+
+EDUCATION = {
+    'BA': ["BA", "Bachelor", "BSc", "Bachelors"],
+    'MS': ["MS", "MSc", "Master", "Masters", r"master\'s"],
+    'Phd': ["Phd", r"Ph\.D", "DPhil", "Doctor of Philosophy"],
+}
+
+EDUCATION_NON_ENGLISH = {
+    'BA': {
+        'Arabic': ["بكالوريوس", "العلوم الأساسية"],
+        'Basque': ["Lizentziatura", "Lizentziadun"],
+        'Catalan': ["Llicenciatura", "Llicenciat"],
+        'Czech': ["Bakalář", "Bakalářský"],
+        'German': ["Bakkalaureatsabschluss", "Bakkalaureat", "Bakkalaureus"],
+        'Danish': ["Kandidat"],
+        'Spanish': ["Grado", "Licenciatura"],
+        'Finnish': ["Kandidaatti", "Luonnontieteiden kandidaatti"],
+        'French': ["licence", "licence universitaire"],
+        'Frisian': [],
+        'Galician': ["Grao", "licenciatura", "licenciado"],
+        'Greek': ["Πτυχίο", "Πτυχιακός"],
+        'Hebrew': ["תואר ראשון", "בצלמל"],
+        'Hungarian': ["Alapképzés", "diplomás"],
+        'Italian': ["Laurea", "Triennale"],
+        'Kurdish': ["Zanist"],
+        'Dutch': ["Bachelordiploma"],
+        'Norwegian': ["Bachelorgrad"],
+        'Polish': ["Licencjat", "Inżynier"],
+        'Portuguese': ["Bacharelado", "diploma de bacharel", "solteiro", "celibatário"],
+        'Romanian': ["burlac", "licenţiat"],
+        'Slovakian': ["Bakalár"],
+        'Slovenian': ["Samec"],
+        'Swedish': ["Ungkarl", "Kandidat"],
+        'Turkish': ["Lisans"],
+        'Japanese': ["学士号", "学士", "理学士", "学士課程"],
+        'Korean': ["학사 학위", "학사", "이학사", "학사 학위과정"],
+        'Chinese_TR': ["學士學位", "學士", "理學士", "學士學位課程"],
+        'Chinese_SP': ["学士学位", "学士", "理学士", "学士学位课程"],
+    },
+    'MS': {
+        'Arabic': ["الماجستير", "الماجستيرات"],
+        'Basque': ["Masterren"],
+        'Catalan': ["Mestres"],
+        'Czech': ["Magistr", "Magisterský", "magisterský"],
+        'German': ["Meister"],
+        'Danish': ["Kandidatuddannelse"],
+        'Spanish': ["Máster", "Maestría"],
+        'Finnish': ["Maisteri", "Luonnontieteiden maisteri"],
+        'French': ["Maîtrise", "Master universitaire"],
+        'Frisian': [],
+        'Galician': ["Mestrado", "mestrado universitario"],
+        'Greek': ["Μεταπτυχιακό", "μεταπτυχιακός", "Μεταπτυχιακή σπουδή"],
+        'Hebrew': ["תואר שני", "מגיסטר"],
+        'Hungarian': ["Mesterképzés", "mesterképző"],
+        'Italian': ["Laurea magistrale", "Magistrale"],
+        'Kurdish': ["Masterên"],
+        'Dutch': ["Meesters"],
+        'Norwegian': ["Mestere"],
+        'Polish': ["Magister", "magisterski"],
+        'Portuguese': ["Mestras", "Mestres"],
+        'Romanian': ["Masterat"],
+        'Slovakian': ["Majstri"],
+        'Slovenian': ["Magistri", "Mojstri"],
+        'Swedish': ["Mästare"],
+        'Turkish': ["Ustalar", "ustaları"],
+        'Japanese': ["学士", "学士号", "学士課程", "バチェラー"],
+        'Korean': ["학사", "학사학위", "배철러"],
+        'Chinese_TR': ["學士", "學士學位", "學士學位課程", "學士學位課程"],
+        'Chinese_SP': ["学士", "学士学位", "学士学位课程", "本科"],
+    },
+    'Phd': {
+        'Arabic': ["دكتوراه في الفلسفة", "دكتوراه", "دكتوراة"],
+        'Basque': ["Filosofia Doktore", "doktoretza", "Doktoregoa"],
+        'Catalan': ["Mestres", "Doctorat"],
+        'Czech': ["Doktor", "Doktorský"],
+        'German': ["Doktorin", "Doktor"],
+        'Danish': [],
+        'Spanish': ["Doctor", "Doctora"],
+        'Finnish': ["Tohtori"],
+        'French': ["Doctorat"],
+        'Frisian': [],
+        'Galician': ["Doutorando", "Doutoramento"],
+        'Greek': [],
+        'Hebrew': ["דוקטורט", "תואר שלישי"],
+        'Hungarian': ["Dr"],
+        'Italian': ["dottorato di ricerca"],
+        'Kurdish': ["Dr"],
+        'Dutch': ["Doctoraat"],
+        'Norwegian': [],
+        'Polish': ["Doktor", "doktorski"],
+        'Portuguese': ["doutorado"],
+        'Romanian': ["doctorat"],
+        'Slovakian': ["PhDr"],
+        'Slovenian': ["doktorat znanosti"],
+        'Swedish': ["doktorsexamen"],
+        'Turkish': ["Doktora"],
+        'Japanese': ["哲学博士"],
+        'Korean': ["박사학위"],
+        'Chinese_TR': ["博士", "哲學博士"],
+        'Chinese_SP': ["博士", "哲学博士"],
+    },
+}
@@ -0,0 +1,78 @@
+'''
+This module loads the RAW CSV files of a job title into a DataFrame per country.
+The country is read from the file name given by the scraper,
+e.g. `Data_Engineer_Czech_Republic_11-04-2023_19-57.csv`.
+'''
+# Python
+import os
+import re
+
+# External
+import pandas as pd
+
+# Internal
+from scraper.config.get import get_encoding
+
+
+def get_CSVs_in_folder(directory: str, job_title: str | None = None) -> dict[str, list[str]]:
+    '''
+    Finds the RAW CSV files of the job title in the directory, without loading them.
+
+    Args:
+    - directory (str): The directory with the RAW CSV files, e.g. "data/RAW/Data Engineer".
+    - job_title (str | None): The job title in the file names.
+    If None, the name of the directory is used.
+
+    Returns:
+    - dict[str, list[str]]: The sorted paths of the files sorted by the country,
+    e.g. "United_States".
+    '''
+
+    if job_title is None:
+        job_title = os.path.basename(os.path.normpath(directory))
+
+    # https://regex101.com/r/QYuVDf/1
+    pattern = re.compile(
+        re.escape(job_title.replace(" ", "_")) +
+        r"_([a-zA-Z_]+)_\d{2}-\d{2}-\d{4}_\d{2}-\d{2}\.csv$"
+    )
+
+    files_by_country: dict[str, list[str]] = {}
+
+    for file in sorted(os.listdir(directory)):
+        match = pattern.match(file)
+        if match:
+            files_by_country.setdefault(match.group(1), []).append(
+                os.path.join(directory, file))
+
+    return {country: files_by_country[country] for country in sorted(files_by_country)}
+
+
+def read_CSVs(file_paths: list[str]) -> pd.DataFrame:
+    '''
+    Loads the RAW CSV files of a country. If the country was scraped more than once,
+    its files are concatenated, the repeated postings are removed later by the cleaning stages.
+    '''
+
+    dfs = [pd.read_csv(file_path, encoding=get_encoding()) for file_path in file_paths]
+
+    return pd.concat(dfs, ignore_index=True) if len(dfs) > 1 else dfs[0]
+
+
+def get_dfs_from_CSVs_in_folder(directory: str, job_title: str | None = None) -> dict[str, pd.DataFrame]:
+    '''
+    Loads the RAW CSV files of the directory into DataFrames keyed by the country.
+
+    Args:
+    - directory (str): The directory with the RAW CSV files, e.g. "data/RAW/Data Engineer".
+    - job_title (str | None): The job title in the file names.
+    If None, the name of the directory is used.
+
+    Returns:
+    - dict[str, pd.DataFrame]: The DataFrames sorted by the country, e.g. "United_States".
+    '''
+
+    return {
+        country: read_CSVs(file_paths)
+        for country, file_paths in get_CSVs_in_folder(directory, job_title).items()
+    }
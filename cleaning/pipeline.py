@@ -0,0 +1,402 @@
+'''
+This module runs the cleaning stages over the RAW CSV files of a job title.
+The countries are independent of each other, so each country DataFrame
+is cleaned in a separate process and the results are concatenated
+into a single clean CSV file with the grouped (MultiIndex) columns.
+The output of each stage is cached, so a re-run cleans only the countries
+with the new or changed RAW files, see `cleaning.stage_cache`.
+'''
+# Python
+import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Iterator
+
+# External
+import pandas as pd
+
+# Internal
+from cleaning import stages
+from cleaning.loader import get_CSVs_in_folder, read_CSVs
+from cleaning.schema import apply_schema
+from cleaning.socioeconomic import SALARY_COLUMNS, load_countries_table
+from cleaning.stage_cache import StageCache, chain_keys, hash_code, load_stage, save_stage
+from cleaning.store import save_clean_parquet
+from cleaning.unique_apply import UniqueStats, collect_stats, record_stats
+from scraper.config.get import get_config, get_encoding
+
+CACHE_DIRECTORY = "_cache"
+
+
+def get_path_csv_clean(job_title: str, date: datetime.date | None = None) -> str:
+    '''
+    Returns the path to the clean CSV file of the job title,
+    e.g. "data/clean/Data_Engineer/Data_Engineer_15-04-2023.csv".
+
+    Args:
+    - job_title (str): The job title, e.g. "Data Engineer".
+    - date (datetime.date | None): The date of the cleaning. Default is today.
+
+    Returns:
+    - str: The path to the clean CSV file.
+    '''
+
+    config = get_config()
+    date = date or datetime.date.today()
+    job_title = job_title.replace(" ", "_")
+
+    return os.path.join(
+        config['output_path']['main'],
+        config['output_path']['clean'],
+        job_title,
+        f"{job_title}_{date.strftime('%d-%m-%Y')}.csv"
+    )
+
+
+def get_path_parquet(path_csv: str) -> str:
+    '''Returns the path to the Parquet file next to the clean CSV file.'''
+
+    return os.path.splitext(path_csv)[0] + ".parquet"
+
+
+def get_path_cache(job_title: str) -> str:
+    '''
+    Returns the directory of the cached stages outputs of the job title,
+    e.g. "data/clean/Data_Engineer/_cache".
+    '''
+
+    return os.path.join(
+        os.path.dirname(get_path_csv_clean(job_title)),
+        CACHE_DIRECTORY
+    )
+
+
+def load_salary_countries() -> pd.DataFrame:
+    '''
+    Loads the columns of the countries table needed to convert the salaries
+    to yearly ones in USD, see `cleaning.socioeconomic`. The other columns are left out,
+    so the cached salaries are kept when they change.
+
+    Returns:
+    - pd.DataFrame: The currencies, the dollar rates and the monthly poverty lines in USD,
+    indexed by the countries.
+    '''
+
+    return load_countries_table()[SALARY_COLUMNS]
+
+
+def get_stages(
+    country: str,
+    countries: pd.DataFrame,
+    year: int
+) -> list[tuple[Callable[..., pd.DataFrame], tuple]]:
+    '''
+    Returns the cleaning stages of a single country, in order.
+
+    Args:
+    - country (str): The country, e.g. "United_States".
+    - countries (pd.DataFrame): The currencies, the dollar rates and the poverty lines
+    of the countries, see `load_salary_countries`.
+    - year (int): The current year, to calculate the companies ages.
+
+    Returns:
+    - list[tuple[Callable[..., pd.DataFrame], tuple]]: The stages with their arguments
+    besides the DataFrame.
+    '''
+
+    # The order of the stages is important!
+    return [
+        (stages.remove_empty_rows, ()),
+        (stages.remove_duplicates, ()),
+        (stages.filter_data_engineering_jobs, (country,)),
+        (stages.apply_locations, (country,)),
+        (stages.add_is_contract, (country,)),
+        (stages.add_seniority, (country,)),
+        (stages.add_salary, (countries,)),
+        (stages.add_company_age, (year,)),
+        (stages.add_job_age, ()),
+        (stages.add_requirements, (country,)),
+        (stages.set_columns, ()),
+    ]
+
+
+def clean_country(
+    country: str,
+    df: pd.DataFrame,
+    countries: pd.DataFrame,
+    year: int
+) -> pd.DataFrame:
+    '''
+    Runs all the cleaning stages over the postings of a single country.
+
+    Args:
+    - country (str): The country, e.g. "United_States".
+    - df (pd.DataFrame): The RAW postings of the country.
+    - countries (pd.DataFrame): The currencies, the dollar rates and the poverty lines
+    of the countries, see `load_salary_countries`.
+    - year (int): The current year, to calculate the companies ages.
+
+    Returns:
+    - pd.DataFrame: The clean postings with the grouped columns.
+    '''
+
+    for stage, args in get_stages(country, countries, year):
+        df = stage(df, *args)
+
+    return df
+
+
+def _clean_country_collecting_stats(
+    *args
+) -> tuple[pd.DataFrame, dict[str, UniqueStats]]:
+    '''Runs `clean_country` and returns also the stats of the distinct values it collected.'''
+
+    with collect_stats() as stats:
+        df = clean_country(*args)
+
+    return df, stats
+
+
+def _clean_country_cached(
+    country_stages: list[tuple[Callable[..., pd.DataFrame], tuple]],
+    file_paths: list[str],
+    stage_paths: list[str],
+    cached: int
+) -> tuple[pd.DataFrame, int | None, dict[str, UniqueStats]]:
+    '''
+    Runs the stages after the cached ones and saves their outputs.
+
+    Args:
+    - country_stages (list[tuple[Callable[..., pd.DataFrame], tuple]]): The stages of the country.
+    - file_paths (list[str]): The RAW CSV files of the country.
+    - stage_paths (list[str]): The Parquet file of each stage output.
+    - cached (int): The number of the first stages, whose outputs are cached.
+
+    Returns:
+    - tuple[pd.DataFrame, int | None, dict[str, UniqueStats]]: The clean postings,
+    the number of the RAW postings if they were loaded and the stats of the distinct values.
+    '''
+
+    with collect_stats() as stats:
+
+        if cached:
+            df = load_stage(stage_paths[cached - 1])
+            rows = None
+        else:
+            df = read_CSVs(file_paths)
+            rows = len(df)
+
+        for (stage, args), stage_path in zip(country_stages[cached:], stage_paths[cached:]):
+            df = stage(df, *args)
+            save_stage(df, stage_path)
+
+    return df, rows, stats
+
+
+def _run_in_pool(
+    function: Callable,
+    jobs: dict[str, tuple],
+    max_workers: int | None
+) -> Iterator[tuple[str, Any]]:
+    '''
+    Runs the function with the arguments of each country in a pool of processes,
+    or one by one in the current process if `max_workers` is 1.
+
+    Returns:
+    - Iterator[tuple[str, Any]]: The countries and the results, in the order of completion.
+    '''
+
+    if max_workers == 1:
+        for country, args in jobs.items():
+            yield country, function(*args)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(function, *args): country
+            for country, args in jobs.items()
+        }
+
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def clean_countries(
+    dfs: dict[str, pd.DataFrame],
+    max_workers: int | None = None
+) -> pd.DataFrame:
+    '''
+    Cleans the countries in parallel, in a pool of processes.
+    The stats of the distinct values from all processes are added to
+    the ones of the current process, see `cleaning.unique_apply.get_stats`.
+
+    Args:
+    - dfs (dict[str, pd.DataFrame]): The RAW postings keyed by the country.
+    - max_workers (int | None): The number of processes. Default is the number of CPUs.
+    With 1 the countries are cleaned one by one in the current process.
+
+    Returns:
+    - pd.DataFrame: The clean postings of all countries, in the order of `dfs`.
+    '''
+
+    countries = load_salary_countries()
+    year = datetime.date.today().year
+
+    jobs = {
+        country: (country, df, countries, year)
+        for country, df in dfs.items()
+    }
+
+    clean_dfs: dict[str, pd.DataFrame] = {}
+
+    for country, (df, stats) in _run_in_pool(
+        _clean_country_collecting_stats, jobs, max_workers
+    ):
+        clean_dfs[country] = df
+        record_stats(stats)
+        _print_country(country, len(dfs[country]), len(df))
+
+    return _concat_countries([clean_dfs[country] for country in dfs])
+
+
+def clean_countries_cached(
+    files: dict[str, list[str]],
+    cache: StageCache,
+    max_workers: int | None = None
+) -> pd.DataFrame:
+    '''
+    Cleans the countries like `clean_countries`, but only the stages whose outputs
+    are not in the cache, i.e. of the new or changed RAW files or of the changed stages.
+
+    Args:
+    - files (dict[str, list[str]]): The RAW CSV files keyed by the country.
+    - cache (StageCache): The cache of the stages outputs.
+    - max_workers (int | None): The number of processes.
+
+    Returns:
+    - pd.DataFrame: The clean postings of all countries, in the order of `files`.
+    '''
+
+    countries = load_salary_countries()
+    year = datetime.date.today().year
+
+    code_hashes: dict[Callable, str] = {}
+    clean_dfs: dict[str, pd.DataFrame] = {}
+    jobs = {}
+    keys_and_paths = {}
+
+    for country, file_paths in files.items():
+        country_stages = get_stages(country, countries, year)
+
+        for stage, _ in country_stages:
+            if stage not in code_hashes:
+                code_hashes[stage] = hash_code(stage)
+
+        keys = chain_keys(cache.hash_RAW_files(country, file_paths), country_stages, code_hashes)
+        paths = cache.get_paths(country, country_stages, keys)
+        keys_and_paths[country] = (keys, paths)
+
+        cached = cache.count_cached(paths)
+
+        if cached == len(country_stages):
+            clean_dfs[country] = load_stage(paths[-1])
+            _print_country(country, cache.manifest[country].get('rows'), len(clean_dfs[country]),
+                           "cached")
+        else:
+            jobs[country] = (country_stages, file_paths, paths, cached)
+
+    for country, (df, rows, stats) in _run_in_pool(_clean_country_cached, jobs, max_workers):
+        clean_dfs[country] = df
+        record_stats(stats)
+
+        rows = rows if rows is not None else cache.manifest[country].get('rows')
+        cache.update(country, *keys_and_paths[country], rows)
+
+        cached = jobs[country][-1]
+        _print_country(country, rows, len(df),
+                       f"{cached}/{len(jobs[country][0])} stages cached" if cached else "")
+
+    cache.save_manifest(list(files))
+
+    return _concat_countries([clean_dfs[country] for country in files])
+
+
+def _concat_countries(clean_dfs: list[pd.DataFrame]) -> pd.DataFrame:
+    '''Concatenates the clean postings of the countries, with the typed columns.'''
+
+    df_all_countries = pd.concat(clean_dfs)
+    df_all_countries.reset_index(inplace=True, drop=True)
+
+    return apply_schema(df_all_countries)
+
+
+def _print_country(country: str, rows_raw: int | None, rows_clean: int, note: str = ""):
+    '''Prints the number of the RAW and clean postings of the country.'''
+
+    print(f"{country}: {rows_raw} -> {rows_clean}" + (f" ({note})" if note else ""))
+
+
+def save_clean_csv(df: pd.DataFrame, file_path: str):
+    '''
+    Saves the clean postings. The file can be read back with the typed columns
+    by `cleaning.schema.read_clean_csv`.
+
+    Args:
+    - df (pd.DataFrame): The clean postings with the grouped columns.
+    - file_path (str): The path to the clean CSV file.
+    '''
+
+    directory = os.path.dirname(file_path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    df.to_csv(file_path, encoding=get_encoding())
+
+
+def run_pipeline(
+    directory: str,
+    job_title: str | None = None,
+    output_path: str | None = None,
+    max_workers: int | None = None,
+    use_cache: bool = True
+) -> str:
+    '''
+    Cleans the RAW CSV files of the job title and saves the clean CSV file,
+    and the same postings in a Parquet file next to it, see `cleaning.store`.
+
+    Args:
+    - directory (str): The directory with the RAW CSV files, e.g. "data/RAW/Data Engineer".
+    - job_title (str | None): The job title. If None, the name of the directory is used.
+    - output_path (str | None): The path to the clean CSV file.
+    Default is given by `get_path_csv_clean`.
+    - max_workers (int | None): The number of processes.
+    - use_cache (bool): If False, all the countries are cleaned from scratch
+    and nothing is cached.
+
+    Returns:
+    - str: The path to the clean CSV file.
+
+    Raises:
+    - FileNotFoundError: If there are no RAW CSV files of the job title.
+    '''
+
+    if job_title is None:
+        job_title = os.path.basename(os.path.normpath(directory))
+
+    files = get_CSVs_in_folder(directory, job_title)
+
+    if not files:
+        raise FileNotFoundError(f"No RAW CSV files of \"{job_title}\" in:\n{directory}")
+
+    if use_cache:
+        cache = StageCache(get_path_cache(job_title))
+        df_all_countries = clean_countries_cached(files, cache, max_workers)
+    else:
+        dfs = {country: read_CSVs(file_paths) for country, file_paths in files.items()}
+        df_all_countries = clean_countries(dfs, max_workers)
+
+    output_path = output_path or get_path_csv_clean(job_title)
+    save_clean_csv(df_all_countries, output_path)
+    save_clean_parquet(df_all_countries, get_path_parquet(output_path))
+
+    return output_path
@@ -0,0 +1,116 @@
+'''
+This module declares the types of the clean dataset columns and applies them
+when the clean CSV file is written and read back.
+
+Read with `header=[0, 1]` alone, every category, text and the flags with missing values
+are object columns. The repeated strings (countries, seniorities, sectors...) become
+categoricals, the flags with missing values nullable booleans (a missing value cast
+to a NumPy boolean would be True), the job ages nullable integers, the ratings float32
+and the long texts (descriptions, reviews) Arrow-backed strings, which takes
+a fraction of the memory. The flags always set (the tools, degrees...) stay
+NumPy booleans, a byte per value, without the mask of the nullable ones.
+'''
+# External
+import pandas as pd
+
+# Internal
+from cleaning.columns import COLUMNS_MULTIINDEX
+from cleaning.keywords import SENIORITIES
+from scraper.config.get import get_encoding
+
+STRING = pd.StringDtype("pyarrow")
+CATEGORY = "category"
+FLAG = "bool"
+FLAG_NULLABLE = "boolean"
+RATING = "float32"
+# Nullable, as the job age is missing if the scraper didn't find it
+DAYS = "Int16"
+
+# The types of the columns besides the flags always set, which are all FLAG
+COLUMNS_DTYPES = {
+    ('Job_details', 'Title'): STRING,
+    ('Job_details', 'Description'): STRING,
+    ('Job_details', 'Seniority'): pd.CategoricalDtype(list(SENIORITIES), ordered=True),
+    ('Job_details', 'City'): CATEGORY,
+    ('Job_details', 'State'): CATEGORY,
+    ('Job_details', 'Country'): CATEGORY,
+    ('Job_details', 'Region'): CATEGORY,
+    ('Job_details', 'Easy_apply'): FLAG_NULLABLE,
+    ('Job_details', 'Job_age'): DAYS,
+    ('Salary', 'Min'): "float64",
+    ('Salary', 'Max'): "float64",
+    ('Salary', 'Avg'): "float64",
+    ('Salary', 'Currency'): CATEGORY,
+    ('Salary', 'Is_hourly'): FLAG_NULLABLE,
+    ('Company_info', 'Name'): CATEGORY,
+    ('Company_info', 'Rating'): RATING,
+    ('Company_info', 'Employees'): CATEGORY,
+    ('Company_info', 'Type_of_ownership'): CATEGORY,
+    ('Company_info', 'Sector'): CATEGORY,
+    ('Company_info', 'Industry'): CATEGORY,
+    ('Company_info', 'Company_age'): "float32",
+    ('Company_info', 'Revenue_USD'): CATEGORY,
+    ('Company_info', 'Friend_recommend'): RATING,
+    ('Company_info', 'CEO_approval'): RATING,
+    ('Company_info', 'Career_opportunities'): RATING,
+    ('Company_info', 'Comp_&_benefits'): RATING,
+    ('Company_info', 'Senior_management'): RATING,
+    ('Company_info', 'Work/Life_balance'): RATING,
+    ('Company_info', 'Culture_&_values'): RATING,
+    ('Company_info', 'Pros'): STRING,
+    ('Company_info', 'Cons'): STRING,
+    ('Company_info', 'Benefits_rating'): RATING,
+    ('Company_info', 'Benefits_reviews'): STRING,
+    ('Education', 'Certificate'): CATEGORY,
+    ('Version_control', 'Git_SVN'): CATEGORY,
+}
+
+
+def get_dtypes() -> dict[tuple[str, str], object]:
+    '''Returns the type of each column of the clean dataset, in the order of the columns.'''
+
+    return {column: COLUMNS_DTYPES.get(column, FLAG) for column in COLUMNS_MULTIINDEX}
+
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    '''
+    Converts the columns of the clean dataset to their declared types.
+
+    Args:
+    - df (pd.DataFrame): The clean postings with the grouped columns.
+
+    Returns:
+    - pd.DataFrame: The postings with the typed columns.
+
+    Raises:
+    - KeyError: If a column of the clean dataset is missing.
+    '''
+
+    return df.astype(get_dtypes())
+
+
+def read_clean_csv(file_path: str, **kwargs) -> pd.DataFrame:
+    '''
+    Reads the clean CSV file with the typed columns.
+
+    Args:
+    - file_path (str): The path to the clean CSV file.
+    - **kwargs: The other arguments of `pd.read_csv`, e.g. `nrows`.
+
+    Returns:
+    - pd.DataFrame: The clean postings with the grouped and typed columns.
+    '''
+
+    df = pd.read_csv(
+        file_path, index_col=0, header=[0, 1], encoding=get_encoding(), **kwargs)
+
+    return apply_schema(df)
+
+
+def get_memory_usage(df: pd.DataFrame) -> pd.Series:
+    '''Returns the memory usage in bytes of each group of columns, including the texts.'''
+
+    usage = df.memory_usage(deep=True, index=False)
+
+    return usage.groupby(level=0, sort=False).sum()
+
@@ -0,0 +1,269 @@
+'''
+This module builds a single table of the socioeconomic data of the countries and joins it
+to the postings by their country.
+
+The files made by `_002_data_cleaning_socioeconomic.ipynb` name the countries differently,
+e.g. "United_Kingdom", "Czechia" or "Türkiye". The names are normalized once, to the names
+of the clean postings, e.g. "United Kingdom", and the files are joined into a table indexed
+by the countries, saved as "data/clean/_Socioeconomic data/countries_socioeconomic.csv":
+
+- Currency: The ISO code of the country currency.
+- Dollar_rate: The units of the currency for a US dollar.
+- Poverty_line_monthly: The monthly poverty line in USD (OECD).
+- PPP_conversion: The purchasing power conversion of USD in the country (OECD).
+- HDI, HDI_category, GNI_per_capita: The Human Development Index of 2021 (UNDP).
+
+The cost of living file has the US states instead of the countries, so it isn't joined.
+
+Usage:
+- python -m cleaning.socioeconomic
+'''
+# Python
+import argparse
+import os
+import sys
+
+# External
+import pandas as pd
+
+# Internal
+from scraper.config.get import get_config
+
+SOCIOECONOMIC_DIRECTORY = "_Socioeconomic data"
+DOLLAR_RATES_FILE = "dollar_rates_04_14_2023.csv"
+POVERTY_LINE_FILE = "OECD_poverty_line_monthly.csv"
+PURCHASING_POWER_FILE = "purchasing_power_index.csv"
+HDI_FILE = "HDI_2021.csv"
+COUNTRIES_FILE = "countries_socioeconomic.csv"
+GROUP = "Socioeconomic"
+# The columns converting the salaries to yearly ones in USD, see `cleaning.stages.add_salary`
+SALARY_COLUMNS = ['Currency', 'Dollar_rate', 'Poverty_line_monthly']
+
+# The names of the sources, besides the underscores, and the names of the postings
+COUNTRY_NAMES = {
+    "Czechia": "Czech Republic",
+    "Hongkong": "Hong Kong",
+    "Korea": "South Korea",
+    "Slovak Republic": "Slovakia",
+    "Türkiye": "Turkey",
+}
+
+COUNTRY_CURRENCIES = {
+    "Australia": "AUD",
+    "Austria": "EUR",
+    "Belgium": "EUR",
+    "Canada": "CAD",
+    "Chile": "CLP",
+    "Colombia": "COP",
+    "Costa Rica": "CRC",
+    "Czech Republic": "CZK",
+    "Denmark": "DKK",
+    "Estonia": "EUR",
+    "Finland": "EUR",
+    "France": "EUR",
+    "Germany": "EUR",
+    "Greece": "EUR",
+    "Hong Kong": "HKD",
+    "Hungary": "HUF",
+    "Iceland": "ISK",
+    "Ireland": "EUR",
+    "Israel": "ILS",
+    "Italy": "EUR",
+    "Japan": "JPY",
+    "Latvia": "EUR",
+    "Lithuania": "EUR",
+    "Luxembourg": "EUR",
+    "Mexico": "MXN",
+    "Netherlands": "EUR",
+    "New Zealand": "NZD",
+    "Norway": "NOK",
+    "Poland": "PLN",
+    "Portugal": "EUR",
+    "Romania": "RON",
+    "Singapore": "SGD",
+    "Slovakia": "EUR",
+    "Slovenia": "EUR",
+    "South Korea": "KRW",
+    "Spain": "EUR",
+    "Sweden": "SEK",
+    "Switzerland": "CHF",
+    "Taiwan": "TWD",
+    "Turkey": "TRY",
+    "United Kingdom": "GBP",
+    "United States": "USD",
+}
+
+
+def get_path_socioeconomic(file_name: str) -> str:
+    '''
+    Returns the path to a socioeconomic data file in the clean data directory.
+
+    Args:
+    - file_name (str): The file name, e.g. "OECD_poverty_line_monthly.csv".
+
+    Returns:
+    - str: The path to the file.
+    '''
+
+    config = get_config()
+
+    return os.path.join(
+        config['output_path']['main'],
+        config['output_path']['clean'],
+        SOCIOECONOMIC_DIRECTORY,
+        file_name
+    )
+
+
+def normalize_country(name: str) -> str:
+    '''Returns the country name used by the postings, e.g. "Türkiye" as "Turkey".'''
+
+    name = " ".join(name.replace("_", " ").split())
+
+    return COUNTRY_NAMES.get(name, name)
+
+
+def _normalize_index(data: pd.DataFrame | pd.Series) -> pd.DataFrame | pd.Series:
+    '''Returns the data indexed by the normalized country names.'''
+
+    data = data.copy()
+    data.index = data.index.map(normalize_country).rename('Country')
+
+    return data
+
+
+def _parse_HDI(hdi: pd.DataFrame) -> pd.DataFrame:
+    '''
+    Parses the HDI table from the spreadsheet: the indexes as thousandths or decimals
+    with the comma, e.g. "962" and "0,94", and the GNI with the spaces, e.g. "66 933".
+    '''
+
+    index = pd.to_numeric(hdi['HDI'].str.replace(",", ".", regex=False))
+
+    return pd.DataFrame({
+        'HDI': index.where(index <= 1, index / 1000),
+        'HDI_category': hdi['HDI category'],
+        'GNI_per_capita': pd.to_numeric(
+            hdi['GNI per capita'].str.replace(r"\D", "", regex=True)),
+    }).set_axis(hdi['Country'])
+
+
+def build_countries_table(
+    dollar_rates: pd.Series,
+    poverty_lines: pd.Series,
+    purchasing_power: pd.Series,
+    hdi: pd.DataFrame
+) -> pd.DataFrame:
+    '''
+    Joins the socioeconomic data into a table indexed by the normalized countries.
+
+    Args:
+    - dollar_rates (pd.Series): The currencies rates to USD, indexed by the ISO codes.
+    - poverty_lines (pd.Series): The monthly poverty lines in USD, indexed by the countries.
+    - purchasing_power (pd.Series): The PPP conversions, indexed by the countries.
+    - hdi (pd.DataFrame): The HDI table as saved by the notebook.
+
+    Returns:
+    - pd.DataFrame: The socioeconomic data of each country of any source, sorted.
+    '''
+
+    currencies = pd.Series(COUNTRY_CURRENCIES, name='Currency').rename_axis('Country')
+
+    countries = pd.concat([
+        currencies,
+        currencies.map(dollar_rates).rename('Dollar_rate'),
+        _normalize_index(poverty_lines).rename('Poverty_line_monthly'),
+        _normalize_index(purchasing_power).rename('PPP_conversion'),
+        _normalize_index(_parse_HDI(hdi)),
+    ], axis=1)
+
+    return countries.sort_index()
+
+
+def build_countries_file() -> str:
+    '''
+    Builds the countries table from the socioeconomic files and saves it.
+
+    Returns:
+    - str: The path to the countries file.
+    '''
+
+    countries = build_countries_table(
+        pd.read_csv(get_path_socioeconomic(DOLLAR_RATES_FILE), index_col='Currency')['Rate'],
+        pd.read_csv(get_path_socioeconomic(POVERTY_LINE_FILE), index_col='LOCATION')['USD'],
+        pd.read_csv(
+            get_path_socioeconomic(PURCHASING_POWER_FILE), index_col='Country')['Conversion'],
+        pd.read_csv(get_path_socioeconomic(HDI_FILE), index_col=0, dtype=str),
+    )
+
+    file_path = get_path_socioeconomic(COUNTRIES_FILE)
+    countries.to_csv(file_path)
+
+    return file_path
+
+
+def load_countries_table(file_path: str | None = None) -> pd.DataFrame:
+    '''
+    Loads the countries table built by `build_countries_file`.
+
+    Args:
+    - file_path (str | None): The path to the countries file,
+    default is the one in the clean socioeconomic data directory.
+
+    Returns:
+    - pd.DataFrame: The socioeconomic data indexed by the countries.
+    '''
+
+    return pd.read_csv(
+        file_path or get_path_socioeconomic(COUNTRIES_FILE),
+        index_col='Country',
+        dtype={'Currency': "category", 'HDI_category': "category"}
+    )
+
+
+def join_socioeconomic(
+    df: pd.DataFrame,
+    countries: pd.DataFrame | None = None,
+    country_column: str | tuple[str, str] = ('Job_details', 'Country')
+) -> pd.DataFrame:
+    '''
+    Adds the socioeconomic data of the postings countries, in a single join.
+
+    Args:
+    - df (pd.DataFrame): The postings, with the grouped columns of the clean dataset
+    or the flat columns.
+    - countries (pd.DataFrame | None): The countries table, default is the saved one.
+    - country_column (str | tuple[str, str]): The column of the countries.
+
+    Returns:
+    - pd.DataFrame: The postings with the columns of the countries table, in the
+    "Socioeconomic" group for the grouped columns, NaN for the unknown countries.
+    '''
+
+    if countries is None:
+        countries = load_countries_table()
+
+    # The countries are categorical in the clean dataset, not normalized in the RAW files
+    postings_countries = df[country_column].astype(str).map(normalize_country)
+
+    socioeconomic = countries.reindex(postings_countries.values).set_axis(df.index)
+
+    if isinstance(df.columns, pd.MultiIndex):
+        socioeconomic.columns = pd.MultiIndex.from_product([[GROUP], socioeconomic.columns])
+
+    return pd.concat([df, socioeconomic], axis=1)
+
+
+def main(args: list[str]):
+    '''Builds the countries table with the command line arguments.'''
+
+    parser = argparse.ArgumentParser(
+        prog="python -m cleaning.socioeconomic",
+        description="Join the socioeconomic files into a single table of the countries.")
+    parser.parse_args(args)
+
+    print(f"Saved:\n{build_countries_file()}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
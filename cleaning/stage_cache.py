@@ -0,0 +1,248 @@
+'''
+This module caches the DataFrame of each country after each cleaning stage in Parquet files,
+so a re-run recomputes only the countries whose RAW files or stages changed.
+
+Each stage output is identified by a key chained from the hash of the country RAW files,
+and for each stage so far: the hash of its code and of its arguments. The code hash
+covers the stage function, the functions and keyword tables it uses, recursively.
+So changing e.g. the seniority keywords reuses the outputs of the stages before
+`add_seniority` and recomputes it and the stages after it.
+
+The manifest keeps the hashes of the RAW files, with their sizes and modification
+times to skip hashing the unchanged files, and the stage keys of each country.
+'''
+# Python
+import hashlib
+import inspect
+import json
+import os
+import re
+import shutil
+from types import CodeType
+from typing import Any, Callable
+
+# External
+import pandas as pd
+
+MANIFEST_FILE = "manifest.json"
+
+
+def hash_file(file_path: str) -> str:
+    '''Returns the SHA-256 hash of the file content.'''
+
+    file_hash = hashlib.sha256()
+
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
+
+
+def hash_code(function: Callable) -> str:
+    '''
+    Returns the hash of the function source, together with the sources of the functions
+    and classes of this package and the values of the constants (upper case names)
+    it refers to, recursively.
+    '''
+
+    return hashlib.sha256("\n".join(_get_sources(function, set())).encode()).hexdigest()
+
+
+def _get_sources(function: Callable, seen: set[str]) -> list[str]:
+    '''Returns the sources of the function and of everything of this package it refers to.'''
+
+    function = inspect.unwrap(function)
+    seen.add(f"{function.__module__}.{function.__qualname__}")
+
+    sources = [inspect.getsource(function)]
+    module_globals = function.__globals__
+
+    for name in sorted(_get_global_names(function.__code__)):
+
+        value = module_globals.get(name)
+        module = getattr(inspect.unwrap(value), '__module__', None) \
+            if callable(value) else None
+
+        if module and module.split(".")[0] == __name__.split(".")[0]:
+            value = inspect.unwrap(value)
+            if inspect.isclass(value):
+                sources.append(inspect.getsource(value))
+            elif f"{value.__module__}.{value.__qualname__}" not in seen:
+                sources.extend(_get_sources(value, seen))
+
+        # Only the constants, the state of the modules (e.g. the stats) changes in a run
+        elif not name.isupper():
+            continue
+
+        elif isinstance(value, re.Pattern):
+            sources.append(f"{name} = {value.pattern!r}")
+
+        elif isinstance(value, (set, frozenset)):
+            sources.append(f"{name} = {sorted(value)!r}")
+
+        elif isinstance(value, (dict, list, tuple, str, int, float)):
+            sources.append(f"{name} = {value!r}")
+
+    return sources
+
+
+def _get_global_names(code: CodeType) -> set[str]:
+    '''Returns the names used by the code and by its nested functions.'''
+
+    names = set(code.co_names)
+
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            names |= _get_global_names(constant)
+
+    return names
+
+
+def hash_value(value: Any) -> str:
+    '''Returns the hash of a stage argument, e.g. the country or the dollar rates.'''
+
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        content = pd.util.hash_pandas_object(value).values.tobytes()
+    else:
+        content = repr(value).encode()
+
+    return hashlib.sha256(content).hexdigest()
+
+
+def chain_keys(
+    raw_hash: str,
+    stages: list[tuple[Callable, tuple]],
+    code_hashes: dict[Callable, str]
+) -> list[str]:
+    '''
+    Returns the key of the output of each stage.
+
+    Args:
+    - raw_hash (str): The hash of the RAW files of the country.
+    - stages (list[tuple[Callable, tuple]]): The stages with their arguments
+    besides the DataFrame, in order.
+    - code_hashes (dict[Callable, str]): The code hashes of the stages.
+
+    Returns:
+    - list[str]: The keys, each depending on all the previous stages.
+    '''
+
+    keys = []
+    key = raw_hash
+
+    for stage, args in stages:
+        key = hashlib.sha256("".join(
+            [key, code_hashes[stage]] + [hash_value(arg) for arg in args]
+        ).encode()).hexdigest()
+        keys.append(key)
+
+    return keys
+
+
+class StageCache:
+    '''
+    The Parquet files of the stages outputs and the manifest of a job title.
+
+    Args:
+    - directory (str): The cache directory, e.g. "data/clean/Data_Engineer/_cache".
+    '''
+
+    def __init__(self, directory: str):
+
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, MANIFEST_FILE)
+
+        self.manifest: dict[str, dict] = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, "r", encoding="utf-8") as file:
+                self.manifest = json.load(file)
+
+    def hash_RAW_files(self, country: str, file_paths: list[str]) -> str:
+        '''
+        Returns the hash of the RAW files of the country. The files with the same size
+        and modification time as in the manifest are not read again.
+        '''
+
+        files_previous = self.manifest.get(country, {}).get('files', {})
+        files = {}
+
+        for file_path in file_paths:
+            stat = os.stat(file_path)
+            name = os.path.basename(file_path)
+            previous = files_previous.get(name, {})
+
+            if previous.get('size') == stat.st_size and \
+                    previous.get('mtime') == stat.st_mtime:
+                file_hash = previous['sha256']
+            else:
+                file_hash = hash_file(file_path)
+
+            files[name] = {'size': stat.st_size, 'mtime': stat.st_mtime, 'sha256': file_hash}
+
+        self.manifest.setdefault(country, {})['files'] = files
+
+        return hashlib.sha256("".join(
+            name + file['sha256'] for name, file in files.items()
+        ).encode()).hexdigest()
+
+    def get_paths(self, country: str, stages: list[tuple[Callable, tuple]],
+                  keys: list[str]) -> list[str]:
+        '''Returns the Parquet file of each stage output, named by the stage and its key.'''
+
+        return [
+            os.path.join(
+                self.directory, country, f"{index:02d}_{stage.__name__}_{key[:16]}.parquet")
+            for index, ((stage, _), key) in enumerate(zip(stages, keys))
+        ]
+
+    @staticmethod
+    def count_cached(paths: list[str]) -> int:
+        '''Returns the number of the first stages, whose outputs are cached.'''
+
+        for index in range(len(paths), 0, -1):
+            if os.path.exists(paths[index - 1]):
+                return index
+
+        return 0
+
+    def update(self, country: str, keys: list[str], paths: list[str], rows: int):
+        '''
+        Records the stage keys and the number of RAW postings of the country,
+        and removes its outdated Parquet files.
+        '''
+
+        self.manifest.setdefault(country, {}).update({'stages': keys, 'rows': rows})
+
+        country_directory = os.path.join(self.directory, country)
+        current = {os.path.basename(path) for path in paths}
+
+        for file in os.listdir(country_directory):
+            if file not in current:
+                os.remove(os.path.join(country_directory, file))
+
+    def save_manifest(self, countries: list[str]):
+        '''Saves the manifest and removes the cache of the countries no longer scraped.'''
+
+        for country in list(self.manifest):
+            if country not in countries:
+                del self.manifest[country]
+                shutil.rmtree(os.path.join(self.directory, country), ignore_errors=True)
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        with open(self.manifest_path, "w", encoding="utf-8") as file:
+            json.dump(self.manifest, file, indent=2)
+
+
+def load_stage(path: str) -> pd.DataFrame:
+    '''Loads the cached output of a stage.'''
+
+    return pd.read_parquet(path)
+
+
+def save_stage(df: pd.DataFrame, path: str):
+    '''Saves the output of a stage.'''
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    df.to_parquet(path)
@@ -0,0 +1,643 @@
+'''
+This module contains the cleaning stages of the RAW job postings of a single country,
+in the order they are run by the pipeline: removing empty and repeated postings,
+keeping only data engineering jobs, splitting the location, parsing the contract,
+seniority and salary, cleaning the company and job ages, searching the description
+for the technologies, certificates and education, and the final columns layout.
+
+Each stage takes the DataFrame of the country and returns the cleaned one.
+'''
+# Python
+import re
+from functools import lru_cache
+from typing import Callable, Iterable, Literal
+
+# External
+import numpy as np
+import pandas as pd
+
+# Internal
+from cleaning.columns import COLUMNS_MULTIINDEX, COLUMNS_RENAMED
+from cleaning.keyword_matcher import KeywordMatcher
+from cleaning.keywords import (
+    CERTIFICATES_NON_ENGLISH,
+    CERTIFICATIONS,
+    CONTRACT_TERMS,
+    CONTRACT_TERMS_NON_ENGLISH,
+    COUNTRIES_LANGUAGES,
+    DATA_TERMS,
+    EDUCATION,
+    EDUCATION_NON_ENGLISH,
+    GIT_PLATFORMS,
+    INVALID_TITLES,
+    INVALID_TITLES_NON_ENGLISH,
+    ISO_CURRENCIES,
+    REGIONS,
+    REMOTE,
+    REMOTE_NON_ENGLISH,
+    SENIORITIES,
+    SENIORITIES_NON_ENGLISH,
+    SPECIALIZATIONS,
+    TECHNOLOGIES,
+)
+from cleaning.socioeconomic import join_socioeconomic
+from cleaning.unique_apply import apply_unique
+
+HOURS_PER_YEAR = 52 * 40
+
+
+def get_languages(country: str) -> list[str]:
+    '''
+    Returns the languages of the job postings in the country, besides English.
+
+    Args:
+    - country (str): The country, e.g. "Czech_Republic".
+
+    Returns:
+    - list[str]: The languages, e.g. ["Czech", "Slovakian", "Hungarian"].
+    '''
+
+    return COUNTRIES_LANGUAGES.get(country, [])
+
+
+def _translations(keywords: dict[str, list[str]], languages: Iterable[str]) -> list[str]:
+    '''Returns the keywords in all the languages.'''
+
+    return [
+        keyword
+        for language in languages
+        for keyword in keywords[language]
+    ]
+
+
+# 1. Empty and repeated postings
+
+
+def remove_empty_rows(df: pd.DataFrame) -> pd.DataFrame:
+    '''Removes the rows only with NaNs.'''
+
+    return df.dropna(how='all')
+
+
+def remove_duplicates(df: pd.DataFrame) -> pd.DataFrame:
+    '''Removes the repeated postings, the same except the job age.'''
+
+    return df.drop_duplicates(subset=df.columns.difference(['Job_age']))
+
+
+# 2. Data engineering jobs
+
+
+@lru_cache(maxsize=None)
+def _get_job_title_patterns(languages: tuple[str, ...]) -> tuple[re.Pattern, ...]:
+    '''
+    Returns the patterns of the specializations, data terms and invalid titles,
+    matched anywhere in the lowercase job title.
+    '''
+
+    # Only the invalid titles are translated,
+    # the English specializations and data terms are used in every country
+    invalid = INVALID_TITLES + _translations(INVALID_TITLES_NON_ENGLISH, languages)
+
+    return tuple(
+        re.compile("|".join(re.escape(term.lower()) for term in terms))
+        for terms in (SPECIALIZATIONS, DATA_TERMS, invalid)
+    )
+
+
+def is_data_engineering_job(job_title: str, country: str | None = None) -> bool:
+    '''
+    Checks if the job title is a data engineering one: it has to contain
+    a specialization and a data term, and none of the invalid titles.
+
+    Args:
+    - job_title (str): The job title.
+    - country (str | None): The country, whose languages extend the invalid titles.
+
+    Returns:
+    - bool: True if the job is a data engineering one.
+    '''
+
+    if not isinstance(job_title, str):
+        return False
+
+    title = job_title.lower()
+
+    languages = tuple(get_languages(country)) if country else ()
+    specs, terms, invalid = _get_job_title_patterns(languages)
+
+    return bool(specs.search(title) and terms.search(title) and not invalid.search(title))
+
+
+def filter_data_engineering_jobs(df: pd.DataFrame, country: str) -> pd.DataFrame:
+    '''Keeps only the data engineering jobs. Each distinct title is checked once.'''
+
+    is_relevant = apply_unique(
+        df['Job_title'], lambda title: is_data_engineering_job(title, country),
+        "is_data_engineering_job")
+
+    return df[is_relevant.astype(bool)]
+
+
+# 3. Location
+
+
+def get_region(country: str) -> str:
+    '''
+    Returns the region/continent of the country.
+
+    Raises:
+    - KeyError: If the region of the country is unknown.
+    '''
+
+    for region, countries in REGIONS.items():
+        if country in countries:
+            return region
+
+    raise KeyError(f"\rUnknown region/continent for:\n{country}")
+
+
+def apply_locations(df: pd.DataFrame, country: str) -> pd.DataFrame:
+    '''
+    Splits the `Location` column into `City`, `State`, `Country` and `Region`,
+    the remote jobs get the "Remote" location, and removes the `Location` column.
+    '''
+
+    df = df.copy()
+
+    remote = {
+        term.lower()
+        for term in REMOTE + _translations(REMOTE_NON_ENGLISH, get_languages(country))
+    }
+
+    def is_remote(value) -> bool:
+        return isinstance(value, str) and value.strip().lower() in remote
+
+    df['Location'] = apply_unique(df['Location'], _clean_location)
+
+    is_remote_job = apply_unique(df['Location'], is_remote, "is_remote") | \
+        apply_unique(df['Job_title'], is_remote, "is_remote")
+    df.loc[is_remote_job, 'Location'] = "Remote"
+
+    df['City'] = apply_unique(df['Location'], _get_city)
+    df['State'] = apply_unique(df['Location'], _get_state)
+
+    df['Country'] = country
+    df['Region'] = get_region(country)
+
+    if country == "Canada":
+        df.loc[df['City'] == "Toronto", 'State'] = "Ontario"
+        df.loc[df['City'] == "Vancouver", 'State'] = "British Columbia"
+
+    for column in ['Region', 'Country', 'State', 'City']:
+        df[column] = apply_unique(df[column], _replace_underscores)
+
+    del df['Location']
+
+    return df
+
+
+def _clean_location(location: str | float) -> str | float:
+    '''Returns NaN for the empty location.'''
+
+    return np.nan if not isinstance(location, str) or location.strip() == "" else location
+
+
+def _get_city(location: str | float) -> str | float:
+    '''Returns the city of the "City, State" location, or the whole location.'''
+
+    return location.split(',')[0].strip() \
+        if isinstance(location, str) and "," in location else location
+
+
+def _get_state(location: str | float) -> str | float:
+    '''Returns the state of the "City, State" location, or NaN.'''
+
+    return location.split(',')[1].strip() \
+        if isinstance(location, str) and "," in location else np.nan
+
+
+def _replace_underscores(value: str | float) -> str | float:
+    '''Replaces the underscores with spaces, e.g. in "United_States".'''
+
+    return value.replace('_', ' ').strip() if isinstance(value, str) else value
+
+
+# 4. Contract and seniority
+
+
+@lru_cache(maxsize=None)
+def _get_contract_matcher(languages: tuple[str, ...]) -> KeywordMatcher:
+    '''Returns the matcher of the contract terms in English and the languages.'''
+
+    return KeywordMatcher({
+        'Is_contract': CONTRACT_TERMS + _translations(CONTRACT_TERMS_NON_ENGLISH, languages)
+    })
+
+
+def get_is_contract(job_title: str, description: str, country: str) -> bool:
+    '''
+    Checks if the job is a contract, temporary, part-time etc. one.
+
+    Args:
+    - job_title (str): The job title.
+    - description (str): The job description.
+    - country (str): The country, whose languages extend the contract terms.
+
+    Returns:
+    - bool: True if any term is in the title or description.
+    '''
+
+    matcher = _get_contract_matcher(tuple(get_languages(country)))
+
+    return bool(matcher.find(str(job_title)) or matcher.find(str(description)))
+
+
+def add_is_contract(df: pd.DataFrame, country: str) -> pd.DataFrame:
+    '''Adds the `Is_contract` column.'''
+
+    df['Is_contract'] = [
+        get_is_contract(job_title, description, country)
+        for job_title, description in zip(df['Job_title'], df['Description'])
+    ]
+
+    return df
+
+
+@lru_cache(maxsize=None)
+def _get_seniority_matcher(languages: tuple[str, ...]) -> KeywordMatcher:
+    '''Returns the matcher of the seniorities titles in English and the languages.'''
+
+    return KeywordMatcher({
+        seniority: titles + [
+            title
+            for language in languages
+            for title in SENIORITIES_NON_ENGLISH[language][seniority]
+        ]
+        for seniority, titles in SENIORITIES.items()
+    })
+
+
+def get_seniority(job_title: str, languages: list[str]) -> str | float:
+    '''
+    Returns the seniority of the job title: Junior, Mid, Senior or Management.
+
+    Remember that some companies have some unique seniority titles, like: "Level I",
+    "Level II", etc. We don't cover those, because each level means something different,
+    depending on the company.
+
+    Args:
+    - job_title (str): The job title.
+    - languages (list[str]): The languages of the country, besides English.
+
+    Returns:
+    - str | float: The first matched seniority or NaN.
+    '''
+
+    seniority = _get_seniority_matcher(tuple(languages)).find_first(job_title, SENIORITIES)
+
+    return np.nan if seniority is None else seniority
+
+
+def add_seniority(df: pd.DataFrame, country: str) -> pd.DataFrame:
+    '''Adds the `Seniority` column. Each distinct title is checked once.'''
+
+    languages = get_languages(country)
+
+    df['Seniority'] = apply_unique(
+        df['Job_title'], lambda title: get_seniority(title, languages), "get_seniority")
+
+    return df
+
+
+# 5. Salary
+
+
+SALARY_PATTERN = re.compile(
+    r"^(?=.*?(?P<period>Per Hour))?"
+    r"(?=.*?(?P<employer_provided>\(Employer est\.\)))?"
+    r"(?P<currency>.+?)(?=\d)"
+    r"(?P<min>\d+(?:\.\d+)?)(?P<min_prefix>[KMG]?)"
+    r"(?:.*(?<![\d.])(?P<max>\d+(?:\.\d+)?)(?P<max_prefix>[KMG]?))?"
+)
+METRIC_PREFIXES = {"": 1.0, "K": 1.0e+3, "M": 1.0e+6, "G": 1.0e+9}
+
+
+def parse_salaries(salary: pd.Series) -> pd.DataFrame:
+    '''
+    Parses the salaries, e.g. "PLN 10K - PLN 15.5K (Employer est.)",
+    with a single pattern for all the values.
+
+    Args:
+    - salary (pd.Series): The RAW salaries, NaN if not given.
+
+    Returns:
+    - pd.DataFrame: The `currency` ISO code or symbol, the `min` and `max` numbers
+    of the range (the same if a single number is given), the `period`
+    ("Hour" for the hourly rates, "Other" for the monthly and yearly ones,
+    told apart later by the poverty line) and `employer_provided` columns.
+    NaN in all columns, besides `employer_provided`, if no salary is given.
+    '''
+
+    # A column without any salary is read from the CSV file as float
+    parts = salary.astype(object).str.extract(SALARY_PATTERN)
+
+    is_salary = parts['min'].notnull()
+
+    no_max = parts['max'].isnull()
+    parts.loc[no_max, 'max'] = parts.loc[no_max, 'min']
+    parts.loc[no_max, 'max_prefix'] = parts.loc[no_max, 'min_prefix']
+
+    currency = parts['currency'].str.strip().str.replace(":", "", regex=False)
+
+    return pd.DataFrame({
+        'currency': apply_unique(currency, _convert_to_ISO_or_nan),
+        'min': _change_metric_prefixes(parts['min'], parts['min_prefix']),
+        'max': _change_metric_prefixes(parts['max'], parts['max_prefix']),
+        'period': parts['period'].notnull().map({True: "Hour", False: "Other"}).where(is_salary),
+        'employer_provided': parts['employer_provided'].notnull(),
+    }, index=salary.index)
+
+
+def _change_metric_prefixes(numbers: pd.Series, prefixes: pd.Series) -> pd.Series:
+    '''Converts the numbers with the metric prefixes to float, e.g. "10" and "K" to 10000.0.'''
+
+    return numbers.astype(float) * prefixes.map(METRIC_PREFIXES)
+
+
+def convert_to_ISO(currency: str) -> str:
+    '''Converts a currency symbol to its ISO code, e.g. "€" to "EUR".'''
+
+    return ISO_CURRENCIES.get(currency.strip(), currency)
+
+
+def _convert_to_ISO_or_nan(currency: str | float) -> str | float:
+    '''Converts the currency symbol to its ISO code, NaN stays NaN.'''
+
+    return convert_to_ISO(currency) if isinstance(currency, str) else currency
+
+
+def calculate_yearly_income(hourly_rate: float) -> float:
+    '''Converts the hourly rate to the gross yearly income, full time.'''
+
+    return hourly_rate * HOURS_PER_YEAR
+
+
+def monthly_to_yearly_salary(salary: float, monthly_poverty_line: float) -> float:
+    '''
+    Converts the monthly salary to the yearly one.
+
+    Job offers outside of the US, particularly in Europe, often provide the salary
+    as a monthly figure rather than yearly. A monthly salary should be not lower
+    than the monthly poverty line and lower than the yearly poverty line.
+    The lower values are too ambiguous (daily, weekly) and are left empty.
+
+    Args:
+    - salary (float): The salary in USD.
+    - monthly_poverty_line (float): The monthly poverty line of the country in USD.
+
+    Returns:
+    - float: The yearly salary or NaN.
+    '''
+
+    if np.isnan(salary):
+        return salary
+
+    if salary <= 0 or salary < monthly_poverty_line:
+        return np.nan
+
+    if salary < monthly_poverty_line * 12:
+        return salary * 12
+
+    return salary
+
+
+def add_salary(df: pd.DataFrame, countries: pd.DataFrame) -> pd.DataFrame:
+    '''
+    Parses the `Salary` column into the yearly salary range in USD
+    and removes the `Salary` column.
+
+    Args:
+    - df (pd.DataFrame): The country postings, with the `Country` column.
+    - countries (pd.DataFrame): The currencies, the dollar rates and the monthly poverty
+    lines in USD of the countries, see `cleaning.socioeconomic.load_countries_table`.
+
+    Returns:
+    - pd.DataFrame: The postings with the `Salary_*` and `Is_salary` columns.
+    '''
+
+    salaries = parse_salaries(df['Salary'])
+
+    df['Salary_employer_provided'] = salaries['employer_provided']
+    df['Salary_hourly'] = salaries['period'].map({"Hour": True, "Other": False})
+    df['Salary_currency'] = salaries['currency']
+    df['Salary_min'] = salaries['min']
+    df['Salary_max'] = salaries['max']
+    df['Is_salary'] = df['Salary_min'].notnull()
+
+    # The poverty line of the country of each posting, in a single join
+    monthly_poverty_lines = join_socioeconomic(
+        df[['Country']], countries, 'Country')['Poverty_line_monthly']
+    # The salary can be in the currency of another country
+    dollar_rates = countries.dropna(subset=['Currency', 'Dollar_rate']) \
+        .drop_duplicates('Currency').set_index('Currency')['Dollar_rate']
+
+    for salary_type in ('Salary_min', 'Salary_max'):
+        df[salary_type] = _to_yearly_usd(
+            df, salary_type, dollar_rates, monthly_poverty_lines)
+
+    df['Salary_avg'] = (df['Salary_max'] + df['Salary_min']) / 2
+
+    del df['Salary']
+
+    return df
+
+
+def _to_yearly_usd(
+    df: pd.DataFrame,
+    salary_type: Literal['Salary_min', 'Salary_max'],
+    dollar_rates: pd.Series,
+    monthly_poverty_lines: pd.Series
+) -> list[float]:
+    '''
+    Converts the salaries to yearly ones in USD: hourly, currency and monthly.
+    The salaries in a currency without the dollar rate are left empty.
+    '''
+
+    salaries = []
+
+    for salary, hourly, currency, monthly_poverty_line in zip(
+        df[salary_type], df['Salary_hourly'], df['Salary_currency'], monthly_poverty_lines
+    ):
+        if isinstance(hourly, (bool, np.bool_)) and hourly:
+            salary = calculate_yearly_income(salary)
+
+        if isinstance(currency, str):
+            salary = np.trunc(salary / dollar_rates.get(currency, np.nan))
+
+        salaries.append(monthly_to_yearly_salary(salary, monthly_poverty_line))
+
+    return salaries
+
+
+# 6. Company and job age
+
+
+def add_company_age(df: pd.DataFrame, year: int) -> pd.DataFrame:
+    '''Replaces the `Founded` column with the `Company_age` in the given year.'''
+
+    df['Company_age'] = apply_unique(
+        df['Founded'], lambda founded: founded if np.isnan(founded) else int(year - founded),
+        "company_age")
+
+    del df['Founded']
+
+    return df
+
+
+def clean_job_age(job_age: str | float) -> int | float:
+    '''Converts the job age to days, e.g. "24h" to 1 and "30d+" to 31.'''
+
+    if job_age in ("24h", "1 day ago"):
+        job_age = "1d"
+    elif job_age == "30d+":
+        job_age = "31d"
+
+    if isinstance(job_age, str):
+        return int(job_age.replace("d", ""))
+
+    return job_age
+
+
+def add_job_age(df: pd.DataFrame) -> pd.DataFrame:
+    '''Converts the `Job_age` column to days.'''
+
+    df['Job_age'] = apply_unique(df['Job_age'], clean_job_age)
+
+    return df
+
+
+# 7. Technologies, version control, education and certificates
+
+
+@lru_cache(maxsize=None)
+def _get_requirements_matcher(languages: tuple[str, ...]) -> KeywordMatcher:
+    '''
+    Returns the matcher of the technologies, version control platforms and degrees,
+    searched for in the job description and title. Its categories are
+    (column, True) for the flag columns and ('Git_SVN', platform) for the platforms.
+    '''
+
+    categories: dict[tuple[str, str | bool], list[str]] = {
+        (column_name, True): tech_names
+        for column_name, tech_names in TECHNOLOGIES.items()
+    }
+
+    for platform in GIT_PLATFORMS:
+        categories[('Git_SVN', platform)] = [platform]
+
+    for column_name, education_names in EDUCATION.items():
+        categories[(column_name, True)] = education_names + \
+            _translations(EDUCATION_NON_ENGLISH[column_name], languages)
+
+    return KeywordMatcher(categories)
+
+
+@lru_cache(maxsize=None)
+def _get_certificates_matcher(languages: tuple[str, ...]) -> KeywordMatcher:
+    '''Returns the matcher of the certificates searched for in the job description.'''
+
+    certifications = CERTIFICATIONS + _translations(CERTIFICATES_NON_ENGLISH, languages)
+
+    return KeywordMatcher({certificate: [certificate] for certificate in certifications})
+
+
+def make_check_certificate(country: str) -> Callable[[str], str | float]:
+    '''
+    Returns the search of the job description for the required certificate.
+
+    Args:
+    - country (str): The country, whose languages extend the certificates.
+
+    Returns:
+    - Callable[[str], str | float]: The search returning the first certificate name
+    on the certificates list, "Other" for a generic certificate or NaN.
+    '''
+
+    matcher = _get_certificates_matcher(tuple(get_languages(country)))
+
+    certificates_generic = [
+        certificate.lower()
+        for certificate in CERTIFICATIONS[-2:] + _translations(
+            CERTIFICATES_NON_ENGLISH, CERTIFICATES_NON_ENGLISH.keys())
+    ]
+
+    def check_certificate(job_description: str) -> str | float:
+
+        certificate = matcher.find_first(job_description, matcher.categories)
+
+        if certificate is None:
+            return np.nan
+
+        if any(str(certificate).lower() in generic for generic in certificates_generic):
+            return "Other"
+
+        return certificate
+
+    return check_certificate
+
+
+def add_requirements(df: pd.DataFrame, country: str) -> pd.DataFrame:
+    '''
+    Adds the columns of the required technologies, version control (`Git_SVN`),
+    degrees and certificate. Each job description is scanned once for all of them.
+    Unix is not required if Linux is, they are usually mentioned together.
+    '''
+
+    languages = tuple(get_languages(country))
+    matcher = _get_requirements_matcher(languages)
+    check_certificate = make_check_certificate(country)
+
+    git_platforms = [('Git_SVN', platform) for platform in GIT_PLATFORMS]
+    flag_columns = list(TECHNOLOGIES) + list(EDUCATION)
+
+    columns: dict[str, list] = {'Git_SVN': [], 'Certificate': []}
+    columns.update({column_name: [] for column_name in flag_columns})
+
+    for job_description, job_title in zip(df['Description'], df['Job_title']):
+
+        matched = matcher.find(" ".join([job_description, job_title]))
+
+        platform = next((key for key in git_platforms if key in matched), None)
+        columns['Git_SVN'].append(platform[1] if platform else np.nan)
+
+        for column_name in flag_columns:
+            columns[column_name].append((column_name, True) in matched)
+
+        columns['Certificate'].append(check_certificate(job_description))
+
+    columns['Unix'] = [
+        is_unix and not is_linux
+        for is_unix, is_linux in zip(columns['Unix'], columns['Linux'])
+    ]
+
+    return _add_columns(df, columns)
+
+
+def _add_columns(df: pd.DataFrame, columns: dict[str, list]) -> pd.DataFrame:
+    '''Adds many columns at once, without fragmenting the DataFrame.'''
+
+    return pd.concat([df, pd.DataFrame(columns, index=df.index)], axis=1)
+
+
+# 8. Final columns
+
+
+def set_columns(df: pd.DataFrame) -> pd.DataFrame:
+    '''Renames the columns, orders them and groups them with a MultiIndex.'''
+
+    df = df.rename(COLUMNS_RENAMED, axis=1)
+    df = df[[column for _, column in COLUMNS_MULTIINDEX]]
+    df.columns = pd.MultiIndex.from_tuples(COLUMNS_MULTIINDEX)
+
+    return df
@@ -0,0 +1,142 @@
+'''
+This module stores the clean dataset as a Parquet file next to the clean CSV file,
+e.g. "data/clean/Data_Engineer/Data_Engineer_15-04-2023.parquet".
+
+Parquet is columnar, so only the requested columns are read, e.g. the model building
+doesn't read the long descriptions. Each country is a separate row group (partition),
+so only the row groups of the requested countries are read. The row groups are kept
+in a single file, a directory per country would read the metadata of every file,
+which takes longer than the whole CSV file for the small countries.
+The grouped columns are stored flat, e.g. "Salary.Avg", and grouped back when read.
+'''
+# Python
+import json
+
+# External
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Internal
+from cleaning.columns import COLUMNS_MULTIINDEX
+from cleaning.schema import get_dtypes
+
+SEPARATOR = "."
+PARTITION_COLUMN = ('Job_details', 'Country')
+COUNTRIES_KEY = b"countries"
+
+
+def _flatten(column: tuple[str, str]) -> str:
+    '''Returns the name of the grouped column in the Parquet file.'''
+
+    return SEPARATOR.join(column)
+
+
+def save_clean_parquet(df: pd.DataFrame, file_path: str):
+    '''
+    Saves the clean postings as a Parquet file with a row group per country.
+
+    Args:
+    - df (pd.DataFrame): The clean postings with the grouped columns.
+    - file_path (str): The path to the Parquet file.
+    '''
+
+    df_flat = df.copy()
+    df_flat.columns = [_flatten(column) for column in df.columns]
+
+    # The index is stored as a column, so the rows of any countries keep it
+    table = pa.Table.from_pandas(df_flat, preserve_index=True)
+
+    countries = df[PARTITION_COLUMN].astype(str)
+    rows_by_country = countries.groupby(countries, sort=False).indices
+
+    metadata = dict(table.schema.metadata or {})
+    metadata[COUNTRIES_KEY] = json.dumps(list(rows_by_country)).encode()
+    table = table.replace_schema_metadata(metadata)
+
+    with pq.ParquetWriter(file_path, table.schema) as writer:
+        for rows in rows_by_country.values():
+            writer.write_table(table.take(rows), row_group_size=len(rows))
+
+
+def get_countries(parquet_file: pq.ParquetFile) -> list[str]:
+    '''Returns the countries of the row groups of the Parquet file, in order.'''
+
+    return json.loads(parquet_file.schema_arrow.metadata[COUNTRIES_KEY])
+
+
+def read_clean_parquet(
+    file_path: str,
+    columns: list[str | tuple[str, str]] | None = None,
+    countries: list[str] | None = None
+) -> pd.DataFrame:
+    '''
+    Reads the clean postings from the Parquet file, with the typed columns.
+
+    Args:
+    - file_path (str): The path to the Parquet file.
+    - columns (list[str | tuple[str, str]] | None): The columns to read, e.g.
+    ('Salary', 'Avg'), or whole groups, e.g. 'Business_Intelligence_Tools'.
+    Default is all the columns.
+    - countries (list[str] | None): The countries to read, e.g. "United States".
+    Default is all the countries.
+
+    Returns:
+    - pd.DataFrame: The clean postings with the grouped columns, in the requested order,
+    indexed as in the clean CSV file.
+
+    Raises:
+    - KeyError: If a column or a group of columns is unknown.
+    '''
+
+    selected = _select_columns(columns)
+
+    parquet_file = pq.ParquetFile(file_path)
+    row_groups = range(parquet_file.num_row_groups)
+
+    if countries is not None:
+        row_groups = [
+            row_group
+            for row_group, country in enumerate(get_countries(parquet_file))
+            if country in countries
+        ]  # type: ignore
+
+    df = parquet_file.read_row_groups(
+        row_groups,
+        columns=[_flatten(column) for column in selected],
+        use_pandas_metadata=True  # Reads also the index
+    ).to_pandas()
+
+    df.columns = pd.MultiIndex.from_tuples(selected)
+    df.sort_index(inplace=True)
+
+    dtypes = get_dtypes()
+
+    # Most columns are read with their types already, e.g. the flags
+    return df.astype({
+        column: dtypes[column]
+        for column in selected
+        if df[column].dtype != dtypes[column]
+    })
+
+
+def _select_columns(columns: list[str | tuple[str, str]] | None) -> list[tuple[str, str]]:
+    '''Returns the grouped columns to read, with the groups expanded to their columns.'''
+
+    if columns is None:
+        return list(COLUMNS_MULTIINDEX)
+
+    selected: list[tuple[str, str]] = []
+
+    for column in columns:
+        if isinstance(column, str):
+            group = [grouped for grouped in COLUMNS_MULTIINDEX if grouped[0] == column]
+            if not group:
+                raise KeyError(f"Unknown group of columns:\n{column}")
+            selected.extend(group)
+        elif tuple(column) in COLUMNS_MULTIINDEX:
+            selected.append(tuple(column))  # type: ignore
+        else:
+            raise KeyError(f"Unknown column:\n{column}")
+
+    return selected
@@ -0,0 +1,154 @@
+'''
+This module applies the row-wise cleaning functions to the distinct values of a column only.
+
+The job titles, locations, salaries or job ages repeat a lot across the postings,
+so a column is factorized, the function is called once for each distinct value
+and the results are mapped back to the rows. The number of values and distinct
+values of each function are counted, to report how many calls were saved (hit ratio).
+The stats are collected per process, the pipeline merges them from the workers.
+'''
+# Python
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+# External
+import numpy as np
+import pandas as pd
+
+
+class UniqueStats:
+    '''
+    The counts of a function applied to the distinct values.
+
+    Attributes:
+    - values (int): The number of values, i.e. the calls without the memoization.
+    - unique (int): The number of distinct values, i.e. the actual calls.
+    '''
+
+    __slots__ = ("values", "unique")
+
+    def __init__(self, values: int = 0, unique: int = 0):
+        self.values = values
+        self.unique = unique
+
+    def add(self, other: 'UniqueStats'):
+        '''Adds the counts of the other stats.'''
+
+        self.values += other.values
+        self.unique += other.unique
+
+    @property
+    def hit_ratio(self) -> float:
+        '''The fraction of the values whose result was reused.'''
+
+        return 1 - self.unique / self.values if self.values else 0.0
+
+    def to_dict(self) -> dict:
+        '''Returns the stats as a JSON-serializable dictionary.'''
+
+        return {
+            'values': self.values,
+            'unique': self.unique,
+            'hit_ratio': round(self.hit_ratio, 4),
+        }
+
+
+_stats: dict[str, UniqueStats] = {}
+
+
+def apply_unique(
+    values: pd.Series,
+    function: Callable,
+    name: str | None = None
+) -> pd.Series:
+    '''
+    Applies the function to each distinct value once and maps the results back,
+    the same as `values.apply(function)`. NaN is passed to the function once as well.
+
+    Args:
+    - values (pd.Series): The column to apply the function to.
+    - function (Callable): The function of a single value.
+    - name (str | None): The name under which the stats are counted.
+    Default is the name of the function.
+
+    Returns:
+    - pd.Series: The results, with the index of the values.
+    '''
+
+    codes, uniques = pd.factorize(values)
+
+    results = [function(value) for value in uniques]
+    if (codes == -1).any():
+        results.append(function(np.nan))  # The code -1 of NaN picks the last result
+
+    _count(name or function.__name__, len(values), len(results))
+
+    results_array = np.empty(len(results), dtype=object)
+    results_array[:] = results
+
+    # Infers the type of the results like `Series.apply`, e.g. the ints with NaNs as floats
+    return pd.Series(results_array[codes], index=values.index).infer_objects()
+
+
+def _count(name: str, values: int, unique: int):
+    '''Counts a call of `apply_unique`.'''
+
+    _stats.setdefault(name, UniqueStats()).add(UniqueStats(values, unique))
+
+
+def get_stats() -> dict[str, UniqueStats]:
+    '''Returns the stats collected in the current process, keyed by the function names.'''
+
+    return _stats
+
+
+def record_stats(stats: dict[str, UniqueStats]):
+    '''Adds the stats collected elsewhere, e.g. in a worker process.'''
+
+    for name, unique_stats in stats.items():
+        _stats.setdefault(name, UniqueStats()).add(unique_stats)
+
+
+@contextmanager
+def collect_stats() -> Iterator[dict[str, UniqueStats]]:
+    '''
+    Collects the stats of the block separately and restores the previous ones after it.
+
+    Returns:
+    - Iterator[dict[str, UniqueStats]]: The stats of the block, filled in when it ends.
+    '''
+
+    global _stats  # pylint: disable=global-statement
+
+    previous, _stats = _stats, {}
+
+    try:
+        yield _stats
+    finally:
+        _stats = previous
+
+
+def format_stats(stats: dict[str, UniqueStats]) -> str:
+    '''
+    Returns the stats as a table, the most reused functions first.
+
+    Args:
+    - stats (dict[str, UniqueStats]): The stats keyed by the function names.
+
+    Returns:
+    - str: The table with the values, distinct values and hit ratio of each function.
+    '''
+
+    width = max([len("Function")] + [len(name) for name in stats])
+
+    lines = [f"{'Function':<{width}}  {'Values':>8}  {'Unique':>8}  {'Hit ratio':>9}"]
+
+    for name, unique_stats in sorted(
+        stats.items(), key=lambda item: item[1].hit_ratio, reverse=True
+    ):
+        lines.append(
+            f"{name:<{width}}  {unique_stats.values:>8}  {unique_stats.unique:>8}  "
+            f"{unique_stats.hit_ratio:>9.1%}"
+        )
+
+    return "\n".join(lines)
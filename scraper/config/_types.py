@@ -18,6 +18,10 @@ Locations = {
 Url = dict[str, str]
 DriverPath = str
 DebugMode = bool
+ProfileStages = bool
+TelemetryDir = str
+Deduplicate = bool
+FingerprintIndex = str
 NA_value = Literal[""]
 Encoding = str
 OutputPath = TypedDict('OutputPath', {'main': str, 'raw': str, 'clean': str})
@@ -25,7 +29,10 @@ Config = TypedDict('Config',
                    {
                        'jobs_titles': JobTitles, 'locations': Locations,
                        'jobs_number': JobNumber, 'url': Url, 'driver_path': DriverPath,
-                       'debug_mode': DebugMode, 'NA_value': NA_value,
-                       'output_path': OutputPath, 'encoding': Encoding
+                       'debug_mode': DebugMode, 'profile_stages': ProfileStages,
+                       'telemetry_dir': TelemetryDir,
+                       'NA_value': NA_value,
+                       'output_path': OutputPath, 'encoding': Encoding,
+                       'deduplicate': Deduplicate, 'fingerprint_index': FingerprintIndex
                    }
                    )
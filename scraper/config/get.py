@@ -120,6 +120,30 @@ def get_path_csv_raw(
     return _get_path_csv(directory=job_title, location=location)
 
 
+def get_path_fingerprint_index(
+        job_title: JobDefault = config['jobs_titles']['default']
+) -> str:
+    '''
+    Returns the absolute path to the fingerprint index of the scraped postings,
+    shared by all RAW CSV files of the job title.
+
+    Args:
+        job_title (str): A string representing the job title.
+
+    Returns:
+        str: The absolute path to the fingerprint index file.
+    '''
+
+    index_path = os.path.join(
+        config['output_path']['main'],
+        config['output_path']['raw'],
+        job_title,
+        config['fingerprint_index']
+    )
+
+    return sanitize_filepath(os.path.abspath(index_path), platform="auto")
+
+
 def get_NA_value() -> NA_value:
     '''
     Returns the 'NA_value' from the configuration file.
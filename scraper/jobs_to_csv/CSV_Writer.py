@@ -10,8 +10,14 @@ from typing import Literal
 
 # Internal
 from scraper.config._types import JobDefault, Location
-from scraper.config.get import get_path_csv_raw, get_encoding
+from scraper.config.get import (
+    get_config,
+    get_encoding,
+    get_path_csv_raw,
+    get_path_fingerprint_index
+)
 from scraper._types import Job
+from .fingerprint_index import FingerprintIndex
 
 
 Mode = Literal["w", "a"]
@@ -30,8 +36,12 @@ class CSV_Writer():
 
     - counter (int): A counter used to keep track of the number of rows written.
 
+    - fingerprint_index (FingerprintIndex | None): The index of already written postings.
+    If provided, duplicated postings are not written.
+
     Methods:
-    - write_observation(observation: Job): Write a row of job observation data to the CSV file.
+    - write_observation(observation: Job) -> bool: Write a row of job observation data
+    to the CSV file, unless it is a duplicate.
 
     - write_row(row: Job): Writes a row of job observation data to the CSV file.
 
@@ -49,15 +59,21 @@ class CSV_Writer():
 
     '''
 
-    def __init__(self, csv_path: str, location: Location) -> None:
+    def __init__(
+            self,
+            csv_path: str,
+            location: Location,
+            fingerprint_index: FingerprintIndex | None = None
+    ) -> None:
 
         self.csv_path = csv_path
         self.location = location
         self.directory_path = os.path.dirname(csv_path)
         self.encoding = get_encoding()
         self.counter = 0
+        self.fingerprint_index = fingerprint_index
 
-    def write_observation(self, observation: Job):
+    def write_observation(self, observation: Job) -> bool:
         '''
         Write a row of job observation data to the CSV file.
 
@@ -65,8 +81,14 @@ class CSV_Writer():
         - observation (Job): A dictionary containing the job observation data 
         to write to the CSV file.
 
+        Returns:
+        - bool: True if the row was written, False if the posting was already indexed.
         '''
 
+        if self.fingerprint_index is not None \
+                and self.fingerprint_index.contains_job(observation):
+            return False
+
         if self.counter == 0:
             self.write_header(observation)
 
@@ -74,6 +96,11 @@ class CSV_Writer():
 
         self.counter += 1
 
+        if self.fingerprint_index is not None:
+            self.fingerprint_index.add_job(observation)
+
+        return True
+
     def write_row(self, row: Job):
         '''
         Writes a row of job observation data to the CSV file.
@@ -179,12 +206,20 @@ class CSV_Writer_RAW(CSV_Writer):
 
     Methods:
     - __init__(): Constructs the CSV_Writer_RAW instance by calling 
-    the parent class constructor with the path to the raw CSV file.
+    the parent class constructor with the path to the raw CSV file
+    and, if deduplication is enabled, the fingerprint index of the job title.
 
     '''
 
     def __init__(self, job_title: JobDefault, location: Location) -> None:
+
+        fingerprint_index = None
+        if get_config()['deduplicate']:
+            fingerprint_index = FingerprintIndex(
+                get_path_fingerprint_index(job_title))
+
         super().__init__(
             csv_path=get_path_csv_raw(job_title, location),
-            location=location
+            location=location,
+            fingerprint_index=fingerprint_index
         )
@@ -4,7 +4,6 @@ for printing info needed for debugging
 '''
 # Python
 from datetime import datetime
-import math
 from os import get_terminal_size
 from typing import Literal
 
@@ -37,15 +36,14 @@ def _print_separator(char_separator: str):
     print(separator)
 
 
-def print_current_page(jobs_so_far: int, jobs_per_page: int, number_of_pages: int | Literal["Unknown"]):
+def print_current_page(page_count: int, number_of_pages: int | Literal["Unknown"]):
     '''
-    Prints the current page number, calculated based on the number
-    of jobs already scraped and the number of jobs displayed 
-    per page on the website.
+    Prints the current page number, tracked by the scraper
+    while clicking through the pages.
 
     Args:
-    - jobs_so_far: an integer representing the total number of jobs already scraped.
-    - jobs_per_page: an integer representing the number of jobs displayed per page on the website.
+    - page_count: an integer representing the number of the page being scraped.
+    - number_of_pages: the total number of pages, or "Unknown".
 
     Returns: None
 
@@ -54,7 +52,6 @@ def print_current_page(jobs_so_far: int, jobs_per_page: int, number_of_pages: in
     Keep things less dependent on elements loaded from the site.
     The fewer interactions, the higher is chance that something will not break up.
     '''
-    page_count = math.ceil(jobs_so_far / jobs_per_page)
 
     pagination_footer = f"Page {page_count} of {number_of_pages}"
 
@@ -85,3 +82,31 @@ def print_current_date_time(intro_word: Literal["Start", "End"]):
     '''
     now = datetime.now().isoformat(sep=" ", timespec="seconds")
     print(f"\r{intro_word}: {now}")
+
+
+def print_stage_timings(summary: dict):
+    '''
+    Prints a table of the scraping stages durations and the page refreshes counts.
+
+    Args:
+    - summary (dict): The summary of the collected timings, see `StageTimer.summary`.
+
+    Returns: None
+    '''
+
+    _print_separator("-")
+
+    print(f"\r{'Stage':<36}{'Count':>8}{'Total s':>10}{'Mean s':>10}{'p95 s':>10}{'Max s':>10}")
+
+    for stage, timings in summary['stages'].items():
+        print(
+            f"\r{stage:<36}{timings['count']:>8}{timings['total_s']:>10.2f}"
+            f"{timings['mean_s']:>10.3f}{timings['p95_s']:>10.3f}{timings['max_s']:>10.3f}"
+        )
+
+    print(f"\rRefreshes: {summary['refreshes']}")
+
+    for cause, count in summary['refresh_causes'].items():
+        print(f"\r- {cause}: {count}")
+
+    _print_separator("-")
@@ -0,0 +1,217 @@
+'''
+This module provides a low-overhead timer for the stages of scraping a single job posting
+(awaiting the jobs list, clicking, pausing, getting values, parsing, writing...).
+Durations are collected into fixed-bucket histograms, so the memory use doesn't grow
+with the number of scraped jobs, and they can be dumped as JSON after the run.
+It also counts the page refreshes and the exceptions which caused them.
+'''
+# Python
+import json
+import os
+import time
+from collections import Counter
+
+# Upper bounds of the histogram buckets in milliseconds, the last bucket is unbounded
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1_000, 2_000, 5_000, 10_000, 30_000)
+
+
+class Histogram:
+    '''
+    A fixed-bucket histogram of durations.
+
+    Attributes:
+    - count (int): The number of recorded durations.
+    - total (float): The sum of recorded durations in seconds.
+    - minimum (float): The shortest recorded duration in seconds.
+    - maximum (float): The longest recorded duration in seconds.
+    - buckets (list[int]): The number of durations for each bucket of `BUCKETS_MS`,
+    plus the last one for longer durations.
+    '''
+
+    __slots__ = ("count", "total", "minimum", "maximum", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, seconds: float):
+        '''
+        Records a single duration.
+
+        Args:
+        - seconds (float): The duration in seconds.
+        '''
+
+        self.count += 1
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+
+        milliseconds = seconds * 1000
+        for index, upper_bound in enumerate(BUCKETS_MS):
+            if milliseconds <= upper_bound:
+                self.buckets[index] += 1
+                return
+
+        self.buckets[-1] += 1
+
+    def percentile(self, fraction: float) -> float:
+        '''
+        Estimates a percentile from the buckets as the upper bound of the bucket containing it.
+
+        Args:
+        - fraction (float): The percentile as a fraction between 0.0 and 1.0.
+
+        Returns:
+        - float: The estimated duration in seconds.
+        '''
+
+        if not self.count:
+            return 0.0
+
+        rank = fraction * self.count
+        cumulative = 0
+
+        for index, bucket_count in enumerate(self.buckets[:-1]):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return min(BUCKETS_MS[index] / 1000, self.maximum)
+
+        return self.maximum
+
+    def to_dict(self) -> dict:
+        '''Returns the histogram as a JSON-serializable dictionary.'''
+
+        return {
+            'count': self.count,
+            'total_s': round(self.total, 6),
+            'mean_s': round(self.total / self.count, 6) if self.count else 0.0,
+            'min_s': round(self.minimum, 6) if self.count else 0.0,
+            'max_s': round(self.maximum, 6),
+            'p50_s': self.percentile(0.5),
+            'p95_s': self.percentile(0.95),
+            'buckets_ms': dict(zip(
+                [f"<={bound}" for bound in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}"],
+                self.buckets
+            )),
+        }
+
+
+class _Measurement:
+    '''Context manager recording the duration of its block into a histogram.'''
+
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        self.histogram.add(time.perf_counter() - self.start)
+        return False
+
+
+class _NoMeasurement:
+    '''Context manager doing nothing, used when the timer is disabled.'''
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return False
+
+
+_NO_MEASUREMENT = _NoMeasurement()
+
+
+class StageTimer:
+    '''
+    Collects durations of named scraping stages and counts page refreshes.
+
+    Args:
+    - enabled (bool): Whether the stages are timed.
+    If not, `measure` costs a single attribute lookup.
+
+    Usage:
+    - with stage_timer.measure("parse_data"):
+    -     parse_data(job)
+    '''
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.histograms: dict[str, Histogram] = {}
+        self.refresh_causes: Counter[str] = Counter()
+
+    @property
+    def refreshes(self) -> int:
+        '''The total number of page refreshes.'''
+
+        return sum(self.refresh_causes.values())
+
+    def measure(self, stage: str) -> _Measurement | _NoMeasurement:
+        '''
+        Returns a context manager timing its block as the given stage.
+
+        Args:
+        - stage (str): The name of the stage.
+
+        Returns:
+        - A context manager recording the duration of its block.
+        '''
+
+        if not self.enabled:
+            return _NO_MEASUREMENT
+
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            histogram = self.histograms[stage] = Histogram()
+
+        return _Measurement(histogram)
+
+    def count_refresh(self, cause: Exception | str):
+        '''
+        Counts a page refresh with its cause.
+
+        Args:
+        - cause (Exception | str): The exception which caused the refresh,
+        or a short description of the cause.
+        '''
+
+        name = cause if isinstance(cause, str) else type(cause).__name__
+        self.refresh_causes[name] += 1
+
+    def summary(self) -> dict:
+        '''Returns the collected timings and refresh counts as a JSON-serializable dictionary.'''
+
+        return {
+            'stages': {
+                stage: histogram.to_dict()
+                for stage, histogram in self.histograms.items()
+            },
+            'refreshes': self.refreshes,
+            'refresh_causes': dict(self.refresh_causes),
+        }
+
+    def dump(self, path: str):
+        '''
+        Writes the summary as a JSON file.
+
+        Args:
+        - path (str): The path to the JSON file.
+        '''
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.summary(), file, indent=4)
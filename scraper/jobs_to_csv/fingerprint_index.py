@@ -0,0 +1,223 @@
+'''
+This module provides a persistent index of fingerprints of already scraped job postings.
+A fingerprint is a 64-bit hash of the company name, job title, location
+and the beginning of the description, so the same posting found again
+(in the next run, in another country or after a page refresh)
+can be skipped before its full extraction and before writing it to the CSV file.
+
+The index file is compact and append-only:
+- 4 bytes of the format marker `JFP1`,
+- followed by 8 bytes (unsigned, little-endian) for each fingerprint.
+
+Usage:
+- python -m scraper.jobs_to_csv.fingerprint_index "data/RAW/Data Engineer"
+builds the index from the RAW CSV files scraped before.
+'''
+# Python
+import csv
+import hashlib
+import os
+import re
+import sys
+from array import array
+
+# Internal
+from scraper._types import Job
+from scraper.config.get import get_encoding, get_path_fingerprint_index
+
+MAGIC = b"JFP1"
+DESCRIPTION_PREFIX_LENGTH = 200
+_FINGERPRINT_SIZE = 8
+_WHITESPACES = re.compile(r"\s+")
+
+
+def job_fingerprint(job: Job) -> int:
+    '''
+    Computes the fingerprint of a job posting.
+    It gives the same value for the posting as scraped from the page
+    and after its parsing, so it can be checked at both stages.
+
+    Args:
+    - job (Job): A dictionary containing at least the 'Company_name', 'Rating',
+    'Job_title', 'Location' and 'Description' fields.
+
+    Returns:
+    - int: The 64-bit fingerprint.
+    '''
+
+    company_name = str(job.get('Company_name', ""))
+
+    # The same as the company name parser, the rating is a part of the scraped name
+    rating = str(job.get('Rating', ""))
+    if rating:
+        for rating_version in (rating, rating.replace(".", ","), rating.replace(",", ".")):
+            company_name = company_name.replace(rating_version, "")
+
+    description = _normalize(job.get('Description', ""))[:DESCRIPTION_PREFIX_LENGTH]
+
+    key = "\x1f".join((
+        _normalize(company_name),
+        _normalize(job.get('Job_title', "")),
+        _normalize(job.get('Location', "")),
+        description,
+    ))
+
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=_FINGERPRINT_SIZE).digest()
+
+    return int.from_bytes(digest, "little")
+
+
+def _normalize(value) -> str:
+    '''Lowercases the value and collapses its whitespaces.'''
+
+    return _WHITESPACES.sub(" ", str(value)).strip().lower()
+
+
+class FingerprintIndex:
+    '''
+    A set of fingerprints of scraped job postings, persisted in a compact file.
+
+    Args:
+    - path (str | None): The path to the index file. It is created if it doesn't exist.
+    If None, the index is kept only in memory.
+
+    Raises:
+    - ValueError: If the file exists but it is not a fingerprint index.
+    '''
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self._fingerprints: set[int] = set()
+
+        if path and os.path.isfile(path):
+            self._load(path)
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def __contains__(self, fingerprint: int) -> bool:
+        return fingerprint in self._fingerprints
+
+    def contains_job(self, job: Job) -> bool:
+        '''
+        Checks whether the job posting was already indexed.
+
+        Args:
+        - job (Job): The job posting, scraped or parsed.
+
+        Returns:
+        - bool: True if the posting is a duplicate.
+        '''
+
+        return job_fingerprint(job) in self._fingerprints
+
+    def add_job(self, job: Job) -> bool:
+        '''
+        Adds the job posting to the index.
+
+        Args:
+        - job (Job): The job posting, scraped or parsed.
+
+        Returns:
+        - bool: True if the posting was added, False if it was already indexed.
+        '''
+
+        return self.add(job_fingerprint(job))
+
+    def add(self, fingerprint: int) -> bool:
+        '''
+        Adds the fingerprint to the index and appends it to the index file.
+
+        Args:
+        - fingerprint (int): The fingerprint of a job posting.
+
+        Returns:
+        - bool: True if the fingerprint was added, False if it was already indexed.
+        '''
+
+        if fingerprint in self._fingerprints:
+            return False
+
+        self._fingerprints.add(fingerprint)
+
+        if self.path:
+            self._append(fingerprint.to_bytes(_FINGERPRINT_SIZE, "little"))
+
+        return True
+
+    def _load(self, path: str):
+        '''Loads the fingerprints from the index file.'''
+
+        with open(path, "rb") as file:
+            data = file.read()
+
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"The file is not a fingerprint index:\n{path}")
+
+        body = data[len(MAGIC):]
+        # A partially written fingerprint, e.g. after a crash, is skipped
+        body = body[:len(body) - len(body) % _FINGERPRINT_SIZE]
+
+        fingerprints = array("Q")
+        fingerprints.frombytes(body)
+
+        if sys.byteorder == "big":
+            fingerprints.byteswap()
+
+        self._fingerprints.update(fingerprints)
+
+    def _append(self, fingerprint_bytes: bytes):
+        '''Appends the fingerprint to the index file, creating the file if needed.'''
+
+        assert self.path is not None
+
+        is_new_file = not os.path.isfile(self.path)
+
+        if is_new_file:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+        with open(self.path, "ab") as file:
+            if is_new_file:
+                file.write(MAGIC)
+            file.write(fingerprint_bytes)
+
+
+def build_index_from_csv_files(index: FingerprintIndex, directory: str) -> int:
+    '''
+    Adds postings from all CSV files in the directory to the index.
+
+    Args:
+    - index (FingerprintIndex): The index to update.
+    - directory (str): The directory with RAW CSV files.
+
+    Returns:
+    - int: The number of newly indexed postings.
+    '''
+
+    added = 0
+
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith(".csv"):
+            continue
+
+        with open(
+            os.path.join(directory, file_name), newline="", encoding=get_encoding()
+        ) as file:
+            for row in csv.DictReader(file):
+                added += index.add_job(row)
+
+    return added
+
+
+if __name__ == '__main__':
+
+    raw_directory = sys.argv[1]
+    job_title = os.path.basename(os.path.normpath(raw_directory))
+
+    fingerprint_index = FingerprintIndex(get_path_fingerprint_index(job_title))
+    newly_indexed = build_index_from_csv_files(fingerprint_index, raw_directory)
+
+    print(f"Indexed {newly_indexed} new postings, {len(fingerprint_index)} in total:")
+    print(fingerprint_index.path)
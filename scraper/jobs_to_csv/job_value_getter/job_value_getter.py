@@ -13,9 +13,16 @@ from ._element_value_getter_and_adder import get_and_add_element_value
 from ..elements_query.await_element import await_element
 from ..elements_query.XPATH_text_getter import XpathListSearch, XpathSearch
 from ..actions.pause import pause
+from ..debugger.stage_timer import StageTimer
+from ..fingerprint_index import FingerprintIndex
 
 
-def get_values_for_job(driver: MyWebDriver, job_button: WebElement) -> Job_values:
+def get_values_for_job(
+        driver: MyWebDriver,
+        job_button: WebElement,
+        stage_timer: StageTimer | None = None,
+        fingerprint_index: FingerprintIndex | None = None
+) -> Job_values | None:
     '''
     Get columns values from the current selected job posting.
 
@@ -26,28 +33,48 @@ def get_values_for_job(driver: MyWebDriver, job_button: WebElement) -> Job_value
         The browser driver
     - job_button (MyWebDriver):
         The job button
+    - stage_timer (StageTimer | None):
+        Times the section functions, if provided
+    - fingerprint_index (FingerprintIndex | None):
+        The index of already scraped postings, if provided
 
     Returns:
     - Job_values (dict):
         A dictionary containing columns values from the job posting
+    - None:
+        If the posting is already in the fingerprint index.
+        Only the job description values are scraped to check it.
     '''
 
     job: Job_values = {}
+    timer = stage_timer or StageTimer(enabled=False)
 
-    job_post = await_element(
-        driver, 25, By.ID, "JDCol")
+    with timer.measure("get_values_for_job.await_JDCol"):
+        job_post = await_element(
+            driver, 25, By.ID, "JDCol")
 
-    pause()
+    with timer.measure("get_values_for_job.pause"):
+        pause()
 
     # Those HTML components should be on job the post
-    _get_job_descriptions_values(job, job_post)
-    _get_job_button_values(job, job_button)
+    with timer.measure("get_values_for_job.job_descriptions_values"):
+        _get_job_descriptions_values(job, job_post)
+
+    if fingerprint_index is not None and fingerprint_index.contains_job(job):
+        return None
+
+    with timer.measure("get_values_for_job.job_button_values"):
+        _get_job_button_values(job, job_button)
 
     # Those HTML components are optional on job the post
-    _get_company_description(job, job_post)
-    _get_company_ratings(job, job_post)
-    _get_company_reviews_by_job_title(job, job_post)
-    _get_company_benefits_review(job, job_post)
+    with timer.measure("get_values_for_job.company_description"):
+        _get_company_description(job, job_post)
+    with timer.measure("get_values_for_job.company_ratings"):
+        _get_company_ratings(job, job_post)
+    with timer.measure("get_values_for_job.company_reviews_by_job_title"):
+        _get_company_reviews_by_job_title(job, job_post)
+    with timer.measure("get_values_for_job.company_benefits_review"):
+        _get_company_benefits_review(job, job_post)
 
     return job
 
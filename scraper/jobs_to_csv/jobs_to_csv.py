@@ -5,7 +5,10 @@ It also contains functions for writing job data to CSV files in its RAW version.
 """
 # Python
 import logging
+import os
+import re
 import sys
+from collections import Counter
 from typing import Literal
 
 # External
@@ -22,7 +25,8 @@ from selenium.webdriver.remote.webelement import WebElement
 # Internal
 from scraper._types import Job_values, MyWebDriver, WebElements
 from scraper.config._types import DebugMode, JobNumber, JobDefault, Location
-from scraper.config.get import get_encoding
+from scraper.config.get import get_config, get_encoding
+from scraper.telemetry.run_log import RunLog
 
 from .actions.click_javascript import click_via_javascript
 from .actions.click_next_page import click_next_page
@@ -33,7 +37,9 @@ from .debugger.printer import (
     print_current_date_time,
     print_current_page,
     print_key_value_pairs,
+    print_stage_timings,
 )
+from .debugger.stage_timer import StageTimer
 from .elements_query.await_element import await_element
 from .job_parser.job_parser import parse_data
 from .job_value_getter.job_value_getter import get_values_for_job
@@ -41,6 +47,11 @@ from .job_value_getter.job_value_getter import get_values_for_job
 # mypy bug https://github.com/python/mypy/issues/11426
 Pages_Number = Literal["Unknown"] | int  # type: ignore[operator]
 
+config = get_config()
+
+# After that many failed attempts (refreshes) the job posting is skipped
+MAX_JOB_ATTEMPTS = 3
+
 # Update the docstring
 
 
@@ -58,6 +69,13 @@ class GlassdoorJobScraper:
         csv_writer (CSV_Writer_RAW): Object responsible for writing data to CSV files.
         progress_bar (enlighten.Counter): Object responsible for displaying progress bar.
         number_of_pages (Pages_Number): The total number of pages for the job search results.
+        stage_timer (StageTimer): Object responsible for timing the scraping stages
+        and counting the page refreshes.
+        run_log (RunLog): Object responsible for writing the run telemetry events.
+        current_page (int): The number of the search results page being scraped.
+        done_job_ids (set[str]): The ids of the job buttons already done on the current page.
+        job_attempts (Counter[str]): The number of failed attempts for each job button id.
+        is_refreshed (bool): Whether the page was refreshed since the jobs list was last loaded.
 
     Methods:
         save_jobs_to_csv_raw(): Retrieves and writes job data to CSV files.
@@ -78,6 +96,8 @@ class GlassdoorJobScraper:
         jobs_number: JobNumber,
         debug_mode: DebugMode,
         driver: MyWebDriver,
+        profile_stages: bool = config['profile_stages'],
+        run_log: RunLog | None = None,
     ):
         self.job_title = job_title
         self.location = location
@@ -87,6 +107,12 @@ class GlassdoorJobScraper:
         self.csv_writer = CSV_Writer_RAW(job_title, location)
         self.progress_bar = None
         self.number_of_pages = None
+        self.stage_timer = StageTimer(enabled=profile_stages)
+        self.run_log = run_log or RunLog()
+        self.current_page = 1
+        self.done_job_ids: set[str] = set()
+        self.job_attempts: Counter[str] = Counter()
+        self.is_refreshed = False
 
     def save_jobs_to_csv_raw(self):
         """
@@ -119,8 +145,12 @@ class GlassdoorJobScraper:
                 total=self.jobs_number,
             )
 
-        while self.csv_writer.counter <= self.jobs_number:
-            self._write_job_listings()
+        try:
+            while self.csv_writer.counter <= self.jobs_number:
+                self._write_job_listings()
+
+        finally:
+            self._report_stage_timings()
 
         if self.progress_bar:
             self.progress_bar.close()
@@ -143,82 +173,239 @@ class GlassdoorJobScraper:
             TimeoutException: If a job posting is not found within a specified timeout.
         """
 
+        timer = self.stage_timer
+
         try:
-            jobs_list_buttons = await_element(
-                self.driver, 25, By.XPATH, '//ul[@data-test="jlGrid"]'
-            )
+            with timer.measure("await_jlGrid"):
+                jobs_list_buttons = await_element(
+                    self.driver, 25, By.XPATH, '//ul[@data-test="jlGrid"]'
+                )
 
             jobs_buttons = self.get_jobs_buttons(jobs_list_buttons)
 
-        except (StaleElementReferenceException, TimeoutException):
-            self.driver.refresh()
+        except (StaleElementReferenceException, TimeoutException) as error:
+            self._refresh(error)
             return
 
-        if self.debug_mode:
-            print_current_page(
-                self.csv_writer.counter, len(jobs_buttons), self.number_of_pages
-            )
+        if self.is_refreshed:
+            self.is_refreshed = False
 
-        click_x_pop_up(self.driver)
+            # The refresh could bring back the first page of the results
+            if self._go_to_current_page():
+                return
 
-        saved_button_index = self._calculate_index(jobs_buttons)
+        self.run_log.event(
+            "page_visited",
+            location=self.location,
+            jobs_on_page=len(jobs_buttons),
+            jobs_written=self.csv_writer.counter,
+        )
 
-        for job_button in jobs_buttons[saved_button_index:]:
+        if self.debug_mode:
+            print_current_page(self.current_page, self.number_of_pages)
+
+        with timer.measure("click_x_pop_up"):
+            click_x_pop_up(self.driver)
+
+        for button_index, job_button in enumerate(jobs_buttons):
             if self.csv_writer.counter > self.jobs_number:
                 break
 
+            try:
+                job_id = self._get_job_id(job_button, button_index)
+
+            except StaleElementReferenceException as error:
+                self._refresh(error)
+                break
+
+            if job_id in self.done_job_ids:
+                continue
+
+            if self.job_attempts[job_id] >= MAX_JOB_ATTEMPTS:
+                self.done_job_ids.add(job_id)
+                self.run_log.event(
+                    "job_skipped", location=self.location, job_id=job_id
+                )
+                continue
+
             if self.debug_mode:
                 print(f"\rProgress: {self.csv_writer.counter}/{self.jobs_number}")
 
             try:
-                job_button.click()
+                with timer.measure("click_job_button"):
+                    try:
+                        job_button.click()
 
-            except ElementClickInterceptedException:
-                click_via_javascript(self.driver, job_button)
+                    except ElementClickInterceptedException:
+                        click_via_javascript(self.driver, job_button)
 
-            except StaleElementReferenceException:
-                self.driver.refresh()
+            except StaleElementReferenceException as error:
+                self._refresh(error, job_id)
                 break
 
-            pause()
-            click_x_pop_up(self.driver)
+            with timer.measure("pause"):
+                pause()
+
+            with timer.measure("click_x_pop_up"):
+                click_x_pop_up(self.driver)
 
             try:
-                job = get_values_for_job(self.driver, job_button)
+                with timer.measure("get_values_for_job"):
+                    job = get_values_for_job(
+                        self.driver, job_button, timer, self.csv_writer.fingerprint_index
+                    )
 
-            except (TimeoutException, StaleElementReferenceException):
-                self.driver.refresh()
+            except (TimeoutException, StaleElementReferenceException) as error:
+                self._refresh(error, job_id)
                 break
 
+            if job is None:
+                self.done_job_ids.add(job_id)
+                self.run_log.event("duplicate_skipped", location=self.location)
+                continue
+
             if not self._job_posting_exists(job):
                 if self.debug_mode:
                     self._save_errored_page()
 
-                self.driver.refresh()
+                self.run_log.event(
+                    "blocked",
+                    location=self.location,
+                    reason="Job posting without company name",
+                )
+                self._refresh("Job posting without company name", job_id)
                 break
 
-            parse_data(job)
+            with timer.measure("parse_data"):
+                parse_data(job)
 
             if self.debug_mode:
                 print_key_value_pairs(job)
 
             try:
-                self.csv_writer.write_observation(job)
+                with timer.measure("write_observation"):
+                    is_written = self.csv_writer.write_observation(job)
 
             except SystemExit as exit_msg:
                 self.driver.quit()
                 sys.exit(exit_msg)
 
+            self.done_job_ids.add(job_id)
+
+            if not is_written:
+                self.run_log.event("duplicate_skipped", location=self.location)
+                continue
+
+            self.run_log.event(
+                "job_written",
+                location=self.location,
+                jobs_written=self.csv_writer.counter,
+            )
+
             if self.progress_bar:
                 self.progress_bar.update()
 
         else:
+            self._go_to_next_page()
+
+            self.current_page += 1
+            self.done_job_ids.clear()
+            self.job_attempts.clear()
+
+    def _go_to_next_page(self):
+        '''
+        Clicks the next page button and waits for the page to load.
+        '''
+
+        with self.stage_timer.measure("click_next_page"):
             click_next_page(self.driver, self.csv_writer.counter, self.jobs_number)
 
-            # Awaits element to upload all buttons. Traditional awaits elements didn't work out.
-            # https://stackoverflow.com/questions/27003423/staleelementreferenceexception-on-python-selenium
+        # Awaits element to upload all buttons. Traditional awaits elements didn't work out.
+        # https://stackoverflow.com/questions/27003423/staleelementreferenceexception-on-python-selenium
+        with self.stage_timer.measure("pause"):
             pause()
 
+    def _go_to_current_page(self) -> bool:
+        '''
+        Goes forward to the page being scraped, if the browser shows an earlier one.
+        The shown page is read from the pagination footer.
+
+        Returns:
+        - bool: True if the browser was moved to another page.
+        '''
+
+        shown_page = self._get_current_web_page()
+
+        if shown_page is None or shown_page >= self.current_page:
+            return False
+
+        for _ in range(self.current_page - shown_page):
+            self._go_to_next_page()
+
+        return True
+
+    def _get_job_id(self, job_button: WebElement, button_index: int) -> str:
+        '''
+        Returns the stable id of the job button, the id of its job listing.
+        If the button has no id, its position on the page is used.
+
+        Args:
+        - job_button (WebElement): The job button.
+        - button_index (int): The position of the button on the page.
+
+        Returns:
+        - str: The id of the job button.
+
+        Raises:
+        - StaleElementReferenceException: If the button is no longer present on the page.
+        '''
+
+        job_id = job_button.get_attribute("data-id")
+
+        return job_id if job_id else f"position-{button_index}"
+
+    def _refresh(self, cause: Exception | str, job_id: str | None = None):
+        '''
+        Refreshes the current page and counts the refresh with its cause.
+
+        Args:
+        - cause (Exception | str): The exception which caused the refresh,
+        or a short description of the cause.
+        - job_id (str | None): The id of the job button which failed, if any.
+        '''
+
+        if job_id is not None:
+            self.job_attempts[job_id] += 1
+
+        self.is_refreshed = True
+        self.stage_timer.count_refresh(cause)
+        self.run_log.event(
+            "refresh",
+            location=self.location,
+            cause=cause if isinstance(cause, str) else type(cause).__name__,
+        )
+        self.driver.refresh()
+
+    def _report_stage_timings(self):
+        '''
+        Writes the stages timings and the refresh counts to the run log.
+        If the stages were timed, dumps them as JSON next to the RAW CSV file
+        and prints them in the debug mode.
+        '''
+
+        self.run_log.event(
+            "stage_durations", location=self.location, **self.stage_timer.summary()
+        )
+
+        if not self.stage_timer.enabled:
+            return
+
+        csv_path_no_extension = os.path.splitext(self.csv_writer.csv_path)[0]
+        self.stage_timer.dump(f"{csv_path_no_extension}_timings.json")
+
+        if self.debug_mode:
+            print_stage_timings(self.stage_timer.summary())
+
     def get_jobs_buttons(self, jobs_list_buttons: WebElement):
         """
         Extracts job listing buttons from the jobs list container.
@@ -243,6 +430,9 @@ class GlassdoorJobScraper:
                 By.TAG_NAME, "li"
             )
         except NoSuchElementException as error:
+            self.run_log.event(
+                "blocked", location=self.location, reason="No job buttons found"
+            )
             sys.exit(
                 f"Check if you did not have any misspell in the job title or \
                     if you were silently blocked by glassdoor.\
@@ -277,19 +467,29 @@ class GlassdoorJobScraper:
         ):
             return "Unknown"
 
-    def _calculate_index(self, jobs_buttons: WebElements) -> int:
+    def _get_current_web_page(self) -> int | None:
         """
-        Calculates the index of the next job button to click,
-        based on the current saved rows count and the number of job buttons available.
+        Extracts the number of the shown page from the pagination footer, e.g. "Page 3 of 30".
 
         Returns:
-            - An integer representing the index of the next job button to click.
+            - The number of the shown page as an integer, or None if it is not found.
         """
+
+        target_element = '//div[@data-test="pagination-footer-text"]'
+
         try:
-            return self.csv_writer.counter % len(jobs_buttons)
+            footer = await_element(self.driver, 10, By.XPATH, target_element).text
+
+        except (
+            TimeoutException,
+            NoSuchElementException,
+            StaleElementReferenceException,
+        ):
+            return None
+
+        page_number = re.search(r"\d+", footer)
 
-        except ZeroDivisionError:
-            return 0
+        return int(page_number.group()) if page_number else None
 
     def _save_errored_page(self):
         """
@@ -17,6 +17,7 @@ from annotated_types import Gt
 from scraper.config.get import get_config, get_url
 from scraper.jobs_to_csv.webpage_getter.webpage_getter import get_webpage
 from scraper.jobs_to_csv.jobs_to_csv import GlassdoorJobScraper
+from scraper.telemetry.run_log import RunLog
 
 config = get_config()
 
@@ -26,7 +27,9 @@ def scrape_data(
         location: str = config['locations']['default'],
         jobs_number: Annotated[int, Gt(0)] = config['jobs_number'],
         driver_path: str = config['driver_path'],
-        debug_mode: bool = config['debug_mode']
+        debug_mode: bool = config['debug_mode'],
+        profile_stages: bool = config['profile_stages'],
+        run_log: RunLog | None = None
 ):
     """
     Scrapes job postings from the glassdoor.com based on the given job title and number of jobs. 
@@ -47,6 +50,12 @@ def scrape_data(
         - debug_mode (bool, optional): Flag to enable debug mode for development and debugging. 
         Defaults to the value in the global config data file.
 
+        - profile_stages (bool, optional): Flag to time each scraping stage.
+        Defaults to the value in the global config data file.
+
+        - run_log (RunLog, optional): The telemetry log of the run the scraping belongs to.
+        Defaults to None, no events are written.
+
     Returns:
         - None
 
@@ -65,7 +74,7 @@ def scrape_data(
     driver = get_webpage(url, location, debug_mode, driver_path)
 
     glassdoor_job_scraper = GlassdoorJobScraper(
-        job_title, location, jobs_number, debug_mode, driver)
+        job_title, location, jobs_number, debug_mode, driver, profile_stages, run_log)
 
     glassdoor_job_scraper.save_jobs_to_csv_raw()
 
@@ -0,0 +1,231 @@
+'''
+This module aggregates the JSON-lines telemetry logs of scraping runs
+into per-run and per-country throughput figures, so the concurrency and pacing
+of long scraping campaigns can be decided from data.
+
+Usage:
+- python -m scraper.telemetry.analyzer logs/*.jsonl
+- python -m scraper.telemetry.analyzer logs/*.jsonl --by-country
+'''
+# Python
+import argparse
+import json
+import sys
+from collections import Counter, defaultdict
+
+Event = dict
+
+
+def load_events(paths: list[str]) -> list[Event]:
+    '''
+    Loads events from the JSON-lines logs, skipping lines which are not valid JSON
+    (e.g. the last line of a log of a killed run).
+
+    Args:
+    - paths (list[str]): The paths to the logs.
+
+    Returns:
+    - list[Event]: The events sorted by their timestamps.
+    '''
+
+    events = []
+
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+
+    events.sort(key=lambda event: event.get('ts', 0))
+
+    return events
+
+
+def summarize_countries(events: list[Event]) -> list[dict]:
+    '''
+    Aggregates the events of each country scraped in each run.
+
+    Args:
+    - events (list[Event]): The events of one or many runs.
+
+    Returns:
+    - list[dict]: A summary of each scraped country in the chronological order, with:
+    run_id, location, outcome, elapsed_s, pages, jobs_written, jobs_per_minute,
+    duplicates, refreshes, refresh_causes, blocked and the mean stages durations.
+    '''
+
+    summaries: dict[tuple[str, str], dict] = {}
+
+    for event in events:
+        location = event.get('location')
+        if location is None:
+            continue
+
+        key = (event['run_id'], location)
+        summary = summaries.get(key)
+
+        if summary is None:
+            summary = summaries[key] = _empty_country_summary(
+                event['run_id'], location, event['ts'])
+
+        _add_country_event(summary, event)
+
+    for summary in summaries.values():
+        summary['refresh_causes'] = dict(summary['refresh_causes'])
+
+        if summary['elapsed_s'] is None:
+            summary['elapsed_s'] = round(summary['last_ts'] - summary['start_ts'], 3)
+
+        minutes = summary['elapsed_s'] / 60
+        summary['jobs_per_minute'] = round(
+            summary['jobs_written'] / minutes, 3) if minutes else 0.0
+
+        del summary['last_ts']
+
+    return list(summaries.values())
+
+
+def summarize_runs(events: list[Event]) -> list[dict]:
+    '''
+    Aggregates the countries of each run into the run throughput.
+
+    Args:
+    - events (list[Event]): The events of one or many runs.
+
+    Returns:
+    - list[dict]: A summary of each run in the chronological order, with:
+    run_id, start_ts, countries, pages, jobs_written, elapsed_s, jobs_per_minute,
+    refreshes, blocked and the change of jobs_per_minute against the previous run.
+    '''
+
+    runs: dict[str, dict] = defaultdict(lambda: {
+        'countries': 0, 'pages': 0, 'jobs_written': 0,
+        'elapsed_s': 0.0, 'refreshes': 0, 'blocked': 0,
+    })
+
+    for country in summarize_countries(events):
+        run = runs[country['run_id']]
+        run.setdefault('run_id', country['run_id'])
+        run.setdefault('start_ts', country['start_ts'])
+        run['countries'] += 1
+
+        for field in ('pages', 'jobs_written', 'elapsed_s', 'refreshes', 'blocked'):
+            run[field] += country[field]
+
+    summaries = sorted(runs.values(), key=lambda run: run['start_ts'])
+    previous_throughput = None
+
+    for run in summaries:
+        minutes = run['elapsed_s'] / 60
+        run['elapsed_s'] = round(run['elapsed_s'], 3)
+        run['jobs_per_minute'] = round(run['jobs_written'] / minutes, 3) if minutes else 0.0
+        run['trend'] = (
+            round(run['jobs_per_minute'] - previous_throughput, 3)
+            if previous_throughput is not None else None
+        )
+        previous_throughput = run['jobs_per_minute']
+
+    return summaries
+
+
+def _empty_country_summary(run_id: str, location: str, start_ts: float) -> dict:
+    '''Returns the summary of a country before any event is added.'''
+
+    return {
+        'run_id': run_id,
+        'location': location,
+        'start_ts': start_ts,
+        'last_ts': start_ts,
+        'outcome': "unfinished",
+        'elapsed_s': None,
+        'pages': 0,
+        'jobs_written': 0,
+        'duplicates': 0,
+        'refreshes': 0,
+        'refresh_causes': Counter(),
+        'blocked': 0,
+        'stages_mean_s': {},
+    }
+
+
+def _add_country_event(summary: dict, event: Event):
+    '''Updates the summary of a country with a single event.'''
+
+    name = event['event']
+    summary['last_ts'] = event['ts']
+
+    if name == "page_visited":
+        summary['pages'] += 1
+
+    elif name == "job_written":
+        summary['jobs_written'] += 1
+
+    elif name == "duplicate_skipped":
+        summary['duplicates'] += 1
+
+    elif name == "refresh":
+        summary['refreshes'] += 1
+        summary['refresh_causes'][event.get('cause', "Unknown")] += 1
+
+    elif name == "blocked":
+        summary['blocked'] += 1
+
+    elif name == "stage_durations":
+        summary['stages_mean_s'] = {
+            stage: timings['mean_s']
+            for stage, timings in event.get('stages', {}).items()
+        }
+
+    elif name == "country_stop":
+        summary['outcome'] = event.get('outcome', "unknown")
+        summary['elapsed_s'] = event.get(
+            'elapsed_s', round(event['ts'] - summary['start_ts'], 3))
+
+
+def _print_table(rows: list[dict], columns: list[str]):
+    '''Prints the selected columns of the rows as a plain text table.'''
+
+    widths = {
+        column: max([len(column)] + [len(str(row.get(column))) for row in rows])
+        for column in columns
+    }
+
+    print("  ".join(column.ljust(widths[column]) for column in columns))
+
+    for row in rows:
+        print("  ".join(str(row.get(column)).ljust(widths[column]) for column in columns))
+
+
+def main(args: list[str]):
+    '''Prints the throughput of the runs, or of each country with `--by-country`.'''
+
+    parser = argparse.ArgumentParser(
+        description="Aggregate the scraping telemetry logs into throughput trends.")
+    parser.add_argument("logs", nargs="+", help="JSON-lines telemetry logs")
+    parser.add_argument("--by-country", action="store_true",
+                        help="summarize each country of each run")
+    parser.add_argument("--json", action="store_true",
+                        help="print the summaries as JSON")
+    options = parser.parse_args(args)
+
+    events = load_events(options.logs)
+
+    if options.by_country:
+        rows = summarize_countries(events)
+        columns = ['run_id', 'location', 'outcome', 'elapsed_s', 'pages',
+                   'jobs_written', 'jobs_per_minute', 'duplicates', 'refreshes', 'blocked']
+    else:
+        rows = summarize_runs(events)
+        columns = ['run_id', 'countries', 'elapsed_s', 'pages', 'jobs_written',
+                   'jobs_per_minute', 'trend', 'refreshes', 'blocked']
+
+    if options.json:
+        print(json.dumps(rows, indent=4))
+    else:
+        _print_table(rows, columns)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
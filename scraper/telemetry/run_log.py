@@ -0,0 +1,105 @@
+'''
+This module provides a structured log of scraping runs.
+Each run writes a JSON-lines event stream (one JSON object per line),
+which can be replayed later to aggregate throughput, refreshes, blockages
+and stages durations across many runs.
+'''
+# Python
+import json
+import os
+import time
+import uuid
+from datetime import datetime
+from typing import IO
+
+# Internal
+from scraper.config.get import get_config
+
+config = get_config()
+
+
+class RunLog:
+    '''
+    Writes events of a scraping run as JSON lines.
+
+    Each event has the fields:
+    - ts (float): The UNIX timestamp of the event.
+    - run_id (str): The identifier shared by all events of the run.
+    - event (str): The event name, e.g. "country_start", "page_visited", "job_written".
+    - and the event specific fields.
+
+    Args:
+    - path (str | None): The path to the JSON-lines file. The events are appended to it.
+    If None, the log is disabled and the events are dropped.
+    - run_id (str | None): The identifier of the run. Generated if not provided.
+
+    Usage:
+    - with RunLog(new_run_log_path()) as run_log:
+    -     run_log.event("country_start", country="Poland")
+    '''
+
+    def __init__(self, path: str | None = None, run_id: str | None = None):
+        self.path = path
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self._file: IO[str] | None = None
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+            # line buffered, so events survive a crash of the browser or the process
+            self._file = open(  # pylint: disable=consider-using-with
+                path, "a", encoding="utf-8", buffering=1)
+
+    @property
+    def enabled(self) -> bool:
+        '''Whether the events are written.'''
+
+        return self._file is not None
+
+    def event(self, name: str, **fields):
+        '''
+        Writes a single event.
+
+        Args:
+        - name (str): The event name.
+        - fields: The event specific JSON-serializable fields.
+        '''
+
+        if self._file is None:
+            return
+
+        record = {'ts': round(time.time(), 3), 'run_id': self.run_id, 'event': name}
+        record.update(fields)
+
+        self._file.write(json.dumps(record, default=str) + "\n")
+
+    def close(self):
+        '''Closes the log file.'''
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'RunLog':
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def new_run_log_path(directory: str = config['telemetry_dir']) -> str:
+    '''
+    Returns a path for the log of a new run, named after the current date and time.
+
+    Args:
+    - directory (str): The directory of the run logs.
+
+    Returns:
+    - str: The path to the JSON-lines file.
+    '''
+
+    date_time = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+    return os.path.join(directory, f"run_{date_time}.jsonl")
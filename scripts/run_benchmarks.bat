@@ -0,0 +1,3 @@
+@ECHO OFF
+ECHO Running benchmarks...
+python -m benchmarks.bench_scraper --jobs 60 --output bench_scraper.json
\ No newline at end of file
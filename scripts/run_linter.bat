@@ -3,4 +3,6 @@ ECHO Running linter...
 pylint config
 pylint scraper
 pylint _001_data_collection.py
-pylint test
\ No newline at end of file
+pylint test
+pylint benchmarks
+pylint cleaning
\ No newline at end of file
@@ -0,0 +1,421 @@
+'''
+This module provides a local HTTP server imitating the glassdoor.com job search.
+It serves search-result pages and job postings with the same HTML structure
+the scraper relies on (`jlGrid`, `JDCol`, `pagination-next`, `pagination-footer-text`),
+so the scraper can be tested and benchmarked without touching the live site.
+
+The served postings are either synthetic (deterministic for a given seed)
+or recorded ones, loaded from a RAW CSV file created earlier by the scraper.
+'''
+
+# Python
+import ast
+import csv
+import html
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+Posting = dict[str, str]
+
+_COMPANIES = ["Acme Data", "Nordic Analytics", "Bluefin Systems", "Orbit Logistics",
+              "Quantum Retail", "Helix Health", "Ferro Energy", "Lumen Banking"]
+_TITLES = ["Data Engineer", "Senior Data Engineer", "Junior Data Engineer",
+           "Big Data Engineer", "Cloud Data Engineer", "Lead Data Engineer"]
+_CITIES = ["Berlin", "Munich", "Hamburg", "Cologne", "Frankfurt", "Remote"]
+_TOOLS = ["Python", "SQL", "Apache Spark", "Kafka", "Airflow", "AWS", "Azure",
+          "Snowflake", "Databricks", "Scala", "Java", "Docker", "Git"]
+_SIZES = ["1 to 50 Employees", "51 to 200 Employees", "1001 to 5000 Employees",
+          "10000+ Employees"]
+_REVENUES = ["$1 to $5 million (USD)", "$25 to $100 million (USD)",
+             "$10+ billion (USD)", "Unknown / Non-Applicable"]
+
+_SEARCH_PAGE = '''<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Fake Glassdoor - page {page}</title>
+<style>
+  #overlay {{position: fixed; top: 0; left: 0; width: 100%; height: 100%;
+             background: rgba(0, 0, 0, 0.4); z-index: 1000;}}
+  #overlay img {{display: block; width: 40px; height: 40px; margin: 200px auto;
+                 background: white;}}
+  li {{cursor: pointer; padding: 4px; border-bottom: 1px solid #ddd;}}
+</style>
+</head>
+<body>
+<div id="scBar"><input id="sc.location" type="text"></div>
+<ul data-test="jlGrid">
+{buttons}
+</ul>
+<div id="JDCol"></div>
+<div data-test="pagination-footer-text">Page {page} of {pages}</div>
+<button data-test="pagination-next" {next_state}
+        onclick="window.location.search = '?p={next_page}'">Next</button>
+<script>
+function showPopUp() {{
+  var overlay = document.createElement('div');
+  overlay.id = 'overlay';
+  overlay.innerHTML = '<img alt="Close" onclick="this.parentNode.remove()">';
+  document.body.appendChild(overlay);
+}}
+function openPosting(jobId) {{
+  var request = new XMLHttpRequest();
+  request.open('GET', '/posting/' + jobId, false);
+  request.send(null);
+  document.getElementById('JDCol').innerHTML = request.responseText;
+  if (request.getResponseHeader('X-Pop-Up') === '1') {{
+    showPopUp();
+  }}
+}}
+{pop_up_on_load}
+</script>
+</body>
+</html>
+'''
+
+_JOB_BUTTON = '''<li data-id="{job_id}" onclick="openPosting({job_id})">
+  <div>{title}</div>
+  <div data-test="job-age">{job_age}</div>
+  <div class="css-pxdlb2">{easy_apply}</div>
+  <span data-test="detailSalary">{salary}</span>
+</li>'''
+
+_POSTING = '''<div data-test="employerName">{company}</div>
+<span data-test="detailRating">{rating}</span>
+<div data-test="location">{location}</div>
+<div data-test="jobTitle">{title}</div>
+<div class="jobDescriptionContent desc">{description}</div>
+<div id="EmpBasicInfo">
+  <div><span>Size</span><span>{size}</span></div>
+  <div><span>Type</span><span>{ownership}</span></div>
+  <div><span>Sector</span><span>{sector}</span></div>
+  <div><span>Founded</span><span>{founded}</span></div>
+  <div><span>Industry</span><span>{industry}</span></div>
+  <div><span>Revenue</span><span>{revenue}</span></div>
+</div>
+<div data-test="company-ratings">
+  <div class="css-ztsow4">{friend_recommend}</div>
+  <div class="css-ztsow4 ceoApprove">{ceo_approval}</div>
+  {ratings}
+</div>
+<div id="Reviews">
+  <div><h2>Pros</h2>{pros}</div>
+  <div><h2>Cons</h2>{cons}</div>
+</div>
+<div data-brandviews="MODULE:n=jobs-benefitsRating">
+  <div><div class="ratingNum mr-sm">{benefits_rating}</div></div>
+</div>
+<div data-brandviews="MODULE:n=jobs-benefitsHighlights">{benefits_reviews}</div>'''
+
+_RATING_ROW = '<div><span>{name}</span><span>&#9733;</span><span>{value}</span></div>'
+
+_RATINGS = {
+    'Career Opportunities': 'Career_opportunities',
+    'Comp & Benefits': 'Comp_&_benefits',
+    'Culture & Values': 'Culture_&_values',
+    'Senior Management': 'Senior_management',
+    'Work/Life Balance': 'Work/Life_balance',
+}
+
+
+class FakeGlassdoorServer:
+    '''
+    A local, threaded HTTP server serving fake glassdoor.com job search pages.
+
+    Args:
+    - postings (list[Posting]): The job postings to serve, in the RAW CSV columns format.
+    - jobs_per_page (int): The number of job buttons on a single search-result page.
+    - latency (float): The delay in seconds added to each served request.
+    - pop_up_every (int): Every n-th opened posting shows a pop-up with the `[alt="Close"]`
+    button, which blocks clicks until closed. `0` disables pop-ups.
+    - pop_up_on_load (bool): Whether each search-result page opens with a pop-up.
+
+    Usage:
+    - with FakeGlassdoorServer(synthetic_postings(90)) as server:
+    -     driver.get(server.url)
+    '''
+
+    def __init__(
+        self,
+        postings: list[Posting],
+        jobs_per_page: int = 30,
+        latency: float = 0.0,
+        pop_up_every: int = 0,
+        pop_up_on_load: bool = False
+    ):
+        if not postings:
+            raise ValueError("The fake server needs at least one posting to serve.")
+
+        self.postings = postings
+        self.jobs_per_page = jobs_per_page
+        self.latency = latency
+        self.pop_up_every = pop_up_every
+        self.pop_up_on_load = pop_up_on_load
+        self.requests_served = 0
+        self.postings_served = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread: threading.Thread | None = None
+
+    @property
+    def pages(self) -> int:
+        '''The total number of search-result pages.'''
+
+        return -(-len(self.postings) // self.jobs_per_page)
+
+    @property
+    def url(self) -> str:
+        '''The URL of the first search-result page.'''
+
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/Job/jobs.htm?p=1"
+
+    def start(self):
+        '''Starts serving requests in a background daemon thread.'''
+
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        '''Stops the server and releases its socket.'''
+
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> 'FakeGlassdoorServer':
+        self.start()
+        return self
+
+    def __exit__(self, *_):
+        self.stop()
+
+    def render_search_page(self, page: int) -> str:
+        '''
+        Renders the search-result page with its job buttons and pagination.
+
+        Args:
+        - page (int): The 1-based number of the page.
+
+        Returns:
+        - str: The HTML of the page.
+        '''
+
+        page = min(max(page, 1), self.pages)
+        first = (page - 1) * self.jobs_per_page
+        last = min(first + self.jobs_per_page, len(self.postings))
+
+        buttons = "\n".join(
+            _render_job_button(job_id, self.postings[job_id])
+            for job_id in range(first, last)
+        )
+
+        is_last_page = page == self.pages
+
+        return _SEARCH_PAGE.format(
+            page=page,
+            pages=self.pages,
+            buttons=buttons,
+            next_page=page + 1,
+            next_state='disabled' if is_last_page else '',
+            pop_up_on_load='showPopUp();' if self.pop_up_on_load else ''
+        )
+
+    def render_posting(self, job_id: int) -> tuple[str, bool]:
+        '''
+        Renders the content of the `JDCol` element for the selected job.
+
+        Args:
+        - job_id (int): The index of the posting.
+
+        Returns:
+        - tuple[str, bool]: The HTML of the posting and
+        whether a pop-up should be shown with it.
+        '''
+
+        with self._lock:
+            self.postings_served += 1
+            served = self.postings_served
+
+        pop_up = bool(self.pop_up_every) and served % self.pop_up_every == 0
+
+        return _render_posting(self.postings[job_id]), pop_up
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        '''Binds the request handler to this server instance.'''
+
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                '''Serves the search-result pages and the job postings.'''
+
+                with server._lock:  # pylint: disable=protected-access
+                    server.requests_served += 1
+
+                if server.latency:
+                    time.sleep(server.latency)
+
+                url = urlparse(self.path)
+                headers = {}
+
+                if url.path.startswith("/posting/"):
+                    try:
+                        job_id = int(url.path.rsplit("/", 1)[-1])
+                        body, pop_up = server.render_posting(job_id)
+                    except (ValueError, IndexError):
+                        self.send_error(404)
+                        return
+                    headers["X-Pop-Up"] = "1" if pop_up else "0"
+
+                elif url.path == "/Job/jobs.htm":
+                    page = parse_qs(url.query).get("p", ["1"])[0]
+                    body = server.render_search_page(
+                        int(page) if page.isdigit() else 1)
+
+                else:
+                    self.send_error(404)
+                    return
+
+                payload = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                '''Keeps the console clean while benchmarking.'''
+
+        return _Handler
+
+
+def synthetic_postings(number: int, seed: int = 0) -> list[Posting]:
+    '''
+    Generates deterministic, realistic-looking job postings.
+
+    Args:
+    - number (int): The number of postings to generate.
+    - seed (int): The seed of the random generator, the same seed gives the same postings.
+
+    Returns:
+    - list[Posting]: The postings in the RAW CSV columns format.
+    '''
+
+    rng = random.Random(seed)
+    postings = []
+
+    for index in range(number):
+        tools = ", ".join(rng.sample(_TOOLS, 4))
+        low = rng.randrange(40, 90)
+        posting = {
+            'Company_name': rng.choice(_COMPANIES),
+            'Rating': f"{rng.uniform(2.5, 5.0):.1f}",
+            'Location': rng.choice(_CITIES),
+            'Job_title': rng.choice(_TITLES),
+            'Description': f"Posting number {index}. We are looking for a data engineer "
+                           f"experienced with {tools}. " + "Lorem ipsum dolor sit amet. " * 40,
+            'Job_age': rng.choice(["24h", "1d", "5d", "14d", "30d+"]),
+            'Easy_apply': rng.choice(["True", "False"]),
+            'Salary': rng.choice(["", f"€{low}K - €{low + 20}K (Employer est.)",
+                                  f"€{low}K - €{low + 15}K (Glassdoor est.)"]),
+            'Employees': rng.choice(_SIZES),
+            'Type_of_ownership': rng.choice(["Company - Private", "Company - Public"]),
+            'Sector': rng.choice(["Information Technology", "Finance", "Manufacturing"]),
+            'Founded': str(rng.randrange(1900, 2020)),
+            'Industry': rng.choice(["Software Development", "Banking & Lending"]),
+            'Revenue_USD': rng.choice(_REVENUES),
+            'Friend_recommend': f"{rng.randrange(40, 100)}%",
+            'CEO_approval': f"{rng.randrange(40, 100)}%",
+            'Pros': str([f'"Nice team" (in {rng.randrange(1, 99)} reviews)']),
+            'Cons': str([f'"Long meetings" (in {rng.randrange(1, 99)} reviews)']),
+            'Benefits_rating': f"{rng.uniform(2.5, 5.0):.1f}",
+            'Benefits_reviews': str(["Remote work", "Health insurance"]),
+        }
+        for column in _RATINGS.values():
+            posting[column] = f"{rng.uniform(2.5, 5.0):.1f}"
+
+        postings.append(posting)
+
+    return postings
+
+
+def load_postings(csv_path: str, encoding: str = "utf-8") -> list[Posting]:
+    '''
+    Loads recorded job postings from a RAW CSV file created by the scraper.
+
+    Args:
+    - csv_path (str): The path to the RAW CSV file.
+    - encoding (str): The encoding of the file.
+
+    Returns:
+    - list[Posting]: The postings in the RAW CSV columns format.
+    '''
+
+    with open(csv_path, newline="", encoding=encoding) as file:
+        return list(csv.DictReader(file))
+
+
+def _render_job_button(job_id: int, posting: Posting) -> str:
+    '''Renders a single job button of the `jlGrid` list.'''
+
+    easy_apply = posting.get('Easy_apply', '') == "True"
+
+    return _JOB_BUTTON.format(
+        job_id=job_id,
+        title=html.escape(posting.get('Job_title', '')),
+        job_age=html.escape(posting.get('Job_age', '')),
+        easy_apply='<div>Easy Apply</div>' if easy_apply else '',
+        salary=html.escape(posting.get('Salary', ''))
+    )
+
+
+def _render_posting(posting: Posting) -> str:
+    '''Renders the job posting, as it is loaded into the `JDCol` element.'''
+
+    def field(column: str) -> str:
+        return html.escape(posting.get(column, ''))
+
+    ratings = "\n  ".join(
+        _RATING_ROW.format(name=html.escape(name), value=field(column))
+        for name, column in _RATINGS.items()
+    )
+
+    return _POSTING.format(
+        company=field('Company_name'),
+        rating=field('Rating'),
+        location=field('Location'),
+        title=field('Job_title'),
+        description=field('Description'),
+        size=field('Employees'),
+        ownership=field('Type_of_ownership'),
+        sector=field('Sector'),
+        founded=field('Founded'),
+        industry=field('Industry'),
+        revenue=field('Revenue_USD'),
+        friend_recommend=field('Friend_recommend'),
+        ceo_approval=field('CEO_approval'),
+        ratings=ratings,
+        pros=_render_list(posting.get('Pros', ''), "p"),
+        cons=_render_list(posting.get('Cons', ''), "p"),
+        benefits_rating=field('Benefits_rating'),
+        benefits_reviews=_render_list(posting.get('Benefits_reviews', ''), "div")
+    )
+
+
+def _render_list(value: str, tag: str) -> str:
+    '''Renders a list stored in the RAW CSV as its string representation.'''
+
+    try:
+        items = ast.literal_eval(value) if value else []
+    except (ValueError, SyntaxError):
+        items = [value]
+
+    return "".join(f"<{tag}>{html.escape(str(item))}</{tag}>" for item in items)
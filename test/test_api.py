@@ -0,0 +1,206 @@
+'''
+This module contains unit tests for the salary prediction API.
+It checks if the postings sent as JSON (dense or sparse), as a NumPy file or as
+the float64 bytes are predicted by the routed model, and if an invalid body
+is answered with 400 instead of reaching the model.
+'''
+
+# Python
+import importlib
+import io
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+
+# External
+import numpy as np
+from sklearn.linear_model import LinearRegression
+
+# Internal
+API_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(__file__)), "FlaskAPI")
+sys.path.insert(0, API_DIRECTORY)
+from data_input import data_in  # noqa: E402
+
+N_FEATURES = len(data_in["valid"])
+NPY_TYPE = "application/x-npy"
+BINARY_TYPE = "application/octet-stream"
+
+
+def save_model(directory, file_name, intercept):
+    '''Saves the linear model predicting the intercept plus the sum of the features.'''
+
+    X = np.eye(N_FEATURES + 1, N_FEATURES)
+    model = LinearRegression().fit(X, np.zeros(len(X)))
+    model.coef_ = np.ones(N_FEATURES)
+    model.intercept_ = float(intercept)
+
+    with open(os.path.join(directory, file_name), "wb") as file:
+        pickle.dump({"model": model}, file)
+
+
+class TestPredict(unittest.TestCase):
+    '''It tests the /predict endpoint with the bodies of the clients'''
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.directory = tempfile.TemporaryDirectory()
+        models = os.path.join(cls.directory.name, "models")
+        os.makedirs(models)
+        save_model(models, "model_file.p", 1000)
+
+        # The API reads the models of its working directory
+        working_directory = os.getcwd()
+        os.chdir(cls.directory.name)
+        try:
+            cls.app = importlib.import_module("app")
+        finally:
+            os.chdir(working_directory)
+
+        cls.client = cls.app.app.test_client()
+        cls.features = np.arange(2 * N_FEATURES, dtype=np.float64).reshape(2, N_FEATURES)
+        cls.expected = [int(1000 + row.sum()) for row in cls.features]
+
+    @classmethod
+    def tearDownClass(cls):
+
+        cls.app.registry.stop_watching()
+        cls.directory.cleanup()
+
+    def predict(self, **kwargs):
+
+        response = self.client.get("/predict", **kwargs)
+        return response.status_code, response.get_json()
+
+    def assert_invalid(self, **kwargs):
+
+        errors = self.app.registry.get_metrics()["global"]["errors"]
+
+        status_code, body = self.predict(**kwargs)
+
+        self.assertEqual(status_code, 400)
+        self.assertTrue(body["salary_predicted"].startswith("invalid input"))
+        # Not counted as an error of the model
+        self.assertEqual(self.app.registry.get_metrics()["global"]["errors"], errors)
+
+    def npy(self, array):
+
+        buffer = io.BytesIO()
+        np.save(buffer, array)
+        return buffer.getvalue()
+
+    def test_started_on_import(self):
+
+        # As under a WSGI server, without running the module
+        metrics = self.app.registry.get_metrics()["global"]
+
+        self.assertTrue(metrics["loaded"])
+        self.assertEqual(metrics["loads"], 1)
+        self.assertTrue(self.app.registry.watcher.is_alive())
+
+    def test_json(self):
+
+        status_code, body = self.predict(json={"input": self.features[0].tolist()})
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(body["salary_predicted"], self.expected[0])
+        self.assertEqual(body["model"], "global")
+
+    def test_json_batch(self):
+
+        status_code, body = self.predict(json={"input": self.features.tolist()})
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(body["salary_predicted"], self.expected)
+
+    def test_json_sparse(self):
+
+        status_code, body = self.predict(
+            json={"input": {"indices": [0, 5], "values": [2.0, 3.0]}})
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(body["salary_predicted"], 1005)
+
+    def test_npy(self):
+
+        status_code, body = self.predict(
+            data=self.npy(self.features), content_type=NPY_TYPE)
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(body["salary_predicted"], self.expected)
+
+    def test_binary(self):
+
+        status_code, body = self.predict(
+            data=self.features.astype("<f8").tobytes(), content_type=BINARY_TYPE,
+            query_string={"region": "Europe"})
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(body["salary_predicted"], self.expected)
+
+    def test_invalid_json(self):
+
+        self.assert_invalid(json=self.features[0].tolist())
+        self.assert_invalid(json=5)
+        self.assert_invalid(data="{", content_type="application/json")
+        self.assert_invalid(json={"input": data_in["invalid"]})
+        self.assert_invalid(json={"input": [1.0, 2.0]})
+        self.assert_invalid(json={"input": []})
+        self.assert_invalid(json={"input": {"indices": ["a"], "values": [1.0]}})
+        self.assert_invalid(json={"input": {"indices": [N_FEATURES], "values": [1.0]}})
+        self.assert_invalid(json={"input": data_in["valid"], "country": 5})
+        self.assert_invalid(data="input", content_type="text/plain")
+
+    def test_not_finite_json(self):
+
+        for value in ("nan", "inf", "-Infinity"):
+            self.assert_invalid(json={"input": [value] + self.features[0, 1:].tolist()})
+        self.assert_invalid(json={"input": {"indices": [0], "values": ["nan"]}})
+        self.assert_invalid(json={"input": {"indices": [0, 1], "values": [1.0, "inf"]}})
+
+    def test_invalid_npy(self):
+
+        self.assert_invalid(data=b"not a NumPy file", content_type=NPY_TYPE)
+        self.assert_invalid(data=b"", content_type=NPY_TYPE)
+        self.assert_invalid(
+            data=self.npy(np.array([{"input": 1}], dtype=object)), content_type=NPY_TYPE)
+        self.assert_invalid(
+            data=self.npy(np.full(N_FEATURES, "1.0")), content_type=NPY_TYPE)
+        self.assert_invalid(
+            data=self.npy(np.zeros((0, N_FEATURES))), content_type=NPY_TYPE)
+        self.assert_invalid(data=self.npy(np.zeros((2, 3))), content_type=NPY_TYPE)
+
+    def test_not_finite_npy(self):
+
+        for value in (np.nan, np.inf, -np.inf):
+            features = self.features.copy()
+            features[1, 3] = value
+            self.assert_invalid(data=self.npy(features), content_type=NPY_TYPE)
+
+    def test_invalid_binary(self):
+
+        self.assert_invalid(data=b"", content_type=BINARY_TYPE)
+        self.assert_invalid(data=b"\x00" * 12, content_type=BINARY_TYPE)
+
+    def test_not_finite_binary(self):
+
+        for value in (np.nan, np.inf, -np.inf):
+            features = self.features.copy()
+            features[0, -1] = value
+            self.assert_invalid(data=features.astype("<f8").tobytes(), content_type=BINARY_TYPE)
+
+    def test_not_finite_prediction(self):
+
+        errors = self.app.registry.get_metrics()["global"]["errors"]
+
+        # Finite, but their sum overflows
+        response = self.client.get("/predict", json={"input": [1e308] * N_FEATURES})
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(self.app.registry.get_metrics()["global"]["errors"], errors + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
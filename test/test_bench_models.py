@@ -0,0 +1,147 @@
+'''
+This module contains unit tests for the regressions flagged by the benchmark of the models.
+It checks if a run is compared only with the latest runs on the same data, with
+the threshold of the time and of the memory and the tolerance of the MAE, and if
+the history is read and saved, empty if it doesn't exist yet.
+'''
+
+# Python
+import os
+import tempfile
+import unittest
+
+# Internal
+from benchmarks.bench_models import (
+    HISTORY_BASELINE_RUNS,
+    find_regressions,
+    load_history,
+    save_history,
+)
+
+DATA = "synthetic 3000 rows (seed 42)"
+
+
+def get_run(time_s=1.0, peak_MB=10.0, mae=5000.0, data=DATA, stage='ols'):
+    '''Returns a run of a single stage.'''
+
+    return {
+        'data': data,
+        'stages': {stage: {'time_s': time_s, 'peak_MB': peak_MB, 'mae': mae}},
+    }
+
+
+class TestFindRegressions(unittest.TestCase):
+    '''It tests comparing a run with the previous ones'''
+
+    def test_no_previous_run(self):
+
+        self.assertEqual(find_regressions(get_run(), []), [])
+
+    def test_within_threshold(self):
+
+        history = [get_run()]
+
+        self.assertEqual(find_regressions(get_run(time_s=1.19, peak_MB=11.9), history), [])
+
+    def test_slower_and_more_memory(self):
+
+        history = [get_run()]
+
+        regressions = find_regressions(get_run(time_s=1.3, peak_MB=12.5), history)
+
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("ols: time_s 1.3 > 1.0"))
+        self.assertTrue(regressions[1].startswith("ols: peak_MB 12.5 > 10.0"))
+
+    def test_threshold(self):
+
+        history = [get_run()]
+        run = get_run(time_s=1.3)
+
+        self.assertEqual(find_regressions(run, history, threshold=0.5), [])
+        self.assertEqual(len(find_regressions(run, history, threshold=0.1)), 1)
+
+    def test_compared_with_best_previous_run(self):
+
+        history = [get_run(time_s=2.0), get_run(time_s=1.0), get_run(time_s=3.0)]
+
+        self.assertEqual(len(find_regressions(get_run(time_s=1.5), history)), 1)
+
+    def test_same_data_only(self):
+
+        history = [get_run(time_s=0.1, peak_MB=1.0, mae=100.0, data="snapshot 0123456789abcdef")]
+
+        self.assertEqual(find_regressions(get_run(), history), [])
+
+    def test_latest_runs_only(self):
+
+        # A fast run before the latest ones is no longer compared with
+        history = [get_run(time_s=0.1)] + [get_run()] * HISTORY_BASELINE_RUNS
+
+        self.assertEqual(find_regressions(get_run(), history), [])
+
+        history = [get_run(time_s=0.1)] + [get_run()] * (HISTORY_BASELINE_RUNS - 1)
+
+        self.assertEqual(len(find_regressions(get_run(), history)), 1)
+
+    def test_worse_mae(self):
+
+        history = [get_run(mae=5000.0)]
+
+        self.assertEqual(find_regressions(get_run(mae=5004.0), history), [])
+        self.assertEqual(
+            find_regressions(get_run(mae=5100.0), history), ["ols: mae 5100.0 > 5000.0"])
+
+    def test_stage_without_mae(self):
+
+        history = [get_run(mae=None), get_run(mae=5000.0)]
+
+        self.assertEqual(find_regressions(get_run(mae=None), history), [])
+        self.assertEqual(find_regressions(get_run(mae=5000.0), [get_run(mae=None)]), [])
+
+    def test_new_stage(self):
+
+        history = [get_run(stage='ols')]
+
+        self.assertEqual(find_regressions(get_run(time_s=9.0, stage='grid_search'), history), [])
+
+
+class TestHistory(unittest.TestCase):
+    '''It tests reading and saving the runs'''
+
+    def setUp(self):
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.history_path = os.path.join(self.directory.name, "history", "bench_models.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_missing_history(self):
+
+        self.assertEqual(load_history(self.history_path), [])
+
+    def test_save_and_load(self):
+
+        history = [get_run(), get_run(time_s=2.0)]
+
+        save_history(history, self.history_path)
+
+        self.assertEqual(load_history(self.history_path), history)
+        self.assertEqual(os.listdir(os.path.dirname(self.history_path)), ["bench_models.json"])
+
+    def test_empty_history(self):
+
+        os.makedirs(os.path.dirname(self.history_path))
+        open(self.history_path, "w").close()
+
+        self.assertEqual(load_history(self.history_path), [])
+
+        save_history([], self.history_path)
+
+        self.assertEqual(load_history(self.history_path), [])
+        self.assertEqual(find_regressions(get_run(), load_history(self.history_path)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
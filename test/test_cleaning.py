@@ -0,0 +1,303 @@
+'''
+This module contains unit tests for the cleaning pipeline of the RAW job postings.
+It checks the single stages on small samples: the data engineering jobs filter,
+the location, seniority and salary parsing, and if the whole pipeline run
+in a pool of processes gives the clean postings with the grouped columns.
+'''
+
+# Python
+import os
+import tempfile
+import unittest
+
+# External
+import numpy as np
+import pandas as pd
+
+# Internal
+from cleaning import stages
+from cleaning.columns import COLUMNS_MULTIINDEX
+from cleaning.loader import get_CSVs_in_folder, get_dfs_from_CSVs_in_folder
+from cleaning.pipeline import clean_countries, clean_countries_cached, save_clean_csv
+from cleaning.schema import get_dtypes, read_clean_csv
+from cleaning.stage_cache import StageCache
+from cleaning.store import read_clean_parquet, save_clean_parquet
+from cleaning.unique_apply import collect_stats
+
+
+def _raw_postings(rows: list[dict]) -> pd.DataFrame:
+    '''Returns the RAW postings, with the missing fields empty.'''
+
+    columns = [
+        'Company_name', 'Rating', 'Location', 'Job_title', 'Description', 'Job_age',
+        'Easy_apply', 'Salary', 'Employees', 'Type_of_ownership', 'Sector', 'Founded',
+        'Industry', 'Revenue_USD', 'Friend_recommend', 'CEO_approval',
+        'Career_opportunities', 'Comp_&_benefits', 'Culture_&_values', 'Senior_management',
+        'Work/Life_balance', 'Pros', 'Cons', 'Benefits_rating', 'Benefits_reviews',
+    ]
+
+    df = pd.DataFrame(rows, columns=columns)
+    df['Founded'] = df['Founded'].astype(float)
+
+    return df
+
+
+class TestStages(unittest.TestCase):
+    '''It tests the single cleaning stages'''
+
+    def test_is_data_engineering_job(self):
+
+        self.assertTrue(stages.is_data_engineering_job("Senior Data Engineer (m/w/d)"))
+        self.assertTrue(stages.is_data_engineering_job("ETL Developer", "Poland"))
+        self.assertFalse(stages.is_data_engineering_job("Data Scientist"))
+        self.assertFalse(stages.is_data_engineering_job("Frontend Developer"))
+        self.assertFalse(stages.is_data_engineering_job(np.nan))
+
+    def test_is_data_engineering_job_translated_invalid_titles(self):
+
+        title = "Data Engineer / Projektmanager"
+
+        self.assertTrue(stages.is_data_engineering_job(title))
+        self.assertFalse(stages.is_data_engineering_job(title, "Germany"))
+
+    def test_apply_locations(self):
+
+        df = pd.DataFrame({
+            'Location': ["Toronto, ON", "Télétravail", np.nan, "Ottawa"],
+            'Job_title': ["Data Engineer"] * 4,
+        })
+
+        df = stages.apply_locations(df, "Canada")
+
+        self.assertEqual(df['City'].tolist()[:2], ["Toronto", "Remote"])
+        self.assertEqual(df['State'].tolist()[0], "Ontario")
+        self.assertTrue(np.isnan(df['City'].tolist()[2]))
+        self.assertEqual(df['City'].tolist()[3], "Ottawa")
+        self.assertEqual(df['Region'].unique().tolist(), ["North America"])
+        self.assertNotIn('Location', df.columns)
+
+    def test_get_seniority(self):
+
+        self.assertEqual(stages.get_seniority("Senior Data Engineer", []), "Senior")
+        self.assertEqual(stages.get_seniority("Head of Data", []), "Management")
+        self.assertEqual(stages.get_seniority("Kierownik Data", ["Polish"]), "Management")
+        self.assertTrue(np.isnan(stages.get_seniority("Data Engineer", [])))
+
+    def test_salary_parsing(self):
+
+        salaries = stages.parse_salaries(pd.Series([
+            "PLN 10K - PLN 15.5K (Employer est.)",
+            "€40K - €60K",
+            "$40.50 - $60 Per Hour",
+            "€35.03 Per Hour(Employer est.)",
+            np.nan,
+        ]))
+
+        self.assertEqual(salaries['currency'].tolist()[:4], ["PLN", "EUR", "USD", "EUR"])
+        self.assertEqual(salaries['min'].tolist()[:4], [10000.0, 40000.0, 40.5, 35.03])
+        self.assertEqual(salaries['max'].tolist()[:4], [15500.0, 60000.0, 60.0, 35.03])
+        self.assertEqual(salaries['period'].tolist()[:4], ["Other", "Other", "Hour", "Hour"])
+        self.assertEqual(
+            salaries['employer_provided'].tolist(), [True, False, False, True, False])
+        self.assertTrue(salaries.iloc[4][['currency', 'min', 'max', 'period']].isnull().all())
+
+    def test_monthly_to_yearly_salary(self):
+
+        self.assertEqual(stages.monthly_to_yearly_salary(3000, 1000), 36000)
+        self.assertEqual(stages.monthly_to_yearly_salary(50000, 1000), 50000)
+        self.assertTrue(np.isnan(stages.monthly_to_yearly_salary(500, 1000)))
+
+    def test_add_salary(self):
+
+        df = pd.DataFrame({
+            'Salary': ["$40 - $60 Per Hour", "€3K - €4K", np.nan, "€1K - €3K", "£3K - £4K"],
+            'Country': ["Germany", "Germany", "Germany", "Greece", "Germany"],
+        })
+        countries = pd.DataFrame({
+            'Currency': ["USD", "EUR", "EUR"],
+            'Dollar_rate': [1.0, 0.5, 0.5],
+            'Poverty_line_monthly': [3000, 2000, np.nan],
+        }, index=pd.Index(["United States", "Germany", "Greece"], name='Country'))
+
+        df = stages.add_salary(df, countries)
+
+        self.assertEqual(df['Salary_min'].tolist()[:2], [83200, 72000])
+        self.assertEqual(df['Salary_max'].tolist()[:2], [124800, 96000])
+        self.assertEqual(df['Salary_avg'].tolist()[0], 104000)
+        self.assertEqual(df['Is_salary'].tolist(), [True, True, False, True, True])
+        self.assertNotIn('Salary', df.columns)
+        # Without the poverty line of the country, the salaries are not monthly ones
+        self.assertEqual(df.loc[3, ['Salary_min', 'Salary_max']].tolist(), [2000, 6000])
+        # Without the dollar rate of the currency
+        self.assertTrue(df.loc[4, ['Salary_min', 'Salary_max']].isna().all())
+
+    def test_check_certificate(self):
+
+        check_certificate = stages.make_check_certificate("Germany")
+
+        self.assertEqual(check_certificate("A DataCamp course"), "DataCamp")
+        self.assertEqual(check_certificate("Ein Zertifikat ist ein Plus"), "Other")
+        self.assertTrue(np.isnan(check_certificate("Nothing required")))
+
+
+class TestPipeline(unittest.TestCase):
+    '''It tests loading and cleaning the RAW CSV files of all countries'''
+
+    def setUp(self):
+
+        self.directory = tempfile.TemporaryDirectory()
+
+        self.poland = _raw_postings([
+            {'Company_name': "Acme", 'Location': "Warszawa", 'Job_title': "Data Engineer",
+             'Description': "Python, AWS and Airflow on Linux, Unix", 'Job_age': "24h",
+             'Salary': "PLN 10K - PLN 15K", 'Founded': 2000},
+            {'Company_name': "Acme", 'Location': "Warszawa", 'Job_title': "Data Engineer",
+             'Description': "Python, AWS and Airflow on Linux, Unix", 'Job_age': "30d+",
+             'Salary': "PLN 10K - PLN 15K", 'Founded': 2000},
+            {'Company_name': "Other", 'Location': "Kraków", 'Job_title': "Android Developer",
+             'Description': "Kotlin", 'Job_age': "2d"},
+        ])
+        self.united_states = _raw_postings([
+            {'Company_name': "Corp", 'Location': "Austin, TX",
+             'Job_title': "Senior ETL Developer",
+             'Description': "SQL Server, GitHub, a Bachelor's degree", 'Job_age': "1d",
+             'Salary': "$100K - $120K (Employer est.)"},
+        ])
+
+        for file_name, df in (
+            ("Data_Engineer_Poland_12-04-2023_11-24.csv", self.poland),
+            ("Data_Engineer_United_States_13-04-2023_18-25.csv", self.united_states),
+            ("Data_Engineer_United_States_20-04-2023_10-00.csv", self.united_states),
+            ("fingerprints.idx", None),
+        ):
+            path = os.path.join(self.directory.name, file_name)
+            if df is None:
+                open(path, "wb").close()
+            else:
+                df.to_csv(path, index=False)
+
+    def tearDown(self):
+
+        self.directory.cleanup()
+
+    def test_get_dfs_from_CSVs_in_folder(self):
+
+        dfs = get_dfs_from_CSVs_in_folder(self.directory.name, "Data Engineer")
+
+        self.assertEqual(list(dfs), ["Poland", "United_States"])
+        self.assertEqual(len(dfs['Poland']), 3)
+        self.assertEqual(len(dfs['United_States']), 2)
+
+    def test_clean_countries(self):
+
+        dfs = get_dfs_from_CSVs_in_folder(self.directory.name, "Data Engineer")
+
+        df = clean_countries(dfs, max_workers=2)
+
+        self.assertEqual(df.columns.tolist(), COLUMNS_MULTIINDEX)
+        self.assertEqual(len(df), 2)
+
+        poland, united_states = df.iloc[0], df.iloc[1]
+
+        self.assertEqual(poland[('Job_details', 'Country')], "Poland")
+        self.assertEqual(poland[('Job_details', 'Job_age')], 1)
+        self.assertEqual(poland[('Salary', 'Currency')], "PLN")
+        self.assertTrue(poland[('Programming_languages', 'Python')])
+        self.assertTrue(poland[('Workflow_orchestration_tools', 'Apache_Airflow')])
+        self.assertTrue(poland[('OS', 'Linux')])
+        self.assertFalse(poland[('OS', 'Unix')])
+
+        self.assertEqual(united_states[('Job_details', 'Seniority')], "Senior")
+        self.assertEqual(united_states[('Job_details', 'State')], "TX")
+        self.assertEqual(united_states[('Salary', 'Max')], 120000)
+        self.assertTrue(united_states[('Salary', 'Employer_provided')])
+        self.assertEqual(united_states[('Version_control', 'Git_SVN')], "Github")
+        self.assertTrue(united_states[('Education', 'BA')])
+
+    def test_clean_csv_schema(self):
+
+        dfs = get_dfs_from_CSVs_in_folder(self.directory.name, "Data Engineer")
+        df = clean_countries(dfs, max_workers=1)
+        file_path = os.path.join(self.directory.name, "clean", "Data_Engineer.csv")
+
+        save_clean_csv(df, file_path)
+        df_read = read_clean_csv(file_path)
+
+        self.assertEqual(df.dtypes.to_dict(), get_dtypes())
+        self.assertEqual(df_read[('Job_details', 'Seniority')].tolist(), [np.nan, "Senior"])
+        self.assertEqual(df_read[('Job_details', 'Description')].dtype, "string")
+        self.assertEqual(df_read[('Salary', 'Is_hourly')].dtype, "boolean")
+        pd.testing.assert_frame_equal(df_read, df)
+
+    def test_clean_csv_schema_missing_values(self):
+
+        # The scraper writes the NA value for the job age and the easy apply it didn't find
+        df = clean_countries({'Poland': _raw_postings([
+            {'Company_name': "Acme", 'Location': "Warszawa", 'Job_title': "Data Engineer",
+             'Description': "Python", 'Job_age': "2d", 'Easy_apply': True},
+            {'Company_name': "Acme", 'Location': "Kraków", 'Job_title': "Data Engineer",
+             'Description': "SQL"},
+        ])}, max_workers=1)
+        file_path = os.path.join(self.directory.name, "clean", "Data_Engineer.csv")
+
+        save_clean_csv(df, file_path)
+        df_read = read_clean_csv(file_path)
+
+        self.assertEqual(df_read[('Job_details', 'Job_age')].tolist(), [2, pd.NA])
+        self.assertEqual(df_read[('Job_details', 'Easy_apply')].tolist(), [True, pd.NA])
+        pd.testing.assert_frame_equal(df_read, df)
+
+    def test_clean_parquet(self):
+
+        dfs = get_dfs_from_CSVs_in_folder(self.directory.name, "Data Engineer")
+        df = clean_countries(dfs, max_workers=1)
+        file_path = os.path.join(self.directory.name, "Data_Engineer.parquet")
+
+        save_clean_parquet(df, file_path)
+
+        pd.testing.assert_frame_equal(read_clean_parquet(file_path), df)
+
+        df_read = read_clean_parquet(
+            file_path, [('Salary', 'Max'), 'Version_control'], ["United States"])
+
+        self.assertEqual(df_read.columns.tolist(),
+                         [('Salary', 'Max'), ('Version_control', 'Git_SVN')])
+        self.assertEqual(df_read.index.tolist(), [1])
+        self.assertEqual(df_read[('Salary', 'Max')].tolist(), [120000])
+
+        with self.assertRaises(KeyError):
+            read_clean_parquet(file_path, ['Salaries'])
+
+    def test_clean_countries_cached(self):
+
+        cache_directory = os.path.join(self.directory.name, "_cache")
+        files = get_CSVs_in_folder(self.directory.name, "Data Engineer")
+
+        df = clean_countries_cached(files, StageCache(cache_directory), max_workers=1)
+
+        dfs = get_dfs_from_CSVs_in_folder(self.directory.name, "Data Engineer")
+        pd.testing.assert_frame_equal(df, clean_countries(dfs, max_workers=1))
+
+        # Nothing changed, nothing is cleaned again
+        with collect_stats() as stats:
+            df_cached = clean_countries_cached(
+                files, StageCache(cache_directory), max_workers=1)
+
+        self.assertEqual(stats, {})
+        pd.testing.assert_frame_equal(df_cached, df)
+
+        # A new scrape of a single country cleans only that country
+        self.poland.to_csv(os.path.join(
+            self.directory.name, "Data_Engineer_Poland_21-04-2023_10-00.csv"), index=False)
+        files = get_CSVs_in_folder(self.directory.name, "Data Engineer")
+
+        with collect_stats() as stats:
+            clean_countries_cached(files, StageCache(cache_directory), max_workers=1)
+
+        self.assertEqual(stats['clean_job_age'].values, 1)
+        self.assertEqual(
+            StageCache(cache_directory).manifest['Poland']['rows'], 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -158,6 +158,11 @@ class TestConfigData(unittest.TestCase):
 
         self.assertIsInstance(self.config['debug_mode'], bool)
 
+    def test_profile_stages(self):
+        '''check an arg for timing the scraping stages'''
+
+        self.assertIsInstance(self.config['profile_stages'], bool)
+
     def test_na_value(self):
         '''check if NA is got'''
 
@@ -0,0 +1,62 @@
+'''
+This module contains unit tests for the encoding of the categories of the models table.
+It checks if the encoded columns are the ones of `pd.get_dummies`, dense or sparse,
+and if the unknown categories of new postings are encoded as zeros.
+'''
+
+# Python
+import unittest
+
+# External
+import numpy as np
+import pandas as pd
+
+# Internal
+from training.encoding import CategoryEncoder
+
+
+class TestCategoryEncoder(unittest.TestCase):
+    '''It tests the encoding of the categories into the fitted columns'''
+
+    def setUp(self):
+
+        self.df = pd.DataFrame({
+            'Rating': [4.1, np.nan, 3.5, 4.8],
+            'Python': [1, 0, 1, 1],
+            'Country': ["Poland", "Germany", "Poland", "Spain"],
+            'Sector': ["Finance", np.nan, "Retail", "Finance"],
+        })
+
+    def test_same_as_get_dummies(self):
+
+        encoder = CategoryEncoder().fit(self.df)
+        expected = pd.get_dummies(self.df)
+
+        self.assertEqual(encoder.columns, expected.columns.tolist())
+        np.testing.assert_array_equal(
+            encoder.transform(self.df), expected.to_numpy(dtype=np.float32))
+
+    def test_sparse_same_as_dense(self):
+
+        encoder = CategoryEncoder().fit(self.df)
+        X_sparse = encoder.transform(self.df, sparse_output=True)
+
+        self.assertEqual(X_sparse.format, 'csr')
+        self.assertEqual(X_sparse.dtype, np.float32)
+        np.testing.assert_array_equal(X_sparse.toarray(), encoder.transform(self.df))
+
+    def test_unknown_categories(self):
+
+        encoder = CategoryEncoder.from_dict(CategoryEncoder().fit(self.df).to_dict())
+        df_new = pd.DataFrame({
+            'Rating': [3.9], 'Python': [0], 'Country': ["France"], 'Sector': ["Retail"]})
+
+        X = pd.DataFrame(encoder.transform(df_new), columns=encoder.columns)
+
+        self.assertEqual(X.shape, (1, len(encoder.columns)))
+        self.assertEqual(X.filter(like='Country_').to_numpy().sum(), 0)
+        self.assertEqual(X.loc[0, 'Sector_Retail'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
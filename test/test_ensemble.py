@@ -0,0 +1,76 @@
+'''
+This module contains unit tests for the ensemble of the salary models.
+It checks if the ensemble predicts the weighted sum of the predictions of its models,
+with the linear models reduced to a single vector of coefficients, and if it is
+the same once saved in the model artifact.
+'''
+
+# Python
+import os
+import tempfile
+import unittest
+
+# External
+import numpy as np
+from scipy import sparse
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import Lasso, LinearRegression
+
+# Internal
+from training.artifact import load_model, save_model
+from training.encoding import CategoryEncoder
+from training.ensemble import Ensemble
+
+
+class TestEnsemble(unittest.TestCase):
+    '''It tests the predictions of the ensemble of the models'''
+
+    def setUp(self):
+
+        random_state = np.random.RandomState(0)
+        self.X = np.hstack([
+            random_state.normal(size=(200, 3)),
+            random_state.randint(0, 2, size=(200, 5)),
+        ])
+        y = self.X @ np.array([3.0, -2.0, 0.5, 4.0, 0.0, -1.0, 0.0, 2.0]) \
+            + 10 + random_state.normal(size=200)
+
+        self.lm = LinearRegression().fit(self.X, y)
+        self.lm_l = Lasso(alpha=0.1).fit(self.X, y)
+        self.rf = RandomForestRegressor(n_estimators=10, random_state=0).fit(self.X, y)
+
+        self.models = [(self.lm, 0.25), (self.rf, 0.5), (self.lm_l, 0.25)]
+
+    def test_weighted_predictions(self):
+
+        ensemble = Ensemble.from_models(self.models)
+
+        expected = sum(weight * model.predict(self.X) for model, weight in self.models)
+
+        self.assertEqual(len(ensemble.estimators), 1)
+        self.assertEqual(ensemble.n_features_in_, self.X.shape[1])
+        np.testing.assert_allclose(ensemble.predict(self.X), expected)
+        np.testing.assert_allclose(ensemble.predict(sparse.csr_matrix(self.X)), expected)
+
+    def test_saved_in_artifact(self):
+
+        ensemble = Ensemble.from_models(self.models)
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "model_file.p")
+            save_model(file_path, ensemble, CategoryEncoder())
+            loaded, _ = load_model(file_path)
+
+        self.assertIsInstance(loaded, Ensemble)
+        np.testing.assert_array_equal(loaded.predict(self.X), ensemble.predict(self.X))
+
+    def test_different_features(self):
+
+        lm = LinearRegression().fit(self.X[:, :4], self.X[:, 0])
+
+        with self.assertRaises(ValueError):
+            Ensemble.from_models([(lm, 0.5), (self.rf, 0.5)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+'''
+This module contains unit tests for the local fake glassdoor server
+used for the scraper benchmarks. It checks if the served pages have
+the HTML structure the scraper relies on, and if the latency
+and pop-ups are injected as configured.
+'''
+
+# Python
+import time
+import unittest
+
+# External
+from bs4 import BeautifulSoup
+import requests
+
+# Internal
+from test.fake_glassdoor import FakeGlassdoorServer, synthetic_postings
+
+
+class TestFakeGlassdoorServer(unittest.TestCase):
+    '''It tests pages served by the fake glassdoor server'''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.postings = synthetic_postings(25, seed=1)
+
+    def test_synthetic_postings_are_deterministic(self):
+
+        self.assertEqual(synthetic_postings(5, seed=3), synthetic_postings(5, seed=3))
+        self.assertNotEqual(synthetic_postings(5, seed=3), synthetic_postings(5, seed=4))
+
+    def test_search_page_structure(self):
+
+        with FakeGlassdoorServer(self.postings, jobs_per_page=10) as server:
+            soup = self._get_soup(server.url)
+
+        buttons = soup.select('ul[data-test="jlGrid"] li')
+        footer = soup.select_one('div[data-test="pagination-footer-text"]')
+        next_button = soup.select_one('button[data-test="pagination-next"]')
+
+        self.assertEqual(len(buttons), 10)
+        self.assertEqual(buttons[0]['data-id'], "0")
+        self.assertIsNotNone(soup.find(id="JDCol"))
+        self.assertEqual(footer.text, "Page 1 of 3")
+        self.assertFalse(next_button.has_attr("disabled"))
+
+    def test_last_page_disables_next_button(self):
+
+        with FakeGlassdoorServer(self.postings, jobs_per_page=10) as server:
+            soup = self._get_soup(server.url.replace("p=1", "p=3"))
+
+        buttons = soup.select('ul[data-test="jlGrid"] li')
+        next_button = soup.select_one('button[data-test="pagination-next"]')
+
+        self.assertEqual(len(buttons), 5)
+        self.assertEqual(buttons[0]['data-id'], "20")
+        self.assertTrue(next_button.has_attr("disabled"))
+
+    def test_posting_structure(self):
+
+        with FakeGlassdoorServer(self.postings) as server:
+            response = requests.get(
+                server.url.replace("Job/jobs.htm?p=1", "posting/2"), timeout=5)
+
+        soup = BeautifulSoup(response.text, "html.parser")
+        posting = self.postings[2]
+
+        self.assertEqual(
+            soup.select_one('div[data-test="employerName"]').text, posting['Company_name'])
+        self.assertEqual(
+            soup.select_one('div[data-test="jobTitle"]').text, posting['Job_title'])
+        self.assertIsNotNone(soup.find(id="EmpBasicInfo"))
+        self.assertIsNotNone(soup.find(id="Reviews"))
+        self.assertEqual(response.headers["X-Pop-Up"], "0")
+
+    def test_pop_up_every_nth_posting(self):
+
+        with FakeGlassdoorServer(self.postings, pop_up_every=2) as server:
+            url = server.url.replace("Job/jobs.htm?p=1", "posting/0")
+            pop_ups = [
+                requests.get(url, timeout=5).headers["X-Pop-Up"] for _ in range(4)
+            ]
+
+        self.assertEqual(pop_ups, ["0", "1", "0", "1"])
+
+    def test_latency(self):
+
+        latency = 0.2
+
+        with FakeGlassdoorServer(self.postings, latency=latency) as server:
+            start = time.perf_counter()
+            requests.get(server.url, timeout=5)
+            elapsed = time.perf_counter() - start
+
+            self.assertEqual(server.requests_served, 1)
+
+        self.assertGreaterEqual(elapsed, latency)
+
+    def test_unknown_path(self):
+
+        with FakeGlassdoorServer(self.postings) as server:
+            response = requests.get(
+                server.url.replace("Job/jobs.htm?p=1", "unknown"), timeout=5)
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_no_postings(self):
+
+        with self.assertRaises(ValueError):
+            FakeGlassdoorServer([])
+
+    @staticmethod
+    def _get_soup(url: str) -> BeautifulSoup:
+        response = requests.get(url, timeout=5)
+        return BeautifulSoup(response.text, "html.parser")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+'''
+This module contains unit tests for the saved features of the salary models.
+It checks if the saved features are the built ones, dense or sparse, loaded by memory map,
+and if they are built again only for a new clean dataset or a new version.
+'''
+
+# Python
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# External
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# Internal
+from cleaning.pipeline import clean_countries, get_path_parquet, save_clean_csv
+from cleaning.store import save_clean_parquet
+from test.test_cleaning import _raw_postings
+from training import features
+from training.dataset import build_model_frame, get_X_y, read_model_columns
+
+
+class TestFeatures(unittest.TestCase):
+    '''It tests building, saving and loading the features'''
+
+    def setUp(self):
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "Data_Engineer_15-04-2023.csv")
+
+        self._save_clean({
+            'Poland': _raw_postings([
+                {'Company_name': "Acme", 'Location': "Warszawa", 'Job_title': "Data Engineer",
+                 'Description': "Python, AWS, Power BI", 'Job_age': "24h", 'Rating': 4.1,
+                 'Salary': "PLN 10K - PLN 15K", 'Sector': "Finance"},
+            ]),
+            'United_States': _raw_postings([
+                {'Company_name': "Corp", 'Location': "Austin, TX",
+                 'Job_title': "Senior Data Engineer", 'Description': "SQL, Snowflake",
+                 'Job_age': "1d", 'Salary': "$100K - $120K (Employer est.)"},
+                {'Company_name': "Corp", 'Location': "Austin, TX",
+                 'Job_title': "Junior Data Engineer", 'Description': "SQL", 'Job_age': "3d"},
+            ]),
+        })
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _save_clean(self, dfs: dict[str, pd.DataFrame]):
+
+        df = clean_countries(dfs, max_workers=1)
+        save_clean_csv(df, self.file_path)
+        save_clean_parquet(df, get_path_parquet(self.file_path))
+
+    def test_saved_same_as_built(self):
+
+        loaded = features.load_features(self.file_path)
+
+        X, y = get_X_y(build_model_frame(read_model_columns(self.file_path)))
+
+        self.assertIsInstance(loaded.X, np.memmap)
+        self.assertEqual(loaded.X.dtype, np.float32)
+        self.assertEqual(loaded.columns, X.columns.tolist())
+        self.assertIn('Country_Poland', loaded.columns)
+        np.testing.assert_array_equal(loaded.y, y)
+        pd.testing.assert_frame_equal(loaded.to_frame(), X.astype(np.float32))
+
+    def test_sparse_same_as_dense(self):
+
+        loaded = features.load_features(self.file_path, sparse_output=True)
+        dense = features.load_features(self.file_path)
+
+        self.assertTrue(sparse.isspmatrix_csr(loaded.X))
+        # The arrays of the matrix are the ones mapped, not copies
+        self.assertFalse(loaded.X.data.flags.owndata)
+        self.assertEqual(loaded.columns, dense.columns)
+        np.testing.assert_array_equal(loaded.X.toarray(), dense.X)
+
+    def test_built_once(self):
+
+        features.load_features(self.file_path)
+
+        with mock.patch.object(
+            features, 'build_features', side_effect=features.build_features
+        ) as build:
+            features.load_features(self.file_path)
+            self.assertEqual(build.call_count, 0)
+
+            with mock.patch.object(features, 'FEATURES_VERSION', features.FEATURES_VERSION + 1):
+                features.load_features(self.file_path)
+            self.assertEqual(build.call_count, 1)
+
+    def test_new_clean_data(self):
+
+        features.load_features(self.file_path)
+
+        self._save_clean({'Poland': _raw_postings([
+            {'Company_name': "Acme", 'Location': "Kraków", 'Job_title': "Data Engineer",
+             'Description': "Scala", 'Job_age': "2d", 'Salary': "PLN 12K - PLN 16K"},
+        ])})
+
+        loaded = features.load_features(self.file_path)
+
+        self.assertEqual(len(loaded.y), 1)
+        self.assertEqual(len(os.listdir(
+            os.path.join(features.get_path_features(self.file_path), "dense"))), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
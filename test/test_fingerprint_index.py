@@ -0,0 +1,130 @@
+'''
+This module contains unit tests for the fingerprint index of scraped job postings.
+It checks if a posting has the same fingerprint before and after its parsing,
+if the index survives being saved and loaded, and if the CSV writer
+skips the postings already indexed.
+'''
+
+# Python
+import csv
+import os
+import tempfile
+import unittest
+
+# Internal
+from scraper.jobs_to_csv.CSV_Writer import CSV_Writer
+from scraper.jobs_to_csv.fingerprint_index import (
+    MAGIC,
+    FingerprintIndex,
+    build_index_from_csv_files,
+    job_fingerprint
+)
+from scraper.jobs_to_csv.job_parser.job_parser import parse_data
+
+
+class TestFingerprintIndex(unittest.TestCase):
+    '''It tests the fingerprint index of scraped job postings'''
+
+    def setUp(self):
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "RAW", "fingerprints.idx")
+
+        self.job = {
+            'Company_name': "Acme Data\n4,2",
+            'Rating': "4,2",
+            'Location': "Berlin",
+            'Job_title': "Data Engineer",
+            'Description': "We are looking for\n  a data engineer.",
+            'Job_age': "5d",
+            'Easy_apply': "Easy Apply",
+            'Salary': "",
+            'Employees': "51 to 200 Employees",
+            'Revenue_USD': "$1 to $5 million (USD)",
+        }
+
+    def tearDown(self):
+
+        self.directory.cleanup()
+
+    def test_fingerprint_is_the_same_after_parsing(self):
+
+        fingerprint = job_fingerprint(self.job)
+
+        parse_data(self.job)
+
+        self.assertEqual(self.job['Company_name'], "Acme Data")
+        self.assertEqual(job_fingerprint(self.job), fingerprint)
+
+    def test_fingerprint_ignores_job_age(self):
+
+        other_job = dict(self.job, Job_age="30d+")
+
+        self.assertEqual(job_fingerprint(other_job), job_fingerprint(self.job))
+
+    def test_fingerprint_differs(self):
+
+        other_job = dict(self.job, Location="Munich")
+
+        self.assertNotEqual(job_fingerprint(other_job), job_fingerprint(self.job))
+
+    def test_add_and_load(self):
+
+        index = FingerprintIndex(self.path)
+
+        self.assertTrue(index.add_job(self.job))
+        self.assertFalse(index.add_job(self.job))
+        self.assertTrue(index.add(42))
+
+        loaded_index = FingerprintIndex(self.path)
+
+        self.assertEqual(len(loaded_index), 2)
+        self.assertTrue(loaded_index.contains_job(self.job))
+        self.assertIn(42, loaded_index)
+        self.assertEqual(os.path.getsize(self.path), len(MAGIC) + 2 * 8)
+
+    def test_load_skips_partial_fingerprint(self):
+
+        FingerprintIndex(self.path).add(7)
+
+        with open(self.path, "ab") as file:
+            file.write(b"\x01\x02\x03")
+
+        self.assertEqual(len(FingerprintIndex(self.path)), 1)
+
+    def test_load_invalid_file(self):
+
+        with open(os.path.join(self.directory.name, "invalid.idx"), "wb") as file:
+            file.write(b"not an index")
+
+        with self.assertRaises(ValueError):
+            FingerprintIndex(file.name)
+
+    def test_csv_writer_skips_duplicates(self):
+
+        csv_path = os.path.join(self.directory.name, "RAW", "jobs.csv")
+        writer = CSV_Writer(csv_path, "Germany", FingerprintIndex(self.path))
+
+        parse_data(self.job)
+
+        self.assertTrue(writer.write_observation(self.job))
+        self.assertFalse(writer.write_observation(dict(self.job, Job_age="1d")))
+        self.assertEqual(writer.counter, 1)
+
+        with open(csv_path, newline="", encoding="utf-8") as file:
+            self.assertEqual(len(list(csv.DictReader(file))), 1)
+
+    def test_build_index_from_csv_files(self):
+
+        csv_path = os.path.join(self.directory.name, "RAW", "jobs.csv")
+        CSV_Writer(csv_path, "Germany").write_observation(self.job)
+
+        index = FingerprintIndex()
+
+        self.assertEqual(
+            build_index_from_csv_files(index, os.path.dirname(csv_path)), 1)
+        self.assertTrue(index.contains_job(self.job))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+'''
+This module contains unit tests for geocoding the job locations.
+It checks if the places are looked up once, in batches, with a gazetteer instead
+of the network, and if a re-run reads all the places from the cache.
+'''
+
+# Python
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# External
+import numpy as np
+import pandas as pd
+
+# Internal
+from cleaning import geocode
+from cleaning.geocode import (
+    GazetteerGeocoder,
+    GeocodeCache,
+    geocode_places,
+    merge_geopositioning,
+    normalize_place,
+)
+
+
+class CountingGeocoder(GazetteerGeocoder):
+    '''The gazetteer counting the places looked up and the batches.'''
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self.batches: list[int] = []
+
+    def geocode(self, places):
+        self.batches.append(len(places))
+        return super().geocode(places)
+
+
+class TestGeocode(unittest.TestCase):
+    '''It tests geocoding the places with the cache'''
+
+    def setUp(self):
+
+        self.directory = tempfile.TemporaryDirectory()
+
+        self.gazetteer_path = os.path.join(self.directory.name, "gazetteer.csv")
+        pd.DataFrame({
+            'Country': ["Poland", "United States", "Greece"],
+            'State': [np.nan, "CA", np.nan],
+            'City': ["Gdynia", "San Jose", "Heraklion"],
+            'Latitude': [54.516498, 37.336166, np.nan],
+            'Longitude': [18.540274, -121.890591, np.nan],
+        }).to_csv(self.gazetteer_path, index=False)
+
+        self.places = pd.DataFrame({
+            'Country': ["Poland", "Poland", "United_States", "United States", "Greece",
+                        "Germany"],
+            'State': [np.nan, np.nan, "CA", "CA", np.nan, np.nan],
+            'City': ["Gdynia", " Gdynia", "San Jose", "San Jose", "Heraklion", "Remote"],
+        })
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _geocode(self, geocoder, batch_size=50):
+
+        cache = GeocodeCache(os.path.join(self.directory.name, "cache.sqlite"))
+        try:
+            return geocode_places(self.places, cache, geocoder, batch_size)
+        finally:
+            cache.close()
+
+    def test_normalize_place(self):
+
+        self.assertEqual(
+            normalize_place("United_States", " CA", np.nan), ("united states", "ca", ""))
+
+    def test_distinct_places_looked_up_once(self):
+
+        geocoder = CountingGeocoder(self.gazetteer_path)
+
+        places = self._geocode(geocoder, batch_size=2)
+
+        # Gdynia and San Jose written differently, the remote job not looked up
+        self.assertEqual(geocoder.batches, [2, 1])
+        self.assertEqual(places['Location'].tolist()[:3],
+                         ["Poland, Gdynia", "Poland, Gdynia", "United_States, CA, San Jose"])
+        self.assertIsNone(places.loc[5, 'Location'])
+        self.assertAlmostEqual(places.loc[3, 'Latitude'], 37.336166)
+        self.assertTrue(places.loc[[4, 5], 'Latitude'].isna().all())
+
+    def test_rerun_without_lookups(self):
+
+        places = self._geocode(CountingGeocoder(self.gazetteer_path))
+
+        geocoder = CountingGeocoder(self.gazetteer_path)
+        places_rerun = self._geocode(geocoder)
+
+        # The place not found is cached too
+        self.assertEqual(geocoder.batches, [])
+        pd.testing.assert_frame_equal(places_rerun, places)
+
+    def test_coordinates_set_by_hand(self):
+
+        self._geocode(CountingGeocoder(self.gazetteer_path))
+
+        cache = GeocodeCache(os.path.join(self.directory.name, "cache.sqlite"))
+        cache.put({normalize_place("Greece", np.nan, "Heraklion"): (35.341460, 25.171464)})
+        cache.close()
+
+        places = self._geocode(CountingGeocoder(self.gazetteer_path))
+
+        self.assertAlmostEqual(places.loc[4, 'Latitude'], 35.341460)
+
+    def test_cache_reads_requested_places(self):
+
+        cache = GeocodeCache(os.path.join(self.directory.name, "cache.sqlite"))
+        try:
+            cache.put({("country", "", f"city {i}"): (i, -i) for i in range(10)})
+            requested = [("country", "", f"city {i}") for i in (7, 2, 3)] + [("poland", "", "")]
+
+            # Queried in chunks
+            with mock.patch.object(geocode, 'QUERY_SIZE', 2):
+                coordinates = cache.get(requested)
+        finally:
+            cache.close()
+
+        self.assertEqual(coordinates, {
+            ("country", "", "city 7"): (7, -7),
+            ("country", "", "city 2"): (2, -2),
+            ("country", "", "city 3"): (3, -3),
+        })
+
+    def test_merge_geopositioning(self):
+
+        file_path = os.path.join(self.directory.name, "geopositioning.csv")
+        pd.DataFrame({
+            'Country': ["Poland", "Greece", "Spain"],
+            'State': [np.nan, np.nan, np.nan],
+            'City': ["Gdynia", "Heraklion", "Madrid"],
+            'Location': ["Poland, Gdynia", "Greece, Heraklion", "Spain, Madrid"],
+            'Latitude': [54.5, np.nan, 40.4],
+            'Longitude': [18.5, np.nan, -3.7],
+        }).to_csv(file_path, index=False)
+
+        places = self._geocode(CountingGeocoder(self.gazetteer_path))
+        places.loc[4, ['Latitude', 'Longitude']] = (35.341460, 25.171464)
+
+        merged = merge_geopositioning(places, file_path)
+
+        # Fixed by hand, and of another clean file
+        self.assertEqual(merged.loc[0, 'Latitude'], 54.5)
+        self.assertEqual(merged.loc[2, 'City'], "Madrid")
+        # Found now
+        self.assertAlmostEqual(merged.loc[1, 'Latitude'], 35.341460)
+        # New, each place once
+        self.assertEqual(merged['City'].tolist()[3:], ["San Jose", "Remote"])
+
+    def test_merge_geopositioning_new_file(self):
+
+        places = self._geocode(CountingGeocoder(self.gazetteer_path))
+
+        merged = merge_geopositioning(
+            places, os.path.join(self.directory.name, "geopositioning.csv"))
+
+        pd.testing.assert_frame_equal(merged, places.drop(index=[1, 3]).reset_index(drop=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+'''
+This module contains unit tests for the keyword matcher used by the cleaning stages.
+It checks if a single scan finds the same categories as a search for each keyword:
+the overlapping keywords, the word boundaries and the lookbehind of the keywords.
+'''
+
+# Python
+import re
+import unittest
+
+# Internal
+from cleaning.keyword_matcher import KeywordMatcher
+from cleaning.keywords import TECHNOLOGIES
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    '''It tests finding the categories of keywords in a text'''
+
+    def test_overlapping_keywords(self):
+
+        matcher = KeywordMatcher({
+            'SQL': ["SQL"],
+            'Microsoft_SQL_Server': ["SQL Server", "MSSQL"],
+        })
+
+        self.assertEqual(
+            matcher.find("Experience with SQL Server"), {'SQL', 'Microsoft_SQL_Server'})
+        self.assertEqual(matcher.find("Experience with MSSQL"), {'Microsoft_SQL_Server'})
+
+    def test_word_boundaries(self):
+
+        matcher = KeywordMatcher({'SQL': ["SQL"], 'Go': ["Go"]})
+
+        self.assertEqual(matcher.find("MySQL and Google"), set())
+        self.assertEqual(matcher.find("sql, GO!"), {'SQL', 'Go'})
+
+    def test_lookbehind(self):
+
+        matcher = KeywordMatcher({'R': TECHNOLOGIES['R']})
+
+        self.assertEqual(matcher.find("Python or R"), {'R'})
+        self.assertEqual(matcher.find("We're hiring"), set())
+
+    def test_not_text(self):
+
+        matcher = KeywordMatcher({'SQL': ["SQL"], 'Empty': []})
+
+        self.assertEqual(matcher.find(float('nan')), set())
+        self.assertEqual(KeywordMatcher({}).find("SQL"), set())
+
+    def test_find_first(self):
+
+        matcher = KeywordMatcher({'Github': ["Github"], 'Git': ["Git"]})
+        text = "Git on Github"
+
+        self.assertEqual(matcher.find_first(text, ['Github', 'Git']), 'Github')
+        self.assertEqual(matcher.find_first(text, ['Git', 'Github']), 'Git')
+        self.assertIsNone(matcher.find_first("SVN", ['Git', 'Github']))
+
+    def test_same_as_search_of_each_keyword(self):
+
+        matcher = KeywordMatcher(TECHNOLOGIES)
+        text = (
+            "Python, C++, C# and .NET, Apache Spark on AWS, PowerBI or Tableau, "
+            "Scala, Java and JavaScript. R and RStudio. Linux/Unix, Go, SQL Server."
+        )
+
+        expected = {
+            column_name
+            for column_name, tech_names in TECHNOLOGIES.items()
+            if any(re.search(r"\b" + name + r"\b", text, re.IGNORECASE) for name in tech_names)
+        }
+
+        self.assertEqual(matcher.find(text), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+'''
+This module contains unit tests for the cross-validated errors of the Lasso regression.
+It checks if the errors of the regularization path are the ones of the independent fits,
+for the dense and the sparse features.
+'''
+
+# Python
+import unittest
+
+# External
+import numpy as np
+from scipy import sparse
+from sklearn.linear_model import Lasso
+from sklearn.model_selection import cross_val_score
+
+# Internal
+from training.lasso import get_best_alpha, get_lasso_errors
+
+
+class TestLassoErrors(unittest.TestCase):
+    '''It tests the errors of the Lasso regression for each alpha'''
+
+    def setUp(self):
+
+        random_state = np.random.RandomState(0)
+        self.X = np.hstack([
+            random_state.normal(size=(200, 4)),
+            random_state.randint(0, 2, size=(200, 6)),
+        ])
+        coefs = np.array([3.0, -2.0, 0.0, 0.5, 4.0, 0.0, 0.0, -1.0, 0.0, 2.0])
+        self.y = self.X @ coefs + 10 + random_state.normal(size=200)
+
+    def test_same_as_independent_fits(self):
+
+        alphas = np.array([0.5, 0.01, 0.2, 1.0, 0.05])
+
+        errors = get_lasso_errors(self.X, self.y, alphas)
+
+        expected = [
+            np.mean(cross_val_score(
+                Lasso(alpha=alpha), self.X, self.y, scoring='neg_mean_absolute_error', cv=3))
+            for alpha in alphas
+        ]
+
+        np.testing.assert_array_equal(errors['alpha'], alphas)
+        np.testing.assert_allclose(errors['error'], expected, rtol=1e-4)
+        self.assertEqual(get_best_alpha(errors), alphas[np.argmax(expected)])
+
+    def test_sparse_same_as_dense(self):
+
+        errors = get_lasso_errors(self.X, self.y)
+        errors_sparse = get_lasso_errors(sparse.csr_matrix(self.X), self.y)
+
+        np.testing.assert_allclose(errors_sparse['error'], errors['error'], rtol=1e-4)
+
+
+if __name__ == '__main__':
+    unittest.main()
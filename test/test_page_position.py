@@ -0,0 +1,140 @@
+'''
+This module contains unit tests for the page-position tracking of GlassdoorJobScraper.
+The browser is mocked: after a refresh the scraper should come back to the page
+it was on and continue with the job buttons it has not done yet,
+without clicking the done ones again.
+'''
+
+# Python
+import unittest
+from unittest.mock import MagicMock, patch
+
+# External
+from selenium.common.exceptions import TimeoutException
+
+# Internal
+from scraper.jobs_to_csv.jobs_to_csv import MAX_JOB_ATTEMPTS, GlassdoorJobScraper
+
+MODULE = "scraper.jobs_to_csv.jobs_to_csv"
+
+
+class FakeBrowser:
+    '''
+    Imitates the search results pages: a list of job ids per page,
+    a pagination footer and a refresh bringing back the first page.
+    '''
+
+    def __init__(self, pages: list[list[str]]):
+        self.pages = pages
+        self.shown_page = 1
+        self.driver = MagicMock()
+        self.driver.refresh.side_effect = self.refresh
+
+    def refresh(self):
+        self.shown_page = 1
+
+    def next_page(self, *_):
+        self.shown_page += 1
+
+    def await_element(self, _driver, _timeout, _by, element):
+
+        if "pagination-footer-text" in element:
+            return MagicMock(text=f"Page {self.shown_page} of {len(self.pages)}")
+
+        jobs_list = MagicMock()
+        jobs_list.find_elements.return_value = [
+            self._button(job_id) for job_id in self.pages[self.shown_page - 1]
+        ]
+        return jobs_list
+
+    @staticmethod
+    def _button(job_id: str) -> MagicMock:
+        button = MagicMock()
+        button.get_attribute.return_value = job_id
+        button.job_id = job_id
+        return button
+
+
+class TestPagePosition(unittest.TestCase):
+    '''It tests resuming the scraping after a page refresh'''
+
+    def setUp(self):
+
+        self.browser = FakeBrowser([["a", "b", "c"], ["d", "e", "f"]])
+        self.clicked: list[str] = []
+        self.failures: dict[str, int] = {}
+
+        patches = [
+            patch(f"{MODULE}.await_element", side_effect=self.browser.await_element),
+            patch(f"{MODULE}.click_next_page", side_effect=self.browser.next_page),
+            patch(f"{MODULE}.get_values_for_job", side_effect=self._get_values_for_job),
+            patch(f"{MODULE}.click_x_pop_up"),
+            patch(f"{MODULE}.pause"),
+            patch(f"{MODULE}.parse_data"),
+        ]
+        for mock_patch in patches:
+            mock_patch.start()
+            self.addCleanup(mock_patch.stop)
+
+        self.scraper = GlassdoorJobScraper(
+            "Data Engineer", "Germany", 100, False, self.browser.driver)
+        self.scraper.csv_writer = MagicMock(counter=0, fingerprint_index=None)
+        self.scraper.csv_writer.write_observation.side_effect = self._write_observation
+
+    def _get_values_for_job(self, _driver, job_button, *_):
+
+        self.clicked.append(job_button.job_id)
+
+        if self.failures.get(job_button.job_id, 0):
+            self.failures[job_button.job_id] -= 1
+            raise TimeoutException()
+
+        return {'Company_name': f"Company {job_button.job_id}"}
+
+    def _write_observation(self, _job):
+
+        self.scraper.csv_writer.counter += 1
+        return True
+
+    def test_resume_after_refresh_on_the_same_page(self):
+
+        self.failures = {"b": 1}
+
+        self.scraper._write_job_listings()  # a, b fails
+        self.scraper._write_job_listings()  # b, c, next page
+
+        self.assertEqual(self.clicked, ["a", "b", "b", "c"])
+        self.assertEqual(self.scraper.current_page, 2)
+        self.assertEqual(self.scraper.done_job_ids, set())
+
+    def test_resume_after_refresh_back_to_the_first_page(self):
+
+        self.failures = {"e": 1}
+
+        self.scraper._write_job_listings()  # a, b, c, next page
+        self.scraper._write_job_listings()  # d, e fails, refresh to page 1
+        self.assertEqual(self.browser.shown_page, 1)
+
+        self.scraper._write_job_listings()  # back to page 2
+        self.assertEqual(self.browser.shown_page, 2)
+
+        self.scraper._write_job_listings()  # e, f
+
+        self.assertEqual(self.clicked, ["a", "b", "c", "d", "e", "e", "f"])
+        self.assertEqual(self.scraper.csv_writer.counter, 6)
+        self.assertEqual(self.scraper.stage_timer.refreshes, 1)
+
+    def test_skip_job_after_max_attempts(self):
+
+        self.failures = {"b": MAX_JOB_ATTEMPTS}
+
+        for _ in range(MAX_JOB_ATTEMPTS + 1):
+            self.scraper._write_job_listings()
+
+        self.assertEqual(self.clicked.count("b"), MAX_JOB_ATTEMPTS)
+        self.assertEqual(self.clicked[-1], "c")
+        self.assertEqual(self.scraper.csv_writer.counter, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+'''
+This module contains unit tests for the batch predictions of the clean dataset.
+It checks if the predictions of the partitions are the ones of the model,
+for all the postings, read from the CSV file in chunks or from the Parquet file.
+'''
+
+# Python
+import os
+import pickle
+import tempfile
+import unittest
+
+# External
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+
+# Internal
+from cleaning.pipeline import clean_countries, get_path_parquet, save_clean_csv
+from cleaning.store import save_clean_parquet
+from test.test_cleaning import _raw_postings
+from training.artifact import load_model, save_model
+from training.dataset import TARGET, build_model_frame, read_model_columns
+from training.features import build_features
+from training.predict import PREDICTION_COLUMN, predict_file
+
+
+class TestPredict(unittest.TestCase):
+    '''It tests predicting the salaries of all the postings of the clean dataset'''
+
+    def setUp(self):
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "Data_Engineer_15-04-2023.csv")
+        self.model_path = os.path.join(self.directory.name, "model_file.p")
+        self.output_path = os.path.join(self.directory.name, "predictions.csv")
+
+        self.df = clean_countries({
+            'Poland': _raw_postings([
+                {'Company_name': "Acme", 'Location': "Warszawa", 'Job_title': "Data Engineer",
+                 'Description': "Python, AWS, Power BI", 'Job_age': "24h", 'Rating': 4.1,
+                 'Salary': "PLN 10K - PLN 15K", 'Sector': "Finance"},
+                {'Company_name': "Acme", 'Location': "Kraków", 'Job_title': "Data Engineer",
+                 'Description': "Scala", 'Job_age': "2d", 'Sector': "Finance"},
+            ]),
+            'United_States': _raw_postings([
+                {'Company_name': "Corp", 'Location': "Austin, TX",
+                 'Job_title': "Senior Data Engineer", 'Description': "SQL, Snowflake",
+                 'Job_age': "1d", 'Salary': "$100K - $120K (Employer est.)"},
+                {'Company_name': "Corp", 'Location': "Austin, TX",
+                 'Job_title': "Junior Data Engineer", 'Description': "SQL", 'Job_age': "3d",
+                 'Salary': "$70K - $90K"},
+                {'Company_name': "Corp", 'Location': "Austin, TX",
+                 'Job_title': "Data Engineer", 'Description': "SQL, Python", 'Job_age': "5d"},
+            ]),
+        }, max_workers=1)
+        save_clean_csv(self.df, self.file_path)
+
+        features = build_features(self.file_path)
+        self.model = LinearRegression().fit(features.X, features.y)
+        save_model(self.model_path, self.model, features.encoder)
+
+        # All the postings, with the salary or not
+        df_model = build_model_frame(read_model_columns(self.file_path), drop_missing_target=False)
+        self.expected = self.model.predict(
+            features.encoder.transform(df_model.drop(columns=TARGET)))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _read_predictions(self) -> pd.Series:
+        return pd.read_csv(self.output_path, index_col=0)[PREDICTION_COLUMN]
+
+    def test_csv_chunks(self):
+
+        n_rows = predict_file(
+            self.model_path, self.file_path, self.output_path, max_workers=1, chunk_size=2)
+
+        predictions = self._read_predictions()
+
+        self.assertEqual(n_rows, len(self.df))
+        self.assertEqual(predictions.index.tolist(), self.df.index.tolist())
+        np.testing.assert_allclose(predictions, self.expected)
+
+    def test_parquet_same_as_csv(self):
+
+        predict_file(self.model_path, self.file_path, self.output_path, max_workers=1)
+        predictions_csv = self._read_predictions()
+
+        save_clean_parquet(self.df, get_path_parquet(self.file_path))
+        predict_file(self.model_path, self.file_path, self.output_path, max_workers=2)
+
+        pd.testing.assert_series_equal(self._read_predictions(), predictions_csv)
+
+    def test_model_without_vocabulary(self):
+
+        # As the notebook saves it
+        with open(self.model_path, "wb") as file:
+            pickle.dump({'model': self.model}, file)
+
+        with self.assertRaises(ValueError):
+            load_model(self.model_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,282 @@
+'''
+This module contains unit tests for the registry of the models served by the API.
+It checks if the requests are routed to the model of their country, else of their region,
+else to the default model, if the least recently used models are unloaded
+beyond the memory budget, never the default one, and if a new version of a model
+replaces it only once its file is no longer written and it passes the smoke batch.
+'''
+
+# Python
+import json
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# External
+import numpy as np
+from sklearn.linear_model import LinearRegression
+
+# Internal
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "FlaskAPI"))
+from registry import InvalidInput, ModelRegistry  # noqa: E402
+
+
+def save_linear_model(file_path, intercept, n_features=3, mtime=None):
+    '''
+    Saves the linear model predicting the intercept, as the notebook saves the model.
+    The modification time is set, so each version of the file is seen as new.
+    '''
+
+    X = np.eye(n_features + 1, n_features)
+    model = LinearRegression().fit(X, np.zeros(len(X)))
+    model.intercept_ = float(intercept)
+
+    with open(file_path, "wb") as file:
+        pickle.dump({"model": model}, file)
+
+    if mtime is not None:
+        os.utime(file_path, (mtime, mtime))
+
+
+class TestModelRegistry(unittest.TestCase):
+    '''It tests the routes, the loads and the evictions of the models'''
+
+    def setUp(self):
+
+        self.directory = tempfile.TemporaryDirectory()
+
+        for name, intercept in (("global", 1), ("europe", 2), ("poland", 3)):
+            save_linear_model(os.path.join(self.directory.name, f"{name}.p"), intercept)
+
+        # Room for two models only
+        model_size = os.path.getsize(os.path.join(self.directory.name, "global.p"))
+        self.manifest = {
+            "default": "global",
+            "memory_budget_MB": 2.5 * model_size / 1e6,
+            "models": {
+                "global": {"file": "global.p"},
+                "europe": {"file": "europe.p", "regions": ["Europe"]},
+                "poland": {"file": "poland.p", "countries": ["Poland"]},
+            },
+        }
+        with open(os.path.join(self.directory.name, "registry.json"), "w") as file:
+            json.dump(self.manifest, file)
+
+        self.registry = ModelRegistry.from_directory(self.directory.name)
+
+    def tearDown(self):
+
+        self.directory.cleanup()
+
+    def predict(self, name):
+
+        return self.registry.get(name).predict(np.zeros((1, 3)))[0]
+
+    def test_route(self):
+
+        self.assertEqual(self.registry.route("Poland", "Europe"), "poland")
+        self.assertEqual(self.registry.route("POLAND"), "poland")
+        self.assertEqual(self.registry.route("Germany", "europe"), "europe")
+        self.assertEqual(self.registry.route(region="Europe"), "europe")
+
+        # Default model
+        self.assertEqual(self.registry.route("United States", "North America"), "global")
+        self.assertEqual(self.registry.route(), "global")
+
+    def test_route_not_string(self):
+
+        with self.assertRaises(InvalidInput):
+            self.registry.route(5)
+        with self.assertRaises(InvalidInput):
+            self.registry.route("Poland", ["Europe"])
+
+    def test_default_without_manifest(self):
+
+        os.remove(os.path.join(self.directory.name, "registry.json"))
+        save_linear_model(os.path.join(self.directory.name, "model_file.p"), 4)
+
+        registry = ModelRegistry.from_directory(self.directory.name)
+
+        self.assertEqual(registry.route("Poland", "Europe"), "global")
+        self.assertAlmostEqual(registry.get("global").predict(np.zeros((1, 3)))[0], 4)
+
+    def test_get_loads_once(self):
+
+        self.assertAlmostEqual(self.predict("poland"), 3)
+        self.assertIs(self.registry.get("poland"), self.registry.get("poland"))
+
+        self.assertEqual(self.registry.get_metrics()["poland"]["loads"], 1)
+
+    def test_evict_least_recently_used(self):
+
+        self.predict("global")
+        self.predict("europe")
+        # Over the budget, Europe is the least recently used model after the default
+        self.predict("poland")
+
+        self.assertEqual(list(self.registry.loaded), ["global", "poland"])
+
+        metrics = self.registry.get_metrics()
+        self.assertEqual(metrics["europe"]["evictions"], 1)
+        self.assertFalse(metrics["europe"]["loaded"])
+        self.assertEqual(metrics["global"]["evictions"], 0)
+
+        # Loaded again
+        self.assertAlmostEqual(self.predict("europe"), 2)
+        self.assertEqual(self.registry.get_metrics()["europe"]["loads"], 2)
+        self.assertEqual(list(self.registry.loaded), ["global", "europe"])
+
+    def test_default_never_evicted(self):
+
+        self.predict("global")
+        self.predict("europe")
+        self.predict("poland")
+        self.predict("europe")
+
+        self.assertIn("global", self.registry.loaded)
+        self.assertEqual(self.registry.get_metrics()["global"]["evictions"], 0)
+
+    def test_metrics(self):
+
+        self.registry.record("europe", 10, 0.02)
+        self.registry.record("europe", 5, 0.04)
+        self.registry.record("europe", 0, 0.01, error=True)
+
+        metrics = self.registry.get_metrics()["europe"]
+
+        self.assertEqual(metrics["requests"], 3)
+        self.assertEqual(metrics["rows"], 15)
+        self.assertEqual(metrics["errors"], 1)
+        self.assertAlmostEqual(metrics["mean_latency_ms"], 70 / 3, places=3)
+        self.assertIsNone(self.registry.get_metrics()["poland"]["mean_latency_ms"])
+
+    def test_preload(self):
+
+        self.registry.preload()
+
+        # The default model first, then the others within the budget
+        self.assertEqual(len(self.registry.loaded), 2)
+        self.assertIn("global", self.registry.loaded)
+        self.assertEqual(
+            sum(metrics["evictions"] for metrics in self.registry.get_metrics().values()), 0)
+
+    def test_start_once_per_process(self):
+
+        try:
+            self.registry.start()
+            watcher = self.registry.watcher
+            self.registry.start()
+
+            self.assertTrue(watcher.is_alive())
+            self.assertIs(self.registry.watcher, watcher)
+            self.assertEqual(len(self.registry.loaded), 2)
+            self.assertEqual(self.registry.get_metrics()["global"]["loads"], 1)
+
+            # A process forked by the server
+            with mock.patch("os.getpid", return_value=os.getpid() + 1):
+                self.registry.start()
+            self.assertIsNot(self.registry.watcher, watcher)
+        finally:
+            self.registry.stop_watching()
+
+
+class TestModelReload(unittest.TestCase):
+    '''It tests the new versions of the loaded models'''
+
+    def setUp(self):
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "model_file.p")
+        save_linear_model(self.file_path, 1, mtime=1_000)
+
+        self.registry = ModelRegistry.from_directory(
+            self.directory.name, smoke_batch=np.zeros((2, 3)))
+        self.model = self.registry.get("global")
+
+    def tearDown(self):
+
+        self.directory.cleanup()
+
+    def predict(self, model=None):
+
+        return (model or self.registry.get("global")).predict(np.zeros((1, 3)))[0]
+
+    def test_reload_once_not_written(self):
+
+        save_linear_model(self.file_path, 5, mtime=2_000)
+
+        # Still written
+        self.registry.reload_changed()
+        self.assertIn("global", self.registry.pending)
+        self.assertAlmostEqual(self.predict(), 1)
+
+        # Written again meanwhile
+        save_linear_model(self.file_path, 6, mtime=3_000)
+        self.registry.reload_changed()
+        self.assertAlmostEqual(self.predict(), 1)
+
+        self.registry.reload_changed()
+        self.assertNotIn("global", self.registry.pending)
+        self.assertAlmostEqual(self.predict(), 6)
+        self.assertEqual(self.registry.get_metrics()["global"]["reloads"], 1)
+
+    def test_reload_unchanged(self):
+
+        self.registry.reload_changed()
+        self.registry.reload_changed()
+
+        self.assertIs(self.registry.get("global"), self.model)
+        self.assertEqual(self.registry.get_metrics()["global"]["reloads"], 0)
+
+    def test_running_request_keeps_old_model(self):
+
+        # The model of a request running during the reload
+        model = self.registry.get("global")
+
+        save_linear_model(self.file_path, 5, mtime=2_000)
+        self.registry.reload_changed()
+        self.registry.reload_changed()
+
+        self.assertAlmostEqual(self.predict(model), 1)
+        self.assertAlmostEqual(self.predict(), 5)
+
+    def assert_not_served(self):
+
+        with self.assertLogs(level="ERROR"):
+            self.registry.reload_changed()
+            self.registry.reload_changed()
+
+        self.assertIs(self.registry.get("global"), self.model)
+        self.assertEqual(self.registry.get_metrics()["global"]["reload_errors"], 1)
+
+        # Not loaded again until the file changes
+        self.registry.reload_changed()
+        self.registry.reload_changed()
+        self.assertEqual(self.registry.get_metrics()["global"]["reload_errors"], 1)
+
+    def test_reload_other_features(self):
+
+        save_linear_model(self.file_path, 5, n_features=4, mtime=2_000)
+
+        self.assert_not_served()
+
+    def test_reload_invalid_predictions(self):
+
+        save_linear_model(self.file_path, np.nan, mtime=2_000)
+
+        self.assert_not_served()
+
+    def test_reload_corrupted_file(self):
+
+        with open(self.file_path, "wb") as file:
+            file.write(b"not a pickle")
+        os.utime(self.file_path, (2_000, 2_000))
+
+        self.assert_not_served()
+
+
+if __name__ == '__main__':
+    unittest.main()
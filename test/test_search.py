@@ -0,0 +1,131 @@
+'''
+This module contains unit tests for the resumable search of the models parameters.
+It checks if the scores are the ones of `GridSearchCV`, if an interrupted search
+fits only the folds left, and if the successive halving fits the finalists on all the rows.
+'''
+
+# Python
+from contextlib import redirect_stderr
+import io
+import os
+import tempfile
+import unittest
+
+# External
+import numpy as np
+from scipy import sparse
+from sklearn.linear_model import Lasso, Ridge
+from sklearn.model_selection import GridSearchCV
+
+# Internal
+from training.search import N_FOLDS, SCORING, ScoreCache, main, search
+
+PARAM_GRID = {'alpha': [0.1, 1.0, 10.0, 100.0], 'fit_intercept': [True, False]}
+
+
+class TestSearch(unittest.TestCase):
+    '''It tests the search of the parameters with the cache of the scores'''
+
+    def setUp(self):
+
+        random_state = np.random.RandomState(42)
+        self.X = random_state.normal(size=(300, 5))
+        self.y = self.X @ np.array([3.0, -2.0, 0.5, 0.0, 1.0]) + 5 + random_state.normal(size=300)
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.directory.name, "scores.jsonl")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _search(self, **kwargs):
+        return search(
+            Ridge(), PARAM_GRID, self.X, self.y, ScoreCache(self.cache_path),
+            max_workers=1, **kwargs)
+
+    def test_same_as_grid_search(self):
+
+        results = self._search()
+
+        grid_search = GridSearchCV(Ridge(), PARAM_GRID, scoring=SCORING, cv=N_FOLDS)
+        grid_search.fit(self.X, self.y)
+
+        expected = {
+            repr(params): score
+            for params, score in zip(
+                grid_search.cv_results_['params'], grid_search.cv_results_['mean_test_score'])
+        }
+
+        self.assertEqual(results['params'].iloc[0], grid_search.best_params_)
+        for params, score in zip(results['params'], results['mean_score']):
+            self.assertAlmostEqual(score, expected[repr(params)])
+
+    def test_resume_interrupted_search(self):
+
+        results = self._search()
+
+        # As if the search was killed while saving the fourth last fit,
+        # the last fold of a combination and all the folds of the last one
+        with open(self.cache_path, "r", encoding="utf-8") as file:
+            lines = file.readlines()
+        with open(self.cache_path, "w", encoding="utf-8") as file:
+            file.writelines(lines[:-4] + [lines[-4][:20]])
+
+        results_resumed = self._search()
+
+        with open(self.cache_path, "r", encoding="utf-8") as file:
+            self.assertEqual(len(file.readlines()), len(lines))
+
+        self.assertEqual((~results_resumed['cached']).sum(), 2)
+        np.testing.assert_allclose(results_resumed['mean_score'], results['mean_score'])
+
+        self.assertTrue(self._search()['cached'].all())
+
+    def test_processes_same_as_one_by_one(self):
+
+        results = self._search()
+        results_pool = search(
+            Ridge(), PARAM_GRID, self.X, self.y,
+            ScoreCache(os.path.join(self.directory.name, "pool.jsonl")), max_workers=2)
+
+        np.testing.assert_allclose(results_pool['mean_score'], results['mean_score'])
+
+    def test_sparse_same_as_dense(self):
+
+        results = search(
+            Lasso(), PARAM_GRID, self.X, self.y,
+            ScoreCache(os.path.join(self.directory.name, "dense.jsonl")), max_workers=1)
+        results_sparse = search(
+            Lasso(), PARAM_GRID, sparse.csr_matrix(self.X), self.y,
+            ScoreCache(os.path.join(self.directory.name, "sparse.jsonl")), max_workers=1)
+
+        self.assertEqual(results_sparse['params'].tolist(), results['params'].tolist())
+        np.testing.assert_allclose(
+            results_sparse['mean_score'], results['mean_score'], rtol=1e-4)
+
+    def test_halving(self):
+
+        results = self._search(halving_factor=2)
+
+        n_train = len(self.X) * (N_FOLDS - 1) // N_FOLDS
+        finalists = results[results['n_samples'] == n_train]
+
+        self.assertEqual(len(results), 8)
+        self.assertLess(len(finalists), 8)
+        self.assertEqual(results.index[results['n_samples'] == n_train].tolist(),
+                         list(range(len(finalists))))
+
+    def test_halving_factor_lower_than_2(self):
+
+        for factor in (1, 0, -2):
+            with self.assertRaises(ValueError):
+                self._search(halving_factor=factor)
+
+        # An argparse error, before reading the file
+        for factor in ("1", "0", "-2", "two"):
+            with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+                main([self.cache_path, "--halving", factor])
+
+
+if __name__ == '__main__':
+    unittest.main()
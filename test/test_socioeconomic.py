@@ -0,0 +1,76 @@
+'''
+This module contains unit tests for the table of the countries socioeconomic data.
+It checks if the country names of the sources are joined under the same names
+and if the table is joined to the grouped and flat columns of the postings.
+'''
+
+# Python
+import unittest
+
+# External
+import numpy as np
+import pandas as pd
+
+# Internal
+from cleaning.socioeconomic import build_countries_table, join_socioeconomic
+
+
+class TestSocioeconomic(unittest.TestCase):
+    '''It tests building the countries table and joining it to the postings'''
+
+    def setUp(self):
+
+        self.countries = build_countries_table(
+            dollar_rates=pd.Series({'USD': 1.0, 'TRY': 19.4, 'CZK': 21.1}),
+            poverty_lines=pd.Series({'United_States': 3114, 'Turkey': 1353,
+                                     'Czech_Republic': 1321}),
+            purchasing_power=pd.Series({'United States': 1.0, 'Turkey': 2.94}),
+            hdi=pd.DataFrame({
+                'Country': ["United States", "Türkiye", "Czechia"],
+                'HDI': ["921", "838", "0,89"],
+                'GNI per capita': ["64 765", "31\xa0033", "38 745"],
+                'HDI category': ["VERY HIGH"] * 3,
+            }),
+        )
+
+    def test_countries_joined_by_normalized_names(self):
+
+        turkey = self.countries.loc["Turkey"]
+
+        self.assertEqual(turkey['Currency'], "TRY")
+        self.assertEqual(turkey['Dollar_rate'], 19.4)
+        self.assertEqual(turkey['Poverty_line_monthly'], 1353)
+        self.assertEqual(turkey['PPP_conversion'], 2.94)
+        self.assertEqual(turkey['GNI_per_capita'], 31033)
+
+        self.assertAlmostEqual(self.countries.loc["Czech Republic", 'HDI'], 0.89)
+        self.assertAlmostEqual(self.countries.loc["United States", 'HDI'], 0.921)
+        self.assertTrue(self.countries.index.is_unique)
+
+    def test_join_grouped_columns(self):
+
+        postings = pd.DataFrame({
+            ('Job_details', 'Country'): pd.Categorical(
+                ["Turkey", "United States", "Taiwan", "Turkey"]),
+            ('Salary', 'Avg'): [30000.0, 120000.0, np.nan, 40000.0],
+        }, index=[3, 1, 7, 5])
+
+        joined = join_socioeconomic(postings, self.countries)
+
+        self.assertEqual(joined.index.tolist(), [3, 1, 7, 5])
+        self.assertEqual(
+            joined[('Socioeconomic', 'Dollar_rate')].tolist()[:2], [19.4, 1.0])
+        self.assertTrue(pd.isna(joined.loc[7, ('Socioeconomic', 'HDI')]))
+        pd.testing.assert_frame_equal(joined[['Job_details', 'Salary']], postings)
+
+    def test_join_flat_columns(self):
+
+        postings = pd.DataFrame({'Country': ["Czech_Republic", "Turkey"]})
+
+        joined = join_socioeconomic(postings, self.countries, 'Country')
+
+        self.assertEqual(joined['Currency'].tolist(), ["CZK", "TRY"])
+
+
+if __name__ == '__main__':
+    unittest.main()
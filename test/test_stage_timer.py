@@ -0,0 +1,122 @@
+'''
+This module contains unit tests for the timer of the scraping stages.
+It checks if the durations are put into the right histogram buckets,
+if the refreshes are counted with their causes,
+and if the disabled timer doesn't record anything.
+'''
+
+# Python
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# External
+from selenium.common.exceptions import TimeoutException
+
+# Internal
+from scraper.jobs_to_csv.debugger.stage_timer import Histogram, StageTimer
+
+
+class TestHistogram(unittest.TestCase):
+    '''It tests the fixed-bucket histogram of durations'''
+
+    def test_add(self):
+
+        histogram = Histogram()
+
+        for seconds in (0.0005, 0.003, 0.003, 0.25, 45.0):
+            histogram.add(seconds)
+
+        self.assertEqual(histogram.count, 5)
+        self.assertAlmostEqual(histogram.total, 45.2565)
+        self.assertEqual(histogram.minimum, 0.0005)
+        self.assertEqual(histogram.maximum, 45.0)
+        self.assertEqual(histogram.buckets[0], 1)  # <= 1 ms
+        self.assertEqual(histogram.buckets[2], 2)  # <= 5 ms
+        self.assertEqual(histogram.buckets[8], 1)  # <= 500 ms
+        self.assertEqual(histogram.buckets[-1], 1)  # > 30 s
+
+    def test_percentile(self):
+
+        histogram = Histogram()
+
+        for _ in range(9):
+            histogram.add(0.004)
+        histogram.add(0.8)
+
+        self.assertEqual(histogram.percentile(0.5), 0.005)  # bucket upper bound
+        self.assertEqual(histogram.percentile(0.95), 0.8)
+        self.assertEqual(Histogram().percentile(0.5), 0.0)
+
+
+class TestStageTimer(unittest.TestCase):
+    '''It tests the timer of the scraping stages'''
+
+    @patch('time.perf_counter', side_effect=[1.0, 1.25, 2.0, 2.5])
+    def test_measure(self, mock_perf_counter):
+
+        timer = StageTimer()
+
+        with timer.measure("pause"):
+            pass
+        with timer.measure("pause"):
+            pass
+
+        timings = timer.summary()['stages']['pause']
+
+        self.assertEqual(timings['count'], 2)
+        self.assertEqual(timings['total_s'], 0.75)
+        self.assertEqual(timings['max_s'], 0.5)
+
+    def test_measure_exception(self):
+
+        timer = StageTimer()
+
+        with self.assertRaises(TimeoutException):
+            with timer.measure("get_values_for_job"):
+                raise TimeoutException()
+
+        self.assertEqual(timer.histograms["get_values_for_job"].count, 1)
+
+    def test_disabled(self):
+
+        timer = StageTimer(enabled=False)
+
+        with timer.measure("pause"):
+            pass
+
+        self.assertEqual(timer.summary()['stages'], {})
+
+    def test_count_refresh(self):
+
+        timer = StageTimer(enabled=False)
+
+        timer.count_refresh(TimeoutException())
+        timer.count_refresh(TimeoutException())
+        timer.count_refresh("Job posting without company name")
+
+        self.assertEqual(timer.refreshes, 3)
+        self.assertEqual(
+            timer.summary()['refresh_causes'],
+            {'TimeoutException': 2, 'Job posting without company name': 1}
+        )
+
+    def test_dump(self):
+
+        timer = StageTimer()
+
+        with timer.measure("parse_data"):
+            pass
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "timings", "run.json")
+            timer.dump(path)
+
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(json.load(file), timer.summary())
+
+
+if __name__ == '__main__':
+    unittest.main()
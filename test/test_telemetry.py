@@ -0,0 +1,118 @@
+'''
+This module contains unit tests for the telemetry of the scraping runs.
+It checks if the run log writes valid JSON lines and if the analyzer
+aggregates the events of several runs into per-country and per-run throughput.
+'''
+
+# Python
+import json
+import os
+import tempfile
+import unittest
+
+# Internal
+from scraper.telemetry.analyzer import load_events, summarize_countries, summarize_runs
+from scraper.telemetry.run_log import RunLog
+
+
+class TestRunLog(unittest.TestCase):
+    '''It tests the JSON-lines log of the scraping runs'''
+
+    def test_event(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "logs", "run.jsonl")
+
+            with RunLog(path, run_id="run-1") as run_log:
+                run_log.event("country_start", location="Poland")
+                run_log.event("job_written", location="Poland", jobs_written=1)
+
+            with open(path, encoding="utf-8") as file:
+                events = [json.loads(line) for line in file]
+
+        self.assertEqual(len(events), 2)
+        self.assertEqual(events[0]['run_id'], "run-1")
+        self.assertEqual(events[0]['event'], "country_start")
+        self.assertEqual(events[1]['jobs_written'], 1)
+        self.assertIn('ts', events[1])
+
+    def test_disabled(self):
+
+        run_log = RunLog()
+        run_log.event("country_start", location="Poland")
+
+        self.assertFalse(run_log.enabled)
+
+
+class TestAnalyzer(unittest.TestCase):
+    '''It tests the aggregation of the scraping runs events'''
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.events = [
+            # the first run, 2 jobs in a minute
+            cls._event(0, "run-1", "country_start", location="Poland"),
+            cls._event(1, "run-1", "page_visited", location="Poland"),
+            cls._event(2, "run-1", "job_written", location="Poland"),
+            cls._event(3, "run-1", "refresh", location="Poland", cause="TimeoutException"),
+            cls._event(4, "run-1", "job_written", location="Poland"),
+            cls._event(4, "run-1", "duplicate_skipped", location="Poland"),
+            cls._event(5, "run-1", "blocked", location="Poland", reason="No job buttons found"),
+            cls._event(6, "run-1", "stage_durations", location="Poland",
+                       stages={'pause': {'mean_s': 0.9}}),
+            cls._event(60, "run-1", "country_stop", location="Poland",
+                       outcome="terminated", elapsed_s=60.0),
+            # the second run, 3 jobs in a minute, not finished
+            cls._event(100, "run-2", "country_start", location="Poland"),
+            cls._event(110, "run-2", "job_written", location="Poland"),
+            cls._event(120, "run-2", "job_written", location="Poland"),
+            cls._event(160, "run-2", "job_written", location="Poland"),
+        ]
+
+    def test_summarize_countries(self):
+
+        first, second = summarize_countries(self.events)
+
+        self.assertEqual(first['outcome'], "terminated")
+        self.assertEqual(first['pages'], 1)
+        self.assertEqual(first['jobs_written'], 2)
+        self.assertEqual(first['jobs_per_minute'], 2.0)
+        self.assertEqual(first['duplicates'], 1)
+        self.assertEqual(first['refresh_causes'], {'TimeoutException': 1})
+        self.assertEqual(first['blocked'], 1)
+        self.assertEqual(first['stages_mean_s'], {'pause': 0.9})
+
+        self.assertEqual(second['outcome'], "unfinished")
+        self.assertEqual(second['elapsed_s'], 60.0)
+        self.assertEqual(second['jobs_per_minute'], 3.0)
+
+    def test_summarize_runs(self):
+
+        first, second = summarize_runs(self.events)
+
+        self.assertEqual(first['run_id'], "run-1")
+        self.assertIsNone(first['trend'])
+        self.assertEqual(second['trend'], 1.0)
+
+    def test_load_events_skips_broken_lines(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "run.jsonl")
+
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(json.dumps(self.events[1]) + "\n")
+                file.write(json.dumps(self.events[0]) + "\n")
+                file.write('{"ts": 7, "run_id": "ru')
+
+            events = load_events([path])
+
+        self.assertEqual(events, self.events[:2])
+
+    @staticmethod
+    def _event(ts: float, run_id: str, name: str, **fields) -> dict:
+        return {'ts': ts, 'run_id': run_id, 'event': name, **fields}
+
+
+if __name__ == '__main__':
+    unittest.main()
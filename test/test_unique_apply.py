@@ -0,0 +1,81 @@
+'''
+This module contains unit tests for applying the cleaning functions to the distinct values.
+It checks if the results are the same as of `Series.apply`, including their types,
+and if the stats count the saved calls separately for the collected blocks.
+'''
+
+# Python
+import unittest
+
+# External
+import numpy as np
+import pandas as pd
+
+# Internal
+from cleaning.stages import clean_job_age
+from cleaning.unique_apply import (
+    apply_unique,
+    collect_stats,
+    format_stats,
+    get_stats,
+    record_stats,
+)
+
+
+class TestApplyUnique(unittest.TestCase):
+    '''It tests applying a function to the distinct values of a column'''
+
+    def test_same_as_apply(self):
+
+        job_ages = pd.Series(["24h", "30d+", np.nan, "24h", "5d", np.nan], index=list("abcdef"))
+
+        results = apply_unique(job_ages, clean_job_age)
+
+        pd.testing.assert_series_equal(results, job_ages.apply(clean_job_age))
+        self.assertEqual(results.dtype, np.float64)
+
+    def test_types_of_results(self):
+
+        titles = pd.Series(["Data Engineer", "Remote", "Remote"])
+
+        is_remote = apply_unique(titles, lambda title: title == "Remote")
+        lengths = apply_unique(titles, len)
+
+        self.assertEqual(is_remote.dtype, bool)
+        self.assertEqual(lengths.tolist(), [13, 6, 6])
+        self.assertEqual(lengths.dtype, np.int64)
+        self.assertEqual(apply_unique(titles.iloc[:0], len).tolist(), [])
+
+    def test_function_called_once_per_value(self):
+
+        calls = []
+
+        def function(value):
+            calls.append(value)
+            return value
+
+        apply_unique(pd.Series(["a", "b", "a", np.nan, np.nan]), function)
+
+        self.assertEqual(calls[:2], ["a", "b"])
+        self.assertEqual(len(calls), 3)
+
+    def test_stats(self):
+
+        with collect_stats() as stats:
+            apply_unique(pd.Series(["a"] * 8 + ["b", "c"]), str.upper, "upper")
+            apply_unique(pd.Series(["a", "a"]), str.upper, "upper")
+
+        self.assertEqual(stats['upper'].to_dict(),
+                         {'values': 12, 'unique': 4, 'hit_ratio': 0.6667})
+        self.assertNotIn('upper', get_stats())
+
+        with collect_stats() as merged:
+            record_stats(stats)
+            record_stats(stats)
+
+        self.assertEqual(merged['upper'].values, 24)
+        self.assertIn("66.7%", format_stats(merged))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+'''
+This module saves and loads the model artifact: the pickle file of the fitted model,
+as `_004_model_building.ipynb` saves it for the API (`{'model': ...}`), with the
+vocabulary of the features (see `training.encoding`), so the postings to predict are
+encoded into the columns the model was fitted on.
+An ensemble of models (see `training.ensemble`) is saved as its arrays and models
+(`{'ensemble': ...}`), so the API loads it without this package.
+
+Usage, at the end of the notebook:
+- save_model("FlaskAPI/models/model_file.p", gs.best_estimator_, features.encoder)
+- save_model("FlaskAPI/models/model_file.p",
+             Ensemble.from_models([(lm, 0.5), (gs.best_estimator_, 0.5)]), features.encoder)
+'''
+# Python
+import os
+import pickle
+
+# External
+from sklearn.base import BaseEstimator
+
+# Internal
+from training.encoding import CategoryEncoder
+from training.ensemble import Ensemble
+
+MODEL_KEY = 'model'
+ENSEMBLE_KEY = 'ensemble'
+VOCABULARY_KEY = 'vocabulary'
+
+
+def save_model(file_path: str, model: BaseEstimator | Ensemble, encoder: CategoryEncoder):
+    '''
+    Saves the fitted model with the vocabulary of its features.
+
+    Args:
+    - file_path (str): The path to the pickle file.
+    - model (BaseEstimator | Ensemble): The model or the ensemble fitted on the features
+    of the encoder.
+    - encoder (CategoryEncoder): The columns and the categories of the features.
+    '''
+
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    if isinstance(model, Ensemble):
+        artifact = {ENSEMBLE_KEY: model.to_dict()}
+    else:
+        artifact = {MODEL_KEY: model}
+
+    with open(file_path, "wb") as file:
+        pickle.dump({**artifact, VOCABULARY_KEY: encoder.to_dict()}, file)
+
+
+def load_model(file_path: str) -> tuple[BaseEstimator | Ensemble, CategoryEncoder]:
+    '''
+    Loads the fitted model, or the ensemble, and the encoder of its features.
+
+    Args:
+    - file_path (str): The path to the pickle file.
+
+    Returns:
+    - tuple[BaseEstimator | Ensemble, CategoryEncoder]: The model and the encoder.
+
+    Raises:
+    - ValueError: If the model is saved without the vocabulary, e.g. by the notebook.
+    '''
+
+    with open(file_path, "rb") as file:
+        artifact = pickle.load(file)
+
+    if VOCABULARY_KEY not in artifact:
+        raise ValueError(
+            f"The model is saved without the vocabulary of its features:\n{file_path}\n"
+            "Save it with `training.artifact.save_model`.")
+
+    encoder = CategoryEncoder.from_dict(artifact[VOCABULARY_KEY])
+
+    if ENSEMBLE_KEY in artifact:
+        return Ensemble.from_dict(artifact[ENSEMBLE_KEY]), encoder
+
+    return artifact[MODEL_KEY], encoder
@@ -0,0 +1,148 @@
+'''
+This module prepares the clean postings for the salary models as in
+`_004_model_building.ipynb`: the model columns are selected, the Business Intelligence
+tools are merged into a single flag, the postings without the salary are dropped,
+the missing values are filled with -1 and the categories are dummy encoded.
+'''
+# Python
+import os
+
+# External
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+
+# Internal
+from cleaning.pipeline import get_path_parquet
+from cleaning.store import read_clean_parquet
+from scraper.config.get import get_encoding
+
+TARGET = 'Salary_avg'
+TEST_SIZE = 0.2
+RANDOM_STATE = 42
+
+# The columns selected in `_004_model_building.ipynb`
+COLUMNS_MODEL = [
+    ('Job_details', 'Country'),
+    ('Job_details', 'Seniority'),
+    ('Job_details', 'Job_age'),
+    ('Salary', 'Avg'),
+    ('Salary', 'Employer_provided'),
+    ('Salary', 'Is_hourly'),
+    ('Company_info', 'Rating'),
+    ('Company_info', 'Employees'),
+    ('Company_info', 'Type_of_ownership'),
+    ('Company_info', 'Sector'),
+    ('Company_info', 'Company_age'),
+    ('Company_info', 'Revenue_USD'),
+    ('Programming_languages', 'SQL'),
+    ('Programming_languages', 'Python'),
+    ('Programming_languages', 'Java'),
+    ('Programming_languages', 'Scala'),
+    ('Cloud_platforms', 'Microsoft_Azure'),
+    ('Cloud_platforms', 'AWS'),
+    ('Cloud_platforms', 'GPC'),
+    ('Data_integration_and_processing', 'Databricks'),
+    ('Search_&_Analytics', 'Snowflake'),
+    ('Stream_processing_tools', 'Apache_Kafka'),
+    ('Big_Data_processing', 'Apache_Spark'),
+]
+BI_TOOLS_GROUP = 'Business_Intelligence_Tools'
+
+
+def get_path_model_data(file_path: str) -> str:
+    '''Returns the Parquet file next to the clean CSV file if it exists, or the CSV file.'''
+
+    path_parquet = get_path_parquet(file_path)
+
+    return path_parquet if os.path.exists(path_parquet) else file_path
+
+
+def read_model_columns(file_path: str) -> pd.DataFrame:
+    '''
+    Reads the model columns of the clean postings, from the Parquet file next to
+    the clean CSV file if it exists, or from the CSV file.
+
+    Args:
+    - file_path (str): The path to the clean CSV file.
+
+    Returns:
+    - pd.DataFrame: The model columns and the Business Intelligence tools.
+    '''
+
+    path_data = get_path_model_data(file_path)
+
+    if path_data != file_path:
+        return read_clean_parquet(path_data, COLUMNS_MODEL + [BI_TOOLS_GROUP])
+
+    return select_model_columns(
+        pd.read_csv(file_path, index_col=0, header=[0, 1], encoding=get_encoding()))
+
+
+def select_model_columns(df: pd.DataFrame) -> pd.DataFrame:
+    '''Returns the model columns and the Business Intelligence tools of the clean postings.'''
+
+    return df.loc[:, COLUMNS_MODEL + df.loc[:, [BI_TOOLS_GROUP]].columns.tolist()]
+
+
+def _untype(column: pd.Series) -> pd.Series:
+    '''
+    Returns the typed column (categorical, nullable boolean, float32) as read from
+    the clean CSV file, with the objects and NaN, so the values are filled and encoded
+    as in the notebook.
+    '''
+
+    if isinstance(column.dtype, pd.CategoricalDtype) or \
+            isinstance(column.dtype, pd.BooleanDtype):
+        return column.astype(object).where(column.notna(), np.nan)
+
+    # Through the shortest text, so e.g. the rating 4.1 is the same float64 as in the CSV
+    if column.dtype == np.float32:
+        return column.astype(str).astype(np.float64)
+
+    return column
+
+
+def build_model_frame(df: pd.DataFrame, drop_missing_target: bool = True) -> pd.DataFrame:
+    '''
+    Builds the table of the models from the clean postings, before the dummy encoding.
+
+    Args:
+    - df (pd.DataFrame): The clean postings with the grouped columns, at least the model
+    columns and the Business Intelligence tools.
+    - drop_missing_target (bool): Drops the postings without the salary, as for the training.
+    The postings to predict are all kept.
+
+    Returns:
+    - pd.DataFrame: The postings with the salary, a column per feature and the target,
+    with the missing values as -1.
+    '''
+
+    df_model = df.loc[:, COLUMNS_MODEL].apply(_untype)
+    df_model.columns = df_model.columns.droplevel(0)
+    df_model = df_model.rename(columns={'Avg': TARGET})
+
+    df_model['BI_Tools'] = df[BI_TOOLS_GROUP].any(axis=1).astype(bool)
+
+    # Better get any estimation than none, even if the model is not so accurate
+    if drop_missing_target:
+        df_model = df_model.dropna(subset=[TARGET])
+
+    # To avoid bugs with infinite values
+    return df_model.fillna(-1)
+
+
+def get_X_y(df_model: pd.DataFrame) -> tuple[pd.DataFrame, np.ndarray]:
+    '''Returns the dummy encoded features and the target of the models table.'''
+
+    df_dum = pd.get_dummies(df_model)
+
+    return df_dum.drop(TARGET, axis=1), df_dum[TARGET].values
+
+
+def split_train_test(
+    X: pd.DataFrame, y: np.ndarray
+) -> tuple[pd.DataFrame, pd.DataFrame, np.ndarray, np.ndarray]:
+    '''Splits the features and the target into the train and test sets of the notebook.'''
+
+    return train_test_split(X, y, test_size=TEST_SIZE, random_state=RANDOM_STATE)
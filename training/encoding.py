@@ -0,0 +1,106 @@
+'''
+This module encodes the categories of the models table (countries, sectors, types
+of ownership...) as the 0/1 columns of `pd.get_dummies`, with the vocabulary of
+the categories fitted once, so the postings to predict are encoded into the same columns,
+the unknown categories as zeros.
+
+The encoded features can be a sparse CSR matrix: almost all the dummy columns of
+a posting are 0, so the memory and the fit time of the models accepting it
+(Lasso, random forest) grow with the non-zero values, not with the number of columns.
+'''
+# External
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# The types encoded by `pd.get_dummies`
+ENCODED_DTYPES = ['object', 'category']
+PREFIX_SEPARATOR = "_"
+
+
+class CategoryEncoder:
+    '''
+    The numeric columns and the categories of each categorical column of the models table.
+
+    Args:
+    - numeric_columns (list[str] | None): The columns kept as they are, e.g. the flags.
+    - categories (dict[str, list] | None): The categories of each encoded column,
+    in the order of the `pd.get_dummies` columns.
+    '''
+
+    __slots__ = ('numeric_columns', 'categories')
+
+    def __init__(
+        self,
+        numeric_columns: list[str] | None = None,
+        categories: dict[str, list] | None = None
+    ):
+
+        self.numeric_columns = numeric_columns or []
+        self.categories = categories or {}
+
+    def fit(self, df: pd.DataFrame) -> 'CategoryEncoder':
+        '''Learns the columns and the categories of the table, as `pd.get_dummies`.'''
+
+        encoded = df.select_dtypes(include=ENCODED_DTYPES).columns
+
+        self.numeric_columns = [column for column in df.columns if column not in encoded]
+        self.categories = {
+            column: pd.get_dummies(df[column]).columns.tolist()
+            for column in encoded
+        }
+
+        return self
+
+    @property
+    def columns(self) -> list[str]:
+        '''Returns the names of the encoded columns, the same as of `pd.get_dummies`.'''
+
+        return self.numeric_columns + [
+            f"{column}{PREFIX_SEPARATOR}{category}"
+            for column, categories in self.categories.items()
+            for category in categories
+        ]
+
+    def transform(
+        self, df: pd.DataFrame, sparse_output: bool = False
+    ) -> np.ndarray | sparse.csr_matrix:
+        '''
+        Encodes the table into the fitted columns.
+
+        Args:
+        - df (pd.DataFrame): The table with the fitted columns.
+        - sparse_output (bool): Returns a sparse CSR matrix instead of a dense array.
+
+        Returns:
+        - np.ndarray | sparse.csr_matrix: The float32 features, a row per posting.
+
+        Raises:
+        - KeyError: If a fitted column is missing.
+        '''
+
+        rows = np.arange(len(df))
+        blocks = [sparse.csr_matrix(df[self.numeric_columns].to_numpy(dtype=np.float32))]
+
+        for column, categories in self.categories.items():
+            codes = pd.Categorical(df[column], categories=categories).codes
+            known = codes >= 0
+            blocks.append(sparse.csr_matrix(
+                (np.ones(known.sum(), dtype=np.float32), (rows[known], codes[known])),
+                shape=(len(df), len(categories))
+            ))
+
+        X = sparse.hstack(blocks, format='csr', dtype=np.float32)
+
+        return X if sparse_output else X.toarray()
+
+    def to_dict(self) -> dict:
+        '''Returns the columns and the categories, to save them with the features.'''
+
+        return {'numeric_columns': self.numeric_columns, 'categories': self.categories}
+
+    @classmethod
+    def from_dict(cls, vocabulary: dict) -> 'CategoryEncoder':
+        '''Returns the encoder of the saved columns and categories.'''
+
+        return cls(vocabulary['numeric_columns'], vocabulary['categories'])
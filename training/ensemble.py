@@ -0,0 +1,122 @@
+'''
+This module combines the models into an ensemble, as the `tpred_lm + tpred_rf` ensembles
+evaluated in `_004_model_building.ipynb`: the prediction is the weighted sum of
+the predictions of the models, in a single pass over the postings.
+
+The linear models (e.g. `LinearRegression`, `Lasso`) predict `X @ coef_ + intercept_`,
+so their weighted sum is a single linear model too: they are reduced to one vector
+of coefficients and one intercept, a single dot product instead of a call per model.
+
+The ensemble is saved in the model artifact as plain arrays and models
+(see `Ensemble.to_dict`), so the API predicts it without this package.
+'''
+# External
+import numpy as np
+from scipy import sparse
+from sklearn.base import BaseEstimator
+
+
+def _is_linear(model: BaseEstimator) -> bool:
+    '''Returns True if the model predicts with its coefficients, e.g. `LinearRegression`.'''
+
+    return hasattr(model, 'coef_') and hasattr(model, 'intercept_') \
+        and np.ndim(model.coef_) == 1
+
+
+class Ensemble:
+    '''
+    The weighted sum of the predictions of the models, the linear ones reduced
+    to their weighted coefficients.
+
+    Args:
+    - coef (np.ndarray): The weighted sum of the coefficients of the linear models.
+    - intercept (float): The weighted sum of the intercepts of the linear models.
+    - estimators (list[tuple[BaseEstimator, float]]): The other models and their weights,
+    in order.
+    '''
+
+    __slots__ = ('coef', 'intercept', 'estimators')
+
+    def __init__(
+        self,
+        coef: np.ndarray,
+        intercept: float,
+        estimators: list[tuple[BaseEstimator, float]]
+    ):
+
+        self.coef = coef
+        self.intercept = intercept
+        self.estimators = estimators
+
+    @classmethod
+    def from_models(cls, models: list[tuple[BaseEstimator, float]]) -> 'Ensemble':
+        '''
+        Returns the ensemble of the fitted models.
+
+        Args:
+        - models (list[tuple[BaseEstimator, float]]): The models fitted on the same
+        features and their weights, e.g. `[(lm, 0.5), (gs.best_estimator_, 0.5)]`
+        for `(tpred_lm + tpred_rf) / 2`.
+
+        Returns:
+        - Ensemble: The ensemble of the models.
+
+        Raises:
+        - ValueError: If there is no model or if they are fitted on different features.
+        '''
+
+        if not models:
+            raise ValueError("The ensemble needs at least one model.")
+
+        n_features = {model.n_features_in_ for model, _ in models}
+        if len(n_features) > 1:
+            raise ValueError(f"The models are fitted on different numbers of features:\n"
+                             f"{sorted(n_features)}")
+
+        coef = np.zeros(n_features.pop(), dtype=np.float64)
+        intercept = 0.0
+        estimators = []
+
+        for model, weight in models:
+            if _is_linear(model):
+                coef += weight * np.asarray(model.coef_, dtype=np.float64)
+                intercept += weight * float(model.intercept_)
+            else:
+                estimators.append((model, weight))
+
+        return cls(coef, intercept, estimators)
+
+    @property
+    def n_features_in_(self) -> int:
+        '''Returns the number of features, as the fitted models.'''
+
+        return len(self.coef)
+
+    def predict(self, X: np.ndarray | sparse.spmatrix) -> np.ndarray:
+        '''Returns the weighted sum of the predictions of the models, for each row of X.'''
+
+        predictions = np.asarray(X @ self.coef, dtype=np.float64) + self.intercept
+
+        for estimator, weight in self.estimators:
+            predictions += weight * estimator.predict(X)
+
+        return predictions
+
+    def to_dict(self) -> dict:
+        '''Returns the coefficients and the models, to save them in the model artifact.'''
+
+        return {
+            'coef': self.coef,
+            'intercept': self.intercept,
+            'estimators': [[estimator, weight] for estimator, weight in self.estimators],
+        }
+
+    @classmethod
+    def from_dict(cls, ensemble: dict) -> 'Ensemble':
+        '''Returns the ensemble saved in the model artifact.'''
+
+        return cls(
+            ensemble['coef'],
+            ensemble['intercept'],
+            [(estimator, weight) for estimator, weight in ensemble['estimators']]
+        )
@@ -0,0 +1,251 @@
+'''
+This module saves the features and the target of the salary models built by
+`training.dataset`, so the training, the analysis and the API build them once
+for each clean dataset.
+
+The features are saved as NumPy files, float32, loaded by memory map, with a manifest
+of the feature columns and the categories encoded (see `training.encoding`),
+the input schema of the models. The features are dense or a sparse CSR matrix, saved
+as its data, indices and indptr arrays. They are saved in the cache directory next to
+the clean CSV file, e.g. "data/clean/Data_Engineer/_cache/features/sparse/",
+in a directory named by the key of the clean data hash and `FEATURES_VERSION`,
+so a new clean dataset or a new version of the features is built again.
+
+Usage:
+- python -m training.features "data/clean/Data_Engineer/Data_Engineer_15-04-2023.csv"
+- python -m training.features "data/clean/Data_Engineer/Data_Engineer_15-04-2023.csv" --sparse
+'''
+# Python
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# External
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# Internal
+from cleaning.stage_cache import hash_file
+from training.dataset import TARGET, build_model_frame, get_path_model_data, read_model_columns
+from training.encoding import CategoryEncoder
+
+# Change it with any change of the features built by `training.dataset`
+FEATURES_VERSION = 2
+FEATURES_DIRECTORY = "features"
+MANIFEST_FILE = "manifest.json"
+X_FILE = "X.npy"
+X_SPARSE_FILES = {'data': "X_data.npy", 'indices': "X_indices.npy", 'indptr': "X_indptr.npy"}
+Y_FILE = "y.npy"
+
+
+class FeatureSet:
+    '''
+    The features and the target of the postings with the salary.
+
+    Args:
+    - X (np.ndarray | sparse.csr_matrix): The features, float32, a column per feature.
+    - y (np.ndarray): The average salaries, float64, as the ones of the clean dataset.
+    - encoder (CategoryEncoder): The columns and the categories of the features.
+    - index (np.ndarray): The postings ids in the clean dataset.
+    '''
+
+    __slots__ = ('X', 'y', 'encoder', 'index')
+
+    def __init__(
+        self,
+        X: np.ndarray | sparse.csr_matrix,
+        y: np.ndarray,
+        encoder: CategoryEncoder,
+        index: np.ndarray
+    ):
+
+        self.X = X
+        self.y = y
+        self.encoder = encoder
+        self.index = index
+
+    @property
+    def columns(self) -> list[str]:
+        '''Returns the names of the features.'''
+
+        return self.encoder.columns
+
+    def to_frame(self) -> pd.DataFrame:
+        '''Returns the features as a DataFrame indexed by the postings, sparse if X is.'''
+
+        if sparse.issparse(self.X):
+            return pd.DataFrame.sparse.from_spmatrix(
+                self.X, index=self.index, columns=self.columns)
+
+        return pd.DataFrame(self.X, columns=self.columns, index=self.index)
+
+
+def _get_encoding(sparse_output: bool) -> str:
+    '''Returns the name of the features encoding, the directory of its saved features.'''
+
+    return "sparse" if sparse_output else "dense"
+
+
+def get_features_key(data_hash: str) -> str:
+    '''Returns the key of the features of the clean data.'''
+
+    return hashlib.sha256(f"{data_hash}{FEATURES_VERSION}".encode()).hexdigest()[:16]
+
+
+def get_path_features(file_path: str) -> str:
+    '''Returns the directory of the saved features, next to the clean CSV file.'''
+
+    return os.path.join(os.path.dirname(file_path), "_cache", FEATURES_DIRECTORY)
+
+
+def build_features(file_path: str, sparse_output: bool = False) -> FeatureSet:
+    '''
+    Builds the features and the target of the clean postings.
+
+    Args:
+    - file_path (str): The path to the clean CSV file.
+    - sparse_output (bool): Builds the features as a sparse CSR matrix.
+
+    Returns:
+    - FeatureSet: The features of the postings with the salary.
+    '''
+
+    df_model = build_model_frame(read_model_columns(file_path))
+    df_features = df_model.drop(columns=TARGET)
+
+    encoder = CategoryEncoder().fit(df_features)
+
+    return FeatureSet(
+        encoder.transform(df_features, sparse_output),
+        df_model[TARGET].to_numpy(dtype=np.float64),
+        encoder,
+        df_model.index.values
+    )
+
+
+def save_features(features: FeatureSet, directory: str, manifest: dict):
+    '''
+    Saves the features in the directory, replacing it at once,
+    so a reader never sees a part of them.
+    '''
+
+    parent = os.path.dirname(directory)
+    os.makedirs(parent, exist_ok=True)
+
+    temporary = tempfile.mkdtemp(dir=parent)
+
+    if sparse.issparse(features.X):
+        for name, file_name in X_SPARSE_FILES.items():
+            np.save(os.path.join(temporary, file_name), getattr(features.X, name))
+    else:
+        np.save(os.path.join(temporary, X_FILE), features.X)
+
+    np.save(os.path.join(temporary, Y_FILE), features.y)
+
+    with open(os.path.join(temporary, MANIFEST_FILE), "w", encoding="utf-8") as file:
+        json.dump({
+            **manifest,
+            'shape': list(features.X.shape),
+            'columns': features.columns,
+            'vocabulary': features.encoder.to_dict(),
+            'index': features.index.tolist(),
+        }, file, indent=2)
+
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(temporary, directory)
+
+
+def load_saved_features(directory: str) -> FeatureSet:
+    '''Loads the saved features, the arrays by memory map.'''
+
+    with open(os.path.join(directory, MANIFEST_FILE), "r", encoding="utf-8") as file:
+        manifest = json.load(file)
+
+    if manifest['encoding'] == _get_encoding(sparse_output=True):
+        X = sparse.csr_matrix(tuple(
+            np.load(os.path.join(directory, X_SPARSE_FILES[name]), mmap_mode='r')
+            for name in ('data', 'indices', 'indptr')
+        ), shape=tuple(manifest['shape']), copy=False)
+    else:
+        X = np.load(os.path.join(directory, X_FILE), mmap_mode='r')
+
+    return FeatureSet(
+        X,
+        np.load(os.path.join(directory, Y_FILE), mmap_mode='r'),
+        CategoryEncoder.from_dict(manifest['vocabulary']),
+        np.array(manifest['index']),
+    )
+
+
+def load_features(
+    file_path: str,
+    directory: str | None = None,
+    sparse_output: bool = False
+) -> FeatureSet:
+    '''
+    Loads the features of the clean postings, built and saved first if they aren't saved
+    for this clean data and this version of the features. The outdated ones are removed.
+
+    Args:
+    - file_path (str): The path to the clean CSV file.
+    - directory (str | None): The directory of the saved features,
+    default is the cache directory next to the clean CSV file.
+    - sparse_output (bool): Loads the features as a sparse CSR matrix.
+
+    Returns:
+    - FeatureSet: The features of the postings with the salary.
+    '''
+
+    encoding = _get_encoding(sparse_output)
+    directory = os.path.join(directory or get_path_features(file_path), encoding)
+
+    data_hash = hash_file(get_path_model_data(file_path))
+    key = get_features_key(data_hash)
+    features_directory = os.path.join(directory, key)
+
+    if not os.path.exists(os.path.join(features_directory, MANIFEST_FILE)):
+
+        features = build_features(file_path, sparse_output)
+        save_features(features, features_directory, {
+            'version': FEATURES_VERSION,
+            'data_hash': data_hash,
+            'encoding': encoding,
+            'rows': len(features.y),
+        })
+
+        for outdated in os.listdir(directory):
+            if outdated != key:
+                shutil.rmtree(os.path.join(directory, outdated), ignore_errors=True)
+
+    return load_saved_features(features_directory)
+
+
+def main(args: list[str]):
+    '''Builds or loads the features with the command line arguments.'''
+
+    parser = argparse.ArgumentParser(
+        prog="python -m training.features",
+        description="Build the features of the salary models, once for each clean dataset.")
+    parser.add_argument("file_path", help="the clean CSV file")
+    parser.add_argument("--sparse", action="store_true",
+                        help="save the features as a sparse matrix")
+    options = parser.parse_args(args)
+
+    if not os.path.exists(options.file_path):
+        sys.exit(f"The clean CSV file doesn't exist:\n{options.file_path}")
+
+    start = time.perf_counter()
+    features = load_features(options.file_path, sparse_output=options.sparse)
+
+    print(f"{features.X.shape[0]} postings x {features.X.shape[1]} features "
+          f"in {time.perf_counter() - start:.2f}s:\n{get_path_features(options.file_path)}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,140 @@
+'''
+This module computes the cross-validated error of the Lasso regression for each alpha,
+as the loop of `_004_model_building.ipynb` fitting `Lasso(alpha=i/100)` with
+`cross_val_score` for i in 1..99, but with a single regularization path per fold:
+the alphas are fitted from the largest, each one starting from the coefficients
+of the previous one (warm start), with the Gram matrix of the fold computed once.
+The sparse features are fitted without the Gram matrix, over their non-zero values.
+
+Usage:
+- python -m training.lasso "data/clean/Data_Engineer/Data_Engineer_15-04-2023.csv"
+'''
+# Python
+import argparse
+import os
+import sys
+import time
+import warnings
+
+# External
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.linear_model import lasso_path
+from sklearn.model_selection import KFold
+
+# Internal
+from training.dataset import split_train_test
+from training.features import load_features
+from training.search import N_FOLDS, as_float64
+
+# The alphas of `_004_model_building.ipynb`
+ALPHAS = np.arange(1, 100) / 100
+
+
+def get_lasso_errors(
+    X: pd.DataFrame | np.ndarray | sparse.spmatrix,
+    y: np.ndarray,
+    alphas: np.ndarray = ALPHAS,
+    max_iter: int = 1000,
+    tol: float = 1e-4
+) -> pd.DataFrame:
+    '''
+    Returns the cross-validated error of the Lasso regression with each alpha,
+    the same as `np.mean(cross_val_score(Lasso(alpha), X, y,
+    scoring='neg_mean_absolute_error', cv=3))` up to the tolerance of the optimization.
+    The warm starts converge within fewer iterations, so the errors of the alphas that
+    `Lasso` doesn't converge for in `max_iter` (the smallest ones) are more accurate.
+
+    Args:
+    - X (pd.DataFrame | np.ndarray | sparse.spmatrix): The features, dense or sparse.
+    - y (np.ndarray): The target.
+    - alphas (np.ndarray): The alphas, in any order.
+    - max_iter (int): The maximal number of iterations of each alpha, as in `Lasso`.
+    - tol (float): The tolerance of the optimization, as in `Lasso`.
+
+    Returns:
+    - pd.DataFrame: The `alpha` and the `error` (the negative mean absolute error,
+    higher is better) of each alpha, in the order of the alphas.
+    '''
+
+    X = as_float64(X)
+    y = np.asarray(y, dtype=np.float64)
+
+    # The path goes from the largest alpha, the one with the fewest coefficients
+    order = np.argsort(alphas)[::-1]
+    alphas_path = np.asarray(alphas, dtype=np.float64)[order]
+
+    errors = np.zeros((N_FOLDS, len(alphas_path)))
+
+    for fold, (train, test) in enumerate(KFold(n_splits=N_FOLDS).split(X)):
+
+        # The intercept as in `Lasso`: the path is fitted on the centered data
+        X_mean = np.asarray(X[train].mean(axis=0)).ravel()
+        y_mean = y[train].mean()
+        y_centered = y[train] - y_mean
+
+        if sparse.issparse(X):
+            # Centered by the solver, keeping the zeros
+            path_args = {
+                'X': X[train].tocsc(),
+                'X_offset': X_mean,
+                'X_scale': np.ones_like(X_mean),
+            }
+        else:
+            X_centered = X[train] - X_mean
+            path_args = {
+                'X': X_centered,
+                'precompute': X_centered.T @ X_centered,
+                'Xy': X_centered.T @ y_centered,
+            }
+
+        with warnings.catch_warnings():
+            # As `Lasso`, the small alphas may not converge on these unscaled features
+            warnings.simplefilter("ignore", ConvergenceWarning)
+            _, coefs, _ = lasso_path(
+                y=y_centered, alphas=alphas_path, max_iter=max_iter, tol=tol, **path_args)
+
+        intercepts = y_mean - X_mean @ coefs
+        predictions = np.asarray(X[test] @ coefs) + intercepts
+
+        errors[fold] = -np.abs(predictions - y[test][:, np.newaxis]).mean(axis=0)
+
+    return pd.DataFrame({'alpha': alphas_path, 'error': errors.mean(axis=0)}) \
+        .iloc[np.argsort(order)].reset_index(drop=True)
+
+
+def get_best_alpha(errors: pd.DataFrame) -> float:
+    '''Returns the alpha with the highest error, i.e. the lowest mean absolute error.'''
+
+    return errors['alpha'].iloc[errors['error'].argmax()]
+
+
+def main(args: list[str]):
+    '''Computes the Lasso errors with the command line arguments.'''
+
+    parser = argparse.ArgumentParser(
+        prog="python -m training.lasso",
+        description="Compute the cross-validated error of the Lasso regression for each alpha.")
+    parser.add_argument("file_path", help="the clean CSV file")
+    parser.add_argument("--sparse", action="store_true", help="fit on the sparse features")
+    options = parser.parse_args(args)
+
+    if not os.path.exists(options.file_path):
+        sys.exit(f"The clean CSV file doesn't exist:\n{options.file_path}")
+
+    features = load_features(options.file_path, sparse_output=options.sparse)
+    X_train, _, y_train, _ = split_train_test(
+        features.X if options.sparse else features.to_frame(), features.y)
+
+    start = time.perf_counter()
+    errors = get_lasso_errors(X_train, y_train)
+
+    print(f"{len(errors)} alphas in {time.perf_counter() - start:.2f}s, "
+          f"best: {get_best_alpha(errors)}, "
+          f"MAE {-errors['error'].max():.0f}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
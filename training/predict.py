@@ -0,0 +1,207 @@
+'''
+This module predicts the salaries of all the postings of a clean dataset, without
+the API: the model artifact (see `training.artifact`) is loaded once in each process,
+the postings are read in partitions, the countries of the Parquet file or the chunks
+of the CSV file, and each partition is encoded and predicted at once.
+Only the model columns are kept, so a partition in memory is small.
+
+The predictions are saved in a CSV file with the ids of the postings (the index of
+the clean dataset), in the order of the partitions, next to the clean CSV file by default,
+e.g. "data/clean/Data_Engineer/Data_Engineer_15-04-2023_predictions.csv".
+
+Usage:
+- python -m training.predict "FlaskAPI/models/model_file.p" "data/clean/Data_Engineer/Data_Engineer_15-04-2023.csv"
+- python -m training.predict "FlaskAPI/models/model_file.p" "data/clean/Data_Engineer/Data_Engineer_15-04-2023.csv" --workers 4 --chunk-size 5000
+'''
+# Python
+import argparse
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import os
+import sys
+import time
+from typing import Any, Callable, Iterator
+import warnings
+
+# External
+import pandas as pd
+import pyarrow.parquet as pq
+
+# Internal
+from cleaning.store import get_countries, read_clean_parquet
+from scraper.config.get import get_encoding
+from training.artifact import load_model
+from training.dataset import (BI_TOOLS_GROUP, COLUMNS_MODEL, TARGET, build_model_frame,
+                              get_path_model_data, select_model_columns)
+
+CHUNK_SIZE = 10_000
+ID_COLUMN = 'Job_id'
+PREDICTION_COLUMN = 'Salary_predicted'
+
+# The model of each process, set once by `_init_worker`
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(model_path: str):
+    '''Loads the model once in the process, so it is not sent with each partition.'''
+
+    _worker['model'], _worker['encoder'] = load_model(model_path)
+
+
+def _predict_frame(df: pd.DataFrame) -> pd.Series:
+    '''
+    Returns the salaries predicted by the model of the process for the clean postings,
+    at least the model columns and the Business Intelligence tools, indexed by their ids.
+    '''
+
+    df_model = build_model_frame(df, drop_missing_target=False)
+    X = _worker['encoder'].transform(df_model.drop(columns=TARGET))
+
+    with warnings.catch_warnings():
+        # The model fitted on the DataFrame of the notebook checks the names of the columns
+        warnings.filterwarnings("ignore", message="X does not have valid feature names")
+        predictions = _worker['model'].predict(X)
+
+    return pd.Series(
+        predictions, index=df_model.index.rename(ID_COLUMN), name=PREDICTION_COLUMN)
+
+
+def _predict_country(file_path: str, country: str) -> pd.Series:
+    '''Reads the model columns of the country from the Parquet file and predicts them.'''
+
+    return _predict_frame(
+        read_clean_parquet(file_path, COLUMNS_MODEL + [BI_TOOLS_GROUP], countries=[country]))
+
+
+def get_partitions(
+    file_path: str, chunk_size: int = CHUNK_SIZE
+) -> Iterator[tuple[Callable, tuple]]:
+    '''
+    Returns the partitions of the clean postings, each one as the function predicting it
+    and its arguments: a country of the Parquet file next to the clean CSV file,
+    read by the process, or else a chunk of the model columns of the CSV file.
+    '''
+
+    path_data = get_path_model_data(file_path)
+
+    if path_data != file_path:
+        for country in get_countries(pq.ParquetFile(path_data)):
+            yield _predict_country, (path_data, country)
+        return
+
+    with pd.read_csv(
+        file_path, index_col=0, header=[0, 1], encoding=get_encoding(), chunksize=chunk_size
+    ) as chunks:
+        for chunk in chunks:
+            yield _predict_frame, (select_model_columns(chunk),)
+
+
+def _run_in_pool(
+    partitions: Iterator[tuple[Callable, tuple]],
+    model_path: str,
+    max_workers: int | None
+) -> Iterator[pd.Series]:
+    '''
+    Predicts the partitions in a pool of processes, or one by one in the current process
+    if `max_workers` is 1. At most twice as many partitions as processes are read ahead,
+    so the CSV file is not loaded whole.
+
+    Returns:
+    - Iterator[pd.Series]: The predictions of each partition, in the order of the partitions.
+    '''
+
+    if max_workers == 1:
+        _init_worker(model_path)
+        for function, args in partitions:
+            yield function(*args)
+        return
+
+    read_ahead = 2 * (max_workers or os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(model_path,)
+    ) as executor:
+        pending: deque[Future] = deque()
+
+        for function, args in partitions:
+            pending.append(executor.submit(function, *args))
+            if len(pending) >= read_ahead:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def predict_file(
+    model_path: str,
+    file_path: str,
+    output_path: str,
+    max_workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE
+) -> int:
+    '''
+    Predicts the salaries of all the postings of the clean dataset and saves them
+    with the ids of the postings, a partition at a time.
+
+    Args:
+    - model_path (str): The path to the model artifact.
+    - file_path (str): The path to the clean CSV file.
+    - output_path (str): The path to the CSV file of the predictions.
+    - max_workers (int | None): The number of processes. Default is the number of CPUs.
+    With 1 the partitions are predicted one by one in the current process.
+    - chunk_size (int): The number of rows of each chunk of the CSV file.
+
+    Returns:
+    - int: The number of postings predicted.
+    '''
+
+    n_rows = 0
+
+    with open(output_path, "w", encoding="utf-8", newline="") as file:
+        for predictions in _run_in_pool(
+            get_partitions(file_path, chunk_size), model_path, max_workers
+        ):
+            predictions.to_csv(file, header=n_rows == 0)
+            n_rows += len(predictions)
+
+    return n_rows
+
+
+def get_path_predictions(file_path: str) -> str:
+    '''Returns the path to the predictions next to the clean CSV file.'''
+
+    return f"{os.path.splitext(file_path)[0]}_predictions.csv"
+
+
+def main(args: list[str]):
+    '''Predicts the salaries of the clean dataset with the command line arguments.'''
+
+    parser = argparse.ArgumentParser(
+        prog="python -m training.predict",
+        description="Predict the salaries of all the postings of the clean dataset.")
+    parser.add_argument("model_path", help="the model artifact")
+    parser.add_argument("file_path", help="the clean CSV file")
+    parser.add_argument("--output", help="the CSV file of the predictions, "
+                        "default is next to the clean CSV file")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of processes, default is the number of CPUs")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                        help="number of rows of each chunk of the CSV file")
+    options = parser.parse_args(args)
+
+    for path in (options.model_path, options.file_path):
+        if not os.path.exists(path):
+            sys.exit(f"The file doesn't exist:\n{path}")
+
+    output_path = options.output or get_path_predictions(options.file_path)
+
+    start = time.perf_counter()
+    n_rows = predict_file(
+        options.model_path, options.file_path, output_path,
+        options.workers, options.chunk_size)
+
+    print(f"{n_rows} postings predicted in {time.perf_counter() - start:.2f}s:\n{output_path}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
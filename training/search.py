@@ -0,0 +1,415 @@
+'''
+This module searches the hyperparameters of the salary models, as `GridSearchCV`
+in `_004_model_building.ipynb`, but each fit of a parameters combination on a fold
+is a separate task in a pool of processes and its score is appended to a cache file
+as soon as it is done. So an interrupted search resumes with the fits left, and
+a re-run on the same data only fits the new combinations.
+
+With successive halving, all the combinations are first scored on a part of the training
+folds, and only the best of each round are scored on a bigger part, so the slow ones
+(e.g. the `absolute_error` criterion with many trees) are not fitted on all the postings.
+
+Usage:
+- python -m training.search "data/clean/Data_Engineer/Data_Engineer_15-04-2023.csv"
+- python -m training.search "data/clean/Data_Engineer/Data_Engineer_15-04-2023.csv"
+--workers 4 --halving 3
+'''
+# Python
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Iterator
+
+# External
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.base import BaseEstimator, clone
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import KFold, ParameterGrid
+
+# Internal
+from training.dataset import split_train_test
+from training.features import load_features
+
+SCORING = 'neg_mean_absolute_error'
+N_FOLDS = 3
+MIN_SAMPLES_HALVING = 40
+CACHE_FILE = "search_scores.jsonl"
+
+# The grid of `_004_model_building.ipynb`, with 1.0 for "auto", which scikit-learn removes
+PARAM_GRID = {
+    'n_estimators': list(range(10, 300, 10)),
+    'criterion': ['friedman_mse', 'absolute_error', 'poisson', 'squared_error'],
+    'max_features': [1.0, 'sqrt', 'log2'],
+}
+
+# The data of the fits in each process, set once by `_init_worker`
+_worker: dict[str, Any] = {}
+
+
+def hash_data(X: pd.DataFrame | np.ndarray | sparse.spmatrix, y: np.ndarray) -> str:
+    '''Returns the hash of the features, with their names, and of the target.'''
+
+    data_hash = hashlib.sha256()
+
+    if isinstance(X, pd.DataFrame):
+        data_hash.update(repr(X.columns.tolist()).encode())
+
+    if sparse.issparse(X):
+        X = as_float64(X)
+        X.sum_duplicates()
+        for array in (X.data, X.indices, X.indptr):
+            data_hash.update(np.ascontiguousarray(array).tobytes())
+    else:
+        data_hash.update(np.ascontiguousarray(X, dtype=np.float64).tobytes())
+
+    data_hash.update(np.ascontiguousarray(y, dtype=np.float64).tobytes())
+
+    return data_hash.hexdigest()
+
+
+def as_float64(
+    X: pd.DataFrame | np.ndarray | sparse.spmatrix
+) -> np.ndarray | sparse.csr_matrix:
+    '''Returns the features as a float64 array, or a float64 CSR matrix if they are sparse.'''
+
+    if sparse.issparse(X):
+        return sparse.csr_matrix(X, dtype=np.float64)
+
+    return np.asarray(X, dtype=np.float64)
+
+
+def get_fit_key(
+    data_hash: str,
+    estimator: BaseEstimator,
+    params: dict,
+    fold: int,
+    n_samples: int | None
+) -> str:
+    '''Returns the key of a fit of the parameters on a fold, with its number of samples.'''
+
+    return hashlib.sha256(json.dumps([
+        data_hash,
+        type(estimator).__name__,
+        repr(estimator.get_params()),
+        sorted(params.items()),
+        N_FOLDS,
+        fold,
+        n_samples,
+    ], default=repr).encode()).hexdigest()
+
+
+class ScoreCache:
+    '''
+    The scores of the fits done, a JSON line per fit appended to the file.
+
+    Args:
+    - file_path (str): The path to the cache file, created if it doesn't exist.
+    '''
+
+    __slots__ = ('file_path', 'scores')
+
+    def __init__(self, file_path: str):
+
+        self.file_path = file_path
+        self.scores: dict[str, dict] = {}
+
+        if not os.path.exists(file_path):
+            return
+
+        with open(file_path, "r", encoding="utf-8") as file:
+            lines = file.readlines()
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            self.scores[record['key']] = record
+
+        # The last line is cut if the search was killed while writing it
+        if len(self.scores) < len(lines):
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.writelines(json.dumps(record) + "\n" for record in self.scores.values())
+
+    def get(self, key: str) -> dict | None:
+        '''Returns the score and the fit time of the fit, or None if it wasn't done.'''
+
+        return self.scores.get(key)
+
+    def add(self, key: str, score: float, fit_time: float):
+        '''Saves the score and the fit time of the fit.'''
+
+        record = {'key': key, 'score': score, 'fit_time': fit_time}
+        self.scores[key] = record
+
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(self.file_path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
+
+
+def _init_worker(estimator: BaseEstimator, X: np.ndarray, y: np.ndarray, scoring: str):
+    '''Keeps the data in the process, so it is not sent with each fit.'''
+
+    _worker.update({'estimator': estimator, 'X': X, 'y': y, 'scorer': get_scorer(scoring)})
+
+
+def _fit_and_score(params: dict, train: np.ndarray, test: np.ndarray) -> tuple[float, float]:
+    '''Fits the estimator with the parameters on the train rows and scores it on the test rows.'''
+
+    estimator = clone(_worker['estimator']).set_params(**params)
+    X, y = _worker['X'], _worker['y']
+
+    start = time.perf_counter()
+    estimator.fit(X[train], y[train])
+    fit_time = time.perf_counter() - start
+
+    return _worker['scorer'](estimator, X[test], y[test]), fit_time
+
+
+def _run_fits(
+    fits: dict[str, tuple[dict, np.ndarray, np.ndarray]],
+    init_args: tuple,
+    max_workers: int | None
+) -> Iterator[tuple[str, tuple[float, float]]]:
+    '''
+    Runs the fits in a pool of processes, or one by one in the current process
+    if `max_workers` is 1.
+
+    Returns:
+    - Iterator[tuple[str, tuple[float, float]]]: The keys of the fits with the scores
+    and the fit times, in the order of completion.
+    '''
+
+    if max_workers == 1:
+        _init_worker(*init_args)
+        for key, args in fits.items():
+            yield key, _fit_and_score(*args)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=init_args
+    ) as executor:
+        futures = {executor.submit(_fit_and_score, *args): key for key, args in fits.items()}
+
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def _score_candidates(
+    candidates: list[dict],
+    folds: list[tuple[np.ndarray, np.ndarray]],
+    n_samples: int | None,
+    estimator: BaseEstimator,
+    X: np.ndarray,
+    y: np.ndarray,
+    data_hash: str,
+    cache: ScoreCache,
+    scoring: str,
+    max_workers: int | None,
+    verbose: bool
+) -> pd.DataFrame:
+    '''
+    Scores the candidates on the folds, with the first `n_samples` of each train fold,
+    or all of them if None.
+    '''
+
+    keys = {
+        (candidate, fold): get_fit_key(data_hash, estimator, params, fold, n_samples)
+        for candidate, params in enumerate(candidates)
+        for fold in range(len(folds))
+    }
+
+    fits = {
+        key: (candidates[candidate], folds[fold][0][:n_samples], folds[fold][1])
+        for (candidate, fold), key in keys.items()
+        if cache.get(key) is None
+    }
+    candidates_by_key = {key: candidate for (candidate, _), key in keys.items()}
+    fits_left = Counter(candidates_by_key[key] for key in fits)
+
+    for key, (score, fit_time) in _run_fits(fits, (estimator, X, y, scoring), max_workers):
+        cache.add(key, score, fit_time)
+
+        candidate = candidates_by_key[key]
+        fits_left[candidate] -= 1
+        if verbose and fits_left[candidate] == 0:
+            seconds = sum(cache.get(keys[candidate, fold])['fit_time']  # type: ignore
+                          for fold in range(len(folds)))
+            print(f"{candidates[candidate]}: {seconds:.1f}s")
+
+    records = []
+    for candidate, params in enumerate(candidates):
+        scores = [cache.get(keys[candidate, fold]) for fold in range(len(folds))]
+        records.append({
+            'params': params,
+            'n_samples': n_samples or min(len(train) for train, _ in folds),
+            'mean_score': np.mean([score['score'] for score in scores]),  # type: ignore
+            'std_score': np.std([score['score'] for score in scores]),  # type: ignore
+            'fit_time': sum(score['fit_time'] for score in scores),  # type: ignore
+            'cached': all(keys[candidate, fold] not in fits for fold in range(len(folds))),
+        })
+
+    return pd.DataFrame(records)
+
+
+def search(
+    estimator: BaseEstimator,
+    param_grid: dict[str, list],
+    X: pd.DataFrame | np.ndarray | sparse.spmatrix,
+    y: np.ndarray,
+    cache: ScoreCache,
+    scoring: str = SCORING,
+    max_workers: int | None = None,
+    halving_factor: int | None = None,
+    verbose: bool = False
+) -> pd.DataFrame:
+    '''
+    Scores each combination of the parameters with the cross-validation of `GridSearchCV`,
+    fitting only the combinations and folds missing from the cache.
+
+    Args:
+    - estimator (BaseEstimator): The estimator, e.g. `RandomForestRegressor()`.
+    - param_grid (dict[str, list]): The values of each parameter.
+    - X (pd.DataFrame | np.ndarray | sparse.spmatrix): The features, dense or sparse.
+    - y (np.ndarray): The target.
+    - cache (ScoreCache): The scores of the fits already done.
+    - scoring (str): The scikit-learn scorer, higher is better.
+    - max_workers (int | None): The number of processes. Default is the number of CPUs.
+    With 1 the fits are done one by one in the current process.
+    - halving_factor (int | None): With successive halving, the fraction of
+    the combinations kept in each round and the factor of the samples added.
+    Default is scoring all the combinations on all the samples.
+    - verbose (bool): Prints the fit time of each combination when its folds are done.
+
+    Returns:
+    - pd.DataFrame: The `params`, `mean_score`, `std_score`, `fit_time` (in seconds,
+    all the folds) and `cached` (no fits done) of each combination, from the best,
+    with the number of samples of its last round.
+
+    Raises:
+    - ValueError: If the halving factor is lower than 2.
+    '''
+
+    if halving_factor is not None and halving_factor < 2:
+        raise ValueError(f"The halving factor is lower than 2:\n{halving_factor}")
+
+    data_hash = hash_data(X, y)
+    X = as_float64(X)
+    y = np.asarray(y, dtype=np.float64)
+
+    folds = list(KFold(n_splits=N_FOLDS).split(X))
+    n_train = min(len(train) for train, _ in folds)
+
+    # The train rows of each fold in a fixed random order, so a part of them is a sample
+    random_state = np.random.RandomState(0)
+    folds = [(random_state.permutation(train), test) for train, test in folds]
+
+    candidates = list(ParameterGrid(param_grid))
+
+    # Until a combination is left, but the first round has at least the minimal samples
+    rounds = 1 if halving_factor is None else max(1, min(
+        math.ceil(math.log(len(candidates), halving_factor)),
+        math.floor(math.log(n_train / MIN_SAMPLES_HALVING, halving_factor)) + 1
+    ))
+
+    results = []
+
+    for round_index in range(rounds):
+        # The last round on the whole train folds
+        n_samples = None if round_index == rounds - 1 else \
+            n_train // halving_factor ** (rounds - 1 - round_index)  # type: ignore
+
+        scores = _score_candidates(
+            candidates, folds, n_samples, estimator, X, y, data_hash, cache, scoring,
+            max_workers, verbose)
+        scores = scores.sort_values('mean_score', ascending=False, kind='stable')
+
+        if halving_factor is not None and round_index < rounds - 1:
+            kept = math.ceil(len(candidates) / halving_factor)
+            results.append(scores.iloc[kept:])
+            candidates = scores['params'].iloc[:kept].tolist()
+        else:
+            results.append(scores)
+
+    # The finalists first, then the candidates of the previous rounds
+    return pd.concat(results[::-1], ignore_index=True)
+
+
+def get_path_cache(file_path: str) -> str:
+    '''Returns the path to the scores cache next to the clean CSV file, with the stages cache.'''
+
+    return os.path.join(os.path.dirname(file_path), "_cache", CACHE_FILE)
+
+
+def _halving_factor(value: str) -> int:
+    '''Returns the halving factor of the command line, at least 2 to halve anything.'''
+
+    try:
+        factor = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an integer: {value!r}")
+
+    if factor < 2:
+        raise argparse.ArgumentTypeError(f"lower than 2: {factor}")
+
+    return factor
+
+
+def main(args: list[str]):
+    '''Searches the parameters of the random forest with the command line arguments.'''
+
+    parser = argparse.ArgumentParser(
+        prog="python -m training.search",
+        description="Search the random forest parameters of the salary model, resumable.")
+    parser.add_argument("file_path", help="the clean CSV file")
+    parser.add_argument("--workers", type=int,
+                        help="the number of processes, default: the number of CPUs")
+    parser.add_argument("--halving", type=_halving_factor, metavar="FACTOR",
+                        help="successive halving, keeping 1/FACTOR of the combinations a round")
+    parser.add_argument("--criteria", nargs="+", choices=PARAM_GRID['criterion'],
+                        default=PARAM_GRID['criterion'], help="the split criteria searched")
+    parser.add_argument("--cache", help="the scores cache, default: next to the stages cache")
+    parser.add_argument("--sparse", action="store_true",
+                        help="fit the forests on the sparse features")
+    options = parser.parse_args(args)
+
+    if not os.path.exists(options.file_path):
+        sys.exit(f"The clean CSV file doesn't exist:\n{options.file_path}")
+
+    features = load_features(options.file_path, sparse_output=options.sparse)
+    X_train, _, y_train, _ = split_train_test(
+        features.X if options.sparse else features.to_frame(), features.y)
+
+    cache = ScoreCache(options.cache or get_path_cache(options.file_path))
+
+    start = time.perf_counter()
+
+    results = search(
+        RandomForestRegressor(),
+        {**PARAM_GRID, 'criterion': options.criteria},
+        X_train, y_train, cache,
+        max_workers=options.workers,
+        halving_factor=options.halving,
+        verbose=True
+    )
+
+    print(f"Searched in {time.perf_counter() - start:.1f}s, "
+          f"{(~results['cached']).sum()} of {len(results)} combinations fitted:")
+    print(results.head(10).to_string())
+    print(f"Best: {results['params'].iloc[0]}, MAE {-results['mean_score'].iloc[0]:.0f}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])